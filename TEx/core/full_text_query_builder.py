@@ -0,0 +1,94 @@
+"""Full Text Search (FTS5) Query Builder."""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from TEx.core.regex_analyzer import RegexAnalyzer
+
+
+class FullTextQueryBuilder:
+    """
+    Build FTS5 Queries Used to Prefilter the Messages Before the Python Side Filters.
+
+    The Index Uses the Trigram Tokenizer, so a Quoted Term Matches any Message that Contains it as a Case Insensitive
+    Substring. The Query Must Always Return a Superset of the Python Side Results, so when a Filter can not be
+    Safely Expressed (Terms Shorter than 3 Chars, Regex without Required Literals), no Query is Built and the
+    Caller Must Scan all Messages.
+    """
+
+    MIN_TERM_LENGTH: int = 3
+
+    # Sequences Produced by str.casefold() Expanding a Single Char (Ex: "ß" > "ss"), Kept Unexpanded by the Index
+    CASEFOLD_EXPANSIONS: Tuple[str, ...] = tuple(sorted({chr(code).casefold() for code in range(0x10000) if len(chr(code).casefold()) > 1}))
+
+    @staticmethod
+    def from_terms(terms: List[str]) -> Optional[str]:
+        """
+        Build a Query that Matches Messages Containing any of the Terms.
+
+        :param terms: Terms (Substrings) to Search
+        :return: FTS5 Query or None if the Terms can not be Searched on the Index
+        """
+        cores: List[Optional[str]] = [FullTextQueryBuilder.__get_casefold_term_core(term) for term in terms]
+
+        if len(cores) == 0 or not all(cores):
+            return None
+
+        return ' OR '.join(FullTextQueryBuilder.__quote(core) for core in cores if core)
+
+    @staticmethod
+    def from_regex(pattern: str) -> Optional[str]:
+        """
+        Build a Query that Matches Messages Containing all Literals Required by the Regex.
+
+        :param pattern: Regex Pattern
+        :return: FTS5 Query or None if the Regex has no Searchable Required Literal
+        """
+        literals: List[str] = [
+            item for item in RegexAnalyzer.required_literals(pattern=pattern) or []
+            if FullTextQueryBuilder.__is_searchable(item)
+            ]
+
+        if len(literals) == 0:
+            return None
+
+        return ' AND '.join(FullTextQueryBuilder.__quote(literal) for literal in dict.fromkeys(literals))
+
+    @staticmethod
+    def __is_searchable(term: str) -> bool:
+        """Check if the Index can Find the Term Without Missing any Message."""
+        return len(term) >= FullTextQueryBuilder.MIN_TERM_LENGTH and term.casefold() == term.lower()
+
+    @staticmethod
+    def __get_casefold_term_core(term: str) -> Optional[str]:
+        """
+        Return the Part of a Term, Matched against the Casefolded Messages, that the Index can Find Without Missing any Message.
+
+        A Term Char can Come from the Casefold Expansion of a Message Char (Ex: "ss" from "ß"), that the Index Keeps
+        Unexpanded. Terms Containing a Whole Expansion are not Searchable, and the Edge Chars that can be Part of an
+        Expansion Crossing the Term Boundary are Removed.
+        """
+        if not FullTextQueryBuilder.__is_searchable(term):
+            return None
+
+        folded: str = term.casefold()
+        if any(expansion in folded for expansion in FullTextQueryBuilder.CASEFOLD_EXPANSIONS):
+            return None
+
+        # Searchable Terms have no Expanding Chars, so the Folded and the Original Terms have the Same Length
+        start: int = max(
+            (size for expansion in FullTextQueryBuilder.CASEFOLD_EXPANSIONS for size in range(1, len(expansion)) if folded.startswith(expansion[-size:])),
+            default=0,
+            )
+        end: int = max(
+            (size for expansion in FullTextQueryBuilder.CASEFOLD_EXPANSIONS for size in range(1, len(expansion)) if folded.endswith(expansion[:size])),
+            default=0,
+            )
+
+        core: str = term[start:len(term) - end]
+        return core if len(core) >= FullTextQueryBuilder.MIN_TERM_LENGTH else None
+
+    @staticmethod
+    def __quote(term: str) -> str:
+        """Quote a Term as a FTS5 String."""
+        return '"' + term.replace('"', '""') + '"'
@@ -23,6 +23,7 @@ class SignalEntityMapper:
                     'INITIALIZATION': section_proxy.get('initialization_notifer', fallback='').split(','),
                     'SHUTDOWN': section_proxy.get('shutdown_notifer', fallback='').split(','),
                     'NEW-GROUP': section_proxy.get('new_group_notifer', fallback='').split(','),
+                    'RULE-DISABLED': section_proxy.get('rule_disabled_notifer', fallback='').split(','),
                 },
             )
 
@@ -34,5 +35,6 @@ class SignalEntityMapper:
                 'INITIALIZATION': [],
                 'SHUTDOWN': [],
                 'NEW-GROUP': [],
+                'RULE-DISABLED': [],
             },
         )
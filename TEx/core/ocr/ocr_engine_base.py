@@ -19,3 +19,10 @@ class OcrEngineBase:
     @abc.abstractmethod
     def run(self, file_path: str) -> Optional[str]:
         """Extract Text from Image."""
+
+    async def run_async(self, file_path: str) -> Optional[str]:
+        """Extract Text from Image without Blocking the Event Loop. Engines with Expensive Processing Must Override."""
+        return self.run(file_path=file_path)
+
+    def shutdown(self) -> None:
+        """Release all Engine Resources."""
@@ -1,9 +1,12 @@
 """Tesseract OCR Engine."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from configparser import SectionProxy
+from multiprocessing import cpu_count
 from typing import Optional, cast
 
 from pytesseract import pytesseract as tesseract
@@ -13,6 +16,12 @@ from TEx.core.ocr.ocr_engine_base import OcrEngineBase
 logger = logging.getLogger('TelegramExplorer')
 
 
+def _image_to_string(cmd: str, file_path: str, language: str, timeout_seconds: int) -> str:
+    """Run Tesseract. Module Level Function to Allow the Execution on Process Pool Workers."""
+    tesseract.tesseract_cmd = cmd
+    return cast(str, tesseract.image_to_string(file_path, lang=language, timeout=timeout_seconds))
+
+
 class TesseractOcrEngine(OcrEngineBase):
     """Tesseract OCR Engine."""
 
@@ -21,6 +30,11 @@ class TesseractOcrEngine(OcrEngineBase):
         super().__init__()
         self.cmd: str = ''
         self.language: str = ''
+        self.process_pool_workers: int = 0
+        self.timeout_seconds: int = 0
+        self.max_in_flight: int = 0
+        self.executor: Optional[Executor] = None
+        self.in_flight_semaphore: Optional[asyncio.Semaphore] = None
 
     def configure(self, config: Optional[SectionProxy]) -> None:
         """Configure the Notifier."""
@@ -30,6 +44,14 @@ class TesseractOcrEngine(OcrEngineBase):
 
         self.cmd = config.get('tesseract_cmd', fallback='')
         self.language = config.get('language', fallback='eng')
+        self.process_pool_workers = int(config.get('process_pool_workers', fallback=str(cpu_count())))
+        self.timeout_seconds = int(config.get('timeout_seconds', fallback='30'))
+        self.max_in_flight = int(config.get('max_in_flight', fallback=str(max(1, self.process_pool_workers) * 2)))
+
+        # Check the Timeout (0 Disables it)
+        if self.timeout_seconds < 0:
+            error_msg_timeout: str = f'"timeout_seconds" setting must be 0 (no timeout) or greater, but is {self.timeout_seconds}'
+            raise AttributeError(error_msg_timeout)
 
         # Check if Tesseract CMD property are set
         if self.cmd == '':
@@ -57,3 +79,38 @@ class TesseractOcrEngine(OcrEngineBase):
             logger.exception(msg='OCR Fail', exc_info=ex)
 
             return ''
+
+    async def run_async(self, file_path: str) -> Optional[str]:
+        """Run Tesseract Engine on the Process Pool and Return Detected Text."""
+        if not os.path.exists(file_path):
+            return ''
+
+        # Lazy Create the Executor and In-Flight Control
+        if self.in_flight_semaphore is None:
+            self.in_flight_semaphore = asyncio.Semaphore(max(1, self.max_in_flight))
+            self.executor = ProcessPoolExecutor(max_workers=self.process_pool_workers) if self.process_pool_workers > 0 else None
+
+        async with self.in_flight_semaphore:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(
+                        self.executor, _image_to_string, self.cmd, file_path, self.language, self.timeout_seconds,
+                    ),
+                    timeout=self.timeout_seconds or None,
+                )
+
+            except asyncio.TimeoutError:
+                logger.warning(f'\t\t\tOCR Timeout ({self.timeout_seconds}s) for "{file_path}"')
+                return ''
+
+            except Exception as ex:
+                logger.exception(msg='OCR Fail', exc_info=ex)
+                return ''
+
+    def shutdown(self) -> None:
+        """Shutdown the Process Pool."""
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+        self.in_flight_semaphore = None
@@ -0,0 +1,68 @@
+"""Telegram Requests Rate Limiter."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class FloodWaitAwareRateLimiter:
+    """
+    Token Bucket Rate Limiter Shared Across Concurrent Telegram Requests.
+
+    When Telegram Asks to Wait (FloodWaitError), all Requests are Paused for the Requested Time and the Rate is
+    Halved. Each Successful Request Slowly Recovers the Rate up to the Configured Max Rate.
+    """
+
+    def __init__(self, max_rate_per_second: float, burst: int, min_rate_per_second: float = 0.05, recovery_step: float = 0.01) -> None:
+        """Initialize the Rate Limiter."""
+        self.max_rate_per_second: float = max_rate_per_second
+        self.min_rate_per_second: float = min(min_rate_per_second, max_rate_per_second)
+        self.recovery_step: float = recovery_step
+        self.rate_per_second: float = max_rate_per_second
+        self.burst: int = max(1, burst)
+        self.tokens: float = float(self.burst)
+        self.last_refill: float = time.monotonic()
+        self.paused_until: float = 0.0
+        self.flood_waits: int = 0
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait Until a Request is Allowed."""
+        async with self.lock:
+            while True:
+                now: float = time.monotonic()
+
+                # Telegram Flood Wait Pause
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.__refill(now=now)
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate_per_second)
+
+    def report_success(self) -> None:
+        """Report a Successful Request, Slowly Recovering the Rate."""
+        self.rate_per_second = min(self.max_rate_per_second, self.rate_per_second + self.recovery_step)
+
+    def report_flood_wait(self, seconds: int) -> None:
+        """Report a Telegram FloodWaitError. Pause all Requests and Reduce the Rate."""
+        self.flood_waits += 1
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.rate_per_second = max(self.min_rate_per_second, self.rate_per_second / 2)
+        self.tokens = 0.0
+        self.last_refill = self.paused_until
+
+        logger.warning(f'\t\tTelegram Flood Wait of {seconds}s Received. Reducing Rate to {self.rate_per_second:.2f} Requests per Second')
+
+    def __refill(self, now: float) -> None:
+        """Refill the Bucket Tokens."""
+        self.tokens = min(float(self.burst), self.tokens + (now - self.last_refill) * self.rate_per_second)
+        self.last_refill = now
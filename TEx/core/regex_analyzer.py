@@ -0,0 +1,101 @@
+"""Regex Analyzer."""
+from __future__ import annotations
+
+import re
+import sys
+from typing import Iterator, List, Optional, Tuple
+
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+else:
+    import sre_parse
+
+
+class RegexAnalyzer:
+    """
+    Inspect the Parsed Structure of Regex Patterns.
+
+    Used to Build Cheap Prefilters (FTS5 Queries, Substring Automatons, Combined Alternations) that Always Return a
+    Superset of the Regex Matches.
+    """
+
+    @staticmethod
+    def required_literals(pattern: str) -> Optional[List[str]]:
+        """
+        Return the Literal Sequences Required by the Regex.
+
+        Only Mandatory Sequences are Returned, so Optional, Repeated, Branched and Lookaround Content is Ignored.
+
+        :param pattern: Regex Pattern
+        :return: List of Literals (Possibly Empty) or None if the Pattern is Invalid
+        """
+        try:
+            parsed: sre_parse.SubPattern = sre_parse.parse(pattern)
+        except re.error:
+            return None
+
+        return RegexAnalyzer.__required_literals(items=list(parsed))
+
+    @staticmethod
+    def __required_literals(items: List[Tuple]) -> List[str]:
+        """Return the Literal Sequences that Must Appear in Every Match of a Parsed Regex Sequence."""
+        h_result: List[str] = []
+        current: str = ''
+
+        for op_code, value in items:
+
+            if op_code == sre_parse.LITERAL:
+                current += chr(value)
+                continue
+
+            # Any Other Node Breaks the Current Sequence
+            h_result.append(current)
+            current = ''
+
+            # Groups are Mandatory, so its Content is Required too
+            if op_code == sre_parse.SUBPATTERN:
+                h_result.extend(RegexAnalyzer.__required_literals(items=list(value[-1])))
+
+        h_result.append(current)
+
+        return [item for item in h_result if item]
+
+    @staticmethod
+    def has_group_references(pattern: str) -> bool:
+        """
+        Check if the Regex Refers to its own Groups (Backreferences or Conditionals).
+
+        Such Patterns can not be Merged into a Larger Regex, as the Group Numbers would Change.
+
+        :param pattern: Regex Pattern
+        :return: True if the Pattern has Group References or is Invalid
+        """
+        try:
+            parsed: sre_parse.SubPattern = sre_parse.parse(pattern)
+        except re.error:
+            return True
+
+        return RegexAnalyzer.__has_group_references(items=list(parsed))
+
+    @staticmethod
+    def __has_group_references(items: List[Tuple]) -> bool:
+        """Check if a Parsed Regex Sequence, or any Nested Sequence, has Group References."""
+        for op_code, value in items:
+
+            if op_code in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS):
+                return True
+
+            if any(RegexAnalyzer.__has_group_references(items=list(child)) for child in RegexAnalyzer.__nested_sequences(value=value)):
+                return True
+
+        return False
+
+    @staticmethod
+    def __nested_sequences(value: object) -> Iterator[sre_parse.SubPattern]:
+        """Yield the Parsed Sequences Nested into a Node Value."""
+        if isinstance(value, sre_parse.SubPattern):
+            yield value
+
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                yield from RegexAnalyzer.__nested_sequences(value=item)
@@ -0,0 +1,139 @@
+"""Staged, Queue-Backed Processing Pipeline."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger('TelegramExplorer')
+
+T = TypeVar('T')
+
+
+class PipelineStage(Generic[T]):
+    """Single Pipeline Stage with Bounded Queue and Workers Pool."""
+
+    def __init__(self, name: str, handler: Callable[[T], Awaitable[Optional[T]]], workers: int) -> None:
+        """Initialize the Stage."""
+        self.name: str = name
+        self.handler: Callable[[T], Awaitable[Optional[T]]] = handler
+        self.workers: int = max(1, workers)
+        self.queue: asyncio.Queue
+        self.tasks: List[asyncio.Task] = []
+        self.processed: int = 0
+        self.failed: int = 0
+
+
+class StagedPipeline(Generic[T]):
+    """
+    Multi Stage asyncio Pipeline.
+
+    Each Stage have its own Bounded Queue and Workers Pool. Items Returned by a Stage Handler are Forwarded to
+    the Next Stage, Returning None Stops the Item Processing. As all Queues are Bounded, a Slow Stage
+    Propagates Backpressure up to the Producer.
+    """
+
+    def __init__(self, name: str, queue_max_size: int) -> None:
+        """Initialize the Pipeline."""
+        self.name: str = name
+        self.queue_max_size: int = queue_max_size
+        self.stages: List[PipelineStage[T]] = []
+        self.is_running: bool = False
+
+    def add_stage(self, name: str, handler: Callable[[T], Awaitable[Optional[T]]], workers: int = 1) -> None:
+        """Register a New Stage at the End of the Pipeline."""
+        if self.is_running:
+            error_msg: str = 'Unable to Add Stages into a Running Pipeline'
+            raise AttributeError(error_msg)
+
+        self.stages.append(PipelineStage(name=name, handler=handler, workers=workers))
+
+    def start(self) -> None:
+        """Create the Queues and Start all Stage Workers."""
+        if self.is_running:
+            return
+
+        for ix, stage in enumerate(self.stages):
+            stage.queue = asyncio.Queue(maxsize=self.queue_max_size)
+            stage.tasks = [
+                asyncio.create_task(self.__worker(stage_ix=ix), name=f'{self.name}.{stage.name}.{worker_ix}')
+                for worker_ix in range(stage.workers)
+            ]
+
+        self.is_running = True
+
+    async def put(self, item: T) -> None:
+        """Enqueue one Item into the First Stage. Waits if the Queue is Full (Backpressure)."""
+        if not self.is_running:
+            error_msg: str = f'Pipeline "{self.name}" is not Running'
+            raise AttributeError(error_msg)
+
+        await self.stages[0].queue.put(item)
+
+    def pending(self) -> int:
+        """Return the Number of Items Waiting in all Stage Queues."""
+        if not self.is_running:
+            return 0
+
+        return sum(stage.queue.qsize() for stage in self.stages)
+
+    async def drain(self, timeout_seconds: float) -> bool:
+        """
+        Wait all Enqueued Items to be Processed and Stop the Workers.
+
+        :param timeout_seconds: Max Time to Wait
+        :return: True if all Items was Processed, False if Timeout was Reached
+        """
+        if not self.is_running:
+            return True
+
+        drained: bool = True
+        try:
+            await asyncio.wait_for(self.__join_all(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f'\t\tPipeline "{self.name}" Drain Timeout Reached. {self.pending()} Items Discarded.')
+            drained = False
+
+        await self.stop()
+        return drained
+
+    async def stop(self) -> None:
+        """Cancel all Workers Immediately."""
+        all_tasks: List[asyncio.Task] = [task for stage in self.stages for task in stage.tasks]
+
+        for task in all_tasks:
+            task.cancel()
+
+        await asyncio.gather(*all_tasks, return_exceptions=True)
+
+        for stage in self.stages:
+            stage.tasks = []
+
+        self.is_running = False
+
+    async def __join_all(self) -> None:
+        """Join all Queues in Stage Order."""
+        for stage in self.stages:
+            await stage.queue.join()
+
+    async def __worker(self, stage_ix: int) -> None:
+        """Stage Worker Loop."""
+        stage: PipelineStage[T] = self.stages[stage_ix]
+        next_stage: Optional[PipelineStage[T]] = self.stages[stage_ix + 1] if stage_ix + 1 < len(self.stages) else None
+
+        while True:
+            item: T = await stage.queue.get()
+
+            try:
+                result: Optional[T] = await stage.handler(item)
+                stage.processed += 1
+
+                if result is not None and next_stage is not None:
+                    await next_stage.queue.put(result)
+
+            except Exception:  # Yes, Catch All
+                stage.failed += 1
+                logger.exception(f'Unable to Process Item on "{self.name}.{stage.name}" Stage')
+
+            finally:
+                stage.queue.task_done()
@@ -1,4 +1,9 @@
 """TEx Database Initializer."""
+from __future__ import annotations
+
+from configparser import ConfigParser
+from typing import Optional
+
 from TEx.database.db_manager import DbManager
 from TEx.database.db_migration import DatabaseMigrator
 from TEx.models.database.telegram_db_model import TelegramDataBaseDeclarativeBase
@@ -9,10 +14,13 @@ class DbInitializer:
     """Central Database Initializer."""
 
     @staticmethod
-    def init(data_path: str) -> None:
+    def init(data_path: str, config: Optional[ConfigParser] = None) -> None:
         """Initialize DB and Structure."""
         # Initialize Main DB
-        DbManager.init_db(data_path=data_path)
+        DbManager.init_db(data_path=data_path, config=config)
+
+        # Switch Journal Mode (WAL by Default)
+        DbManager.apply_journal_mode()
 
         # Initialize Main DB
         TempDataBaseDeclarativeBase.metadata.create_all(DbManager.SQLALCHEMY_BINDS['temp'], checkfirst=True)
@@ -1,13 +1,20 @@
 """Database Manager."""
+from __future__ import annotations
 
+import logging
 import os
+import sqlite3
+from configparser import ConfigParser
 from sqlite3 import Connection
+from typing import Dict, List, Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.event import listen
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import _ConnectionRecord
 
+logger = logging.getLogger('TelegramExplorer')
+
 
 class DbManager:
     """Main Database Manager."""
@@ -15,9 +22,27 @@ class DbManager:
     SQLALCHEMY_BINDS = {}  # type:ignore
     SESSIONS = {}  # type:ignore
 
+    DEFAULT_SETTINGS: Dict[str, str] = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': '268435456',
+        'cache_size': '-65536',
+        'temp_store': 'MEMORY',
+        'read_page_size': '1000',
+        }
+    ALLOWED_VALUES: Dict[str, List[str]] = {
+        'journal_mode': ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'],
+        'synchronous': ['OFF', 'NORMAL', 'FULL', 'EXTRA'],
+        'temp_store': ['DEFAULT', 'FILE', 'MEMORY'],
+        }
+    SETTINGS: Dict[str, str] = {}
+
     @staticmethod
-    def init_db(data_path: str) -> None:
+    def init_db(data_path: str, config: Optional[ConfigParser] = None) -> None:
         """Initialize the DB Connection."""
+        DbManager.SETTINGS = DbManager.__load_settings(config=config)
+        data_file: str = os.path.abspath(os.path.join(data_path, 'data_local.db'))
+
         DbManager.SQLALCHEMY_BINDS = {
             'temp': create_engine(
                 f'sqlite:///{os.path.join(data_path, "temp_local.db")}?nolock=1&check_same_thread=false',
@@ -29,18 +54,98 @@ class DbManager:
                 connect_args={'check_same_thread': False, 'timeout': 120},
                 echo=False, logging_name='sqlalchemy',
                 ),
+            'data_read_only': create_engine(
+                f'sqlite:///file:{data_file}?mode=ro&uri=true',
+                connect_args={'check_same_thread': False, 'timeout': 120},
+                echo=False, logging_name='sqlalchemy',
+                ),
             }
 
         DbManager.SESSIONS = {
             'temp': sessionmaker(autocommit=False, autoflush=True, bind=DbManager.SQLALCHEMY_BINDS['temp'])(),
             'data': sessionmaker(autocommit=False, autoflush=True, bind=DbManager.SQLALCHEMY_BINDS['data'])(),
+            'data_read_only': sessionmaker(autocommit=False, autoflush=False, bind=DbManager.SQLALCHEMY_BINDS['data_read_only'])(),
             }
 
         listen(DbManager.SQLALCHEMY_BINDS['data'], 'connect', DbManager.do_connect)
+        listen(DbManager.SQLALCHEMY_BINDS['data_read_only'], 'connect', DbManager.do_connect_read_only)
 
     @staticmethod
     def do_connect(dbapi_connection: Connection, connection_record: _ConnectionRecord) -> None:
-        """Disable SQLLite Transaction auto Start."""
+        """Disable SQLLite Transaction auto Start and Apply the Performance Pragmas."""
         # disable pysqlite's emitting of the BEGIN statement entirely.
         # also stops it from emitting COMMIT before any DDL.
         dbapi_connection.isolation_level = None
+
+        DbManager.__apply_pragmas(dbapi_connection=dbapi_connection, names=['synchronous', 'mmap_size', 'cache_size', 'temp_store'])
+
+    @staticmethod
+    def do_connect_read_only(dbapi_connection: Connection, connection_record: _ConnectionRecord) -> None:
+        """Configure the Read Only Connections, Used by Reports, to Never Write or Hold Write Locks."""
+        dbapi_connection.isolation_level = None
+
+        DbManager.__apply_pragmas(dbapi_connection=dbapi_connection, names=['mmap_size', 'cache_size', 'temp_store'])
+        dbapi_connection.execute('PRAGMA query_only=ON')
+
+    @staticmethod
+    def apply_journal_mode() -> None:
+        """
+        Switch the Data DB to the Configured Journal Mode.
+
+        The Journal Mode is Persisted into the DB File, so Existing Databases are Switched Once. If the DB is
+        Locked by Another Process, the Current Mode is Kept and the Switch is Retried on the Next Execution.
+        """
+        target_mode: str = DbManager.SETTINGS['journal_mode'].lower()
+
+        with DbManager.SQLALCHEMY_BINDS['data'].connect() as connection:
+            dbapi_connection: Connection = connection.connection.dbapi_connection
+            current_mode: str = str(dbapi_connection.execute('PRAGMA journal_mode').fetchone()[0]).lower()
+
+            if current_mode == target_mode:
+                return
+
+            logger.info(f'\t[*] SWITCHING DB (data) JOURNAL MODE FROM {current_mode.upper()} TO {target_mode.upper()}')
+
+            try:
+                new_mode: str = str(dbapi_connection.execute(f'PRAGMA journal_mode={target_mode}').fetchone()[0]).lower()
+            except sqlite3.OperationalError as ex:
+                logger.warning(f'\t[*] Unable to Switch DB (data) Journal Mode: {ex}')
+                return
+
+            if new_mode != target_mode:
+                logger.warning(f'\t[*] Unable to Switch DB (data) Journal Mode. Current Mode is {new_mode.upper()}')
+
+    @staticmethod
+    def get_page_size(page_size: Optional[int] = None) -> int:
+        """Return the Page Size Used by the Keyset Paginated Queries."""
+        return max(1, page_size if page_size else int(DbManager.SETTINGS.get('read_page_size', DbManager.DEFAULT_SETTINGS['read_page_size'])))
+
+    @staticmethod
+    def __apply_pragmas(dbapi_connection: Connection, names: List[str]) -> None:
+        """Apply the Configured Pragmas into a New Connection."""
+        for name in names:
+            dbapi_connection.execute(f'PRAGMA {name}={DbManager.SETTINGS[name]}')
+
+    @staticmethod
+    def __load_settings(config: Optional[ConfigParser]) -> Dict[str, str]:
+        """Load and Validate the [DATABASE] Pragma and Paging Settings."""
+        settings: Dict[str, str] = dict(DbManager.DEFAULT_SETTINGS)
+
+        if config is None or not config.has_section('DATABASE'):
+            return settings
+
+        for name in settings:
+            value: str = config['DATABASE'].get(name, fallback=settings[name]).strip().upper()
+
+            if name in DbManager.ALLOWED_VALUES:
+                if value not in DbManager.ALLOWED_VALUES[name]:
+                    error_msg: str = f'Invalid [DATABASE] "{name}" value "{value}". Allowed values are: {", ".join(DbManager.ALLOWED_VALUES[name])}'
+                    raise AttributeError(error_msg)
+
+            elif not value.lstrip('-').isdigit():
+                error_msg = f'Invalid [DATABASE] "{name}" value "{value}". Must be an integer'
+                raise AttributeError(error_msg)
+
+            settings[name] = value
+
+        return settings
@@ -7,6 +7,7 @@ import sqlalchemy
 from sqlalchemy import Index, MetaData, Table
 
 from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramMessageSearchDatabaseManager
 from TEx.models.database.telegram_db_model import TelegramMediaOrmEntity, TelegramMessageOrmEntity
 
 logger = logging.getLogger('TelegramExplorer')
@@ -48,6 +49,43 @@ class DatabaseMigrator:
             db_name=db_name,
         )
 
+        # ix_telegram_message_group_id_date_from_id - V0.3.1 - Covering Index for Messages and Active Users Count by Group and Time Window
+        DatabaseMigrator.__create_index(
+            metadata=meta,
+            table_name='telegram_message',
+            index_name='ix_telegram_message_group_id_date_from_id',
+            version='V0.3.1',
+            field_spec=(TelegramMessageOrmEntity.group_id, TelegramMessageOrmEntity.date_time, TelegramMessageOrmEntity.from_id),
+            db_name=db_name,
+        )
+
+        # ix_telegram_media_group_id_mime_type_date - V0.3.1 - Covering Index for Medias by Group, Mime-Type and Time Window
+        DatabaseMigrator.__create_index(
+            metadata=meta,
+            table_name='telegram_media',
+            index_name='ix_telegram_media_group_id_mime_type_date',
+            version='V0.3.1',
+            field_spec=(
+                TelegramMediaOrmEntity.group_id, TelegramMediaOrmEntity.mime_type, TelegramMediaOrmEntity.date_time,
+                TelegramMediaOrmEntity.size_bytes,
+                ),
+            db_name=db_name,
+        )
+
+        # telegram_message_fts - V0.3.1
+        DatabaseMigrator.__create_full_text_search_index(version='V0.3.1', db_name=db_name)
+
+    @staticmethod
+    def __create_full_text_search_index(version: str, db_name: str) -> None:
+        """Create the Messages Full Text Search Index."""
+        if TelegramMessageSearchDatabaseManager.exists():
+            return
+
+        logger.info(f'\t[*] APPLYING DB ({db_name}) MIGRATION ({version}) - {TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME}')
+
+        if TelegramMessageSearchDatabaseManager.create() and not TelegramMessageSearchDatabaseManager.is_ready():
+            logger.warning('\t[*] Existing Messages are not Indexed for Full Text Search. Run the "rebuild_search_index" Command to Index them')
+
     @staticmethod
     def __create_index(metadata: MetaData, table_name: str, index_name: str, version: str, field_spec: tuple,
                        db_name: str) -> None:
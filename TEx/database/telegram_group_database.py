@@ -2,27 +2,106 @@
 from __future__ import annotations
 
 import datetime
-from typing import Dict, List, Optional, cast
+import logging
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 import pytz
 import sqlalchemy.exc
 from cachetools import cached
-from sqlalchemy import delete, desc, insert, select, text, update
+from cachetools.keys import hashkey
+from sqlalchemy import case, delete, desc, insert, select, text, tuple_
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import ChunkedIteratorResult, CursorResult, Row
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import Delete, Select, distinct, or_
-from sqlalchemy.sql.elements import BinaryExpression
+from sqlalchemy.sql.elements import BinaryExpression, ColumnElement, TextClause
 from sqlalchemy.sql.expression import func
 
-from TEx.database import GROUPS_CACHE, USERS_CACHE
+from TEx.database import GROUPS_CACHE, USERS_CACHE, NoneSupportedTTLCache
 from TEx.database.db_manager import DbManager
 from TEx.models.database.telegram_db_model import (
     TelegramGroupOrmEntity,
+    TelegramGroupSyncStateOrmEntity,
     TelegramMediaOrmEntity,
     TelegramMessageOrmEntity,
+    TelegramSearchIndexStateOrmEntity,
     TelegramUserOrmEntity,
 )
 
+logger = logging.getLogger('TelegramExplorer')
+
+UPSERT_CHUNK_SIZE: int = 1000
+
+MESSAGE_ROW_COLUMNS: Tuple = (
+    TelegramMessageOrmEntity.id,
+    TelegramMessageOrmEntity.group_id,
+    TelegramMessageOrmEntity.media_id,
+    TelegramMessageOrmEntity.date_time,
+    TelegramMessageOrmEntity.message,
+    TelegramMessageOrmEntity.raw,
+    TelegramMessageOrmEntity.from_id,
+    TelegramMessageOrmEntity.from_type,
+    TelegramMessageOrmEntity.to_id,
+    TelegramMessageOrmEntity.is_reply,
+    TelegramMessageOrmEntity.reply_to_msg_id,
+    )
+"""Columns Returned by the Lightweight Message Rows"""
+
+
+def _pk_cache_key(pk: Optional[int]) -> Tuple:
+    """Build the same Cache Key for Positional and Keyword pk Calls."""
+    return cast(Tuple, hashkey(pk))
+
+
+def _bulk_upsert(entity_type: type[Union[TelegramGroupOrmEntity, TelegramUserOrmEntity]], entities_values: List[Dict], cache: NoneSupportedTTLCache) -> None:
+    """
+    Insert or Update a Set of Entities using INSERT ... ON CONFLICT(id) DO UPDATE in Chunks.
+
+    All Chunks Runs in a Single Transaction. Cached Entities Affected by the Upsert are Reloaded with a Single Query.
+    """
+    if len(entities_values) == 0:
+        return
+
+    # Rows with Different Set of Keys Needs Different Statements, as Missing Keys Must Keep the Current Values
+    rows_by_keys: Dict[Tuple[str, ...], List[Dict]] = {}
+    for entity_values in entities_values:
+        rows_by_keys.setdefault(tuple(sorted(entity_values.keys())), []).append(entity_values)
+
+    session: Session = DbManager.SESSIONS['data']
+
+    # The Connection Runs with Transaction auto Start Disabled, so Open it Explicitly to Avoid one Commit per Row
+    session.execute(text('BEGIN'))
+
+    try:
+        for keys, rows in rows_by_keys.items():
+            statement: SqliteInsert = sqlite_insert(entity_type)
+            update_columns: Dict = {key: statement.excluded[key] for key in keys if key != 'id'}
+            statement = statement.on_conflict_do_update(index_elements=['id'], set_=update_columns) if update_columns else statement.on_conflict_do_nothing(index_elements=['id'])
+
+            for chunk_start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                session.connection().execute(statement, rows[chunk_start:chunk_start + UPSERT_CHUNK_SIZE])
+
+        session.commit()
+
+    except Exception:
+        session.rollback()
+        raise
+
+    # Refresh Cached Entities in One Pass
+    cached_ids: List[int] = [entity_values['id'] for entity_values in entities_values if _pk_cache_key(entity_values['id']) in cache]
+
+    for chunk_start in range(0, len(cached_ids), UPSERT_CHUNK_SIZE):
+        entities: List[Union[TelegramGroupOrmEntity, TelegramUserOrmEntity]] = cast(
+            List[Union[TelegramGroupOrmEntity, TelegramUserOrmEntity]],
+            session.execute(
+                select(entity_type).where(entity_type.id.in_(cached_ids[chunk_start:chunk_start + UPSERT_CHUNK_SIZE])),
+                ).scalars().all(),
+            )
+
+        for entity in entities:
+            cache[_pk_cache_key(entity.id)] = entity
+
 
 class TelegramGroupDatabaseManager:
     """Telegram Group Database Manager."""
@@ -32,15 +111,15 @@ class TelegramGroupDatabaseManager:
         """Retrieve all Groups using the Source Phone Number."""
         return cast(
             List[TelegramGroupOrmEntity],
-            DbManager.SESSIONS['data'].execute(
+            DbManager.SESSIONS['data_read_only'].execute(
                 select(TelegramGroupOrmEntity)
                 .where(TelegramGroupOrmEntity.source == phone_number),
                 ).scalars().all(),
             )
 
     @staticmethod
-    @cached(cache=GROUPS_CACHE)
-    def get_by_id(pk: str) -> Optional[TelegramGroupOrmEntity]:
+    @cached(cache=GROUPS_CACHE, key=_pk_cache_key)
+    def get_by_id(pk: int) -> Optional[TelegramGroupOrmEntity]:
         """Retrieve one TelegramGroupOrmEntity by PK."""
         return cast(
             Optional[TelegramGroupOrmEntity],
@@ -50,36 +129,28 @@ class TelegramGroupDatabaseManager:
     @staticmethod
     def insert_or_update(entity_values: Dict) -> None:
         """Insert or Update one Telegram Group."""
-        is_update: bool = True
-        entity: Optional[TelegramGroupOrmEntity] = TelegramGroupDatabaseManager.get_by_id(entity_values['id'])
-        if entity is None:
-            entity = TelegramGroupOrmEntity(id=entity_values['id'])
-            is_update = False
+        TelegramGroupDatabaseManager.insert_or_update_batch([entity_values])
 
-        cursor: CursorResult
-
-        if is_update:
-            cursor = DbManager.SESSIONS['data'].execute(
-                update(TelegramGroupOrmEntity).
-                where(TelegramGroupOrmEntity.id == entity_values['id']).
-                values(entity_values),
-                )
-        else:
-            cursor = DbManager.SESSIONS['data'].execute(
-                insert(TelegramGroupOrmEntity).
-                values(entity_values),
-                )
+    @staticmethod
+    def insert_or_update_batch(values: Optional[List[Dict]]) -> None:
+        """Insert or Update a Set of Telegram Groups."""
+        if values is None:
+            return
 
-        DbManager.SESSIONS['data'].commit()
-        cursor.close()
+        _bulk_upsert(entity_type=TelegramGroupOrmEntity, entities_values=values, cache=GROUPS_CACHE)
 
 
 class TelegramMessageDatabaseManager:
     """Telegram Message Database Manager."""
 
     @staticmethod
-    def get_all_messages_from_group(group_id: int, order_by_desc: bool = False, message_datetime_limit_seconds: Optional[int] = None) -> List[TelegramMessageOrmEntity]:
-        """Return all Messages from a Single Group."""
+    def get_all_messages_from_group(group_id: int, order_by_desc: bool = False, message_datetime_limit_seconds: Optional[int] = None,
+                                    full_text_query: Optional[str] = None) -> List[TelegramMessageOrmEntity]:
+        """
+        Return all Messages from a Single Group.
+
+        :param full_text_query: Optional FTS5 Query. If Set, Return Only the Messages that Match the Query
+        """
         select_statement: Select = select(TelegramMessageOrmEntity).where(TelegramMessageOrmEntity.group_id == group_id)
 
         if message_datetime_limit_seconds:
@@ -87,14 +158,63 @@ class TelegramMessageDatabaseManager:
                 TelegramMessageOrmEntity.date_time >= (datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(seconds=message_datetime_limit_seconds)),
                 )
 
+        if full_text_query:
+            select_statement = select_statement.where(TelegramMessageSearchDatabaseManager.build_match_clause(full_text_query=full_text_query))
+
         if order_by_desc:
             select_statement = select_statement.order_by(desc('date_time'))
 
         return cast(
             List[TelegramMessageOrmEntity],
-            DbManager.SESSIONS['data'].execute(select_statement).scalars().all(),
+            DbManager.SESSIONS['data_read_only'].execute(select_statement).scalars().all(),
             )
 
+    @staticmethod
+    def iterate_messages_from_group(group_id: int, order_by_desc: bool = False, message_datetime_limit_seconds: Optional[int] = None,
+                                    full_text_query: Optional[str] = None, page_size: Optional[int] = None) -> Iterator[Row]:
+        """
+        Iterate all Messages from a Single Group, Ordered by Date/Time and Paginated by the (group_id, date_time, id) Keyset.
+
+        Each Page is Loaded by a new Query that Starts After the Last Row of the Previous Page, so the Memory Usage
+        does not Depends on the Group Size. Rows are Lightweight Named Tuples with the MESSAGE_ROW_COLUMNS, not ORM Entities.
+
+        :param full_text_query: Optional FTS5 Query. If Set, Return Only the Messages that Match the Query
+        :param page_size: Number of Messages per Page. Default: [DATABASE] read_page_size
+        """
+        limit: int = DbManager.get_page_size(page_size=page_size)
+        base_statement: Select = select(*MESSAGE_ROW_COLUMNS).where(TelegramMessageOrmEntity.group_id == group_id)
+
+        if message_datetime_limit_seconds:
+            base_statement = base_statement.where(
+                TelegramMessageOrmEntity.date_time >= (datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(seconds=message_datetime_limit_seconds)),
+                )
+
+        if full_text_query:
+            base_statement = base_statement.where(TelegramMessageSearchDatabaseManager.build_match_clause(full_text_query=full_text_query))
+
+        if order_by_desc:
+            base_statement = base_statement.order_by(desc(TelegramMessageOrmEntity.date_time), desc(TelegramMessageOrmEntity.id))
+        else:
+            base_statement = base_statement.order_by(TelegramMessageOrmEntity.date_time, TelegramMessageOrmEntity.id)
+
+        base_statement = base_statement.limit(limit)
+        keyset: Optional[ColumnElement[bool]] = None
+
+        while True:
+            rows: Sequence[Row] = DbManager.SESSIONS['data_read_only'].execute(
+                base_statement.where(keyset) if keyset is not None else base_statement,
+                ).all()
+
+            yield from rows
+
+            if len(rows) < limit:
+                return
+
+            # Next Page Starts After the Last Row
+            last_key = tuple_(rows[-1].date_time, rows[-1].id)
+            current_key = tuple_(TelegramMessageOrmEntity.date_time, TelegramMessageOrmEntity.id)
+            keyset = current_key < last_key if order_by_desc else current_key > last_key
+
     @staticmethod
     def insert(entity_values: Dict) -> None:
         """Insert or Update one Telegram Message."""
@@ -113,23 +233,68 @@ class TelegramMessageDatabaseManager:
 
             raise
 
+    @staticmethod
+    def insert_batch(entities_values: List[Dict]) -> None:
+        """
+        Insert a Batch of Telegram Messages using a Single Transaction (Group Commit).
+
+        Already Existing Messages are Ignored. The Groups Sync State is Updated in the Same Transaction.
+        """
+        if len(entities_values) == 0:
+            return
+
+        # All Rows Must Have the Same Keys for the executemany
+        columns: List[str] = TelegramMessageOrmEntity.__table__.columns.keys()
+        rows_by_group: Dict[int, List[Dict]] = {}
+        for entity_values in entities_values:
+            rows_by_group.setdefault(entity_values['group_id'], []).append({column: entity_values.get(column) for column in columns})
+
+        session: Session = DbManager.SESSIONS['data']
+
+        # The Connection Runs with Transaction auto Start Disabled, so Open it Explicitly to Avoid one Commit per Row
+        session.execute(text('BEGIN'))
+
+        try:
+            for group_id, rows in rows_by_group.items():
+                cursor: CursorResult = session.connection().execute(
+                    insert(TelegramMessageOrmEntity).prefix_with('OR IGNORE'),
+                    rows,
+                    )
+
+                # Databases Created Before the Sync State Table May Already Have Newer Messages
+                last_row: Dict = max(rows, key=lambda row: int(row['id']))
+                last_message_id: int = last_row['id']
+                if TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=group_id) is None:
+                    last_message_id = max(last_message_id, TelegramMessageDatabaseManager.get_max_id_from_group(group_id=group_id) or 0)
+
+                TelegramGroupSyncStateDatabaseManager.update_from_batch(
+                    group_id=group_id,
+                    last_message_id=last_message_id,
+                    last_message_date_time=last_row['date_time'] if last_message_id == last_row['id'] else None,
+                    batch_messages=cursor.rowcount,
+                    )
+
+            session.commit()
+
+        except Exception:
+            session.rollback()
+            raise
+
     @staticmethod
     def get_max_id_from_group(group_id: int) -> Optional[int]:
         """Return the Maximum id from a Group (AKA: Last Offset)."""
-        row: Optional[Row] = DbManager.SESSIONS['data'].execute(
-            select(TelegramMessageOrmEntity)
-            .where(TelegramMessageOrmEntity.group_id == group_id)
-            .order_by(desc('id'))
-            .limit(1),
-            ).one_or_none()
-
-        if row is None:
+        max_id: Optional[int] = DbManager.SESSIONS['data'].execute(
+            select(func.max(TelegramMessageOrmEntity.id))
+            .where(TelegramMessageOrmEntity.group_id == group_id),
+            ).scalar()
+
+        if max_id is None:
             return None
 
-        return int(row[0].id)
+        return int(max_id)
 
     @staticmethod
-    def count_messages_from_group(group_id: int, message_datetime_limit_seconds: Optional[int] = None) -> int:
+    def count_messages_from_group(group_id: int, message_datetime_limit_seconds: Optional[int] = None, full_text_query: Optional[str] = None) -> int:
         """Count all Messages from a Single Group."""
         select_statement: Select = select(TelegramMessageOrmEntity).where(TelegramMessageOrmEntity.group_id == group_id)
 
@@ -138,9 +303,12 @@ class TelegramMessageDatabaseManager:
                 TelegramMessageOrmEntity.date_time >= (datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(seconds=message_datetime_limit_seconds)),
                 )
 
+        if full_text_query:
+            select_statement = select_statement.where(TelegramMessageSearchDatabaseManager.build_match_clause(full_text_query=full_text_query))
+
         select_statement = select_statement.with_only_columns(func.count())
 
-        return cast(int, DbManager.SESSIONS['data'].execute(select_statement).scalar())
+        return cast(int, DbManager.SESSIONS['data_read_only'].execute(select_statement).scalar())
 
     @staticmethod
     def count_active_users_from_group(group_id: int, message_datetime_limit_seconds: Optional[int] = None) -> int:
@@ -154,7 +322,7 @@ class TelegramMessageDatabaseManager:
 
         select_statement = select_statement.with_only_columns(func.count(distinct(TelegramMessageOrmEntity.from_id)))
 
-        return cast(int, DbManager.SESSIONS['data'].execute(select_statement).scalar())
+        return cast(int, DbManager.SESSIONS['data_read_only'].execute(select_statement).scalar())
 
     @staticmethod
     def count_active_users(message_datetime_limit_seconds: Optional[int] = None) -> int:
@@ -168,34 +336,226 @@ class TelegramMessageDatabaseManager:
 
         select_statement = select_statement.with_only_columns(func.count(distinct(TelegramMessageOrmEntity.from_id)))
 
-        return cast(int, DbManager.SESSIONS['data'].execute(select_statement).scalar())
+        return cast(int, DbManager.SESSIONS['data_read_only'].execute(select_statement).scalar())
 
     @staticmethod
-    def remove_all_messages_by_age(group_id: int, limit_days: int) -> int:
+    def remove_all_messages_by_age(group_id: int, limit_days: int, page_size: Optional[int] = None) -> int:
         """
         Remove all Messages older that Age in Seconds.
 
+        The Messages are Removed in Pages, each one on its own Transaction, to Keep the WAL File and the Write Lock Short.
+
         :param group_id: Target Group ID
         :param limit_days: Age of Messages in Days
+        :param page_size: Number of Messages Removed per Transaction. Default: [DATABASE] read_page_size
         :return: Number of Messages Removed
         """
-        statement: Delete = delete(TelegramMessageOrmEntity)\
+        limit: int = DbManager.get_page_size(page_size=page_size)
+        page_statement: Select = select(TelegramMessageOrmEntity.id)\
             .where(TelegramMessageOrmEntity.group_id == group_id)\
             .where(
                 TelegramMessageOrmEntity.date_time <= (datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(days=limit_days)),
-                )
+                )\
+            .order_by(TelegramMessageOrmEntity.date_time)\
+            .limit(limit)
+
+        statement: Delete = delete(TelegramMessageOrmEntity)\
+            .where(TelegramMessageOrmEntity.group_id == group_id)\
+            .where(TelegramMessageOrmEntity.id.in_(page_statement))
+
+        total_messages: int = 0
+
+        while True:
+            removed_messages: int = cast(int, DbManager.SESSIONS['data'].execute(statement).rowcount)
+            DbManager.SESSIONS['data'].commit()
+
+            total_messages += removed_messages
+
+            if removed_messages < limit:
+                return total_messages
+
+
+class TelegramMessageSearchDatabaseManager:
+    """
+    Telegram Messages Full Text Search (FTS5) Database Manager.
+
+    The Index is an External Content FTS5 Table over telegram_message.raw, Kept in Sync by Triggers. The Trigram
+    Tokenizer Allows Case Insensitive Substring Searches, the Same Semantics Used by the Reports.
+    """
 
-        total_messages: int = cast(int, DbManager.SESSIONS['data'].execute(statement).rowcount)
+    FTS_TABLE_NAME: str = 'telegram_message_fts'
+
+    @staticmethod
+    def exists() -> bool:
+        """Check if the Full Text Search Table Exists."""
+        return DbManager.SESSIONS['data'].execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME},
+            ).first() is not None
+
+    @staticmethod
+    def create() -> bool:
+        """
+        Create the Full Text Search Table and the Sync Triggers.
+
+        :return: False if the SQLite Build has no FTS5 (or Trigram Tokenizer) Support
+        """
+        session: Session = DbManager.SESSIONS['data']
+        try:
+            session.execute(text(
+                "CREATE VIRTUAL TABLE telegram_message_fts USING fts5(raw, content='telegram_message', content_rowid='rowid', tokenize='trigram')",
+                ))
+        except sqlalchemy.exc.OperationalError as ex:
+            logger.warning(f'\t[*] Full Text Search not Available on this SQLite Build ({ex.orig}). Reports will Scan all Messages')
+            return False
+
+        # Existing Messages are Indexed Only by the Backfill (rebuild_search_index Command). Until there, the Sync
+        # Triggers are not Created, as Deleting a non Indexed Message from an External Content Table Corrupts the Index
+        has_messages: bool = session.execute(select(TelegramMessageOrmEntity.id).limit(1)).first() is not None
+
+        if not has_messages:
+            TelegramMessageSearchDatabaseManager.__create_triggers()
+
+        TelegramMessageSearchDatabaseManager.set_ready(is_ready=not has_messages)
+
+        return True
+
+    @staticmethod
+    def is_ready() -> bool:
+        """Check if the Full Text Search Index Exists and Contains all Messages."""
+        is_ready: Optional[bool] = DbManager.SESSIONS['data_read_only'].execute(
+            select(TelegramSearchIndexStateOrmEntity.is_ready)
+            .where(TelegramSearchIndexStateOrmEntity.index_name == TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME),
+            ).scalar()
+
+        return bool(is_ready)
+
+    @staticmethod
+    def set_ready(is_ready: bool) -> None:
+        """Set the Full Text Search Index State."""
+        statement: SqliteInsert = sqlite_insert(TelegramSearchIndexStateOrmEntity).values(
+            index_name=TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME,
+            is_ready=is_ready,
+            updated_at=datetime.datetime.now(tz=pytz.UTC),
+            )
+        statement = statement.on_conflict_do_update(
+            index_elements=['index_name'],
+            set_={'is_ready': statement.excluded.is_ready, 'updated_at': statement.excluded.updated_at},
+            )
+
+        DbManager.SESSIONS['data'].execute(statement)
         DbManager.SESSIONS['data'].commit()
 
-        return total_messages
+    @staticmethod
+    def rebuild() -> bool:
+        """
+        Rebuild the Full Text Search Index from all Stored Messages (Backfill).
+
+        :return: False if the Full Text Search Table does not Exists
+        """
+        if not TelegramMessageSearchDatabaseManager.exists():
+            return False
+
+        TelegramMessageSearchDatabaseManager.__create_triggers()
+        DbManager.SESSIONS['data'].execute(text("INSERT INTO telegram_message_fts(telegram_message_fts) VALUES ('rebuild')"))
+        DbManager.SESSIONS['data'].execute(text("INSERT INTO telegram_message_fts(telegram_message_fts) VALUES ('optimize')"))
+        TelegramMessageSearchDatabaseManager.set_ready(is_ready=True)
+
+        return True
+
+    @staticmethod
+    def __create_triggers() -> None:
+        """Create the Triggers that Keep the Full Text Search Index in Sync with telegram_message."""
+        session: Session = DbManager.SESSIONS['data']
+        session.execute(text(
+            'CREATE TRIGGER IF NOT EXISTS telegram_message_fts_ai AFTER INSERT ON telegram_message BEGIN '
+            'INSERT INTO telegram_message_fts(rowid, raw) VALUES (new.rowid, new.raw); END',
+            ))
+        session.execute(text(
+            'CREATE TRIGGER IF NOT EXISTS telegram_message_fts_ad AFTER DELETE ON telegram_message BEGIN '
+            "INSERT INTO telegram_message_fts(telegram_message_fts, rowid, raw) VALUES ('delete', old.rowid, old.raw); END",
+            ))
+        session.execute(text(
+            'CREATE TRIGGER IF NOT EXISTS telegram_message_fts_au AFTER UPDATE OF raw ON telegram_message BEGIN '
+            "INSERT INTO telegram_message_fts(telegram_message_fts, rowid, raw) VALUES ('delete', old.rowid, old.raw); "
+            'INSERT INTO telegram_message_fts(rowid, raw) VALUES (new.rowid, new.raw); END',
+            ))
+
+    @staticmethod
+    def build_match_clause(full_text_query: str) -> TextClause:
+        """Build the WHERE Clause that Restricts telegram_message to the Rows Matching the FTS5 Query."""
+        return text(
+            'telegram_message.rowid IN (SELECT rowid FROM telegram_message_fts WHERE telegram_message_fts MATCH :full_text_query)',
+            ).bindparams(full_text_query=full_text_query)
+
+
+class TelegramGroupSyncStateDatabaseManager:
+    """Telegram Group Synchronization State Database Manager."""
+
+    @staticmethod
+    def get_by_group_id(group_id: int) -> Optional[TelegramGroupSyncStateOrmEntity]:
+        """Retrieve the Sync State of one Group."""
+        return cast(
+            Optional[TelegramGroupSyncStateOrmEntity],
+            DbManager.SESSIONS['data'].get(TelegramGroupSyncStateOrmEntity, group_id),
+            )
+
+    @staticmethod
+    def get_all() -> List[TelegramGroupSyncStateOrmEntity]:
+        """Retrieve the Sync State of all Groups."""
+        return cast(
+            List[TelegramGroupSyncStateOrmEntity],
+            DbManager.SESSIONS['data'].execute(select(TelegramGroupSyncStateOrmEntity)).scalars().all(),
+            )
+
+    @staticmethod
+    def get_last_message_id(group_id: int) -> Optional[int]:
+        """
+        Return the Last Synced Message id from a Group (AKA: Last Offset).
+
+        Databases Created Before the Sync State Table Falls Back to the Messages Table.
+        """
+        entity: Optional[TelegramGroupSyncStateOrmEntity] = TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=group_id)
+
+        if entity is None:
+            return TelegramMessageDatabaseManager.get_max_id_from_group(group_id=group_id)
+
+        return entity.last_message_id
+
+    @staticmethod
+    def update_from_batch(group_id: int, last_message_id: int, last_message_date_time: Optional[datetime.datetime], batch_messages: int) -> None:
+        """Insert or Update the Sync State of one Group. Do not Commit, as Must Run in the Batch Transaction."""
+        statement: SqliteInsert = sqlite_insert(TelegramGroupSyncStateOrmEntity).values(
+            group_id=group_id,
+            last_message_id=last_message_id,
+            last_message_date_time=last_message_date_time,
+            last_sync_at=datetime.datetime.now(tz=pytz.UTC),
+            total_messages=batch_messages,
+            total_batches=1,
+            last_batch_messages=batch_messages,
+            )
+
+        is_newer: ColumnElement[bool] = statement.excluded.last_message_id > TelegramGroupSyncStateOrmEntity.last_message_id
+        statement = statement.on_conflict_do_update(
+            index_elements=['group_id'],
+            set_={
+                'last_message_id': case((is_newer, statement.excluded.last_message_id), else_=TelegramGroupSyncStateOrmEntity.last_message_id),
+                'last_message_date_time': case((is_newer, statement.excluded.last_message_date_time), else_=TelegramGroupSyncStateOrmEntity.last_message_date_time),
+                'last_sync_at': statement.excluded.last_sync_at,
+                'total_messages': TelegramGroupSyncStateOrmEntity.total_messages + statement.excluded.total_messages,
+                'total_batches': TelegramGroupSyncStateOrmEntity.total_batches + 1,
+                'last_batch_messages': statement.excluded.last_batch_messages,
+                },
+            )
+
+        DbManager.SESSIONS['data'].connection().execute(statement)
 
 
 class TelegramUserDatabaseManager:
     """Telegram User Database Manager."""
 
     @staticmethod
-    @cached(cache=USERS_CACHE)
+    @cached(cache=USERS_CACHE, key=_pk_cache_key)
     def get_by_id(pk: Optional[int]) -> Optional[TelegramUserOrmEntity]:
         """Retrieve one TelegramUserOrmEntity by PK."""
         if pk is None:
@@ -209,42 +569,15 @@ class TelegramUserDatabaseManager:
     @staticmethod
     def insert_or_update(values: Dict) -> None:
         """Insert or Update one Telegram User."""
-        TelegramUserDatabaseManager.__insert_or_update_single_entity(values)
-        DbManager.SESSIONS['data'].commit()
+        TelegramUserDatabaseManager.insert_or_update_batch([values])
 
     @staticmethod
     def insert_or_update_batch(values: Optional[List[Dict]]) -> None:
-        """Insert or Update one Telegram User."""
+        """Insert or Update a Set of Telegram Users."""
         if values is None:
             return
 
-        _ = [TelegramUserDatabaseManager.__insert_or_update_single_entity(item) for item in values]
-        DbManager.SESSIONS['data'].commit()
-
-    @staticmethod
-    def __insert_or_update_single_entity(entity_values: Dict) -> None:
-        """Insert or Update one Telegram User."""
-        is_update: bool = True
-        entity: Optional[TelegramUserOrmEntity] = TelegramUserDatabaseManager.get_by_id(entity_values['id'])
-        if entity is None:
-            entity = TelegramUserOrmEntity(id=entity_values['id'])
-            is_update = False
-
-        cursor: CursorResult
-
-        if is_update:
-            cursor = DbManager.SESSIONS['data'].execute(
-                update(TelegramUserOrmEntity).
-                where(TelegramUserOrmEntity.id == entity_values['id']).
-                values(entity_values),
-                )
-        else:
-            cursor = DbManager.SESSIONS['data'].execute(
-                insert(TelegramUserOrmEntity).
-                values(entity_values),
-                )
-
-        cursor.close()
+        _bulk_upsert(entity_type=TelegramUserOrmEntity, entities_values=values, cache=USERS_CACHE)
 
 
 class TelegramMediaDatabaseManager:
@@ -258,7 +591,7 @@ class TelegramMediaDatabaseManager:
 
         return cast(
             Optional[TelegramMediaOrmEntity],
-            DbManager.SESSIONS['data'].get(TelegramMediaOrmEntity, pk),
+            DbManager.SESSIONS['data_read_only'].get(TelegramMediaOrmEntity, pk),
             )
 
     @staticmethod
@@ -307,7 +640,7 @@ class TelegramMediaDatabaseManager:
 
             select_statement = select_statement.where(or_(*parts_or_filter))
 
-        return DbManager.SESSIONS['data'].execute(select_statement)  # type: ignore
+        return DbManager.SESSIONS['data_read_only'].execute(select_statement)  # type: ignore
 
     @staticmethod
     def stats_all_medias_from_group_by_mimetype(group_id: int, file_datetime_limit_seconds: Optional[int] = None) -> Dict:
@@ -336,7 +669,7 @@ class TelegramMediaDatabaseManager:
         select_statement = select_statement.group_by(TelegramMediaOrmEntity.mime_type)
         select_statement = select_statement.group_by(TelegramMediaOrmEntity.group_id == group_id)
 
-        medias: ChunkedIteratorResult = DbManager.SESSIONS['data'].execute(select_statement).all()
+        medias: ChunkedIteratorResult = DbManager.SESSIONS['data_read_only'].execute(select_statement).all()
 
         h_result: Dict = {}
 
@@ -363,9 +696,42 @@ class TelegramMediaDatabaseManager:
 
         return cast(
             List[TelegramMediaOrmEntity],
-            DbManager.SESSIONS['data'].execute(statement).scalars().all(),
+            DbManager.SESSIONS['data_read_only'].execute(statement).scalars().all(),
             )
 
+    @staticmethod
+    def iterate_medias_by_age(group_id: int, media_limit_days: int, page_size: Optional[int] = None) -> Iterator[Row]:
+        """
+        Iterate all Medias older that Age in Days, Paginated by id Keyset.
+
+        Rows are Lightweight Named Tuples (id, group_id, file_name), not ORM Entities.
+
+        :param group_id: Target Group ID
+        :param media_limit_days: Age of Media in Days
+        :param page_size: Number of Medias per Page. Default: [DATABASE] read_page_size
+        """
+        limit: int = DbManager.get_page_size(page_size=page_size)
+        base_statement: Select = select(TelegramMediaOrmEntity.id, TelegramMediaOrmEntity.group_id, TelegramMediaOrmEntity.file_name)\
+            .where(TelegramMediaOrmEntity.group_id == group_id)\
+            .where(
+                TelegramMediaOrmEntity.date_time <= (datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(days=media_limit_days)),
+                )\
+            .order_by(TelegramMediaOrmEntity.id)\
+            .limit(limit)
+        last_id: Optional[int] = None
+
+        while True:
+            rows: Sequence[Row] = DbManager.SESSIONS['data_read_only'].execute(
+                base_statement.where(TelegramMediaOrmEntity.id > last_id) if last_id is not None else base_statement,
+                ).all()
+
+            yield from rows
+
+            if len(rows) < limit:
+                return
+
+            last_id = rows[-1].id
+
     @staticmethod
     def delete_media_by_id(media_id: int) -> None:
         """
@@ -389,3 +755,6 @@ class TelegramMediaDatabaseManager:
         :return: Number of Medias Removed
         """
         DbManager.SESSIONS['data'].execute(text('vacuum'))
+
+        # VACUUM may Change the telegram_message ROWIDs, Used as Keys by the Full Text Search Index
+        TelegramMessageSearchDatabaseManager.rebuild()
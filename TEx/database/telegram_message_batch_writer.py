@@ -0,0 +1,119 @@
+"""Telegram Message Batch Writer."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from configparser import ConfigParser, SectionProxy
+from typing import Dict, List, Optional
+
+from TEx.database.telegram_group_database import TelegramMessageDatabaseManager
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class TelegramMessageBatchWriter:
+    """
+    Buffer Telegram Messages and Write them into DB in Batches (Group Commit).
+
+    The Buffer is Flushed when it Reaches the Max Batch Size or when the Oldest Buffered Message Exceeds the Max Delay.
+    When the Write Fails (Ex: Database Locked), the Messages are Kept on the Buffer and Written by the Next Flush. The
+    Kept Messages are Capped to a Few Batches, Dropping the Oldest Ones while the Database is Unavailable.
+    """
+
+    MAX_BUFFERED_BATCHES: int = 4
+
+    def __init__(self) -> None:
+        """Initialize the Writer."""
+        self.max_batch_size: int = 500
+        self.max_delay_ms: int = 200
+        self.buffer: List[Dict] = []
+        self.oldest_entry_time: float = 0.0
+        self.total_messages: int = 0
+        self.total_batches: int = 0
+        self.total_failed_batches: int = 0
+        self.total_dropped: int = 0
+        self.is_failing: bool = False
+
+    def configure(self, config: ConfigParser) -> None:
+        """Configure the Writer from the Optional [DATABASE] Section."""
+        database_config: Optional[SectionProxy] = config['DATABASE'] if config.has_section('DATABASE') else None
+
+        if database_config:
+            self.max_batch_size = max(1, int(database_config.get('write_batch_size', fallback='500')))
+            self.max_delay_ms = max(1, int(database_config.get('write_batch_max_delay_ms', fallback='200')))
+
+    def add(self, entity_values: Dict) -> None:
+        """
+        Add one Message into the Buffer and Flush if the Batch is Full or Expired.
+
+        Never Raises. While the Writes are Failing, the Messages are Only Buffered and the Retries are Left to the Next
+        Explicit Flush or to the Background Task.
+        """
+        if len(self.buffer) == 0:
+            self.oldest_entry_time = time.monotonic()
+
+        # Drop the Oldest Message if the Buffer is Full
+        if len(self.buffer) >= self.max_batch_size * TelegramMessageBatchWriter.MAX_BUFFERED_BATCHES:
+            del self.buffer[0]
+            self.total_dropped += 1
+
+            # Log Once per Dropped Batch
+            if (self.total_dropped - 1) % self.max_batch_size == 0:
+                logger.error(f'\t\tMessages Buffer is Full. {self.total_dropped} Messages Dropped')
+
+        self.buffer.append(entity_values)
+
+        if not self.is_failing and self.is_flush_due():
+            try:
+                self.flush()
+            except Exception:  # Yes, Catch All
+                logger.exception('Unable to Write Messages Batch')
+
+    def is_flush_due(self) -> bool:
+        """Check if the Buffer Must be Flushed."""
+        if len(self.buffer) == 0:
+            return False
+
+        if len(self.buffer) >= self.max_batch_size:
+            return True
+
+        return (time.monotonic() - self.oldest_entry_time) * 1000 >= self.max_delay_ms
+
+    def flush(self) -> int:
+        """
+        Write all Buffered Messages into DB.
+
+        :return: Number of Written Messages
+        """
+        if len(self.buffer) == 0:
+            return 0
+
+        batch: List[Dict] = self.buffer
+
+        try:
+            TelegramMessageDatabaseManager.insert_batch(batch)
+
+        except Exception:
+            # Keep the Buffer, so the Messages are Written by the Next Flush
+            self.total_failed_batches += 1
+            self.is_failing = True
+            raise
+
+        self.buffer = []
+        self.is_failing = False
+        self.total_messages += len(batch)
+        self.total_batches += 1
+
+        return len(batch)
+
+    async def auto_flush(self) -> None:
+        """Flush the Buffer when the Max Delay Expires. Must Run as a Background Task."""
+        while True:
+            await asyncio.sleep(self.max_delay_ms / 1000)
+
+            if self.is_flush_due():
+                try:
+                    self.flush()
+                except Exception:  # Yes, Catch All
+                    logger.exception('Unable to Write Messages Batch')
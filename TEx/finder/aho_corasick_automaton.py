@@ -0,0 +1,159 @@
+"""Aho-Corasick Multi Term Automaton."""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Set, Tuple
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick Automaton to Find any Number of Terms with a Single Linear Pass over the Text.
+
+    Each Term is Added with an Integer Value (Usually the Index of the Owner Object). After the Build, the Scan
+    Cost Depends only on the Text Size and on the Number of Matches, not on the Number of Terms.
+
+    To Support Watchlists with Hundreds of Thousands of Terms, all Transitions are Stored into a Single Flat Dict
+    Keyed by (State, Char Code), Instead of one Dict per State.
+    """
+
+    CHAR_BITS: int = 21  # Enough for any Unicode Code Point
+    CHAR_MASK: int = (1 << CHAR_BITS) - 1
+
+    def __init__(self) -> None:
+        """Initialize the Automaton with the Root State."""
+        self.transitions: Dict[int, int] = {}
+        self.depth: List[int] = [0]
+        self.fail: List[int] = [0]
+        self.term_values: Dict[int, Tuple[int, ...]] = {}
+        self.outputs: Dict[int, Tuple[int, ...]] = {}
+        self.is_built: bool = False
+
+    def __len__(self) -> int:
+        """Return the Number of States."""
+        return len(self.depth)
+
+    def add(self, term: str, value: int) -> None:
+        """
+        Add one Term into the Automaton.
+
+        :param term: Term to Find
+        :param value: Value Returned when the Term is Found
+        """
+        if not term:
+            error_msg: str = 'Unable to Add an Empty Term into the Automaton'
+            raise AttributeError(error_msg)
+
+        state: int = 0
+        for char in term:
+            key: int = (state << AhoCorasickAutomaton.CHAR_BITS) | ord(char)
+            next_state: int = self.transitions.get(key, -1)
+
+            if next_state == -1:
+                next_state = len(self.depth)
+                self.depth.append(self.depth[state] + 1)
+                self.fail.append(0)
+                self.transitions[key] = next_state
+
+            state = next_state
+
+        self.term_values[state] = self.term_values.get(state, ()) + (value,)
+        self.is_built = False
+
+    def build(self) -> None:
+        """Compute the Failure Links (in Depth Order) and Merge the Outputs of each State Suffixes."""
+        transitions: Dict[int, int] = self.transitions
+        fail: List[int] = self.fail
+        outputs: Dict[int, Tuple[int, ...]] = dict(self.term_values)
+        char_bits: int = AhoCorasickAutomaton.CHAR_BITS
+        char_mask: int = AhoCorasickAutomaton.CHAR_MASK
+
+        # Parents are Always Processed Before its Children
+        for key, next_state in sorted(transitions.items(), key=lambda item: self.depth[item[1]]):
+            state: int = key >> char_bits
+            char_code: int = key & char_mask
+            target: int = 0
+
+            if state != 0:
+                fallback: int = fail[state]
+                while True:
+                    target = transitions.get((fallback << char_bits) | char_code, -1)
+                    if target != -1:
+                        break
+                    if fallback == 0:
+                        target = 0
+                        break
+                    fallback = fail[fallback]
+
+            fail[next_state] = target
+
+            inherited: Tuple[int, ...] = outputs.get(target, ())
+            if inherited:
+                outputs[next_state] = outputs.get(next_state, ()) + inherited
+
+        self.outputs = outputs
+        self.is_built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Scan the Text and Yield all Matches, Including Overlapped Ones.
+
+        :param text: Text to Scan
+        :return: Iterator of (End Position (Exclusive), Term Value)
+        """
+        if not self.is_built:
+            self.build()
+
+        outputs: Dict[int, Tuple[int, ...]] = self.outputs
+
+        for position, state in enumerate(self.__iter_states(text=text), start=1):
+            if state in outputs:
+                for value in outputs[state]:
+                    yield position, value
+
+    def find_values(self, text: str) -> Set[int]:
+        """
+        Scan the Text and Return the Values of all Terms Found.
+
+        :param text: Text to Scan
+        :return: Set of Term Values
+        """
+        if not self.is_built:
+            self.build()
+
+        transitions: Dict[int, int] = self.transitions
+        fail: List[int] = self.fail
+        outputs: Dict[int, Tuple[int, ...]] = self.outputs
+        char_bits: int = AhoCorasickAutomaton.CHAR_BITS
+        h_result: Set[int] = set()
+        state: int = 0
+
+        # Same Loop of __iter_states, Inlined as this is the Hot Path of the Finder
+        for char_code in map(ord, text):
+            next_state: int = transitions.get((state << char_bits) | char_code, -1)
+
+            while next_state == -1 and state != 0:
+                state = fail[state]
+                next_state = transitions.get((state << char_bits) | char_code, -1)
+
+            state = next_state if next_state != -1 else 0
+
+            if state in outputs:
+                h_result.update(outputs[state])
+
+        return h_result
+
+    def __iter_states(self, text: str) -> Iterator[int]:
+        """Yield the Automaton State After each Char of the Text."""
+        transitions: Dict[int, int] = self.transitions
+        fail: List[int] = self.fail
+        char_bits: int = AhoCorasickAutomaton.CHAR_BITS
+        state: int = 0
+
+        for char_code in map(ord, text):
+            next_state: int = transitions.get((state << char_bits) | char_code, -1)
+
+            while next_state == -1 and state != 0:
+                state = fail[state]
+                next_state = transitions.get((state << char_bits) | char_code, -1)
+
+            state = next_state if next_state != -1 else 0
+            yield state
@@ -0,0 +1,144 @@
+"""Combined Regex Matcher for all Regex Finder Rules."""
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from TEx.core.regex_analyzer import RegexAnalyzer
+from TEx.finder.aho_corasick_automaton import AhoCorasickAutomaton
+from TEx.finder.finder_match_progress import FinderMatchProgress
+
+
+class CombinedRegexMatcher:
+    """
+    Match all Regex Finder Rules Against a Message with a Single Scan.
+
+    The Longest Literal Required by each Pattern is Added into one Aho-Corasick Automaton. Each Message is Case
+    Folded and Scanned Once, and only the Patterns whose Literal was Found are Confirmed with the Real Regex.
+
+    Patterns without Required Literals are Merged into one Alternation, Used to Skip them all when Nothing Matches.
+    Identical Patterns from Different Rules are Evaluated Only Once.
+    """
+
+    # Chars that re.IGNORECASE Considers Equal, but str.lower() Keeps Different
+    EXTRA_CASE_EQUIVALENCES: Tuple[str, ...] = (
+        'iı', 'sſ', 'µμ', 'ͅιι', 'ΐΐ', 'ΰΰ', 'βϐ',
+        'εϵ', 'θϑ', 'κϰ', 'πϖ', 'ρϱ', 'ςσ', 'φϕ',
+        'вᲀ', 'дᲁ', 'оᲂ', 'сᲃ', 'тᲄᲅ', 'ъᲆ',
+        'ѣᲇ', 'ꙋᲈ', 'ṡẛ', 'ﬅﬆ',
+        )
+
+    # str.lower() Expands the Capital I with Dot into 2 Chars, but re.IGNORECASE Maps it to a Plain "i"
+    PRE_FOLD_TABLE: Dict[int, str] = {0x130: 'i'}
+    FOLD_TABLE: Dict[int, str] = {
+        ord(char): min(equivalence) for equivalence in EXTRA_CASE_EQUIVALENCES for char in equivalence if char != min(equivalence)
+        }
+
+    def __init__(self) -> None:
+        """Initialize the Matcher."""
+        self.automaton: AhoCorasickAutomaton = AhoCorasickAutomaton()
+        self.patterns: List[re.Pattern] = []
+        self.pattern_rules: List[List[str]] = []
+        self.pattern_index: Dict[Tuple[str, int], int] = {}
+        self.unfiltered_patterns: List[int] = []
+        self.unfiltered_prefilter: Optional[re.Pattern] = None
+
+    def __len__(self) -> int:
+        """Return the Number of Distinct Patterns."""
+        return len(self.patterns)
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Fold the Text Case, Mirroring the re.IGNORECASE Char Equivalences."""
+        return text.translate(CombinedRegexMatcher.PRE_FOLD_TABLE).lower().translate(CombinedRegexMatcher.FOLD_TABLE)
+
+    def add_rule(self, rule_id: str, patterns: List[re.Pattern]) -> None:
+        """
+        Add the Patterns of one Rule.
+
+        :param rule_id: Rule ID Returned when any of the Patterns Match
+        :param patterns: Compiled Patterns
+        """
+        for pattern in patterns:
+
+            # Shared Pattern
+            pattern_ix: int = self.pattern_index.get((pattern.pattern, pattern.flags), -1)
+            if pattern_ix != -1:
+                if rule_id not in self.pattern_rules[pattern_ix]:
+                    self.pattern_rules[pattern_ix].append(rule_id)
+                continue
+
+            pattern_ix = len(self.patterns)
+            self.patterns.append(pattern)
+            self.pattern_rules.append([rule_id])
+            self.pattern_index[(pattern.pattern, pattern.flags)] = pattern_ix
+
+            literals: List[str] = RegexAnalyzer.required_literals(pattern=pattern.pattern) or []
+
+            if len(literals) == 0:
+                self.unfiltered_patterns.append(pattern_ix)
+                continue
+
+            self.automaton.add(term=CombinedRegexMatcher.fold(max(literals, key=len)), value=pattern_ix)
+
+    def build(self) -> None:
+        """Build the Literals Automaton and the Alternation of the Patterns without Literals."""
+        self.automaton.build()
+        self.unfiltered_prefilter = self.__build_unfiltered_prefilter()
+
+    def match(self, raw_text: str, rule_ids: Optional[Set[str]] = None, progress: Optional[FinderMatchProgress] = None) -> Set[str]:
+        """
+        Find all Rules with at Least one Matching Pattern.
+
+        :param raw_text: Text to Search
+        :param rule_ids: Restrict the Match to these Rules. None for all Rules
+        :param progress: Optional Progress Tracker, Informed of each Rule Before its Pattern is Confirmed
+        :return: Set of Matched Rule IDs
+        """
+        h_result: Set[str] = set()
+
+        if not raw_text or len(self.patterns) == 0 or (rule_ids is not None and len(rule_ids) == 0):
+            return h_result
+
+        candidates: Set[int] = self.automaton.find_values(CombinedRegexMatcher.fold(raw_text))
+
+        if self.unfiltered_prefilter is None or self.unfiltered_prefilter.search(raw_text):
+            candidates.update(self.unfiltered_patterns)
+
+        for pattern_ix in sorted(candidates):
+            rules: List[str] = self.pattern_rules[pattern_ix]
+            if rule_ids is not None:
+                rules = [rule_id for rule_id in rules if rule_id in rule_ids]
+
+            if not rules or h_result.issuperset(rules):
+                continue
+
+            if progress:
+                progress.enter(rule_id=rules[0])
+
+            if self.patterns[pattern_ix].search(raw_text):
+                h_result.update(rules)
+
+        return h_result
+
+    def __build_unfiltered_prefilter(self) -> Optional[re.Pattern]:
+        """
+        Merge the Patterns without Literals into one Alternation.
+
+        Returns None (No Prefilter) if the Patterns can not be Merged without Changing its Semantics.
+        """
+        if len(self.unfiltered_patterns) <= 1:
+            return None
+
+        patterns: List[re.Pattern] = [self.patterns[pattern_ix] for pattern_ix in self.unfiltered_patterns]
+
+        if len({pattern.flags for pattern in patterns}) > 1 or patterns[0].flags & re.VERBOSE:
+            return None
+
+        if any(RegexAnalyzer.has_group_references(pattern=pattern.pattern) for pattern in patterns):
+            return None
+
+        try:
+            return re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in patterns), flags=patterns[0].flags)
+        except re.error:  # Ex: Duplicated Group Names or Inline Global Flags
+            return None
@@ -0,0 +1,58 @@
+"""Finder Batch Worker. Match Batches of Stored Messages on Process Pool Workers."""
+from __future__ import annotations
+
+import asyncio
+import signal
+from configparser import ConfigParser
+from typing import Dict, List, Optional, Tuple
+
+from TEx.finder.finder_rule_set import FinderRuleSet
+
+
+class _BatchWorkerState:
+    """Worker Process State. Set by the Pool Initializer."""
+
+    rule_set: FinderRuleSet
+    loop: asyncio.AbstractEventLoop
+    source: str
+
+
+def init_batch_worker(sections: Dict[str, Dict[str, str]], source: str) -> None:
+    """Build the Rule Set Inside the Worker Process."""
+    # Keep the Main Process in Charge of SIGINT
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config: ConfigParser = ConfigParser()
+    config.read_dict(sections)
+
+    _BatchWorkerState.rule_set = FinderRuleSet()
+    _BatchWorkerState.rule_set.load(config=config)
+    _BatchWorkerState.loop = asyncio.new_event_loop()
+    _BatchWorkerState.source = source
+
+
+def match_batch(messages: List[Tuple[Optional[int], str]]) -> List[Tuple[int, List[str]]]:
+    """
+    Match a Batch of Messages Inside the Worker Process.
+
+    :param messages: List of (Group ID, Raw Text)
+    :return: List of (Message Index on the Batch, Matched Rule IDs in Rules Order), Only for Messages with any Match
+    """
+    return _BatchWorkerState.loop.run_until_complete(_match_batch(messages=messages))
+
+
+async def _match_batch(messages: List[Tuple[Optional[int], str]]) -> List[Tuple[int, List[str]]]:
+    """Match a Batch of Messages."""
+    rule_set: FinderRuleSet = _BatchWorkerState.rule_set
+    h_result: List[Tuple[int, List[str]]] = []
+
+    for message_ix, (group_id, raw_text) in enumerate(messages):
+        rules, regex_rule_ids = rule_set.get_applicable_rules(group_id=group_id, source=_BatchWorkerState.source)
+        rule_ids: List[str] = [rule['id'] for rule in rules]
+
+        matched_rule_ids = await rule_set.match(raw_text=raw_text or '', rule_ids=rule_ids, regex_rule_ids=regex_rule_ids)
+
+        if matched_rule_ids:
+            h_result.append((message_ix, [rule_id for rule_id in rule_ids if rule_id in matched_rule_ids]))
+
+    return h_result
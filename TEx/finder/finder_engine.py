@@ -1,71 +1,61 @@
 """Finder Engine."""
 from __future__ import annotations
 
+import asyncio
+import configparser
+import logging
+import os
+import re
+import time
 from configparser import ConfigParser, SectionProxy
-from typing import Dict, List, Optional
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 import aiofiles
 import aiofiles.os
 
 from TEx.exporter.exporter_engine import ExporterEngine
-from TEx.finder.all_messages_finder import AllMessagesFinder
-from TEx.finder.base_finder import BaseFinder
-from TEx.finder.regex_finder import RegexFinder
+from TEx.finder.finder_match_cache import FinderMatchCache
+from TEx.finder.finder_match_progress import FinderMatchProgress
+from TEx.finder.finder_rule_profile import FinderRuleProfile
+from TEx.finder.finder_rule_set import FinderRuleSet
+from TEx.finder.finder_worker_pool import FinderWorkerPool
+from TEx.finder.text_file_view import TextFileView
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.notifier.notifier_engine import NotifierEngine
+from TEx.notifier.signals_engine import SignalsEngine
+
+logger = logging.getLogger('TelegramExplorer')
 
 
 class FinderEngine:
     """Primary Finder Engine."""
 
+    EXECUTION_MODES: Tuple[str, ...] = ('inline', 'process')
+
     def __init__(self) -> None:
         """Initialize Finder Engine."""
         self.is_finder_enabled: bool = False
-        self.rules: List[Dict] = []
+        self.rule_set: FinderRuleSet = FinderRuleSet()
         self.notification_engine: NotifierEngine
         self.exporter_engine: ExporterEngine
+        self.signals_engine: Optional[SignalsEngine] = None
         self.find_in_text_enabled: bool = False
         self.find_in_text_files_max_size_bytes: int = 0
-
-    def __load_rules(self, config: ConfigParser) -> None:
-        """Load Finder Rules."""
-        rules_sections: List[str] = [item for item in config.sections() if 'FINDER.RULE.' in item]
-
-        # Process Each Rule
-        for sec in rules_sections:
-
-            cf_proxy: SectionProxy = config[sec]
-
-            # Get Basic Setting
-            rule_spec: Dict = {
-                    'id': sec,
-                    'instance': None,
-                    'notifier': cf_proxy.get('notifier', fallback='').split(','),
-                    'exporter': cf_proxy.get('exporter', fallback='').split(','),
-                    'type': cf_proxy['type'],
-                    }
-
-            # Get Specific Setting
-            if cf_proxy['type'] == 'regex':
-                rule_spec['instance'] = RegexFinder(config=config[sec])
-            elif cf_proxy['type'] == 'all':
-                rule_spec['instance'] = AllMessagesFinder(config=config[sec])
-
-            # Normalize Notifier Setting
-            rule_spec['notifier'] = list(
-                filter(lambda item: item != '', rule_spec['notifier']),
-            )
-            if len(rule_spec['notifier']) == 0:
-                rule_spec['notifier'] = None
-
-            # Normalize Exporter Setting
-            rule_spec['exporter'] = list(
-                filter(lambda item: item != '', rule_spec['exporter']),
-            )
-            if len(rule_spec['exporter']) == 0:
-                rule_spec['exporter'] = None
-
-            self.rules.append(rule_spec)
+        self.find_in_text_files_chunk_size_bytes: int = TextFileView.DEFAULT_CHUNK_SIZE_BYTES
+        self.execution_mode: str = 'inline'
+        self.match_budget_ms: int = 0
+        self.max_budget_violations: int = 3
+        self.budget_violations: Dict[str, int] = {}
+        self.worker_pool: Optional[FinderWorkerPool] = None
+        self.match_cache: FinderMatchCache = FinderMatchCache(max_entries=0, ttl_seconds=0)
+        self.profile: Optional[FinderRuleProfile] = None
+        self.profile_file_path: str = ''
+        self.pool_workers: int = cpu_count()
+        self.reload_check_interval_seconds: int = 0
+        self.reload_lock: Optional[asyncio.Lock] = None
+        self.reloads: int = 0
 
     def configure(self, config: ConfigParser, notification_engine: NotifierEngine, exporter_engine: ExporterEngine) -> None:
         """Configure Finder."""
@@ -77,9 +67,41 @@ class FinderEngine:
             self.is_finder_enabled = finder_config_proxy.get('enabled', fallback='false') == 'true'
             self.find_in_text_enabled = finder_config_proxy.get('find_in_text_files_enabled', fallback='false') == 'true'
             self.find_in_text_files_max_size_bytes = int(finder_config_proxy.get('find_in_text_files_max_size_bytes', fallback='10000000'))
+            self.find_in_text_files_chunk_size_bytes = int(finder_config_proxy.get(
+                'find_in_text_files_chunk_size_bytes', fallback=str(TextFileView.DEFAULT_CHUNK_SIZE_BYTES),
+                ))
+
+            # Get Sandbox Props
+            self.execution_mode = finder_config_proxy.get('execution_mode', fallback='inline')
+            self.match_budget_ms = int(finder_config_proxy.get('match_budget_ms', fallback='0'))
+            self.max_budget_violations = int(finder_config_proxy.get('max_budget_violations', fallback='3'))
+            self.pool_workers = int(finder_config_proxy.get('pool_workers', fallback=str(cpu_count())))
+
+            # Get Hot Reload Props
+            self.reload_check_interval_seconds = int(finder_config_proxy.get('reload_check_interval_seconds', fallback='0'))
+
+            # Get Match Cache Props
+            self.match_cache = FinderMatchCache(
+                max_entries=int(finder_config_proxy.get('match_cache_size', fallback='10000')),
+                ttl_seconds=int(finder_config_proxy.get('match_cache_ttl_seconds', fallback='600')),
+                )
+
+            # Get Profiling Props
+            if finder_config_proxy.get('profiling_enabled', fallback='false') == 'true':
+                self.profile = FinderRuleProfile()
+                self.profile_file_path = finder_config_proxy.get(
+                    'profiling_file', fallback=os.path.join(config.get('CONFIGURATION', 'data_path', fallback=''), 'finder_profile.json'),
+                    )
+
+            if self.execution_mode not in FinderEngine.EXECUTION_MODES:
+                error_msg: str = f'Invalid Finder Execution Mode "{self.execution_mode}". Must be one of {", ".join(FinderEngine.EXECUTION_MODES)}'
+                raise AttributeError(error_msg)
 
             # Load all Rules
-            self.__load_rules(config=config)
+            self.rule_set.load(config=config)
+
+            # Create the Worker Pool (Processes are Created on the First Match)
+            self.worker_pool = self.__build_worker_pool(config=config, rule_set=self.rule_set)
 
         else:
             self.find_in_text_enabled = False
@@ -100,67 +122,316 @@ class FinderEngine:
         if not self.is_finder_enabled or not entity:
             return
 
-        cached_file_content: str = ''
+        # Hold the Current Rules Until the Message is Done, so a Reload only Takes Effect Between Messages
+        rule_set: FinderRuleSet = self.rule_set
+        worker_pool: Optional[FinderWorkerPool] = self.worker_pool
 
-        for rule in self.rules:
+        # Resolve the Rules Scoped to the Message Group and Source
+        rules, regex_rule_ids = rule_set.get_applicable_rules(group_id=entity.group_id, source=source)
+        if len(rules) == 0:
+            return
 
-            # Resolve Finder
-            finder: BaseFinder = rule['instance']
+        # Repeated (Forwarded) Messages Reuse the Matched Rules
+        cache_key: bytes = FinderMatchCache.build_key(
+            raw_text=entity.raw_text,
+            media=entity.downloaded_media_info,
+            dispatch_key=rule_set.get_dispatch_key(group_id=entity.group_id, source=source),
+            ) if self.match_cache.is_enabled else b''
+        cached: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = self.match_cache.get(key=cache_key) if self.match_cache.is_enabled else None
 
-            # Find in Raw Text Content
-            is_found_on_content: bool = await finder.find(raw_text=entity.raw_text)
-            is_found_on_text_downloaded_file: bool = False
+        if cached:
+            found_on_content, found_on_file = cached
 
-            # Find into Downloaded File (If Applicable)
-            if not is_found_on_content and self.find_in_text_enabled and rule['type'] != 'all':
-                is_found_on_text_downloaded_file = await self.__find_in_text_files(
-                    entity=entity,
-                    finder=finder,
-                    file_content=cached_file_content,
+        else:
+            found_on_content, found_on_file = await self.__find(
+                entity=entity, rule_set=rule_set, worker_pool=worker_pool, rules=rules, regex_rule_ids=regex_rule_ids,
                 )
+            # Skip Caching if the Rules were Reloaded During the Match
+            if rule_set is self.rule_set:
+                self.match_cache.put(key=cache_key, found_on_content=found_on_content, found_on_file=found_on_file)
+
+        for rule in rules:
 
-            if is_found_on_content or is_found_on_text_downloaded_file:
+            is_found_on_content: bool = rule['id'] in found_on_content
+            if not is_found_on_content and rule['id'] not in found_on_file:
+                continue
 
-                # Update found_on Flag
-                entity.found_on = 'MESSAGE' if is_found_on_content else f'FILE\n{entity.downloaded_media_info.disk_file_path}'  # type: ignore
+            if self.profile:
+                self.profile.add_hit(rule_id=rule['id'])
 
-                # Run the Notification Engine
-                await self.notification_engine.run(
-                    notifiers=rule['notifier'],
+            # Update found_on Flag
+            entity.found_on = 'MESSAGE' if is_found_on_content else f'FILE\n{entity.downloaded_media_info.disk_file_path}'  # type: ignore
+
+            # Run the Notification Engine
+            await self.notification_engine.run(
+                notifiers=rule['notifier'],
+                entity=entity,
+                rule_id=rule['id'],
+                source=source,
+                )
+
+            # Run the Data Export Engine
+            if rule['exporter']:
+                await self.exporter_engine.run(
+                    exporters=rule['exporter'],
                     entity=entity,
                     rule_id=rule['id'],
-                    source=source,
-                    )
+                )
 
-                # Run the Data Export Engine
-                if rule['exporter']:
-                    await self.exporter_engine.run(
-                        exporters=rule['exporter'],
-                        entity=entity,
-                        rule_id=rule['id'],
-                    )
+    async def reload(self, config_file_path: str) -> bool:
+        """
+        Reload the Rules from the Configuration File, without Restarting the Listener.
+
+        The New Rules (and Regex Matcher) are Built on a Background Thread and Swapped at Once, so Messages in
+        Progress Finish with the Previous Rules. Invalid Rules (Including Rules with Notifiers or Exporters not Loaded
+        by the Running Engines) are Rejected and the Running Rules are Kept.
+
+        :return: True if the Rules were Reloaded
+        """
+        # Created on the Running Loop
+        if not self.reload_lock:
+            self.reload_lock = asyncio.Lock()
+
+        async with self.reload_lock:
+            logger.info(f'\t\tReloading Finder Rules from "{config_file_path}"...')
+
+            try:
+                config, rule_set = await asyncio.get_running_loop().run_in_executor(None, FinderEngine.__load_rule_set, config_file_path)
+                self.__validate_rule_set(rule_set=rule_set)
+
+            except (AttributeError, KeyError, ValueError, OSError, re.error, configparser.Error) as ex:
+                logger.warning(f'\t\tFinder Rules Reload Rejected, Keeping the Current Rules. {type(ex).__name__}: {ex}')
+                return False
+
+            previous_worker_pool: Optional[FinderWorkerPool] = self.worker_pool
+
+            # Swap (no await Between the Assignments)
+            self.rule_set = rule_set
+            self.worker_pool = self.__build_worker_pool(config=config, rule_set=rule_set)
+            self.budget_violations = {}
+            self.match_cache.clear()
+            self.reloads += 1
+
+            # Running Tasks on the Previous Pool are Finished Before the Processes Exit
+            if previous_worker_pool:
+                previous_worker_pool.shutdown()
+
+            logger.info(f'\t\tFinder Rules Reloaded. {len(rule_set.rules)} Rules: {", ".join([rule["id"] for rule in rule_set.rules])}')
+            return True
+
+    async def watch_config(self, config_file_path: str) -> None:
+        """Reload the Rules when the Configuration File Changes. Checks each reload_check_interval_seconds, Until Cancelled."""
+        if self.reload_check_interval_seconds <= 0:
+            return
+
+        last_modified: float = FinderEngine.__get_modified_time(file_path=config_file_path)
+
+        while True:
+            await asyncio.sleep(self.reload_check_interval_seconds)
+
+            modified: float = FinderEngine.__get_modified_time(file_path=config_file_path)
+            if modified != last_modified:
+                last_modified = modified
+                await self.reload(config_file_path=config_file_path)
+
+    def get_profile_summary(self, top: int = 5) -> Optional[str]:
+        """Return the Summary of the Slowest Rules, or None if the Profiling is Disabled."""
+        if not self.profile:
+            return None
+
+        return self.profile.summary(top=top)
+
+    def shutdown(self) -> None:
+        """Shutdown the Worker Pool and Write the Rules Profile."""
+        if self.worker_pool:
+            self.worker_pool.shutdown()
 
-    async def __find_in_text_files(self, entity: FinderNotificationMessageEntity, finder: BaseFinder, file_content: str) -> bool:
-        """Try to Run the Finder Engine into the Downloaded Text File."""
-        if not entity.downloaded_media_info or not entity.downloaded_media_info.allow_search_in_text_file():
-            return False
+        if self.profile:
+            self.profile.dump(file_path=self.profile_file_path)
+            logger.info(f'\t\tFinder Rules Profile Saved on "{self.profile_file_path}"')
+
+        if self.match_cache.is_enabled:
+            logger.info(
+                f'\t\tFinder Match Cache: {self.match_cache.hits} Hits, {self.match_cache.misses} Misses '
+                f'({self.match_cache.hit_rate:.1%} Hit Rate)',
+                )
+
+    def __build_worker_pool(self, config: ConfigParser, rule_set: FinderRuleSet) -> Optional[FinderWorkerPool]:
+        """Create the Worker Pool on process Execution Mode. Processes are Created on the First Match."""
+        if self.execution_mode != 'process':
+            return None
+
+        return FinderWorkerPool(
+            config=config,
+            rule_ids=[rule['id'] for rule in rule_set.rules],
+            workers=self.pool_workers,
+            budget_seconds=self.match_budget_ms / 1000,
+            )
+
+    @staticmethod
+    def __load_rule_set(config_file_path: str) -> Tuple[ConfigParser, FinderRuleSet]:
+        """Read the Configuration File and Build a New Rule Set."""
+        config: ConfigParser = ConfigParser()
+
+        if not config.read(config_file_path):
+            error_msg: str = f'Configuration File "{config_file_path}" not Found'
+            raise AttributeError(error_msg)
+
+        rule_set: FinderRuleSet = FinderRuleSet()
+        rule_set.load(config=config)
+
+        return config, rule_set
+
+    def __validate_rule_set(self, rule_set: FinderRuleSet) -> None:
+        """Check the Rules only Use the Notifiers and Exporters Loaded by the Running Engines."""
+        for rule in rule_set.rules:
+            unknown: List[str] = [name for name in (rule['notifier'] or []) if name not in self.notification_engine.notifiers]
+            unknown.extend([name for name in (rule['exporter'] or []) if name not in self.exporter_engine.exporters])
+
+            if len(unknown) > 0:
+                error_msg: str = f'Rule "{rule["id"]}" Uses Notifiers or Exporters not Loaded: {", ".join(unknown)}'
+                raise AttributeError(error_msg)
+
+    @staticmethod
+    def __get_modified_time(file_path: str) -> float:
+        """Return the File Modification Time, or 0 if the File is Missing."""
+        try:
+            return Path(file_path).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    async def __find(
+            self, entity: FinderNotificationMessageEntity, rule_set: FinderRuleSet, worker_pool: Optional[FinderWorkerPool],
+            rules: List[Dict], regex_rule_ids: Optional[Set[str]],
+            ) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Return the IDs of the Rules Found on the Message Content and on the Downloaded File."""
+        # Find in Raw Text Content
+        found_on_content: Set[str] = await self.__find_rules(
+            rule_set=rule_set, worker_pool=worker_pool, rules=rules, regex_rule_ids=regex_rule_ids, raw_text=entity.raw_text,
+            )
+
+        # Find into Downloaded File (If Applicable)
+        found_on_file: Set[str] = set()
+        if self.find_in_text_enabled:
+            found_on_file = await self.__find_in_text_files(
+                entity=entity,
+                rule_set=rule_set,
+                worker_pool=worker_pool,
+                rules=[rule for rule in rules if rule['id'] not in found_on_content and rule['type'] != 'all'],
+                regex_rule_ids=regex_rule_ids,
+            )
+
+        return frozenset(found_on_content), frozenset(found_on_file)
+
+    async def __find_rules(
+            self, rule_set: FinderRuleSet, worker_pool: Optional[FinderWorkerPool], rules: List[Dict], regex_rule_ids: Optional[Set[str]], raw_text: str,
+            ) -> Set[str]:
+        """Return the IDs of the Rules that Match the Text, Enforcing the Match Budget."""
+        rule_ids: List[str] = [rule['id'] for rule in rules]
+
+        if len(rule_ids) == 0:
+            return set()
+
+        if self.profile:
+            self.profile.add_evaluations(rule_ids=rule_ids)
+
+        if not worker_pool:
+            return await self.__find_rules_inline(rule_set=rule_set, rule_ids=rule_ids, regex_rule_ids=regex_rule_ids, raw_text=raw_text)
+
+        while len(rule_ids) > 0:
+            h_result, timed_out_rule_id = await worker_pool.match(
+                raw_text=raw_text, rule_ids=rule_ids, regex_rule_ids=regex_rule_ids, profile=self.profile,
+                )
+
+            if timed_out_rule_id is None:
+                return h_result
+
+            await self.__register_budget_violation(rule_set=rule_set, rule_id=timed_out_rule_id)
+
+            # Worker Killed Before any Rule Started (Unable to Blame a Rule)
+            if timed_out_rule_id not in rule_ids:
+                return set()
+
+            # Run Again without the Rule that Exceeded the Budget
+            rule_ids = [rule_id for rule_id in rule_ids if rule_id != timed_out_rule_id]
+            regex_rule_ids = {rule_id for rule_id in rule_ids if rule_set.rules_by_id[rule_id]['type'] == 'regex'}
+
+        return set()
+
+    async def __find_rules_inline(self, rule_set: FinderRuleSet, rule_ids: List[str], regex_rule_ids: Optional[Set[str]], raw_text: str) -> Set[str]:
+        """Run the Rules on the Main Process. Running Rules can not be Interrupted, so the Slowest Rule is Blamed After the Match."""
+        if self.match_budget_ms <= 0 and not self.profile:
+            return await rule_set.match(raw_text=raw_text, rule_ids=rule_ids, regex_rule_ids=regex_rule_ids)
+
+        progress: FinderMatchProgress = FinderMatchProgress(profile=self.profile)
+        progress.start()
+        start: float = time.monotonic()
+
+        h_result: Set[str] = await rule_set.match(raw_text=raw_text, rule_ids=rule_ids, regex_rule_ids=regex_rule_ids, progress=progress)
+
+        progress.finish()
+        if 0 < self.match_budget_ms < (time.monotonic() - start) * 1000 and progress.slowest_rule_id:
+            await self.__register_budget_violation(rule_set=rule_set, rule_id=progress.slowest_rule_id)
+
+        return h_result
+
+    async def __register_budget_violation(self, rule_set: FinderRuleSet, rule_id: str) -> None:
+        """Count a Match Budget Violation, Disabling the Rule After max_budget_violations."""
+        if not rule_id or rule_id in rule_set.disabled_rule_ids:
+            return
+
+        self.budget_violations[rule_id] = self.budget_violations.get(rule_id, 0) + 1
+        logger.warning(
+            f'\t\tFinder Rule "{rule_id}" Exceeded the Match Budget of {self.match_budget_ms}ms '
+            f'({self.budget_violations[rule_id]}/{self.max_budget_violations})',
+            )
+
+        if self.max_budget_violations <= 0 or self.budget_violations[rule_id] < self.max_budget_violations:
+            return
+
+        rule_set.disable_rule(rule_id=rule_id)
+        logger.warning(f'\t\tFinder Rule "{rule_id}" Disabled')
+
+        if self.signals_engine:
+            await self.signals_engine.rule_disabled(
+                rule_id=rule_id,
+                reason=f'Exceeded the Match Budget of {self.match_budget_ms}ms {self.budget_violations[rule_id]} Times',
+                )
+
+    async def __find_in_text_files(
+            self, entity: FinderNotificationMessageEntity, rule_set: FinderRuleSet, worker_pool: Optional[FinderWorkerPool],
+            rules: List[Dict], regex_rule_ids: Optional[Set[str]],
+            ) -> Set[str]:
+        """Try to Run the Rules into the Downloaded Text File. The File is Read and Decoded Once for all Rules."""
+        h_result: Set[str] = set()
+
+        if len(rules) == 0 or not entity.downloaded_media_info or not entity.downloaded_media_info.allow_search_in_text_file():
+            return h_result
 
         # Check if File Exists
         file_exists: bool = await aiofiles.os.path.exists(entity.downloaded_media_info.disk_file_path)
         if not file_exists:
-            return False
+            return h_result
 
         # Check Max Size
         max_size_exceeded: bool = entity.downloaded_media_info.size_bytes > self.find_in_text_files_max_size_bytes
         if max_size_exceeded:
-            return False
+            return h_result
+
+        file_view: TextFileView = TextFileView(
+            file_path=entity.downloaded_media_info.disk_file_path,
+            chunk_size_bytes=self.find_in_text_files_chunk_size_bytes,
+            )
+
+        async for chunk in file_view.iter_chunks():
+
+            # Only Rules not Found on Previous Chunks
+            pending_rules: List[Dict] = [rule for rule in rules if rule['id'] not in h_result]
+            h_result.update(await self.__find_rules(
+                rule_set=rule_set, worker_pool=worker_pool, rules=pending_rules, regex_rule_ids=regex_rule_ids, raw_text=chunk,
+                ))
 
-        # Open and Read the File
-        if file_content == '':
-            async with aiofiles.open(entity.downloaded_media_info.disk_file_path, 'rb') as f:
-                file_bytes = await f.read()
-                file_content = file_bytes.decode('UTF-8')
-                await f.close()
+            if len(h_result) == len(rules):
+                break
 
-        # Run Finder
-        return await finder.find(raw_text=file_content)
+        return h_result
@@ -0,0 +1,92 @@
+"""Finder Match Cache."""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import FrozenSet, Optional, Tuple
+
+from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
+
+
+class FinderMatchCache:
+    """
+    Bounded LRU Cache, with Expiration, of the Rules Matched by a Message Content.
+
+    The Same Message is Often Forwarded to Many Groups in a Short Time. The Cache is Keyed by a Hash of the Text, the
+    Downloaded Media and the Dispatch Key (Messages with the Same Key have the Same Applicable Rules), so Repeated
+    Messages Skip the Rules Evaluation.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        """Initialize the Cache."""
+        self.max_entries: int = max_entries
+        self.ttl_seconds: int = ttl_seconds
+        self.entries: OrderedDict[bytes, Tuple[float, FrozenSet[str], FrozenSet[str]]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Return if the Cache is Enabled."""
+        return self.max_entries > 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the Hit Rate (0 to 1)."""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    @staticmethod
+    def build_key(raw_text: str, media: Optional[MediaHandlingEntity], dispatch_key: Tuple[Optional[int], Optional[str]]) -> bytes:
+        """
+        Build the Cache Key.
+
+        Telegram Keep the Media ID when a Message is Forwarded, so the Media is Identified by its ID and Size.
+        """
+        key_hash = hashlib.blake2b(raw_text.encode('utf-8', errors='surrogatepass'), digest_size=16)
+        key_hash.update((f'|{media.media_id}:{media.size_bytes}' if media else '|').encode())
+        key_hash.update(f'|{dispatch_key[0]}|{dispatch_key[1]}'.encode())
+
+        return key_hash.digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """
+        Return the Rules Matched on the Message Content and on the Downloaded File, or None if not Cached.
+
+        :param key: Cache Key
+        :return: Tuple of Rule IDs Found on Content and Rule IDs Found on File
+        """
+        entry: Optional[Tuple[float, FrozenSet[str], FrozenSet[str]]] = self.entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[0] < time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(self, key: bytes, found_on_content: FrozenSet[str], found_on_file: FrozenSet[str]) -> None:
+        """Store the Rules Matched by a Message, Evicting the Least Recently Used Entries."""
+        if not self.is_enabled:
+            return
+
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, found_on_content, found_on_file)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all Entries (Ex: when the Rules Change)."""
+        self.entries.clear()
@@ -0,0 +1,63 @@
+"""Finder Match Progress Tracker."""
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional
+
+from TEx.finder.finder_rule_profile import FinderRuleProfile
+
+
+class FinderMatchProgress:
+    """
+    Track which Rule is Being Evaluated and which Rule was the Slowest on a Match.
+
+    Used to Blame a Rule when a Message Exceeds the Match Time Budget and to Profile the Rules Latency.
+    """
+
+    def __init__(self, profile: Optional[FinderRuleProfile] = None) -> None:
+        """Initialize the Tracker."""
+        self.profile: Optional[FinderRuleProfile] = profile
+        self.current_rule_id: Optional[str] = None
+        self.current_started_at: float = 0.0
+        self.slowest_rule_id: Optional[str] = None
+        self.slowest_elapsed_seconds: float = 0.0
+        self.rules_elapsed_seconds: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """Reset the Tracker for a new Match."""
+        self.current_rule_id = None
+        self.slowest_rule_id = None
+        self.slowest_elapsed_seconds = 0.0
+        self.rules_elapsed_seconds = {}
+
+    def enter(self, rule_id: str) -> None:
+        """Report that a Rule Evaluation Started, Finishing the Previous one."""
+        now: float = time.monotonic()
+        self.__close(now=now)
+
+        self.current_rule_id = rule_id
+        self.current_started_at = now
+
+    def finish(self) -> None:
+        """Report the End of the Match. The Time of each Rule on the Match is Added to the Profile, if Any."""
+        self.__close(now=time.monotonic())
+        self.current_rule_id = None
+
+        if self.profile:
+            for rule_id, elapsed in self.rules_elapsed_seconds.items():
+                self.profile.add_latency(rule_id=rule_id, elapsed_seconds=elapsed)
+
+        self.rules_elapsed_seconds = {}
+
+    def __close(self, now: float) -> None:
+        """Finish the Current Rule Evaluation."""
+        if self.current_rule_id is None:
+            return
+
+        elapsed: float = now - self.current_started_at
+        if self.profile:
+            self.rules_elapsed_seconds[self.current_rule_id] = self.rules_elapsed_seconds.get(self.current_rule_id, 0.0) + elapsed
+
+        if elapsed > self.slowest_elapsed_seconds:
+            self.slowest_rule_id = self.current_rule_id
+            self.slowest_elapsed_seconds = elapsed
@@ -0,0 +1,120 @@
+"""Finder Rules Profile."""
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Union
+
+
+class FinderRuleStats:
+    """
+    Evaluation Counters and Latency Histogram of a Single Rule.
+
+    Latencies are Counted on Power of 2 Microseconds Buckets, so the Memory Usage is Fixed and the Percentiles are
+    Estimated with a Max Error of 2x.
+    """
+
+    BUCKETS: int = 32
+
+    def __init__(self) -> None:
+        """Initialize the Stats."""
+        self.evaluations: int = 0
+        self.timed_evaluations: int = 0
+        self.hits: int = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds: float = 0.0
+        self.histogram: List[int] = [0] * FinderRuleStats.BUCKETS
+
+    def add_latency(self, elapsed_seconds: float) -> None:
+        """Add a Rule Evaluation Latency."""
+        self.timed_evaluations += 1
+        self.total_seconds += elapsed_seconds
+        self.max_seconds = max(self.max_seconds, elapsed_seconds)
+        self.histogram[min(FinderRuleStats.BUCKETS - 1, int(elapsed_seconds * 1_000_000).bit_length())] += 1
+
+    def merge(self, other: FinderRuleStats) -> None:
+        """Add the Counters of Other Stats."""
+        self.evaluations += other.evaluations
+        self.timed_evaluations += other.timed_evaluations
+        self.hits += other.hits
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.histogram = [current + added for current, added in zip(self.histogram, other.histogram)]
+
+    def percentile_seconds(self, percentile: float) -> float:
+        """Estimate a Latency Percentile (0 to 100) as the Upper Bound of the Bucket, Limited to the Max Latency."""
+        if self.timed_evaluations == 0:
+            return 0.0
+
+        target: float = self.timed_evaluations * percentile / 100
+        accumulated: int = 0
+
+        for bucket_ix, count in enumerate(self.histogram):
+            accumulated += count
+            if accumulated >= target:
+                return min(self.max_seconds, (1 << bucket_ix) / 1_000_000)
+
+        return self.max_seconds
+
+
+class FinderRuleProfile:
+    """Per Rule Evaluation Counts, Latency and Hits, Used to Find the Slow Rules."""
+
+    def __init__(self) -> None:
+        """Initialize the Profile."""
+        self.rules: Dict[str, FinderRuleStats] = {}
+
+    def get_stats(self, rule_id: str) -> FinderRuleStats:
+        """Return the Rule Stats, Creating it if Needed."""
+        stats: FinderRuleStats = self.rules.get(rule_id) or FinderRuleStats()
+        self.rules[rule_id] = stats
+        return stats
+
+    def add_evaluations(self, rule_ids: List[str]) -> None:
+        """Count the Rules Evaluated for a Text."""
+        for rule_id in rule_ids:
+            self.get_stats(rule_id=rule_id).evaluations += 1
+
+    def add_latency(self, rule_id: str, elapsed_seconds: float) -> None:
+        """Add a Rule Latency."""
+        self.get_stats(rule_id=rule_id).add_latency(elapsed_seconds=elapsed_seconds)
+
+    def add_hit(self, rule_id: str) -> None:
+        """Count a Rule Hit."""
+        self.get_stats(rule_id=rule_id).hits += 1
+
+    def merge(self, other: FinderRuleProfile) -> None:
+        """Add the Stats of Other Profile (Ex: Collected on a Worker Process)."""
+        for rule_id, stats in other.rules.items():
+            self.get_stats(rule_id=rule_id).merge(other=stats)
+
+    def to_dict(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Return the Stats by Rule, Slowest (Total Time) First."""
+        return {
+            rule_id: {
+                'evaluations': stats.evaluations,
+                'timed_evaluations': stats.timed_evaluations,
+                'hits': stats.hits,
+                'total_ms': round(stats.total_seconds * 1000, 3),
+                'mean_ms': round(stats.total_seconds * 1000 / stats.timed_evaluations, 3) if stats.timed_evaluations else 0.0,
+                'p50_ms': round(stats.percentile_seconds(percentile=50) * 1000, 3),
+                'p90_ms': round(stats.percentile_seconds(percentile=90) * 1000, 3),
+                'p99_ms': round(stats.percentile_seconds(percentile=99) * 1000, 3),
+                'max_ms': round(stats.max_seconds * 1000, 3),
+                }
+            for rule_id, stats in sorted(self.rules.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            }
+
+    def summary(self, top: int) -> str:
+        """Return a Text Summary of the Slowest Rules."""
+        lines: List[str] = [
+            f'{rule_id}: {values["total_ms"]}ms Total, p50 {values["p50_ms"]}ms, p99 {values["p99_ms"]}ms, '
+            f'{values["evaluations"]} Evaluations, {values["hits"]} Hits'
+            for rule_id, values in list(self.to_dict().items())[:top]
+            ]
+
+        return '\n'.join(lines)
+
+    def dump(self, file_path: str) -> None:
+        """Write the Profile into a JSON File."""
+        with open(file_path, 'w', encoding='UTF-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
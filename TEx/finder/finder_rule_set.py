@@ -0,0 +1,215 @@
+"""Finder Rule Set."""
+from __future__ import annotations
+
+from configparser import ConfigParser, SectionProxy
+from typing import Dict, List, Optional, Set, Tuple
+
+from TEx.finder.all_messages_finder import AllMessagesFinder
+from TEx.finder.base_finder import BaseFinder
+from TEx.finder.combined_regex_matcher import CombinedRegexMatcher
+from TEx.finder.finder_match_progress import FinderMatchProgress
+from TEx.finder.keywords_finder import KeywordsFinder
+from TEx.finder.regex_finder import RegexFinder
+
+
+class FinderRuleSet:
+    """
+    Load the Finder Rules (FINDER.RULE.* Sections) and Match them Against Texts.
+
+    Kept Apart from the Finder Engine (Notifications, Exports and Files) to be Built Inside the Finder Worker Processes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Rule Set."""
+        self.rules: List[Dict] = []
+        self.rules_by_id: Dict[str, Dict] = {}
+        self.regex_matcher: CombinedRegexMatcher = CombinedRegexMatcher()
+        self.disabled_rule_ids: Set[str] = set()
+        self.scoped_group_ids: Set[int] = set()
+        self.scoped_sources: Set[str] = set()
+        self.dispatch_index: Dict[Tuple[Optional[int], Optional[str]], Tuple[List[Dict], Optional[Set[str]]]] = {}
+
+    @staticmethod
+    def get_rules_sections(config: ConfigParser) -> List[str]:
+        """Return the Rules Section Names, in Config Order."""
+        return [item for item in config.sections() if 'FINDER.RULE.' in item]
+
+    @staticmethod
+    def get_rules_config(config: ConfigParser, rule_ids: Optional[Set[str]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Return the Raw (not Interpolated) Rules Sections, to Rebuild the Rule Set on Worker Processes.
+
+        :param rule_ids: Return Only these Rules. None for all Rules
+        """
+        return {
+            sec: dict(config.items(sec, raw=True))
+            for sec in FinderRuleSet.get_rules_sections(config=config)
+            if rule_ids is None or sec in rule_ids
+            }
+
+    def load(self, config: ConfigParser, rule_ids: Optional[Set[str]] = None) -> None:
+        """
+        Load Finder Rules.
+
+        :param rule_ids: Load Only these Rules. None for all Rules
+        """
+        # Process Each Rule
+        for sec in FinderRuleSet.get_rules_sections(config=config):
+
+            if rule_ids is not None and sec not in rule_ids:
+                continue
+
+            cf_proxy: SectionProxy = config[sec]
+
+            # Get Basic Setting
+            rule_spec: Dict = {
+                    'id': sec,
+                    'instance': None,
+                    'notifier': cf_proxy.get('notifier', fallback='').split(','),
+                    'exporter': cf_proxy.get('exporter', fallback='').split(','),
+                    'type': cf_proxy['type'],
+                    'groups': FinderRuleSet.__parse_group_ids(value=cf_proxy.get('groups', fallback=''), rule_id=sec),
+                    'exclude_groups': FinderRuleSet.__parse_group_ids(value=cf_proxy.get('exclude_groups', fallback=''), rule_id=sec),
+                    'sources': set(FinderRuleSet.__parse_list(value=cf_proxy.get('sources', fallback=''))),
+                    }
+
+            # Get Specific Setting
+            if cf_proxy['type'] == 'regex':
+                rule_spec['instance'] = RegexFinder(config=config[sec])
+                self.regex_matcher.add_rule(rule_id=sec, patterns=rule_spec['instance'].regex_patterns)
+            elif cf_proxy['type'] == 'keywords':
+                rule_spec['instance'] = KeywordsFinder(config=config[sec])
+            elif cf_proxy['type'] == 'all':
+                rule_spec['instance'] = AllMessagesFinder(config=config[sec])
+            else:
+                error_msg: str = f'Invalid Finder Rule Type "{cf_proxy["type"]}" for "{sec}". Must be one of regex, keywords, all'
+                raise AttributeError(error_msg)
+
+            # Normalize Notifier Setting
+            rule_spec['notifier'] = list(
+                filter(lambda item: item != '', rule_spec['notifier']),
+            )
+            if len(rule_spec['notifier']) == 0:
+                rule_spec['notifier'] = None
+
+            # Normalize Exporter Setting
+            rule_spec['exporter'] = list(
+                filter(lambda item: item != '', rule_spec['exporter']),
+            )
+            if len(rule_spec['exporter']) == 0:
+                rule_spec['exporter'] = None
+
+            self.rules.append(rule_spec)
+            self.rules_by_id[sec] = rule_spec
+
+        # Build the Combined Matcher of all Regex Rules
+        self.regex_matcher.build()
+
+        # Build the Group and Source Dispatch Index
+        self.__build_dispatch_index()
+
+    def disable_rule(self, rule_id: str) -> None:
+        """Disable a Rule. Disabled Rules are Removed from the Dispatch Index."""
+        self.disabled_rule_ids.add(rule_id)
+        self.__build_dispatch_index()
+
+    def get_applicable_rules(self, group_id: Optional[int], source: str) -> Tuple[List[Dict], Optional[Set[str]]]:
+        """
+        Return the Rules Applicable to a Message, Following the Rules Order.
+
+        :param group_id: Message Group ID
+        :param source: Source Account/Phone Number
+        :return: List of Rules and the Set of Applicable Regex Rule IDs (None if all Regex Rules are Applicable)
+        """
+        return self.dispatch_index.get(self.get_dispatch_key(group_id=group_id, source=source), (self.rules, None))
+
+    def get_dispatch_key(self, group_id: Optional[int], source: str) -> Tuple[Optional[int], Optional[str]]:
+        """Return the Dispatch Index Key of a Message. Messages with the Same Key have the Same Applicable Rules."""
+        return group_id if group_id in self.scoped_group_ids else None, source if source in self.scoped_sources else None
+
+    async def match(self, raw_text: str, rule_ids: List[str], regex_rule_ids: Optional[Set[str]], progress: Optional[FinderMatchProgress] = None) -> Set[str]:
+        """
+        Return the IDs of the Rules that Match the Text. All Regex Rules are Matched with a Single Scan.
+
+        :param raw_text: Text to Search
+        :param rule_ids: Rules to Evaluate
+        :param regex_rule_ids: Regex Rules to Evaluate (None for all)
+        :param progress: Optional Progress Tracker
+        :return: Set of Matched Rule IDs
+        """
+        h_result: Set[str] = set()
+
+        if len(rule_ids) == 0:
+            return h_result
+
+        matched_regex_rules: Set[str] = self.regex_matcher.match(raw_text=raw_text, rule_ids=regex_rule_ids, progress=progress)
+
+        for rule_id in rule_ids:
+            rule: Dict = self.rules_by_id[rule_id]
+
+            if rule['type'] == 'regex':
+                is_found: bool = rule_id in matched_regex_rules
+
+            else:
+                if progress:
+                    progress.enter(rule_id=rule_id)
+
+                # Resolve Finder
+                finder: BaseFinder = rule['instance']
+                is_found = await finder.find(raw_text=raw_text)
+
+            if is_found:
+                h_result.add(rule_id)
+
+        return h_result
+
+    def __build_dispatch_index(self) -> None:
+        """
+        Compile the Rules Scopes (groups, exclude_groups and sources) into a Dict Index.
+
+        Groups and Sources not Referenced by any Rule Share the Same Entry (None), so the Index has one Entry for each
+        Combination of Referenced Group and Source, and the Applicable Rules of a Message are Resolved in O(1).
+        """
+        self.scoped_group_ids = set()
+        self.scoped_sources = set()
+
+        for rule in self.rules:
+            self.scoped_group_ids.update(rule['groups'])
+            self.scoped_group_ids.update(rule['exclude_groups'])
+            self.scoped_sources.update(rule['sources'])
+
+        all_regex_rule_ids: Set[str] = {rule['id'] for rule in self.rules if rule['type'] == 'regex'}
+        self.dispatch_index = {}
+
+        for group_id in [None, *self.scoped_group_ids]:
+            for source in [None, *self.scoped_sources]:
+
+                rules: List[Dict] = [
+                    rule for rule in self.rules
+                    if rule['id'] not in self.disabled_rule_ids
+                    and (len(rule['groups']) == 0 or group_id in rule['groups'])
+                    and group_id not in rule['exclude_groups']
+                    and (len(rule['sources']) == 0 or source in rule['sources'])
+                    ]
+                regex_rule_ids: Set[str] = {rule['id'] for rule in rules if rule['type'] == 'regex'}
+
+                self.dispatch_index[(group_id, source)] = (rules, None if regex_rule_ids == all_regex_rule_ids else regex_rule_ids)
+
+    @staticmethod
+    def __parse_list(value: str) -> List[str]:
+        """Parse a Comma Separated Setting."""
+        return [item.strip() for item in value.split(',') if item.strip() != '']
+
+    @staticmethod
+    def __parse_group_ids(value: str, rule_id: str) -> Set[int]:
+        """Parse a Comma Separated List of Group IDs."""
+        h_result: Set[int] = set()
+
+        for item in FinderRuleSet.__parse_list(value=value):
+            if not item.lstrip('-').isdigit():
+                error_msg: str = f'Invalid Group ID "{item}" for "{rule_id}". Must be an integer'
+                raise AttributeError(error_msg)
+
+            h_result.add(int(item))
+
+        return h_result
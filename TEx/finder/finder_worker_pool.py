@@ -0,0 +1,225 @@
+"""Finder Worker Pool."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from configparser import ConfigParser
+from multiprocessing import Array, Value
+from multiprocessing.sharedctypes import Synchronized, SynchronizedArray
+from typing import Dict, List, Optional, Set, Tuple
+
+from TEx.finder.finder_match_progress import FinderMatchProgress
+from TEx.finder.finder_rule_profile import FinderRuleProfile
+from TEx.finder.finder_rule_set import FinderRuleSet
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class _WorkerSlots:
+    """
+    Shared Memory Slots, one per Worker Process.
+
+    Each Worker Publish its PID, the Current Task, the Current Rule and when the Task Started, so the Main Process can
+    Find and Kill the Worker Stuck on a Catastrophic Regex.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Allocate the Slots."""
+        self.size: int = size
+        self.counter: Synchronized[int] = Value('i', 0)
+        self.pids: SynchronizedArray[int] = Array('q', size)
+        self.task_ids: SynchronizedArray[int] = Array('q', size)
+        self.rule_ixs: SynchronizedArray[int] = Array('i', size)
+        self.started_at: SynchronizedArray[float] = Array('d', size)
+
+
+class _WorkerState:
+    """Worker Process State. Set by the Pool Initializer."""
+
+    rule_set: FinderRuleSet
+    loop: asyncio.AbstractEventLoop
+    slots: _WorkerSlots
+    slot_ix: int
+    rule_ixs: Dict[str, int]
+
+
+class _SlotMatchProgress(FinderMatchProgress):
+    """Progress Tracker that Publish the Current Rule into the Worker Slot."""
+
+    def enter(self, rule_id: str) -> None:
+        """Report that a Rule Evaluation Started."""
+        super().enter(rule_id=rule_id)
+        _WorkerState.slots.rule_ixs[_WorkerState.slot_ix] = _WorkerState.rule_ixs[rule_id]
+
+
+def _init_worker(sections: Dict[str, Dict[str, str]], slots: _WorkerSlots) -> None:
+    """Build the Rule Set Inside the Worker Process. Module Level Function to Allow the Execution on Process Pool Workers."""
+    # Keep the Main Process in Charge of SIGINT
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config: ConfigParser = ConfigParser()
+    config.read_dict(sections)
+
+    _WorkerState.rule_set = FinderRuleSet()
+    _WorkerState.rule_set.load(config=config)
+    _WorkerState.rule_ixs = {rule['id']: ix for ix, rule in enumerate(_WorkerState.rule_set.rules)}
+    _WorkerState.loop = asyncio.new_event_loop()
+    _WorkerState.slots = slots
+
+    with slots.counter.get_lock():
+        _WorkerState.slot_ix = slots.counter.value
+        slots.counter.value += 1
+
+    slots.pids[_WorkerState.slot_ix] = os.getpid()
+
+
+def _match(task_id: int, raw_text: str, rule_ids: List[str], regex_rule_ids: Optional[Set[str]], is_profiling: bool) -> Tuple[Set[str], Optional[FinderRuleProfile]]:
+    """
+    Match the Rules Inside the Worker Process. Module Level Function to Allow the Execution on Process Pool Workers.
+
+    :return: Set of Matched Rule IDs and the Rules Latency of this Match (if Profiling)
+    """
+    slots: _WorkerSlots = _WorkerState.slots
+    slot_ix: int = _WorkerState.slot_ix
+    profile: Optional[FinderRuleProfile] = FinderRuleProfile() if is_profiling else None
+    progress: _SlotMatchProgress = _SlotMatchProgress(profile=profile)
+
+    slots.task_ids[slot_ix] = task_id
+    slots.rule_ixs[slot_ix] = -1
+    slots.started_at[slot_ix] = time.monotonic()
+
+    try:
+        progress.start()
+        h_result: Set[str] = _WorkerState.loop.run_until_complete(
+            _WorkerState.rule_set.match(raw_text=raw_text, rule_ids=rule_ids, regex_rule_ids=regex_rule_ids, progress=progress),
+            )
+        progress.finish()
+
+        return h_result, profile
+
+    finally:
+        slots.started_at[slot_ix] = 0.0
+
+
+class FinderWorkerPool:
+    """
+    Process Pool that Runs the Finder Rules Isolated from the Main Process.
+
+    Each Worker Loads its own Copy of the Rules. When a Task Exceeds the Match Budget, the Worker Process is Killed
+    (the only Way to Interrupt a Running Regex), the Pool is Recreated and the Rule Running at that Moment is Blamed.
+    """
+
+    def __init__(self, config: ConfigParser, rule_ids: List[str], workers: int, budget_seconds: float) -> None:
+        """Initialize the Pool. The Worker Processes are Created on the First Match."""
+        self.sections: Dict[str, Dict[str, str]] = FinderRuleSet.get_rules_config(config=config)
+        self.rule_ids: List[str] = rule_ids
+        self.workers: int = max(1, workers)
+        self.budget_seconds: float = budget_seconds
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.slots: Optional[_WorkerSlots] = None
+        self.next_task_id: int = 0
+        self.timed_out_tasks: Dict[int, str] = {}
+        self.restarts: int = 0
+        self.restart_lock: asyncio.Lock = asyncio.Lock()
+
+    async def match(self, raw_text: str, rule_ids: List[str], regex_rule_ids: Optional[Set[str]], profile: Optional[FinderRuleProfile] = None) -> Tuple[Set[str], Optional[str]]:
+        """
+        Match the Rules on a Worker Process.
+
+        :param raw_text: Text to Search
+        :param rule_ids: Rules to Evaluate
+        :param regex_rule_ids: Regex Rules to Evaluate (None for all)
+        :param profile: Optional Profile, Updated with the Rules Latency Measured on the Worker
+        :return: Set of Matched Rule IDs and the ID of the Rule that Exceeded the Budget (None if the Match Finished, Empty if Unknown)
+        """
+        # Tasks Lost by a Worker Killed due Other Task Timeout are Resubmitted Once
+        for _ in range(2):
+            executor: ProcessPoolExecutor = self.__get_executor()
+            self.next_task_id += 1
+            task_id: int = self.next_task_id
+
+            future: asyncio.Future[Tuple[Set[str], Optional[FinderRuleProfile]]] = asyncio.get_running_loop().run_in_executor(
+                executor, _match, task_id, raw_text, rule_ids, regex_rule_ids, profile is not None,
+                )
+
+            while not future.done():
+                await asyncio.wait({future}, timeout=self.__poll_interval())
+                if not future.done():
+                    self.__kill_if_expired(task_id=task_id)
+
+            try:
+                h_result, task_profile = future.result()
+
+            except BrokenProcessPool:
+                await self.__restart(executor=executor)
+
+                if task_id in self.timed_out_tasks:
+                    return set(), self.timed_out_tasks.pop(task_id)
+
+                continue
+
+            if profile and task_profile:
+                profile.merge(other=task_profile)
+
+            return h_result, None
+
+        error_msg: str = 'Finder Worker Pool Broken'
+        raise BrokenProcessPool(error_msg)
+
+    def shutdown(self) -> None:
+        """Shutdown the Process Pool."""
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """Lazy Create the Executor."""
+        if self.executor is None:
+            self.slots = _WorkerSlots(size=self.workers)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.sections, self.slots))
+
+        return self.executor
+
+    def __poll_interval(self) -> float:
+        """Interval to Check the Running Tasks Against the Budget."""
+        return max(0.01, self.budget_seconds / 2) if self.budget_seconds > 0 else 1.0
+
+    def __kill_if_expired(self, task_id: int) -> None:
+        """Kill the Worker Running the Task, if the Task Exceeded the Budget."""
+        if not self.slots or self.budget_seconds <= 0:
+            return
+
+        now: float = time.monotonic()
+
+        for slot_ix in range(self.slots.size):
+            started_at: float = self.slots.started_at[slot_ix]
+
+            if self.slots.task_ids[slot_ix] != task_id or not started_at or now - started_at <= self.budget_seconds:
+                continue
+
+            rule_ix: int = self.slots.rule_ixs[slot_ix]
+            self.timed_out_tasks[task_id] = self.rule_ids[rule_ix] if 0 <= rule_ix < len(self.rule_ids) else ''
+
+            logger.warning(f'\t\tFinder Worker {self.slots.pids[slot_ix]} Exceeded the Match Budget. Killing')
+            with contextlib.suppress(OSError):
+                os.kill(self.slots.pids[slot_ix], getattr(signal, 'SIGKILL', signal.SIGTERM))
+
+            # Avoid Killing Twice
+            self.slots.started_at[slot_ix] = 0.0
+            return
+
+    async def __restart(self, executor: ProcessPoolExecutor) -> None:
+        """Recreate the Broken Pool. Concurrent Tasks Broken by the Same Kill Restart it Only Once."""
+        async with self.restart_lock:
+            if self.executor is not executor:
+                return
+
+            executor.shutdown(wait=False)
+            self.executor = None
+            self.restarts += 1
@@ -0,0 +1,85 @@
+"""Keywords (Watchlist) Finder."""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from configparser import SectionProxy
+from typing import Dict, List
+
+from TEx.finder.aho_corasick_automaton import AhoCorasickAutomaton
+from TEx.finder.base_finder import BaseFinder
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class KeywordsFinder(BaseFinder):
+    """
+    Literal Keywords Finder, for Large Watchlists (Handles, Wallet Addresses, Domains, ...).
+
+    The Terms are Loaded from a File (One Term per Line) and Built into an Aho-Corasick Automaton Once, so each
+    Message is Matched with a Single Linear Pass, no Matter how Many Terms the Watchlist has.
+    """
+
+    def __init__(self, config: SectionProxy) -> None:
+        """Initialize Keywords Finder."""
+        self.file_path: str = config['file']
+        self.case_folding: bool = config.get('case_folding', fallback='true') == 'true'
+        self.word_boundaries: bool = config.get('word_boundaries', fallback='false') == 'true'
+        self.terms_length: List[int] = []
+        self.automaton: AhoCorasickAutomaton = AhoCorasickAutomaton()
+
+        if not os.path.exists(self.file_path):
+            error_msg: str = f'Keywords File "{self.file_path}" not Found for "{config.name}"'
+            raise AttributeError(error_msg)
+
+        start: float = time.monotonic()
+        self.__load_terms()
+
+        logger.info(f'\t\t{len(self.terms_length)} Keywords Loaded from "{self.file_path}" in {time.monotonic() - start:.2f}s')
+
+    def __load_terms(self) -> None:
+        """Load the Terms File and Build the Automaton. Empty Lines and Lines Starting with # are Ignored."""
+        terms: Dict[str, int] = {}
+
+        with open(self.file_path, encoding='UTF-8') as file:
+            for line in file:
+                term: str = self.__normalize(line.strip())
+
+                if term and not term.startswith('#') and term not in terms:
+                    terms[term] = len(terms)
+                    self.automaton.add(term=term, value=terms[term])
+
+        self.terms_length = [len(term) for term in terms]
+        self.automaton.build()
+
+    def __normalize(self, text: str) -> str:
+        """Apply the Case Folding, if Enabled."""
+        return text.casefold() if self.case_folding else text
+
+    @staticmethod
+    def __is_word_char(text: str, position: int) -> bool:
+        """Check if the Char at Position is a Word Char (Letter, Digit or Underscore). Out of Range is not."""
+        if position < 0 or position >= len(text):
+            return False
+
+        char: str = text[position]
+        return char.isalnum() or char == '_'
+
+    async def find(self, raw_text: str) -> bool:
+        """Apply Find Logic."""
+        if not raw_text or len(raw_text) == 0:
+            return False
+
+        text: str = self.__normalize(raw_text)
+
+        if not self.word_boundaries:
+            return next(self.automaton.iter_matches(text), None) is not None
+
+        for end_position, term_ix in self.automaton.iter_matches(text):
+            start_position: int = end_position - self.terms_length[term_ix]
+
+            if not KeywordsFinder.__is_word_char(text, start_position - 1) and not KeywordsFinder.__is_word_char(text, end_position):
+                return True
+
+        return False
@@ -27,4 +27,4 @@ class RegexFinder(BaseFinder):
         if not raw_text or len(raw_text) == 0:
             return False
 
-        return any(len(pattern.findall(raw_text)) > 0 for pattern in self.regex_patterns)
+        return any(pattern.search(raw_text) for pattern in self.regex_patterns)
@@ -0,0 +1,69 @@
+"""Chunked View of Downloaded Text Files."""
+from __future__ import annotations
+
+import codecs
+from typing import AsyncIterator
+
+import aiofiles
+
+
+class TextFileView:
+    """
+    Read and Decode a Downloaded Text File Once, in Chunks, to be Scanned by all Finder Rules.
+
+    The File is Decoded as UTF-8, Replacing Invalid Bytes, so Dumps with Mixed or Broken Encodings can Still be
+    Searched. Each Chunk Ends on a Line Break (When Possible) and the Next Chunk Starts with the Last Lines of the
+    Previous one (Up to the Overlap Size), so Line Anchored Patterns and Matches Crossing the Chunk Boundary are
+    Preserved. Only one Chunk is Kept in Memory, Allowing the Search of Files with Hundreds of MB.
+    """
+
+    DEFAULT_CHUNK_SIZE_BYTES: int = 4 * 1024 * 1024
+    DEFAULT_OVERLAP_CHARS: int = 4096
+
+    def __init__(self, file_path: str, chunk_size_bytes: int = DEFAULT_CHUNK_SIZE_BYTES, overlap_chars: int = DEFAULT_OVERLAP_CHARS) -> None:
+        """Initialize the View."""
+        self.file_path: str = file_path
+        self.chunk_size_bytes: int = max(1, chunk_size_bytes)
+        self.overlap_chars: int = max(0, overlap_chars)
+        self.chunks_read: int = 0
+
+    async def iter_chunks(self) -> AsyncIterator[str]:
+        """
+        Read the File and Yield the Decoded Chunks.
+
+        :return: Async Iterator of Text Chunks
+        """
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending: str = ''
+
+        async with aiofiles.open(self.file_path, 'rb') as file:
+            while True:
+                raw_bytes: bytes = await file.read(self.chunk_size_bytes)
+                is_last: bool = len(raw_bytes) < self.chunk_size_bytes
+                text: str = pending + decoder.decode(raw_bytes, final=is_last)
+
+                if is_last:
+                    if text or self.chunks_read == 0:
+                        self.chunks_read += 1
+                        yield text
+                    return
+
+                # Cut After the Last Line Break. Very Long Lines are Cut at the Chunk End
+                cut: int = text.rfind('\n') + 1
+                if cut == 0 or len(text) - cut > self.overlap_chars:
+                    cut = len(text)
+
+                self.chunks_read += 1
+                yield text[:cut]
+
+                pending = text[self.__next_chunk_start(text=text, cut=cut):]
+
+    def __next_chunk_start(self, text: str, cut: int) -> int:
+        """Find where the Next Chunk Starts: the First Line Start Inside the Overlap Window Before the Cut."""
+        window_start: int = max(0, cut - self.overlap_chars)
+
+        if window_start == 0 or text[window_start - 1] == '\n':
+            return window_start
+
+        line_start: int = text.find('\n', window_start, cut) + 1
+        return line_start if line_start > 0 else window_start
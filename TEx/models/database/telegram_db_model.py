@@ -109,3 +109,32 @@ class TelegramUserOrmEntity(TelegramDataBaseDeclarativeBase):
     photo_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     photo_base64: Mapped[Optional[str]] = mapped_column(String(1024000), nullable=True)
     photo_name: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+
+
+class TelegramGroupSyncStateOrmEntity(TelegramDataBaseDeclarativeBase):
+    """Telegram Group Synchronization State ORM Model."""
+
+    __bind_key__ = 'data'
+    __tablename__ = 'telegram_group_sync_state'
+
+    group_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    last_message_id: Mapped[int] = mapped_column(Integer)
+    last_message_date_time: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
+    last_sync_at: Mapped[datetime.datetime] = mapped_column(DateTime)
+
+    total_messages: Mapped[int] = mapped_column(Integer)
+    total_batches: Mapped[int] = mapped_column(Integer)
+    last_batch_messages: Mapped[int] = mapped_column(Integer)
+
+
+class TelegramSearchIndexStateOrmEntity(TelegramDataBaseDeclarativeBase):
+    """Telegram Full Text Search Index State ORM Model."""
+
+    __bind_key__ = 'data'
+    __tablename__ = 'telegram_search_index_state'
+
+    index_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    is_ready: Mapped[bool] = mapped_column(Boolean)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime)
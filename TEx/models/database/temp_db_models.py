@@ -33,3 +33,20 @@ class StateFileOrmEntity(TempDataBaseDeclarativeBase):
     path: Mapped[str] = mapped_column(String(255), primary_key=True)
     data: Mapped[str] = mapped_column(String)
     created_at: Mapped[Integer] = mapped_column(Integer)
+
+
+class NotificationOutboxOrmEntity(TempDataBaseDeclarativeBase):
+    """Notification Outbox ORM Model."""
+
+    __bind_key__ = 'temp'
+    __tablename__ = 'notification_outbox'
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    notifier: Mapped[str] = mapped_column(String(255))
+    rule_id: Mapped[str] = mapped_column(String(255))
+    source: Mapped[str] = mapped_column(String(255))
+    entity_type: Mapped[str] = mapped_column(String(16))
+    entity: Mapped[str] = mapped_column(String)
+    attempts: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[int] = mapped_column(Integer)
+    next_attempt_at: Mapped[int] = mapped_column(Integer, index=True)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
 
@@ -25,3 +25,4 @@ class FinderNotificationMessageEntity(BaseModel):
     is_reply: Optional[bool]
     downloaded_media_info: Optional[MediaHandlingEntity]
     found_on: str
+    dedup_tag: Optional[int] = Field(default=None, exclude=True)  # Computed Once by the Notifier Engine, not Serialized
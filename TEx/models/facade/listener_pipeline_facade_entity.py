@@ -0,0 +1,20 @@
+"""Facade Entity for the Listener Ingest Pipeline."""
+from __future__ import annotations
+
+from typing import Optional
+
+from telethon.events import NewMessage
+from telethon.tl.patched import Message
+
+from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
+
+
+class ListenerPipelineItem:
+    """Work Item that Flows Across the Listener Pipeline Stages."""
+
+    def __init__(self, event: NewMessage.Event) -> None:
+        """Initialize the Work Item."""
+        self.event: NewMessage.Event = event
+        self.message: Message = event.message
+        self.downloaded_media: Optional[MediaHandlingEntity] = None
+        self.ocr_content: Optional[str] = None
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional
+from typing import Optional, Union
+
+from sqlalchemy.engine import Row
 
 from TEx.models.database.telegram_db_model import TelegramMessageOrmEntity
 
@@ -30,8 +32,8 @@ class TelegramMessageReportFacadeEntityMapper:
     """Mapper for TelegramMessageReportFacadeEntity."""
 
     @staticmethod
-    def create_from_dbentity(source: TelegramMessageOrmEntity) -> TelegramMessageReportFacadeEntity:
-        """Map TelegramMessageOrmEntity to TelegramMessageReportFacadeEntity."""
+    def create_from_dbentity(source: Union[TelegramMessageOrmEntity, Row]) -> TelegramMessageReportFacadeEntity:
+        """Map TelegramMessageOrmEntity (or a Lightweight Message Row) to TelegramMessageReportFacadeEntity."""
         h_result: TelegramMessageReportFacadeEntity = TelegramMessageReportFacadeEntity()
 
         h_result.id = source.id
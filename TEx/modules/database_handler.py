@@ -30,7 +30,12 @@ class DatabaseHandler(BaseModule):
             os.mkdir(config['CONFIGURATION']['data_path'])
 
         # Initialize DB
-        DbInitializer.init(config['CONFIGURATION']['data_path'])
+        try:
+            DbInitializer.init(data_path=config['CONFIGURATION']['data_path'], config=config)
+        except AttributeError as ex:
+            logger.fatal(ex)
+            data['internals']['panic'] = True
+            return
 
         # Expire Temp Files
         TempFileHandler.remove_expired_entries()
@@ -259,6 +259,39 @@ class InputArgsHandler(BaseModule):
                     },
                 },
             },
+        'rebuild_search_index': {
+            'help': 'Rebuild the Messages Full Text Search Index (Used by Reports to Filter Messages)',
+            'sub_args': {
+                'config': {
+                    'param': '--config', 'type': str, 'action': 'store', 'help': 'Configuration File.',
+                    'default': None, 'required': True,
+                    },
+                },
+            },
+        'retro_hunt': {
+            'help': 'Run the Finder Rules over the Stored Messages, Sending the Hits to the Rules Notifiers and Exporters',
+            'sub_args': {
+                'config': {
+                    'param': '--config', 'type': str, 'action': 'store', 'help': 'Configuration File.',
+                    'default': None, 'required': True,
+                    },
+                'rule': {
+                    'param': '--rule', 'type': str, 'action': 'store',
+                    'help': 'Finder Rules to Run. Ex: --rule FINDER.RULE.MyRule,MyOtherRule',
+                    'default': '*', 'required': False,
+                    },
+                'limit_days': {
+                    'param': '--limit_days', 'type': int, 'action': 'store',
+                    'help': 'Limit Messages Period in Days',
+                    'default': 30, 'required': False,
+                    },
+                'group_id': {
+                    'param': '--group_id', 'type': str, 'action': 'store',
+                    'help': 'Target Group IDs. Ex: --group GroupA,GroupB,"Group C"',
+                    'default': '*', 'required': False,
+                    },
+                },
+            },
         'purge_temp_files': {
             'param': '--purge_temp_files',
             'type': str,
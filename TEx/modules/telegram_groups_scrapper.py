@@ -57,7 +57,17 @@ class TelegramGroupScrapper(BaseModule):
             client=client,
             )
 
-        # Get Only the Groups
+        # Groups are Written Together at the End
+        groups_values: List[Dict] = []
+
+        try:
+            await self.__process_chats(args=args, config=config, client=client, chats=chats, groups_values=groups_values)
+        finally:
+            # Add Groups to DB
+            TelegramGroupDatabaseManager.insert_or_update_batch(groups_values)
+
+    async def __process_chats(self, args: Dict, config: ConfigParser, client: TelegramClient, chats: List, groups_values: List[Dict]) -> None:
+        """Sync Members and Build the Database Values for all Chats."""
         for chat in chats:
 
             logger.info(f'\t\tProcessing "{chat.title} ({chat.id})" Members and Group Profile Picture')
@@ -99,8 +109,8 @@ class TelegramGroupScrapper(BaseModule):
                     continue
                 raise
 
-            # Add Group to DB
-            TelegramGroupDatabaseManager.insert_or_update(values)
+            # Add Group to the Batch
+            groups_values.append(values)
 
     async def __get_chat_photo(self, args: Dict, chat: telethon.Channel, client: TelegramClient, config: ConfigParser, data_values: Dict) -> None:
         """Get Photo from Chat."""
@@ -4,11 +4,13 @@ from __future__ import annotations
 import logging
 import os.path
 from configparser import ConfigParser
-from typing import Dict, List, cast
+from typing import Dict, Iterator, List, cast
+
+from sqlalchemy.engine import Row
 
 from TEx.core.base_module import BaseModule
 from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, TelegramMessageDatabaseManager
-from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramMediaOrmEntity
+from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity
 
 logger = logging.getLogger('TelegramExplorer')
 
@@ -55,27 +57,27 @@ class TelegramMaintenancePurgeOldData(BaseModule):
         """Process and Remove Old Messages and Medias from a Single Group."""
         logger.info(f'\t\tPurging ({group_id}) "{group_name}"')
 
-        # Get all Old Medias
-        all_medias: List[TelegramMediaOrmEntity] = TelegramMediaDatabaseManager.get_all_medias_by_age(
+        # Stream all Old Medias by Pages
+        all_medias: Iterator[Row] = TelegramMediaDatabaseManager.iterate_medias_by_age(
             group_id=group_id,
             media_limit_days=max_age,
             )
-        media_count: int = len(all_medias)
-        logger.info(f'\t\t\t{len(all_medias)} Medias to be Removed')
+        media_count: int = 0
 
-        if media_count > 0:
+        for media in all_medias:
 
-            for media in all_medias:
+            # Remove from Disk
+            media_file_name: str = os.path.join(media_root_path, 'media', str(media.group_id), media.file_name)
+            logger.info(f'\t\t\t\t{media_file_name}')
 
-                # Remove from Disk
-                media_file_name: str = os.path.join(media_root_path, 'media', str(media.group_id), media.file_name)
-                logger.info(f'\t\t\t\t{media_file_name}')
+            if os.path.exists(media_file_name):
+                os.remove(media_file_name)
 
-                if os.path.exists(media_file_name):
-                    os.remove(media_file_name)
+            # Remove from DB
+            TelegramMediaDatabaseManager.delete_media_by_id(media_id=media.id)
+            media_count += 1
 
-                # Remove from DB
-                TelegramMediaDatabaseManager.delete_media_by_id(media_id=media.id)
+        logger.info(f'\t\t\t{media_count} Medias Removed')
 
         # Delete all Old Messages
         total_messages: int = TelegramMessageDatabaseManager.remove_all_messages_by_age(
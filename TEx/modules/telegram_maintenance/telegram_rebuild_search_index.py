@@ -0,0 +1,37 @@
+"""Telegram Maintenance - Rebuild Full Text Search Index."""
+from __future__ import annotations
+
+import logging
+from configparser import ConfigParser
+from typing import Dict, cast
+
+from TEx.core.base_module import BaseModule
+from TEx.database.telegram_group_database import TelegramMessageSearchDatabaseManager
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class TelegramMaintenanceRebuildSearchIndex(BaseModule):
+    """Telegram Maintenance - Rebuild (Backfill) the Messages Full Text Search Index."""
+
+    async def can_activate(self, config: ConfigParser, args: Dict, data: Dict) -> bool:
+        """
+        Abstract Method for Module Activation Function.
+
+        :return:
+        """
+        return cast(bool, args['rebuild_search_index'])
+
+    async def run(self, config: ConfigParser, args: Dict, data: Dict) -> None:
+        """Execute Module."""
+        if not await self.can_activate(config, args, data):
+            logger.debug('\t\tModule is Not Enabled...')
+            return
+
+        logger.info('\t\tRebuilding Full Text Search Index')
+
+        if not TelegramMessageSearchDatabaseManager.rebuild():
+            logger.warning('\t\tFull Text Search is not Available on this SQLite Build')
+            return
+
+        logger.info('\t\tFull Text Search Index Rebuilt Successfully')
@@ -5,7 +5,7 @@ import asyncio
 import contextlib
 import logging
 import signal
-from configparser import ConfigParser
+from configparser import ConfigParser, SectionProxy
 from typing import Dict, List, Optional, Tuple, cast
 
 import pytz
@@ -13,7 +13,7 @@ from telethon import TelegramClient, events
 from telethon.errors.rpcerrorlist import ChannelPrivateError
 from telethon.events import NewMessage
 from telethon.tl.patched import Message
-from telethon.tl.types import Channel, PeerUser, User
+from telethon.tl.types import Channel, PeerChannel, PeerUser, User
 
 from TEx.core.base_module import BaseModule
 from TEx.core.mapper.telethon_channel_mapper import TelethonChannelEntityMapper
@@ -22,10 +22,12 @@ from TEx.core.mapper.telethon_user_mapper import TelethonUserEntiyMapper
 from TEx.core.media_handler import UniversalTelegramMediaHandler
 from TEx.core.ocr.ocr_engine_base import OcrEngineBase
 from TEx.core.ocr.ocr_engine_factory import OcrEngineFactory
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMessageDatabaseManager, TelegramUserDatabaseManager
+from TEx.core.staged_pipeline import StagedPipeline
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramGroupSyncStateDatabaseManager, TelegramUserDatabaseManager
+from TEx.database.telegram_message_batch_writer import TelegramMessageBatchWriter
 from TEx.exporter.exporter_engine import ExporterEngine
 from TEx.finder.finder_engine import FinderEngine
-from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
+from TEx.models.facade.listener_pipeline_facade_entity import ListenerPipelineItem
 from TEx.notifier.notifier_engine import NotifierEngine
 from TEx.notifier.signals_engine import SignalsEngine, SignalsEngineFactory
 
@@ -57,6 +59,18 @@ class TelegramGroupMessageListener(BaseModule):
         self.signals_engine: SignalsEngine
         self.term_signal: bool = False
         self.sleep_task: asyncio.Task
+        self.pipeline: StagedPipeline[ListenerPipelineItem]
+        self.pipeline_drain_timeout_seconds: int = 0
+        self.notifications_flush_timeout_seconds: int = 0
+        self.sync_lock: asyncio.Lock
+        self.message_writer: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        self.message_writer_task: asyncio.Task
+        self.gap_warning_threshold: int = 0
+        self.last_message_ids: Dict[int, Optional[int]] = {}
+        self.config_file_path: str = ''
+        self.loop: asyncio.AbstractEventLoop
+        self.finder_reload_task: Optional[asyncio.Task] = None
+        self.finder_watch_task: Optional[asyncio.Task] = None
 
     def __handle_term_signal(self, *args: Tuple) -> None:
         """Handle the Interruption and Termination Signals."""
@@ -68,11 +82,29 @@ class TelegramGroupMessageListener(BaseModule):
 
         logger.warning('\t\tTermination Signal Received, please wait to Stop Processing Gracefully.')
 
-    async def __handler(self, event: NewMessage.Event) -> None:
-        """Handle the Message."""
-        # Get Message
-        message: Message = event.message
+    def __attach_signals(self) -> None:
+        """Attach the Termination Signals and the Finder Rules Reload Signal."""
+        signal.signal(signal.SIGINT, self.__handle_term_signal)  # type: ignore
+        signal.signal(signal.SIGTERM, self.__handle_term_signal)  # type: ignore
+
+        # Not Available on Windows
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self.__handle_reload_signal)  # type: ignore
 
+    def __handle_reload_signal(self, *args: Tuple) -> None:
+        """Handle the Hang Up Signal, Reloading the Finder Rules on the Event Loop."""
+        logger.info('\t\tReload Signal Received')
+        self.loop.call_soon_threadsafe(self.__reload_finder)
+
+    def __reload_finder(self) -> None:
+        """Start the Finder Rules Reload, Unless one is Already Running."""
+        if self.finder_reload_task and not self.finder_reload_task.done():
+            return
+
+        self.finder_reload_task = asyncio.create_task(self.finder.reload(config_file_path=self.config_file_path))
+
+    async def __handler(self, event: NewMessage.Event) -> None:
+        """Handle the Message. Only Enqueue the Event into the Ingest Pipeline."""
         # Apply Filter (If group filtering are enabled)
         if len(self.group_ids) > 0 and event.chat.id not in self.group_ids:
             logger.debug(f'\t\tMessage Filtered (GroupID={event.chat.id}) ...')
@@ -81,30 +113,61 @@ class TelegramGroupMessageListener(BaseModule):
         if event and not event.chat:
             return  # TO_DO: Need to Be Handled in Future Version
 
+        # Enqueue (Waits if Pipeline is Full)
+        await self.pipeline.put(ListenerPipelineItem(event=event))
+
+    async def __stage_media(self, item: ListenerPipelineItem) -> Optional[ListenerPipelineItem]:
+        """Pipeline Stage - Ensure Group Exists on DB, Download Media and Ensure User Exists on DB."""
         # Ensure Group Exists on DB
-        await self.__ensure_group_exists(event=event)
+        async with self.sync_lock:
+            await self.__ensure_group_exists(event=item.event)
 
         # Download Media
-        downloaded_media: Optional[MediaHandlingEntity] = await self.media_handler.handle_medias(
-            message, event.chat.id, self.data_path,
+        item.downloaded_media = await self.media_handler.handle_medias(
+            item.message, item.event.chat.id, self.data_path,
             ) if self.download_media else None
 
-        # Process OCR
-        ocr_content: Optional[str] = None
-        if downloaded_media and downloaded_media.is_ocr_supported:
-            ocr_content = self.ocr_engine.run(file_path=downloaded_media.disk_file_path)
+        # Ensure User Exists
+        if item.message.from_id is not None and isinstance(item.message.from_id, PeerUser):
+            async with self.sync_lock:
+                await self.__ensure_user_exists(event=item.event)
+
+        return item
+
+    async def __stage_ocr(self, item: ListenerPipelineItem) -> Optional[ListenerPipelineItem]:
+        """Pipeline Stage - Process OCR."""
+        if item.downloaded_media and item.downloaded_media.is_ocr_supported:
+            ocr_content: Optional[str] = await self.ocr_engine.run_async(file_path=item.downloaded_media.disk_file_path)
             if ocr_content:
-                ocr_content = '====OCR CONTENT====\n' + ocr_content
+                item.ocr_content = '====OCR CONTENT====\n' + ocr_content
+
+        return item
+
+    async def __stage_finder(self, item: ListenerPipelineItem) -> Optional[ListenerPipelineItem]:
+        """Pipeline Stage - Execute Finder and Notifications."""
+        await self.finder.run(
+            await TelethonMessageEntityMapper.to_finder_notification_facade_entity(
+                message=item.message,
+                downloaded_media_info=item.downloaded_media,
+                ocr_content=item.ocr_content),
+            source=self.target_phone_number,
+        )
+
+        return item
+
+    async def __stage_persist(self, item: ListenerPipelineItem) -> Optional[ListenerPipelineItem]:
+        """Pipeline Stage - Persist the Message into DB."""
+        message: Message = item.message
 
         # Create Dict with All Value
         values: Dict = {
             'id': message.id,
-            'group_id': event.chat.id,
+            'group_id': item.event.chat.id,
             'date_time': message.date.astimezone(tz=pytz.utc),
-            'message': self.__build_final_message(message.message, ocr_content),
-            'raw': self.__build_final_message(message.raw_text, ocr_content),
+            'message': self.__build_final_message(message.message, item.ocr_content),
+            'raw': self.__build_final_message(message.raw_text, item.ocr_content),
             'to_id': message.to_id.channel_id if message.to_id is not None and hasattr(message.to_id, 'channel_id') else None,
-            'media_id': downloaded_media.media_id if downloaded_media else None,
+            'media_id': item.downloaded_media.media_id if item.downloaded_media else None,
             'is_reply': message.is_reply,
             'reply_to_msg_id': message.reply_to.reply_to_msg_id if message.is_reply else None,
         }
@@ -112,32 +175,61 @@ class TelegramGroupMessageListener(BaseModule):
         # Process Sender ID
         if message.from_id is not None:
             if isinstance(message.from_id, PeerUser):
-
                 values['from_id'] = message.from_id.user_id
                 values['from_type'] = 'User'
 
-                # Ensure User Exists
-                await self.__ensure_user_exists(event=event)
-
             else:
                 values['from_id'] = None
                 values['from_type'] = None
 
-        # Execute Finder
-        await self.finder.run(
-            await TelethonMessageEntityMapper.to_finder_notification_facade_entity(
-                message=message,
-                downloaded_media_info=downloaded_media,
-                ocr_content=ocr_content),
-            source=self.target_phone_number,
-        )
+        # Check Missing Messages
+        if isinstance(message.peer_id, PeerChannel):
+            self.__detect_gap(group_id=item.event.chat.id, message_id=message.id)
 
         # Add to DB
-        TelegramMessageDatabaseManager.insert(values)
+        self.message_writer.add(values)
 
         # Update Signals Engine
         self.signals_engine.inc_messages_sent()
 
+        return None
+
+    def __configure_pipeline(self, config: ConfigParser) -> None:
+        """Configure the Ingest Pipeline Stages."""
+        listener_config: Optional[SectionProxy] = config['LISTENER'] if config.has_section('LISTENER') else None
+
+        def get_setting(name: str, default: str) -> int:
+            return int(listener_config.get(name, fallback=default)) if listener_config else int(default)
+
+        self.pipeline_drain_timeout_seconds = get_setting('drain_timeout_seconds', '60')
+        self.notifications_flush_timeout_seconds = get_setting('notifications_flush_timeout_seconds', '60')
+        self.gap_warning_threshold = get_setting('gap_warning_threshold', '100')
+
+        self.pipeline = StagedPipeline(name='listener', queue_max_size=get_setting('queue_max_size', '1000'))
+        self.pipeline.add_stage(name='media', handler=self.__stage_media, workers=get_setting('media_workers', '4'))
+        self.pipeline.add_stage(name='ocr', handler=self.__stage_ocr, workers=get_setting('ocr_workers', '4'))
+        self.pipeline.add_stage(name='finder', handler=self.__stage_finder, workers=get_setting('finder_workers', '2'))
+        self.pipeline.add_stage(name='persist', handler=self.__stage_persist, workers=get_setting('persist_workers', '1'))
+
+    def __detect_gap(self, group_id: int, message_id: int) -> None:
+        """Warn when Messages Between the Last Synced Message of a Channel and the Received one are Missing."""
+        if self.gap_warning_threshold <= 0:
+            return
+
+        if group_id not in self.last_message_ids:
+            self.last_message_ids[group_id] = TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=group_id)
+
+        last_message_id: Optional[int] = self.last_message_ids[group_id]
+
+        if last_message_id is not None and message_id - last_message_id > self.gap_warning_threshold:
+            logger.warning(
+                f'\t\tGap Detected on Group "{group_id}". {message_id - last_message_id - 1} Messages Missing '
+                f'(from {last_message_id + 1} to {message_id - 1})',
+            )
+
+        if last_message_id is None or message_id > last_message_id:
+            self.last_message_ids[group_id] = message_id
+
     def __build_final_message(self, message: str, ocr_data: Optional[str]) -> str:
         """Compute Final Message for Dict."""
         h_result: str = ''
@@ -219,14 +311,16 @@ class TelegramGroupMessageListener(BaseModule):
         self.download_media = not args['ignore_media']
         self.data_path = config['CONFIGURATION']['data_path']
         self.target_phone_number = config['CONFIGURATION']['phone_number']
+        self.config_file_path = args['config']
+        self.loop = asyncio.get_running_loop()
 
         try:
-            # Attach Termination Signals
-            signal.signal(signal.SIGINT, self.__handle_term_signal)  # type: ignore
-            signal.signal(signal.SIGTERM, self.__handle_term_signal)  # type: ignore
+            # Attach Termination and Reload Signals
+            self.__attach_signals()
 
-            # Set Notification Engines
+            # Set Notification Engines (and Send the Notifications Left on the Outbox)
             self.notification_engine.configure(config=config)
+            self.notification_engine.start()
 
             # Set Data Export Engines
             self.exporter_engine.configure(config=config)
@@ -244,6 +338,10 @@ class TelegramGroupMessageListener(BaseModule):
             # Set OCR Engine
             self.ocr_engine = OcrEngineFactory.get_instance(config=config)
 
+            # Set Ingest Pipeline
+            self.__configure_pipeline(config=config)
+            self.message_writer.configure(config=config)
+
             # Set Keep Alive Settings
             self.signals_engine = SignalsEngineFactory.get_instance(
                 config=config,
@@ -251,6 +349,9 @@ class TelegramGroupMessageListener(BaseModule):
                 source=self.target_phone_number,
             )
 
+            # Report Finder Rules Disabled by the Match Budget
+            self.finder.signals_engine = self.signals_engine
+
         except AttributeError as ex:
             logger.fatal(ex)
             data['internals']['panic'] = True
@@ -264,6 +365,14 @@ class TelegramGroupMessageListener(BaseModule):
         # Get Client
         client: TelegramClient = data['telegram_client']
 
+        # Start Ingest Pipeline
+        self.sync_lock = asyncio.Lock()
+        self.pipeline.start()
+        self.message_writer_task = asyncio.create_task(self.message_writer.auto_flush())
+
+        # Watch the Configuration File for Finder Rules Changes
+        self.finder_watch_task = asyncio.create_task(self.finder.watch_config(config_file_path=self.config_file_path))
+
         # Register Handlers
         client.add_event_handler(self.__handler, events.NewMessage)
 
@@ -287,8 +396,14 @@ class TelegramGroupMessageListener(BaseModule):
             else:
                 break  # Future: Handle Reconnection + Configure Reconnection in config file
 
-            # Send Keep-Alive Signal
-            await self.signals_engine.keep_alive()
+            # Send Keep-Alive Signal (With the Notifiers Delivery Metrics and the Finder Slowest Rules, if Profiling)
+            await self.signals_engine.keep_alive(details=self.__get_keep_alive_details())
+
+        # Stop Reloading the Finder Rules
+        await self.__stop_finder_reload()
+
+        # Stop Receiving Messages and Drain the Ingest Pipeline
+        await self.__drain_pipeline(client=client)
 
         # Disconnect Telegram Client
         await self.__disconnect(client=client)
@@ -296,6 +411,47 @@ class TelegramGroupMessageListener(BaseModule):
         # Shutdown All Exporters
         await self.__shutdown_exporters()
 
+        # Shutdown OCR Engine
+        self.ocr_engine.shutdown()
+
+        # Shutdown Finder Worker Pool
+        self.finder.shutdown()
+
+        # Deliver the Pending Notifications (Including the Shutdown Signal)
+        await self.notification_engine.shutdown(timeout_seconds=self.notifications_flush_timeout_seconds)
+
+    def __get_keep_alive_details(self) -> Optional[str]:
+        """Return the Keep-Alive Signal Details."""
+        details: List[str] = [item for item in [self.notification_engine.get_summary(), self.finder.get_profile_summary()] if item]
+        return '\n'.join(details) if details else None
+
+    async def __stop_finder_reload(self) -> None:
+        """Stop Watching the Configuration File and Wait any Running Finder Rules Reload."""
+        if self.finder_watch_task:
+            self.finder_watch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.finder_watch_task
+
+        if self.finder_reload_task:
+            await self.finder_reload_task
+
+    async def __drain_pipeline(self, client: TelegramClient) -> None:
+        """Remove the Event Handler and Wait the Ingest Pipeline Finish all Pending Messages."""
+        client.remove_event_handler(self.__handler, events.NewMessage)
+
+        logger.info(f'\t\tDraining Ingest Pipeline ({self.pipeline.pending()} Pending Messages)...')
+        await self.pipeline.drain(timeout_seconds=self.pipeline_drain_timeout_seconds)
+
+        # Stop the Batch Writer and Write the Remaining Messages
+        self.message_writer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.message_writer_task
+
+        try:
+            self.message_writer.flush()
+        except Exception:  # Yes, Catch All
+            logger.exception(f'Unable to Write the Remaining Messages. {len(self.message_writer.buffer)} Buffered Messages Lost')
+
     async def __shutdown_exporters(self) -> None:
         """Shutdown all Exporters."""
         logger.info('\t\tShutdown File Exporters...')
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from configparser import ConfigParser
+from configparser import ConfigParser, SectionProxy
 from typing import Dict, List, Optional, cast
 
 import pytz
@@ -13,7 +13,9 @@ from telethon.tl.types import Message, MessageService, PeerChannel, PeerUser
 
 from TEx.core.base_module import BaseModule
 from TEx.core.media_handler import UniversalTelegramMediaHandler
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMessageDatabaseManager
+from TEx.core.rate_limiter import FloodWaitAwareRateLimiter
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramGroupSyncStateDatabaseManager
+from TEx.database.telegram_message_batch_writer import TelegramMessageBatchWriter
 from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity
 from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
 
@@ -23,9 +25,15 @@ logger = logging.getLogger('TelegramExplorer')
 class TelegramGroupMessageScrapper(BaseModule):
     """Download all Messages from Telegram Groups."""
 
+    # Max Number of Messages Returned by a Single Telegram GetHistory Request
+    PAGE_SIZE: int = 100
+
     def __init__(self) -> None:
         """Class Initializer."""
         self.media_handler: UniversalTelegramMediaHandler = UniversalTelegramMediaHandler()
+        self.message_writer: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        self.rate_limiter: FloodWaitAwareRateLimiter
+        self.concurrency: int = 1
 
     async def can_activate(self, config: ConfigParser, args: Dict, data: Dict) -> bool:
         """
@@ -44,6 +52,12 @@ class TelegramGroupMessageScrapper(BaseModule):
         # Configure Media Handler
         self.media_handler.configure(config=config)
 
+        # Configure Messages Writer
+        self.message_writer.configure(config=config)
+
+        # Configure Scheduler and Rate Limiter
+        self.__configure_scheduler(config=config)
+
         # Get Client
         client: TelegramClient = data['telegram_client']
 
@@ -59,14 +73,57 @@ class TelegramGroupMessageScrapper(BaseModule):
 
             logger.info(f'\t\tApplied Groups Filtering... {len(groups)} remaining')
 
+        # Enqueue all Groups
+        pending_groups: asyncio.Queue = asyncio.Queue()
         for group in groups:
+            pending_groups.put_nowait(group)
+
+        # Download Groups Concurrently. A Failing Worker does not Detach the Others
+        results: List[Optional[BaseException]] = await asyncio.gather(*[
+            self.__group_worker(
+                pending_groups=pending_groups,
+                client=client,
+                download_media=not args['ignore_media'],
+                data_path=config['CONFIGURATION']['data_path'],
+                )
+            for _ in range(min(self.concurrency, len(groups)))
+        ], return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error('\t\tGroups Download Worker Failed', exc_info=result)
+
+        # Write the Messages Left by Failed Downloads
+        try:
+            self.message_writer.flush()
+        except Exception:  # Yes, Catch All
+            logger.exception(f'Unable to Write the Remaining Messages. {len(self.message_writer.buffer)} Buffered Messages Lost')
+
+    def __configure_scheduler(self, config: ConfigParser) -> None:
+        """Configure the Groups Scheduler and the Shared Rate Limiter."""
+        download_config: Optional[SectionProxy] = config['MESSAGES.DOWNLOAD'] if config.has_section('MESSAGES.DOWNLOAD') else None
+
+        def get_setting(name: str, default: str) -> str:
+            return download_config.get(name, fallback=default) if download_config else default
+
+        self.concurrency = max(1, int(get_setting('concurrency', '4')))
+        self.rate_limiter = FloodWaitAwareRateLimiter(
+            max_rate_per_second=float(get_setting('max_requests_per_second', '1')),
+            burst=int(get_setting('requests_burst', str(self.concurrency))),
+            )
+
+    async def __group_worker(self, pending_groups: asyncio.Queue, client: TelegramClient, download_media: bool, data_path: str) -> None:
+        """Download Groups from the Queue Until it is Empty."""
+        while not pending_groups.empty():
+            group: TelegramGroupOrmEntity = pending_groups.get_nowait()
+
             try:
                 await self.__download_messages(
                     group_id=group.id,
                     client=client,
                     group_name=group.title,
-                    download_media=not args['ignore_media'],
-                    data_path=config['CONFIGURATION']['data_path'],
+                    download_media=download_media,
+                    data_path=data_path,
                     iter_message_type=PeerChannel,
                     )
             except ValueError as ex:
@@ -81,65 +138,97 @@ class TelegramGroupMessageScrapper(BaseModule):
         # Main Download Loop
         while True:
 
-            # Loop Control
-            records: int = 0
-
             # Get the Latest OffSet from Group
-            last_offset: Optional[int] = TelegramMessageDatabaseManager.get_max_id_from_group(group_id=group_id)
+            last_offset: Optional[int] = TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=group_id)
 
             # Log
             logger.info(f'\t\tDownload Messages from "{group_name}" > Last Offset: {last_offset}')
 
             # Wait to Prevent Telegram Flood Detection
-            await asyncio.sleep(1)
+            await self.rate_limiter.acquire()
+
+            # Download the Page
+            try:
+                records: int = await self.__download_page(
+                    group_id=group_id,
+                    client=client,
+                    download_media=download_media,
+                    data_path=data_path,
+                    iter_message_type=iter_message_type,
+                    last_offset=last_offset,
+                    )
+                self.rate_limiter.report_success()
+
+            except telethon.errors.rpcerrorlist.FloodWaitError as ex:
+                # Retry the Same Group after the Wait, Keeping the Messages Already Downloaded
+                self.rate_limiter.report_flood_wait(seconds=ex.seconds)
+                self.message_writer.flush()
+                continue
 
-            # Get all Chats from a Single Group
-            # https://docs.telethon.dev/en/latest/modules/client.html#telethon.client.messages.MessageMethods.iter_messages
-            async for message in client.iter_messages(
-                    iter_message_type(group_id),
-                    reverse=True,
-                    limit=500,
-                    min_id=last_offset if last_offset is not None else -1,
-                    ):
+            # Write all Buffered Messages before Query the Next Offset
+            self.message_writer.flush()
 
-                # Ignore MessageService Messages
-                if isinstance(message, MessageService):
-                    continue
+            # Exit Rule
+            if records == 0:
+                break
 
-                # Loop Control
-                records += 1
+    async def __download_page(self, group_id: int, client: TelegramClient, download_media: bool, data_path: str, iter_message_type: type, last_offset: Optional[int]) -> int:
+        """
+        Download one Page of Messages from a Single Group.
 
-                # Handle Unknown Types
-                if not isinstance(message, Message):
-                    logger.debug(f'\t\t{type(message)}')
+        :return: Number of Downloaded Messages
+        """
+        records: int = 0
 
-                if message.reply_to is not None:
-                    pass
+        # Get all Chats from a Single Group
+        # https://docs.telethon.dev/en/latest/modules/client.html#telethon.client.messages.MessageMethods.iter_messages
+        async for message in client.iter_messages(
+                iter_message_type(group_id),
+                reverse=True,
+                limit=TelegramGroupMessageScrapper.PAGE_SIZE,
+                min_id=last_offset if last_offset is not None else -1,
+                ):
 
-                if message.reply_to_msg_id:
+            # Ignore MessageService Messages
+            if isinstance(message, MessageService):
+                continue
+
+            # Loop Control
+            records += 1
+
+            # Handle Unknown Types
+            if not isinstance(message, Message):
+                logger.debug(f'\t\t{type(message)}')
+
+            if message.reply_to is not None:
+                pass
+
+            if message.reply_to_msg_id:
+                pass
+
+            # Each Media Download is a Telegram Request
+            downloaded_media: Optional[MediaHandlingEntity] = None
+            if download_media and message.media is not None:
+                await self.rate_limiter.acquire()
+                downloaded_media = await self.media_handler.handle_medias(message, group_id, data_path)
+            values: Dict = {
+                'id': message.id,
+                'group_id': group_id,
+                'date_time': message.date.astimezone(tz=pytz.utc),
+                'message': message.message,
+                'raw': message.raw_text,
+                'to_id': message.to_id.channel_id if message.to_id is not None else None,
+                'media_id': downloaded_media.media_id if downloaded_media else None,
+            }
+
+            if message.from_id is not None:
+                if isinstance(message.from_id, PeerUser):
+                    values['from_id'] = message.from_id.user_id
+                    values['from_type'] = 'User'
+                else:
                     pass
 
-                downloaded_media: Optional[MediaHandlingEntity] = await self.media_handler.handle_medias(message, group_id, data_path) if download_media else None
-                values: Dict = {
-                    'id': message.id,
-                    'group_id': group_id,
-                    'date_time': message.date.astimezone(tz=pytz.utc),
-                    'message': message.message,
-                    'raw': message.raw_text,
-                    'to_id': message.to_id.channel_id if message.to_id is not None else None,
-                    'media_id': downloaded_media.media_id if downloaded_media else None,
-                }
-
-                if message.from_id is not None:
-                    if isinstance(message.from_id, PeerUser):
-                        values['from_id'] = message.from_id.user_id
-                        values['from_type'] = 'User'
-                    else:
-                        pass
-
-                # Add to DB
-                TelegramMessageDatabaseManager.insert(values)
+            # Add to DB
+            self.message_writer.add(values)
 
-            # Exit Rule
-            if records == 0:
-                break
+        return records
@@ -1,20 +1,23 @@
 """Telegram Report Generator."""
 from __future__ import annotations
 
+import itertools
 import logging
 import os
 import re
 import shutil
 from configparser import ConfigParser
 from operator import attrgetter
-from typing import Dict, List, Optional, cast
+from typing import Dict, Iterable, Iterator, List, Optional, Set, cast
 
 import aiofiles
+from sqlalchemy.engine import Row
 
 from TEx.core.base_module import BaseModule
 from TEx.core.dir_manager import DirectoryManagerUtils
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMessageDatabaseManager
-from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramMessageOrmEntity
+from TEx.core.full_text_query_builder import FullTextQueryBuilder
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMessageDatabaseManager, TelegramMessageSearchDatabaseManager
+from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity
 from TEx.models.facade.telegram_group_report_facade_entity import TelegramGroupReportFacadeEntity, TelegramGroupReportFacadeEntityMapper
 from TEx.models.facade.telegram_message_report_facade_entity import TelegramMessageReportFacadeEntity, TelegramMessageReportFacadeEntityMapper
 
@@ -108,50 +111,59 @@ class TelegramExportTextGenerator(BaseModule):
         limit_days: int = int(args['limit_days'])
         limit_seconds: int = limit_days * 24 * 60 * 60
 
-        db_messages: List[TelegramMessageOrmEntity] = TelegramMessageDatabaseManager.get_all_messages_from_group(
+        filter_regex: Optional[str] = args['regex'] if args['regex'] else None
+
+        # Stream the Messages by Pages, so the Memory Usage does not Depends on the Group Size
+        rows: Iterator[Row] = TelegramMessageDatabaseManager.iterate_messages_from_group(
             group_id=group.id,
             order_by_desc=args['order_desc'],
             message_datetime_limit_seconds=limit_seconds,
+            full_text_query=self.build_full_text_query(filter_regex=filter_regex),
             )
 
         # Convert Messages to Report Facade Entity
-        messages: List[TelegramMessageReportFacadeEntity] = [
+        messages: Iterator[TelegramMessageReportFacadeEntity] = (
             TelegramMessageReportFacadeEntityMapper.create_from_dbentity(item)
-            for item in db_messages
-            ]
+            for item in rows
+            )
 
-        # Filter Messages
+        # Filter and Dedup Messages
         logger.info('\t\t\tFiltering')
-        filter_regex: Optional[str] = args['regex'] if args['regex'] else None
-        filtered_messages: List[str] = self.filter_messages(messages=messages, filter_regex=filter_regex)
+        filtered_messages: Iterator[str] = self.dedup_messages(messages=self.filter_messages(messages=messages, filter_regex=filter_regex))
 
         # if Has 0 Messages, Get Out
-        if len(filtered_messages) == 0:
+        first_message: Optional[str] = next(filtered_messages, None)
+        if first_message is None:
             return
 
-        # Dedup Messages
-        filtered_messages = list(dict.fromkeys(filtered_messages))
-
         logger.info('\t\t\tRendering')
+        group.meta_message_count = 0
+
         async with aiofiles.open(f'{report_root_folder}/result_{group.group_username}_{group.id}.txt', 'wb') as file:
 
-            for message in filtered_messages:
+            for message in itertools.chain([first_message], filtered_messages):
                 if isinstance(message, str):
                     await file.write(message.encode('utf-8'))
                     await file.write(b'\r\n')
 
+                # Add Meta in Group
+                group.meta_message_count += 1
+
             await file.flush()
             await file.close()
 
-        # Add Meta in Group
-        group.meta_message_count = len(filtered_messages)
+    def build_full_text_query(self, filter_regex: Optional[str]) -> Optional[str]:
+        """Build the Full Text Search Query Used to Prefilter the Messages, or None if the Index can not be Used."""
+        if not filter_regex or not TelegramMessageSearchDatabaseManager.is_ready():
+            return None
+
+        return FullTextQueryBuilder.from_regex(pattern=filter_regex)
 
-    def filter_messages(self, messages: List[TelegramMessageReportFacadeEntity], filter_regex: Optional[str]) -> List[str]:
+    def filter_messages(self, messages: Iterable[TelegramMessageReportFacadeEntity], filter_regex: Optional[str]) -> Iterator[str]:
         """Filter Messages."""
         if not filter_regex or len(filter_regex) == 0:
-            return [item.raw for item in messages]
-
-        h_messages: List[str] = []
+            yield from (item.raw for item in messages)
+            return
 
         # Compile Regex
         compiled_regex = re.compile(filter_regex, flags=re.IGNORECASE | re.MULTILINE)
@@ -165,11 +177,18 @@ class TelegramExportTextGenerator(BaseModule):
             if len(matches) > 0:
                 for match in matches:
                     if isinstance(match, str):
-                        h_messages.append(match)
+                        yield match
                     elif isinstance(match, tuple):
-                        h_messages.extend(list(match))
+                        yield from match
+
+    def dedup_messages(self, messages: Iterable[str]) -> Iterator[str]:
+        """Deduplicate the Messages, Keeping the First Occurrence Order."""
+        seen_messages: Set[str] = set()
 
-        return h_messages
+        for message in messages:
+            if message not in seen_messages:
+                seen_messages.add(message)
+                yield message
 
     def ireplace(self, old: str, repl: str, text: str) -> str:
         """Case Insensitive Replace."""
@@ -2,23 +2,33 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import logging
 import os
 import re
 import shutil
+from collections import deque
 from configparser import ConfigParser
 from hashlib import md5
 from operator import attrgetter
-from typing import Dict, List, Optional, cast
+from typing import AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional, Set, cast
 
 import aiofiles
 import pytz
 from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from sqlalchemy.engine import Row
 
 from TEx.core.base_module import BaseModule
 from TEx.core.dir_manager import DirectoryManagerUtils
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, TelegramMessageDatabaseManager, TelegramUserDatabaseManager
-from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramMediaOrmEntity, TelegramMessageOrmEntity, TelegramUserOrmEntity
+from TEx.core.full_text_query_builder import FullTextQueryBuilder
+from TEx.database.telegram_group_database import (
+    TelegramGroupDatabaseManager,
+    TelegramMediaDatabaseManager,
+    TelegramMessageDatabaseManager,
+    TelegramMessageSearchDatabaseManager,
+    TelegramUserDatabaseManager,
+)
+from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramMediaOrmEntity, TelegramUserOrmEntity
 from TEx.models.facade.telegram_group_report_facade_entity import TelegramGroupReportFacadeEntity, TelegramGroupReportFacadeEntityMapper
 from TEx.models.facade.telegram_message_report_facade_entity import TelegramMessageReportFacadeEntity, TelegramMessageReportFacadeEntityMapper
 
@@ -30,6 +40,9 @@ class TelegramReportGenerator(BaseModule):
 
     __USERS_RESOLUTION_CACHE: Dict = {}
 
+    RENDER_BUFFER_SIZE: int = 65536
+    """Rendered HTML Size Buffered Before Writing into the Report File"""
+
     async def can_activate(self, config: ConfigParser, args: Dict, data: Dict) -> bool:
         """
         Abstract Method for Module Activation Function.
@@ -60,6 +73,7 @@ class TelegramReportGenerator(BaseModule):
         env = Environment(
             loader=FileSystemLoader('report_templates'),
             autoescape=select_autoescape(),
+            enable_async=True,
             )
         report_template: Template = env.get_template('default_report.html')
         index_template: Template = env.get_template('default_index.html')
@@ -126,7 +140,7 @@ class TelegramReportGenerator(BaseModule):
 
         # Generate Object to Render
         logger.info('\t\t\tRendering Index Page')
-        output = template.render(
+        output = await template.render_async(
             groups=[group for group in groups if getattr(group, 'meta_message_count', 0) > 0],
             end=datetime.datetime.now(tz=pytz.UTC).strftime('%Y-%m-%d %H:%M:%S'),
             start=(datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(seconds=int(args['limit_days']) * 24 * 60 * 60)).strftime('%Y-%m-%d %H:%M:%S'),
@@ -156,59 +170,91 @@ class TelegramReportGenerator(BaseModule):
         limit_days: int = int(args['limit_days'])
         limit_seconds: int = limit_days * 24 * 60 * 60
 
-        db_messages: List[TelegramMessageOrmEntity] = TelegramMessageDatabaseManager.get_all_messages_from_group(
+        filter_words: Optional[List[str]] = args['filter'].split(',') if args['filter'] else None
+
+        # Prefilter the Messages using the Full Text Search Index
+        full_text_query: Optional[str] = self.build_full_text_query(filter_words=filter_words)
+
+        if full_text_query and TelegramMessageDatabaseManager.count_messages_from_group(
+                group_id=group.id,
+                message_datetime_limit_seconds=limit_seconds,
+                full_text_query=full_text_query,
+                ) == 0:
+            return
+
+        # Stream the Messages by Pages, so the Memory Usage does not Depends on the Group Size
+        rows: Iterator[Row] = TelegramMessageDatabaseManager.iterate_messages_from_group(
             group_id=group.id,
             order_by_desc=args['order_desc'],
             message_datetime_limit_seconds=limit_seconds,
+            full_text_query=full_text_query if int(args['around_messages']) == 0 else None,  # Around Messages Needs the Full Timeline
             )
 
         # Convert Messages to Report Facade Entity
-        messages: List[TelegramMessageReportFacadeEntity] = [
+        messages: Iterator[TelegramMessageReportFacadeEntity] = (
             TelegramMessageReportFacadeEntityMapper.create_from_dbentity(item)
-            for item in db_messages
-            ]
+            for item in rows
+            )
 
         # Filter Messages
         logger.info('\t\t\tFiltering')
-        filter_words: Optional[List[str]] = args['filter'].split(',') if args['filter'] else None
         messages = self.filter_messages(messages=messages, filter_words=filter_words, args=args)
 
         # if Has 0 Messages, Get Out
-        if len(messages) == 0:
+        first_message: Optional[TelegramMessageReportFacadeEntity] = next(messages, None)
+        if first_message is None:
             return
 
         logger.info('\t\t\tProcessing Messages')
 
         # Generate Object to Render
-        render_messages: List = await self.process_messages(
-            messages=messages,
-            assets_root_folder=assets_root_folder,
-            suppress_repeating_messages=args['suppress_repeating_messages'],
-            data_path=config['CONFIGURATION']['data_path'],
+        group.meta_message_count = 0
+        render_messages: AsyncIterator[Dict] = self.__count_rendered_messages(
+            group=group,
+            source=self.process_messages(
+                messages=itertools.chain([first_message], messages),
+                assets_root_folder=assets_root_folder,
+                suppress_repeating_messages=args['suppress_repeating_messages'],
+                data_path=config['CONFIGURATION']['data_path'],
+                ),
             )
 
         logger.info('\t\t\tRendering')
         async with aiofiles.open(f'{report_root_folder}/result_{group.group_username}_{group.id}.html', 'wb') as file:
-            output = template.render(
-                groupname=group.title,
-                groupusername=group.group_username,
-                messages=render_messages,
-                )
-            await file.write(output.encode('utf-8'))
+            buffer: List[str] = []
+            buffer_size: int = 0
+
+            async for chunk in template.generate_async(
+                    groupname=group.title,
+                    groupusername=group.group_username,
+                    messages=render_messages,
+                    ):
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+
+                if buffer_size >= TelegramReportGenerator.RENDER_BUFFER_SIZE:
+                    await file.write(''.join(buffer).encode('utf-8'))
+                    buffer = []
+                    buffer_size = 0
+
+            await file.write(''.join(buffer).encode('utf-8'))
             await file.flush()
             await file.close()
 
-        # Add Meta in Group
-        group.meta_message_count = len(render_messages)
+    async def __count_rendered_messages(self, group: TelegramGroupReportFacadeEntity, source: AsyncIterator[Dict]) -> AsyncIterator[Dict]:
+        """Count the Rendered Messages into Group Meta."""
+        async for item in source:
+            group.meta_message_count += 1
+            yield item
 
     async def process_messages(self,
-                               messages: List[TelegramMessageReportFacadeEntity],
+                               messages: Iterable[TelegramMessageReportFacadeEntity],
                                assets_root_folder: str,
                                suppress_repeating_messages: bool,
-                               data_path: str) -> List[TelegramMediaOrmEntity]:
-        """Process Group Messages."""
-        h_result: List = []
-        reppeating_messages_signatures: List[str] = []
+                               data_path: str) -> AsyncIterator[Dict]:
+        """Process Group Messages, Yielding one Entry per Rendered Message."""
+        pending_entry: Optional[Dict] = None
+        reppeating_messages_signatures: Set[str] = set()
 
         # Process Each Message
         for message in messages:
@@ -217,7 +263,7 @@ class TelegramReportGenerator(BaseModule):
                 message_hash: str = md5(message.message.encode('utf-8')).hexdigest()
                 if message_hash in reppeating_messages_signatures:
                     continue
-                reppeating_messages_signatures.append(message_hash)
+                reppeating_messages_signatures.add(message_hash)
 
             # Get the From Message User
             from_user: Optional[TelegramUserOrmEntity] = self.get_user(message.from_id) if message.from_id else None
@@ -225,33 +271,36 @@ class TelegramReportGenerator(BaseModule):
             # Check if Append the Message on Previous Message OR Creates a New One
             is_user_bot: bool = from_user is not None and not from_user.is_bot
             not_has_media = message.media_id is None
-            is_same_user: bool = len(h_result) > 0 and h_result[-1]['from_id'] == message.from_id and h_result[-1]['to_id'] == message.to_id
+            is_same_user: bool = pending_entry is not None and pending_entry['from_id'] == message.from_id and pending_entry['to_id'] == message.to_id
 
-            if is_user_bot and is_same_user and not_has_media:
+            if pending_entry is not None and is_user_bot and is_same_user and not_has_media:
 
                 # Attach to Previous Message
-                h_result[-1]['message'] += '\r\n' + message.message
+                pending_entry['message'] += '\r\n' + message.message
+                continue
 
-            else:
+            # Process new Message
+            entry: Dict = {
+                'id': message.id,
+                'date_time': message.date_time,
+                'from_id': message.from_id,
+                'to_id': message.to_id,
+                'message': message.message,
+                'meta_next': getattr(message, 'meta_next', None),
+                'meta_previous': getattr(message, 'meta_previous', None),
+                'to_from_information': self.render_to_from_message_info(message=message, from_user=from_user),
+                }
 
-                # Process new Message
-                entry: Dict = {
-                    'id': message.id,
-                    'date_time': message.date_time,
-                    'from_id': message.from_id,
-                    'to_id': message.to_id,
-                    'message': message.message,
-                    'meta_next': getattr(message, 'meta_next', None),
-                    'meta_previous': getattr(message, 'meta_previous', None),
-                    'to_from_information': self.render_to_from_message_info(message=message, from_user=from_user),
-                    }
+            # Process Media
+            entry.update(await self.get_media(message=message, assets_root_folder=assets_root_folder, data_path=data_path))
 
-                # Process Media
-                entry.update(await self.get_media(message=message, assets_root_folder=assets_root_folder, data_path=data_path))
+            if pending_entry is not None:
+                yield pending_entry
 
-                h_result.append(entry)
+            pending_entry = entry
 
-        return h_result
+        if pending_entry is not None:
+            yield pending_entry
 
     async def get_media(self, message: TelegramMessageReportFacadeEntity, assets_root_folder: str, data_path: str) -> Dict:
         """Download Media and Return the Metadata."""
@@ -324,95 +373,66 @@ class TelegramReportGenerator(BaseModule):
 
         return cast(Optional[TelegramUserOrmEntity], TelegramReportGenerator.__USERS_RESOLUTION_CACHE[user_id])
 
-    def filter_messages(self, messages: List[TelegramMessageReportFacadeEntity], filter_words: Optional[List[str]], args: Dict) -> List[TelegramMessageReportFacadeEntity]:
-        """Filter Messages."""
+    def build_full_text_query(self, filter_words: Optional[List[str]]) -> Optional[str]:
+        """Build the Full Text Search Query Used to Prefilter the Messages, or None if the Index can not be Used."""
+        if not filter_words or not TelegramMessageSearchDatabaseManager.is_ready():
+            return None
+
+        return FullTextQueryBuilder.from_terms(terms=filter_words)
+
+    def filter_messages(self, messages: Iterator[TelegramMessageReportFacadeEntity], filter_words: Optional[List[str]], args: Dict) -> Iterator[TelegramMessageReportFacadeEntity]:
+        """
+        Filter Messages, Including the Around (Previous and Next) Messages of Each Match.
+
+        Works as a Sliding Window over the Messages Stream, so Each Message is Returned Only Once.
+        """
         if not filter_words or len(filter_words) == 0:
-            return messages
+            yield from messages
+            return
 
-        h_messages: List[TelegramMessageReportFacadeEntity] = []
-        h_result: List[TelegramMessageReportFacadeEntity] = []
+        around_messages: int = int(args['around_messages'])
+        previous_messages: Deque[TelegramMessageReportFacadeEntity] = deque(maxlen=around_messages)
+        pending_next_messages: int = 0
 
         # Loop on Messages
         for message in messages:
 
             matched: bool = False
-            new_message: TelegramMessageReportFacadeEntity = message
 
             # Process Each Filter
             for word in filter_words:
 
                 # Check Filter
                 if word.casefold() in message.raw.casefold():
-                    new_message.message = self.ireplace(word, f'<span class="marker">{word}</span>', new_message.message)
+                    message.message = self.ireplace(word, f'<span class="marker">{word}</span>', message.message)
                     matched = True
 
             if matched:
-                h_messages.append(new_message)
 
-        # Add the Around Messages
-        for single_result in h_messages:
+                # Place an Color Wrapper Around
+                for item in previous_messages:
+                    item.meta_previous = True
+                    item.meta_next = False
+                    yield item
 
-            single_result.meta_next = False
-            single_result.meta_previous = False
+                previous_messages.clear()
 
-            # Get The Next and Previous Messages
-            previous_messages: List[TelegramMessageReportFacadeEntity] = self.get_previous_messages(target_id=single_result.id, messages=messages, count=int(args['around_messages']))
-            next_messages: List[TelegramMessageReportFacadeEntity] = self.get_next_messages(target_id=single_result.id, messages=messages, count=int(args['around_messages']))
+                message.meta_next = False
+                message.meta_previous = False
+                yield message
 
-            # Place an Color Wrapper Around
-            for item in previous_messages:
-                item.meta_previous = True
-                item.meta_next = False
+                pending_next_messages = around_messages
 
-            for item in next_messages:
-                item.meta_next = True
-                item.meta_previous = False
+            elif pending_next_messages > 0:
+                message.meta_next = True
+                message.meta_previous = False
+                yield message
 
-            h_result.extend(previous_messages)
-            h_result.append(single_result)
-            h_result.extend(next_messages)
+                pending_next_messages -= 1
 
-        return self.dedup_messages(messages=h_result)
+            else:
+                previous_messages.append(message)
 
     def ireplace(self, old: str, repl: str, text: str) -> str:
         """Case Insensitive Replace."""
         return re.sub('(?i)' + re.escape(old), lambda _m: repl, text)
-
-    def get_previous_messages(self, target_id: int, messages: List[TelegramMessageReportFacadeEntity], count: int) -> List[TelegramMessageReportFacadeEntity]:
-        """Return the (count) messages prior the (id) message."""
-        if count == 0:
-            return []
-
-        target_ix: int = [messages.index(item) for item in messages if item.id == target_id][0]
-        dest_ix: int = target_ix - count
-
-        if dest_ix > 0:
-            return messages[dest_ix:target_ix]
-
-        return messages[0:target_ix]
-
-    def get_next_messages(self, target_id: int, messages: List[TelegramMessageReportFacadeEntity], count: int) -> List[TelegramMessageReportFacadeEntity]:
-        """Return the (count) messages after the (id) message."""
-        if count == 0:
-            return []
-
-        target_ix: int = [messages.index(item) for item in messages if item.id == target_id][0]
-        dest_ix: int = target_ix + count + 1
-
-        if dest_ix <= len(messages):
-            return messages[target_ix + 1:dest_ix]
-
-        return messages[target_ix:]
-
-    def dedup_messages(self, messages: List[TelegramMessageReportFacadeEntity]) -> List[TelegramMessageReportFacadeEntity]:
-        """Deduplicate the Messages."""
-        if len(messages) == 0:
-            return []
-
-        h_result: List[TelegramMessageReportFacadeEntity] = []
-
-        for message in messages:
-            if len(h_result) == 0 or message.id != h_result[-1].id:
-                h_result.append(message)
-
-        return h_result
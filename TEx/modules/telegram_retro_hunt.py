@@ -0,0 +1,253 @@
+"""Telegram Retro Hunt - Run the Finder Rules over the Stored Messages."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from configparser import ConfigParser
+from multiprocessing import cpu_count
+from typing import Dict, Iterator, List, Optional, Set, Tuple, cast
+
+from sqlalchemy.engine import Row
+
+from TEx.core.base_module import BaseModule
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, TelegramMessageDatabaseManager
+from TEx.exporter.exporter_engine import ExporterEngine
+from TEx.finder.finder_batch_worker import init_batch_worker, match_batch
+from TEx.finder.finder_rule_set import FinderRuleSet
+from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramMediaOrmEntity
+from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
+from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
+from TEx.notifier.notifier_engine import NotifierEngine
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class TelegramRetroHunt(BaseModule):
+    """
+    Run the Finder Rules over the Stored Messages, Sending the Hits to the Rules Notifiers and Exporters.
+
+    Messages are Streamed from the Database by Pages ([DATABASE] read_page_size) and each Page is Matched on a Process
+    Pool Worker. Only a Bounded Number of Pages are in Flight, so the Memory Usage does not Depends on the Database Size.
+    """
+
+    PROGRESS_INTERVAL_SECONDS: int = 10
+
+    def __init__(self) -> None:
+        """Initialize Module."""
+        self.notification_engine: NotifierEngine = NotifierEngine()
+        self.exporter_engine: ExporterEngine = ExporterEngine()
+        self.rule_set: FinderRuleSet = FinderRuleSet()
+        self.source: str = ''
+        self.data_path: str = ''
+        self.messages_processed: int = 0
+        self.hits: int = 0
+        self.started_at: float = 0.0
+        self.last_progress_at: float = 0.0
+
+    async def can_activate(self, config: ConfigParser, args: Dict, data: Dict) -> bool:
+        """
+        Abstract Method for Module Activation Function.
+
+        :return:
+        """
+        return cast(bool, args['retro_hunt'])
+
+    async def run(self, config: ConfigParser, args: Dict, data: Dict) -> None:
+        """Execute Module."""
+        if not await self.can_activate(config, args, data):
+            logger.debug('\t\tModule is Not Enabled...')
+            return
+
+        self.source = config['CONFIGURATION']['phone_number']
+        self.data_path = config['CONFIGURATION']['data_path']
+
+        try:
+            rule_ids: Optional[Set[str]] = TelegramRetroHunt.__resolve_rule_ids(config=config, rule=args['rule'])
+
+            # Load the Rules, Notification and Data Export Engines
+            self.rule_set.load(config=config, rule_ids=rule_ids)
+            self.notification_engine.configure(config=config)
+            self.exporter_engine.configure(config=config)
+
+        except AttributeError as ex:
+            logger.fatal(ex)
+            data['internals']['panic'] = True
+            return
+
+        if len(self.rule_set.rules) == 0:
+            logger.warning('\t\tNo Finder Rules Found')
+            return
+
+        logger.info(f'\t\tHunting {len(self.rule_set.rules)} Rules: {", ".join([rule["id"] for rule in self.rule_set.rules])}')
+
+        workers: int = max(1, int(config.get('FINDER', 'pool_workers', fallback=str(cpu_count()))))
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_batch_worker,
+            initargs=(FinderRuleSet.get_rules_config(config=config, rule_ids=rule_ids), self.source),
+            )
+
+        self.started_at = time.monotonic()
+        self.last_progress_at = self.started_at
+
+        # Send the Notifications Left on the Outbox and Retry the Failed Ones, Sharing the Persisted Deduplication
+        self.notification_engine.start()
+
+        try:
+            for group in self.__filter_groups(args=args):
+                await self.__hunt_group(
+                    group=group,
+                    limit_seconds=int(args['limit_days']) * 24 * 60 * 60,
+                    executor=executor,
+                    max_in_flight=workers * 2,
+                    )
+
+        finally:
+            executor.shutdown(wait=True)
+            await self.exporter_engine.shutdown()
+            await self.notification_engine.shutdown()
+
+        self.__log_progress(prefix='Retro Hunt Finished')
+
+    @staticmethod
+    def __resolve_rule_ids(config: ConfigParser, rule: str) -> Optional[Set[str]]:
+        """Resolve the --rule Argument (Comma Separated, with or without the FINDER.RULE. Prefix). None for all Rules."""
+        if not rule or rule == '*':
+            return None
+
+        available_rules: List[str] = FinderRuleSet.get_rules_sections(config=config)
+        h_result: Set[str] = set()
+
+        for item in [item.strip() for item in rule.split(',') if item.strip() != '']:
+            rule_id: str = item if item.startswith('FINDER.RULE.') else f'FINDER.RULE.{item}'
+
+            if rule_id not in available_rules:
+                error_msg: str = f'Finder Rule "{item}" not Found'
+                raise AttributeError(error_msg)
+
+            h_result.add(rule_id)
+
+        return h_result
+
+    def __filter_groups(self, args: Dict) -> List[TelegramGroupOrmEntity]:
+        """Load and Filter the Groups."""
+        groups: List[TelegramGroupOrmEntity] = TelegramGroupDatabaseManager.get_all_by_phone_number(self.source)
+
+        if args['group_id'] != '*':
+            target_group_ids: List[int] = [int(group) for group in str(args['group_id']).split(',')]
+            groups = [group for group in groups if group.id in target_group_ids]
+
+        logger.info(f'\t\tFound {len(groups)} Groups')
+        return groups
+
+    async def __hunt_group(self, group: TelegramGroupOrmEntity, limit_seconds: int, executor: ProcessPoolExecutor, max_in_flight: int) -> None:
+        """Stream the Group Messages by Pages and Match each Page on the Process Pool."""
+        logger.info(f'\t\tProcessing "{group.title}" ({group.id})')
+
+        rows: Iterator[Row] = TelegramMessageDatabaseManager.iterate_messages_from_group(
+            group_id=group.id,
+            message_datetime_limit_seconds=limit_seconds,
+            )
+        in_flight: Dict[asyncio.Future[List[Tuple[int, List[str]]]], List[Row]] = {}
+        page_size: int = DbManager.get_page_size()
+
+        while True:
+            page: List[Row] = list(itertools.islice(rows, page_size))
+            if len(page) == 0:
+                break
+
+            # Bound the Pages in Flight (and the Memory Usage)
+            while len(in_flight) >= max_in_flight:
+                await self.__handle_completed(group=group, in_flight=in_flight)
+
+            future: asyncio.Future[List[Tuple[int, List[str]]]] = asyncio.get_running_loop().run_in_executor(
+                executor, match_batch, [(row.group_id, row.raw) for row in page],
+                )
+            in_flight[future] = page
+
+        while len(in_flight) > 0:
+            await self.__handle_completed(group=group, in_flight=in_flight)
+
+    async def __handle_completed(self, group: TelegramGroupOrmEntity, in_flight: Dict[asyncio.Future[List[Tuple[int, List[str]]]], List[Row]]) -> None:
+        """Wait at Least one Page to Finish and Send its Hits."""
+        done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
+
+        for future in done:
+            page: List[Row] = in_flight.pop(future)
+
+            for message_ix, rule_ids in future.result():
+                await self.__send_hit(group=group, row=page[message_ix], rule_ids=rule_ids)
+
+            self.messages_processed += len(page)
+
+        if time.monotonic() - self.last_progress_at >= TelegramRetroHunt.PROGRESS_INTERVAL_SECONDS:
+            self.last_progress_at = time.monotonic()
+            self.__log_progress(prefix='Retro Hunt Progress')
+
+    async def __send_hit(self, group: TelegramGroupOrmEntity, row: Row, rule_ids: List[str]) -> None:
+        """Send the Message to the Notifiers and Exporters of each Matched Rule."""
+        entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
+            date_time=row.date_time,
+            raw_text=row.raw,
+            group_name=group.title,
+            group_id=row.group_id,
+            from_id=row.from_id,
+            to_id=row.to_id,
+            reply_to_msg_id=row.reply_to_msg_id,
+            message_id=row.id,
+            is_reply=row.is_reply,
+            downloaded_media_info=self.__get_media_info(media_id=row.media_id, group_id=row.group_id),
+            found_on='MESSAGE',
+        )
+
+        for rule_id in rule_ids:
+            rule: Dict = self.rule_set.rules_by_id[rule_id]
+            self.hits += 1
+
+            # Run the Notification Engine. Waits for the Notifier Queues, as the Hits may Come Faster than the Delivery
+            await self.notification_engine.run(
+                notifiers=rule['notifier'],
+                entity=entity,
+                rule_id=rule_id,
+                source=self.source,
+                block=True,
+                )
+
+            # Run the Data Export Engine
+            if rule['exporter']:
+                await self.exporter_engine.run(
+                    exporters=rule['exporter'],
+                    entity=entity,
+                    rule_id=rule_id,
+                )
+
+    def __get_media_info(self, media_id: Optional[int], group_id: int) -> Optional[MediaHandlingEntity]:
+        """Load the Message Downloaded Media Info."""
+        if not media_id:
+            return None
+
+        media: Optional[TelegramMediaOrmEntity] = TelegramMediaDatabaseManager.get_by_id(pk=media_id)
+        if not media:
+            return None
+
+        return MediaHandlingEntity(
+            media_id=media.id,
+            file_name=media.file_name,
+            content_type=media.mime_type,
+            size_bytes=media.size_bytes,
+            disk_file_path=os.path.join(self.data_path, 'media', str(group_id), media.file_name),
+            is_ocr_supported=False,
+        )
+
+    def __log_progress(self, prefix: str) -> None:
+        """Log the Progress and Throughput."""
+        elapsed_seconds: float = max(time.monotonic() - self.started_at, 0.001)
+        logger.info(
+            f'\t\t{prefix}: {self.messages_processed} Messages in {elapsed_seconds:.1f}s '
+            f'({self.messages_processed / elapsed_seconds:.0f} msg/s), {self.hits} Hits',
+            )
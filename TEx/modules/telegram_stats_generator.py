@@ -6,7 +6,7 @@ import logging
 import os
 import shutil
 from configparser import ConfigParser
-from typing import Dict, List, TypedDict, cast
+from typing import Dict, List, Optional, TypedDict, cast
 
 import aiofiles
 import pytz
@@ -14,8 +14,13 @@ from aiofiles.threadpool.text import AsyncTextIOWrapper
 
 from TEx.core.base_module import BaseModule
 from TEx.core.dir_manager import DirectoryManagerUtils
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, TelegramMessageDatabaseManager
-from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity
+from TEx.database.telegram_group_database import (
+    TelegramGroupDatabaseManager,
+    TelegramGroupSyncStateDatabaseManager,
+    TelegramMediaDatabaseManager,
+    TelegramMessageDatabaseManager,
+)
+from TEx.models.database.telegram_db_model import TelegramGroupOrmEntity, TelegramGroupSyncStateOrmEntity
 from TEx.models.facade.telegram_group_report_facade_entity import TelegramGroupReportFacadeEntity, TelegramGroupReportFacadeEntityMapper
 
 logger = logging.getLogger('TelegramExplorer')
@@ -146,6 +151,25 @@ class TelegramStatsGenerator(BaseModule):
             await file.write(
                 f'\n{ct_group_name.ljust(max_large_group_name)}: {ct_total_messages.ljust(16)}: {ct_active_users}')
 
+    async def __render_sync_stats(self, file: AsyncTextIOWrapper, max_large_group_name: int, stats_messages_per_groups: List[Dict]) -> None:
+        """Render Synchronization Statistics (How Far Behind Each Group Is)."""
+        await file.write('\n\n**** Sync Status for Groups ****')
+        now: datetime.datetime = datetime.datetime.now(tz=pytz.UTC).replace(tzinfo=None)
+
+        for single in stats_messages_per_groups:
+            ct_group_name: str = single['group'].ljust(max_large_group_name)
+            sync_state: Optional[TelegramGroupSyncStateOrmEntity] = single['sync_state']
+
+            if sync_state is None:
+                await file.write(f'\n{ct_group_name}: never synced')
+                continue
+
+            ct_last_message: str = f'last message {sync_state.last_message_id}'
+            ct_last_sync: str = f'synced at {sync_state.last_sync_at.strftime("%Y-%m-%d %H:%M:%S")}'
+            ct_behind: str = f'{((now - sync_state.last_message_date_time).total_seconds() / 3600):.1f} hours behind' if sync_state.last_message_date_time else 'unknown'
+
+            await file.write(f'\n{ct_group_name}: {ct_last_message.ljust(32)}: {ct_last_sync} : {ct_behind}')
+
     async def __get_group_stats(self, group: TelegramGroupReportFacadeEntity, limit_seconds: int) -> Dict:
         """
         Get a Single Group Stats.
@@ -177,6 +201,7 @@ class TelegramStatsGenerator(BaseModule):
             'messages': message_count,
             'active_users': active_user_count,
             'media': media_stats,
+            'sync_state': TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=group.id),
             }
 
     async def __render(self, params: RenderParams) -> None:
@@ -205,6 +230,7 @@ class TelegramStatsGenerator(BaseModule):
 
             await self.__render_messages_stats(file, max_large_group_name, params['stats_messages_per_groups'])
             await self.__render_media_stats(file, max_large_group_name, params['stats_messages_per_groups'])
+            await self.__render_sync_stats(file, max_large_group_name, params['stats_messages_per_groups'])
 
             await file.flush()
             await file.close()
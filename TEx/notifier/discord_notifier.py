@@ -1,43 +1,71 @@
 """Discord Notifier."""
 from __future__ import annotations
 
-import os
+import asyncio
 from configparser import SectionProxy
-from typing import Union
+from typing import Dict, Optional, Union
 
-import aiofiles
-from discord_webhook import AsyncDiscordWebhook, DiscordEmbed
+from discord_webhook import DiscordEmbed
 
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.discord_webhook_scheduler import DiscordWebhookScheduler
+from TEx.notifier.notification_attachment_store import NotificationAttachmentStore
+from TEx.notifier.notification_dedup_store import NotificationDedupStore
 from TEx.notifier.notifier_base import BaseNotifier
 
 
 class DiscordNotifier(BaseNotifier):
-    """Basic Discord Notifier."""
+    """
+    Basic Discord Notifier.
+
+    The Embeds are Sent by the Webhook Scheduler, that Packs the Pending Embeds of the Same Webhook URL into a
+    Single Request and Follows the Discord Rate Limits. The Attachments are Read by the Attachment Store, Shared by
+    all Notifiers and Rules.
+    """
+
+    # Max Size of the Embed Description Accepted by Discord
+    MAX_DESCRIPTION_CHARS: int = 4096
 
     def __init__(self) -> None:
         """Initialize Discord Notifier."""
         super().__init__()
         self.url: str = ''
-
-    def configure(self, url: str, config: SectionProxy) -> None:
-        """Configure the Notifier."""
+        self.scheduler: Optional[DiscordWebhookScheduler] = None
+        self.attachment_store: NotificationAttachmentStore = NotificationAttachmentStore()
+
+    def configure(
+            self,
+            url: str,
+            config: SectionProxy,
+            dedup_store: Optional[NotificationDedupStore] = None,
+            attachment_store: Optional[NotificationAttachmentStore] = None,
+            ) -> None:
+        """Configure the Notifier. Without a Shared Attachment Store, the Notifier Uses its Own."""
         self.url = url
-        self.configure_base(config=config)
+        self.configure_base(config=config, dedup_store=dedup_store)
+        if attachment_store is not None:
+            self.attachment_store = attachment_store
+        self.scheduler = DiscordWebhookScheduler.get_instance(
+            name=config.name,
+            url=url,
+            timeout_seconds=self.timeout_seconds,
+            max_pending=int(config.get('batch_max_pending', fallback='100')),
+            )
 
     async def run(self, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str) -> None:
         """Run Discord Notifier."""
-        # Run the Notification Process
-        webhook = AsyncDiscordWebhook(  # type: ignore
-            url=self.url,
-            rate_limit_retry=True,
-            timeout=self.timeout_seconds,
-        )
+        if not self.scheduler:
+            return
 
         embed: DiscordEmbed
+        files: Dict[str, bytes] = {}
+        duplication_tag: str = ''
+        attachment_path: str = ''
+
         if isinstance(entity, FinderNotificationMessageEntity):
-            is_duplicated, duplication_tag = self.check_is_duplicated(message=entity.raw_text)
+            is_duplicated: bool
+            is_duplicated, duplication_tag = self.check_is_duplicated(message=entity.raw_text, tag=entity.dedup_tag)
             if is_duplicated:
                 return
 
@@ -49,9 +77,9 @@ class DiscordNotifier(BaseNotifier):
             )
 
             # Handle Attachments
-            await self.__handle_attachment(
+            attachment_path = await self.__handle_attachment(
                 entity=entity,
-                webhook=webhook,
+                files=files,
                 embed=embed,
             )
 
@@ -61,38 +89,60 @@ class DiscordNotifier(BaseNotifier):
                 source=source,
             )
 
-        webhook.add_embed(embed)
-        await webhook.execute(remove_embeds=True)
+        # Wait the Batch Delivery, so the Failures can be Retried
+        try:
+            delivery: asyncio.Future = await self.scheduler.send(embed=embed, files=files)
+            await delivery
+
+        except Exception:
+            self.release_duplication_tag(tag=duplication_tag)
+            raise
+
+        finally:
+            if attachment_path:
+                self.attachment_store.release(path=attachment_path)
 
-    async def __handle_attachment(self, entity: FinderNotificationMessageEntity, webhook: AsyncDiscordWebhook, embed: DiscordEmbed) -> None:
-        """Handle the Attachment Upload."""
+    async def shutdown(self) -> None:
+        """Send the Scheduled Embeds and Close the Webhook Session."""
+        if self.scheduler:
+            await self.scheduler.shutdown()
+
+    async def __handle_attachment(self, entity: FinderNotificationMessageEntity, files: Dict[str, bytes], embed: DiscordEmbed) -> str:
+        """
+        Handle the Attachment Upload. The File Content is Shared with the Other Notifiers and Rules.
+
+        :return: Acquired Attachment Path, to be Released after the Delivery
+        """
         if not entity.downloaded_media_info or not self.media_attachments_enabled:
-            return
+            return ''
 
         # Check Max Size
         if entity.downloaded_media_info.size_bytes > self.media_attachments_max_size_bytes:
-            return
+            return ''
 
-        # Upload File
-        if os.path.exists(entity.downloaded_media_info.disk_file_path):
+        content: Optional[bytes] = await self.attachment_store.acquire(
+            path=entity.downloaded_media_info.disk_file_path,
+            size_bytes=entity.downloaded_media_info.size_bytes,
+            )
+        if content is None:
+            return ''
+
+        files[entity.downloaded_media_info.file_name] = content
 
-            # Open and Upload
-            async with aiofiles.open(entity.downloaded_media_info.disk_file_path, 'rb') as f:
-                webhook.add_file(file=await f.read(), filename=f'{entity.downloaded_media_info.file_name}')
-                await f.close()
+        # Add on Embed
+        if entity.downloaded_media_info.is_image():
+            embed.set_image(url=f'attachment://{entity.downloaded_media_info.file_name}')
 
-            # Add on Embed
-            if entity.downloaded_media_info.is_image():
-                embed.set_image(url=f'attachment://{entity.downloaded_media_info.file_name}')
+        elif entity.downloaded_media_info.is_video():
+            embed.set_video(url=f'attachment://{entity.downloaded_media_info.file_name}')
 
-            elif entity.downloaded_media_info.is_video():
-                embed.set_video(url=f'attachment://{entity.downloaded_media_info.file_name}')
+        return entity.downloaded_media_info.disk_file_path
 
     async def __get_signal_notification_embed(self, entity: SignalNotificationEntityModel, source: str) -> DiscordEmbed:
         """Return the Embed Object for Signals."""
         embed = DiscordEmbed(
             title=entity.signal,
-            description=entity.content,
+            description=DiscordNotifier.__truncate_description(text=entity.content),
             )
 
         embed.add_embed_field(name='Source', value=source, inline=True)
@@ -113,7 +163,7 @@ class DiscordNotifier(BaseNotifier):
 
         embed = DiscordEmbed(
             title=title,
-            description=entity.raw_text,
+            description=DiscordNotifier.__truncate_description(text=entity.raw_text),
             )
 
         embed.add_embed_field(name='Source', value=source, inline=True)
@@ -131,3 +181,11 @@ class DiscordNotifier(BaseNotifier):
         embed.add_embed_field(name='Tag', value=duplication_tag, inline=False)
 
         return embed
+
+    @staticmethod
+    def __truncate_description(text: str) -> str:
+        """Truncate the Text to the Discord Embed Description Limit, so a Long Message does not Reject the Whole Batch."""
+        if not text or len(text) <= DiscordNotifier.MAX_DESCRIPTION_CHARS:
+            return text
+
+        return f'{text[:DiscordNotifier.MAX_DESCRIPTION_CHARS - 3]}...'
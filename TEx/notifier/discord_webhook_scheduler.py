@@ -0,0 +1,278 @@
+"""Discord Webhook Scheduler."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+import httpx
+from discord_webhook import DiscordEmbed
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class DiscordRateLimitBucket:
+    """Discord Rate Limit Bucket State, Updated from the Response Headers."""
+
+    def __init__(self) -> None:
+        """Initialize the Bucket."""
+        self.bucket_id: str = ''
+        self.remaining: int = 1
+        self.reset_at: float = 0.0
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Update the Bucket with the X-RateLimit-* Headers."""
+        if 'X-RateLimit-Remaining' in headers:
+            self.remaining = int(headers['X-RateLimit-Remaining'])
+
+        if 'X-RateLimit-Reset-After' in headers:
+            self.reset_at = time.monotonic() + float(headers['X-RateLimit-Reset-After'])
+
+    def exhaust(self, retry_after_seconds: float) -> None:
+        """Block the Bucket after a 429 Response."""
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, time.monotonic() + retry_after_seconds)
+
+    def get_wait_seconds(self) -> float:
+        """Return the Time to Wait Before the Next Request."""
+        if self.remaining > 0:
+            return 0.0
+
+        return max(0.0, self.reset_at - time.monotonic())
+
+
+class DiscordWebhookScheduler:
+    """
+    Send the Discord Notifications of a Webhook URL in Batches, Following the Rate Limit Buckets.
+
+    Notifications are Queued and a Single Sender Task Packs up to 10 Embeds (and 6000 Characters) into each Webhook
+    Execution, Reusing one HTTP Session. While the Bucket is Exhausted the Sender Waits and the Queue Grows, so the
+    Next Executions are Fuller and the Throughput Scales with the Burst Size. Notifications with Attachments are Sent
+    Alone. When Discord Rejects a Batch (4xx), the Embeds are Resent One at a Time, so Only the Invalid Ones Fail.
+    """
+
+    MAX_EMBEDS_PER_MESSAGE: int = 10
+    MAX_EMBEDS_CHARS: int = 6000
+    MAX_RETRIES: int = 5
+    INSTANCES: ClassVar[Dict[str, DiscordWebhookScheduler]] = {}
+    BUCKETS: ClassVar[Dict[str, DiscordRateLimitBucket]] = {}
+
+    def __init__(self, name: str, url: str, timeout_seconds: int, max_pending: int) -> None:
+        """Initialize the Scheduler. The Queue, Sender Task and HTTP Session are Created on the First Notification."""
+        self.name: str = name
+        self.url: str = url
+        self.timeout_seconds: int = timeout_seconds
+        self.max_pending: int = max(1, max_pending)
+        self.bucket: DiscordRateLimitBucket = DiscordRateLimitBucket()
+        self.queue: Optional[asyncio.Queue[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]]] = None
+        self.sender_task: Optional[asyncio.Task] = None
+        self.client: Optional[httpx.AsyncClient] = None
+        self.carry_over: Optional[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]] = None
+        self.requests: int = 0
+        self.sent: int = 0
+        self.failed: int = 0
+        self.rate_limited: int = 0
+
+    @staticmethod
+    def get_instance(name: str, url: str, timeout_seconds: int, max_pending: int) -> DiscordWebhookScheduler:
+        """Return the Scheduler of the Webhook URL, Shared by all Notifiers of the Same URL."""
+        if url not in DiscordWebhookScheduler.INSTANCES:
+            DiscordWebhookScheduler.INSTANCES[url] = DiscordWebhookScheduler(name=name, url=url, timeout_seconds=timeout_seconds, max_pending=max_pending)
+
+        return DiscordWebhookScheduler.INSTANCES[url]
+
+    async def send(self, embed: DiscordEmbed, files: Dict[str, bytes]) -> asyncio.Future:
+        """
+        Schedule an Embed (and its Attachments by File Name). Waits only if the Queue is Full.
+
+        :return: Future Resolved when the Embed is Sent, or Failed with the Delivery Error
+        """
+        if not self.queue:
+            self.queue = asyncio.Queue(maxsize=self.max_pending)
+            self.client = httpx.AsyncClient(timeout=self.timeout_seconds)
+            self.sender_task = asyncio.create_task(self.__sender())
+
+        delivery: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self.queue.put((embed, files, delivery))
+        return delivery
+
+    async def shutdown(self) -> None:
+        """Send the Scheduled Notifications and Close the HTTP Session."""
+        DiscordWebhookScheduler.INSTANCES.pop(self.url, None)
+
+        if not self.queue:
+            return
+
+        await self.queue.join()
+
+        if self.sender_task:
+            self.sender_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.sender_task
+
+        if self.client:
+            await self.client.aclose()
+
+        self.queue = None
+        self.sender_task = None
+        self.client = None
+
+        logger.info(
+            f'\t\tDiscord Webhook "{self.name}": {self.sent} Embeds Sent in {self.requests} Requests, '
+            f'{self.failed} Failed, {self.rate_limited} Rate Limited',
+            )
+
+    async def __sender(self) -> None:
+        """Sender Loop."""
+        queue: asyncio.Queue[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]] = self.queue  # type: ignore
+
+        while True:
+            first: Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future] = self.carry_over or await queue.get()
+            self.carry_over = None
+
+            # Wait the Bucket Reset, Accumulating the Next Notifications
+            wait_seconds: float = self.bucket.get_wait_seconds()
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+
+            batch: List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]] = self.__pack(first=first, queue=queue)
+
+            try:
+                await self.__deliver(batch=batch)
+
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def __deliver(self, batch: List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]]) -> None:
+        """Send the Batch and Resolve its Deliveries. A Rejected Batch is Resent One Embed at a Time, so Only the Invalid Embeds Fail."""
+        try:
+            await self.__execute(batch=batch)
+            self.sent += len(batch)
+            DiscordWebhookScheduler.__complete(batch=batch, error=None)
+
+        except httpx.HTTPStatusError as ex:
+            if len(batch) > 1 and ex.response.is_client_error and ex.response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+                logger.warning(f'\t\tDiscord Webhook "{self.name}" Rejected {len(batch)} Embeds ({ex.response.status_code}). Resending One by One')
+
+                for item in batch:
+                    wait_seconds: float = self.bucket.get_wait_seconds()
+                    if wait_seconds > 0:
+                        await asyncio.sleep(wait_seconds)
+
+                    await self.__deliver(batch=[item])
+
+                return
+
+            self.failed += len(batch)
+            logger.warning(f'\t\tUnable to Send {len(batch)} Discord Embeds on "{self.name}": {ex}')
+            DiscordWebhookScheduler.__complete(batch=batch, error=ex)
+
+        except httpx.HTTPError as ex:
+            self.failed += len(batch)
+            logger.warning(f'\t\tUnable to Send {len(batch)} Discord Embeds on "{self.name}": {ex}')
+            DiscordWebhookScheduler.__complete(batch=batch, error=ex)
+
+        except Exception as ex:  # Yes, Catch All
+            self.failed += len(batch)
+            logger.exception(f'Unable to Send Discord Notification on "{self.name}"')
+            DiscordWebhookScheduler.__complete(batch=batch, error=ex)
+
+    @staticmethod
+    def __complete(batch: List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]], error: Optional[Exception]) -> None:
+        """Resolve the Batch Deliveries. The Notifier may Have Given up (Cancelled) the Delivery."""
+        for _, _, delivery in batch:
+            if delivery.done():
+                continue
+
+            if error:
+                delivery.set_exception(error)
+            else:
+                delivery.set_result(None)
+
+    def __pack(
+            self, first: Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future], queue: asyncio.Queue[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]],
+            ) -> List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]]:
+        """Pack the Queued Embeds into a Single Webhook Execution."""
+        batch: List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]] = [first]
+        chars: int = DiscordWebhookScheduler.__get_embed_chars(embed=first[0])
+
+        while not first[1] and len(batch) < DiscordWebhookScheduler.MAX_EMBEDS_PER_MESSAGE and not queue.empty():
+            item: Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future] = queue.get_nowait()
+            item_chars: int = DiscordWebhookScheduler.__get_embed_chars(embed=item[0])
+
+            if item[1] or chars + item_chars > DiscordWebhookScheduler.MAX_EMBEDS_CHARS:
+                self.carry_over = item
+                break
+
+            batch.append(item)
+            chars += item_chars
+
+        return batch
+
+    async def __execute(self, batch: List[Tuple[DiscordEmbed, Dict[str, bytes], asyncio.Future]]) -> None:
+        """Execute the Webhook, Retrying when Rate Limited. Raises httpx.HTTPError if the Embeds were not Sent."""
+        payload: Dict = {'embeds': [embed.__dict__ for embed, _, _ in batch]}
+        files: Dict[str, bytes] = batch[0][1]
+        response: httpx.Response
+
+        for _ in range(DiscordWebhookScheduler.MAX_RETRIES):
+            self.requests += 1
+
+            response = await self.client.post(  # type: ignore
+                self.url,
+                json=payload if not files else None,
+                files={
+                    'payload_json': (None, json.dumps(payload).encode('utf-8')),
+                    **{f'_{file_name}': (file_name, content) for file_name, content in files.items()},
+                    } if files else None,
+                )
+
+            self.__update_bucket(headers=response.headers)
+
+            if response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+                response.raise_for_status()
+                return
+
+            # Rate Limited. Wait and Retry the Same Batch
+            self.rate_limited += 1
+            retry_after_seconds: float = DiscordWebhookScheduler.__get_retry_after_seconds(response=response)
+            self.bucket.exhaust(retry_after_seconds=retry_after_seconds)
+            logger.warning(f'\t\tDiscord Webhook "{self.name}" Rate Limited. Retrying {len(batch)} Embeds in {retry_after_seconds:.2f}s')
+
+            await asyncio.sleep(self.bucket.get_wait_seconds())
+
+        # Rate Limited on all Retries
+        response.raise_for_status()
+
+    def __update_bucket(self, headers: httpx.Headers) -> None:
+        """Track the Rate Limit Bucket of the Webhook. Webhooks on the Same Bucket Share the State."""
+        bucket_id: Optional[str] = headers.get('X-RateLimit-Bucket')
+
+        if bucket_id and bucket_id != self.bucket.bucket_id:
+            self.bucket = DiscordWebhookScheduler.BUCKETS.setdefault(bucket_id, self.bucket)
+            self.bucket.bucket_id = bucket_id
+
+        self.bucket.update(headers=headers)
+
+    @staticmethod
+    def __get_retry_after_seconds(response: httpx.Response) -> float:
+        """Return the Time to Wait after a 429 Response, from the Body or the Retry-After Header."""
+        try:
+            return float(response.json()['retry_after'])
+
+        except (ValueError, KeyError, TypeError):
+            return float(response.headers.get('Retry-After', '1'))
+
+    @staticmethod
+    def __get_embed_chars(embed: DiscordEmbed) -> int:
+        """Return the Embed Size as Counted by Discord for the 6000 Characters Limit."""
+        chars: int = len(embed.title or '') + len(embed.description or '')
+
+        for field in embed.fields:
+            chars += len(str(field.get('name') or '')) + len(str(field.get('value') or ''))
+
+        return chars
@@ -1,19 +1,35 @@
 """Elastic Search Notifier."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
 from configparser import SectionProxy
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import pytz
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import BulkIndexError, async_streaming_bulk
 
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
 from TEx.notifier.notifier_base import BaseNotifier
 
+logger = logging.getLogger('TelegramExplorer')
+
 
 class ElasticSearchNotifier(BaseNotifier):
-    """Basic Elastic Search Notifier."""
+    """
+    Basic Elastic Search Notifier.
+
+    On Bulk Mode, the Documents are Buffered and Sent with the Bulk API when the Buffer Reaches bulk_max_actions or
+    bulk_max_bytes, or each bulk_flush_interval_seconds. Documents Rejected with 429 (Too Many Requests) are Retried.
+    Each Notification Waits its Document to be Sent, so the Rejected Documents Fail the Notification (and can be
+    Retried by the Outbox).
+    """
 
     def __init__(self) -> None:
         """Initialize Elastic Search Notifier."""
@@ -22,6 +38,21 @@ class ElasticSearchNotifier(BaseNotifier):
         self.client: Optional[AsyncElasticsearch] = None
         self.index: str = ''
         self.pipeline: str = ''
+        self.bulk_enabled: bool = False
+        self.bulk_max_actions: int = 500
+        self.bulk_max_bytes: int = 5242880
+        self.bulk_flush_interval_seconds: float = 5
+        self.bulk_max_retries: int = 3
+        self.bulk_retry_backoff_seconds: float = 1
+        self.bulk_buffer: List[Dict] = []
+        self.bulk_buffer_bytes: int = 0
+        self.bulk_deliveries: Dict[str, asyncio.Future] = {}
+        self.bulk_lock: Optional[asyncio.Lock] = None
+        self.bulk_flush_task: Optional[asyncio.Task] = None
+        self.bulk_flushes: int = 0
+        self.bulk_indexed: int = 0
+        self.bulk_rejected: int = 0
+        self.bulk_max_flush_seconds: float = 0.0
 
     def configure(self, config: SectionProxy) -> None:
         """Configure the Notifier."""
@@ -39,6 +70,14 @@ class ElasticSearchNotifier(BaseNotifier):
         self.index = config['index_name']
         self.pipeline = config['pipeline_name']
 
+        # Bulk Mode
+        self.bulk_enabled = config.get('bulk_enabled', fallback='false') == 'true'
+        self.bulk_max_actions = max(1, int(config.get('bulk_max_actions', fallback='500')))
+        self.bulk_max_bytes = max(1, int(config.get('bulk_max_bytes', fallback='5242880')))
+        self.bulk_flush_interval_seconds = max(0.1, float(config.get('bulk_flush_interval_seconds', fallback='5')))
+        self.bulk_max_retries = int(config.get('bulk_max_retries', fallback='3'))
+        self.bulk_retry_backoff_seconds = float(config.get('bulk_retry_backoff_seconds', fallback='1'))
+
     async def run(self, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str) -> None:
         """Run Elastic Search Notifier."""
         if not self.client:
@@ -58,12 +97,148 @@ class ElasticSearchNotifier(BaseNotifier):
                 source=source,
             )
 
+        # Wait the Bulk Request, so the Failures can be Retried
+        if self.bulk_enabled:
+            delivery: asyncio.Future = await self.__add_to_bulk(content=content)
+            await delivery
+            return
+
         await self.client.index(
             index=self.index,
             pipeline=self.pipeline,
             document=content,
         )
 
+    async def shutdown(self) -> None:
+        """Flush the Bulk Buffer and Close the Client."""
+        if self.bulk_flush_task:
+            self.bulk_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.bulk_flush_task
+            self.bulk_flush_task = None
+
+        await self.flush()
+
+        if self.bulk_flushes > 0:
+            logger.info(
+                f'\t\tElastic Search Bulk "{self.index}": {self.bulk_indexed} Indexed, {self.bulk_rejected} Rejected '
+                f'in {self.bulk_flushes} Flushes (Max {self.bulk_max_flush_seconds * 1000:.0f}ms)',
+                )
+
+        if self.client:
+            await self.client.close()
+
+    async def flush(self) -> None:
+        """Send the Buffered Documents with the Bulk API."""
+        if len(self.bulk_buffer) == 0 or not self.client:
+            return
+
+        # Created on the Running Loop
+        if not self.bulk_lock:
+            self.bulk_lock = asyncio.Lock()
+
+        async with self.bulk_lock:
+            actions: List[Dict] = self.bulk_buffer
+            deliveries: Dict[str, asyncio.Future] = self.bulk_deliveries
+            self.bulk_buffer = []
+            self.bulk_buffer_bytes = 0
+            self.bulk_deliveries = {}
+
+            if len(actions) == 0:
+                return
+
+            start: float = time.monotonic()
+            rejected: int = 0
+
+            try:
+                # Only the Failed Items are Retried
+                async for _, item in async_streaming_bulk(
+                        client=self.client,
+                        actions=actions,
+                        chunk_size=self.bulk_max_actions,
+                        max_chunk_bytes=self.bulk_max_bytes,
+                        raise_on_error=False,
+                        raise_on_exception=False,
+                        max_retries=self.bulk_max_retries,
+                        initial_backoff=self.bulk_retry_backoff_seconds,
+                        yield_ok=False,
+                        pipeline=self.pipeline,
+                        ):
+                    rejected += 1
+                    logger.debug(f'\t\tElastic Search Document Rejected: {item}')
+                    ElasticSearchNotifier.__complete(
+                        delivery=deliveries.pop(next(iter(item.values())).get('_id', ''), None),
+                        error=BulkIndexError('Elastic Search Document Rejected', [item]),
+                        )
+
+            except Exception as ex:
+                for delivery in deliveries.values():
+                    ElasticSearchNotifier.__complete(delivery=delivery, error=ex)
+                raise
+
+            for delivery in deliveries.values():
+                ElasticSearchNotifier.__complete(delivery=delivery, error=None)
+
+            elapsed_seconds: float = time.monotonic() - start
+            self.bulk_flushes += 1
+            self.bulk_indexed += len(actions) - rejected
+            self.bulk_rejected += rejected
+            self.bulk_max_flush_seconds = max(self.bulk_max_flush_seconds, elapsed_seconds)
+
+            log_message: str = f'\t\tElastic Search Bulk Flush "{self.index}": {len(actions)} Documents in {elapsed_seconds * 1000:.0f}ms, {rejected} Rejected'
+            if rejected > 0:
+                logger.warning(log_message)
+            else:
+                logger.debug(log_message)
+
+    @staticmethod
+    def __complete(delivery: Optional[asyncio.Future], error: Optional[Exception]) -> None:
+        """Resolve the Document Delivery."""
+        if not delivery or delivery.done():
+            return
+
+        if error:
+            delivery.set_exception(error)
+        else:
+            delivery.set_result(None)
+
+    async def __add_to_bulk(self, content: Dict) -> asyncio.Future:
+        """
+        Buffer the Document, Flushing when the Buffer is Full. The Buffer never Exceeds bulk_max_actions or bulk_max_bytes.
+
+        :return: Future Resolved when the Document is Sent, or Failed when Rejected
+        """
+        size_bytes: int = len(json.dumps(content, default=str))
+
+        if len(self.bulk_buffer) > 0 and self.bulk_buffer_bytes + size_bytes > self.bulk_max_bytes:
+            await self.flush()
+
+        # The Document ID Identifies the Rejected Documents on the Bulk Response
+        document_id: str = uuid.uuid4().hex
+        delivery: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.bulk_buffer.append({'_index': self.index, '_id': document_id, '_source': content})
+        self.bulk_deliveries[document_id] = delivery
+        self.bulk_buffer_bytes += size_bytes
+
+        if len(self.bulk_buffer) >= self.bulk_max_actions or self.bulk_buffer_bytes >= self.bulk_max_bytes:
+            await self.flush()
+
+        # Time Triggered Flush
+        if not self.bulk_flush_task:
+            self.bulk_flush_task = asyncio.create_task(self.__auto_flush())
+
+        return delivery
+
+    async def __auto_flush(self) -> None:
+        """Flush the Buffer each bulk_flush_interval_seconds. Runs Until Cancelled."""
+        while True:
+            await asyncio.sleep(self.bulk_flush_interval_seconds)
+
+            try:
+                await self.flush()
+            except Exception:  # Yes, Catch All
+                logger.exception(f'Unable to Flush the Elastic Search Bulk "{self.index}"')
+
     async def __get_dict_for_finder_notification(self, entity: FinderNotificationMessageEntity, rule_id: str, source: str) -> Dict:
         """Return the Dict for Finder Notifications."""
         content: Dict = {
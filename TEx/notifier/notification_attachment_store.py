@@ -0,0 +1,167 @@
+"""Notification Attachment Store."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from configparser import ConfigParser, SectionProxy
+from typing import Optional
+
+import aiofiles
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class NotificationAttachment:
+    """Attachment Content Shared by all Notifications of the Same Media File."""
+
+    def __init__(self, path: str, size_bytes: int) -> None:
+        """Initialize the Attachment."""
+        self.path: str = path
+        self.size_bytes: int = size_bytes
+        self.references: int = 0
+        self.loaded: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class NotificationAttachmentStore:
+    """
+    Attachments Store Shared by all Notifiers.
+
+    Each Media File is Read Once and the Content is Shared by all Notifiers and Rules that Upload it. The Content is
+    Kept while Referenced by any Upload, and the Released Contents are Kept (for the Next Notifiers of the Same Message)
+    until the Memory is Needed. The Memory Used by the Attachments is Capped, so the Uploads Wait for the Memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Store."""
+        self.max_memory_bytes: int = 64 * 1024 * 1024
+        self.attachments: OrderedDict[str, NotificationAttachment] = OrderedDict()
+        self.used_memory_bytes: int = 0
+        self.total_reads: int = 0
+        self.total_shared: int = 0
+        self.memory_released: Optional[asyncio.Event] = None
+
+    def configure(self, config: ConfigParser) -> None:
+        """Configure the Store from the Optional [NOTIFICATION_ATTACHMENTS] Section."""
+        attachments_config: Optional[SectionProxy] = config['NOTIFICATION_ATTACHMENTS'] if config.has_section('NOTIFICATION_ATTACHMENTS') else None
+
+        if not attachments_config:
+            return
+
+        self.max_memory_bytes = max(1, int(float(attachments_config.get('max_memory_mb', fallback='64')) * 1024 * 1024))
+
+    async def acquire(self, path: str, size_bytes: int) -> Optional[bytes]:
+        """
+        Return the File Content, Reading the File Only if not Loaded Yet. Each Acquire Must be Released.
+
+        :return: File Content or None if the File cannot be Read
+        """
+        attachment: Optional[NotificationAttachment] = self.attachments.get(path)
+        is_loader: bool = False
+
+        if attachment:
+            self.total_shared += 1
+
+        else:
+            await self.__reserve(size_bytes=size_bytes)
+
+            # Loaded by Other Upload while Waiting the Memory
+            attachment = self.attachments.get(path)
+            if attachment:
+                self.__release_memory(size_bytes=size_bytes)
+                self.total_shared += 1
+
+            else:
+                attachment = NotificationAttachment(path=path, size_bytes=size_bytes)
+                self.attachments[path] = attachment
+                is_loader = True
+
+        attachment.references += 1
+        self.attachments.move_to_end(path)
+
+        try:
+            if is_loader:
+                await self.__load(attachment=attachment)
+
+            # Shielded, so a Cancelled Upload does not Cancel the Load for the Others
+            content: Optional[bytes] = await asyncio.shield(attachment.loaded)
+
+        except asyncio.CancelledError:
+            self.release(path=path)
+            raise
+
+        if content is None:
+            self.release(path=path)
+
+        return content
+
+    def release(self, path: str) -> None:
+        """Release an Acquired Attachment. The Content is Kept until the Memory is Needed."""
+        attachment: Optional[NotificationAttachment] = self.attachments.get(path)
+        if not attachment:
+            return
+
+        attachment.references = max(0, attachment.references - 1)
+
+        # Not Loaded Contents are never Reused
+        if attachment.references == 0 and attachment.loaded.done() and attachment.loaded.result() is None:
+            self.__remove(attachment=attachment)
+
+        # Released Contents can be Evicted by the Uploads Waiting the Memory
+        elif attachment.references == 0 and self.memory_released:
+            self.memory_released.set()
+
+    async def __load(self, attachment: NotificationAttachment) -> None:
+        """Read the File Content. The Waiting Uploads are Always Resolved, Even if Cancelled."""
+        content: Optional[bytes] = None
+
+        try:
+            if os.path.exists(attachment.path):
+                async with aiofiles.open(attachment.path, 'rb') as file:
+                    content = await file.read()
+                self.total_reads += 1
+
+        except OSError:
+            logger.warning(f'\t\tUnable to Read the Notification Attachment "{attachment.path}"')
+
+        finally:
+            # Track the Real Size
+            if content is not None and len(content) != attachment.size_bytes:
+                self.used_memory_bytes += len(content) - attachment.size_bytes
+                attachment.size_bytes = len(content)
+
+            attachment.loaded.set_result(content)
+
+    async def __reserve(self, size_bytes: int) -> None:
+        """Wait Until the Memory is Available, Evicting the Released Contents. Always Allows a Single Attachment."""
+        if not self.memory_released:
+            self.memory_released = asyncio.Event()
+
+        while self.used_memory_bytes > 0 and self.used_memory_bytes + size_bytes > self.max_memory_bytes:
+            if not self.__evict():
+                self.memory_released.clear()
+                await self.memory_released.wait()
+
+        self.used_memory_bytes += size_bytes
+
+    def __evict(self) -> bool:
+        """Remove the Oldest Released Attachment."""
+        for attachment in self.attachments.values():
+            if attachment.references == 0 and attachment.loaded.done():
+                self.__remove(attachment=attachment)
+                return True
+
+        return False
+
+    def __remove(self, attachment: NotificationAttachment) -> None:
+        """Remove the Attachment and Release its Memory."""
+        del self.attachments[attachment.path]
+        self.__release_memory(size_bytes=attachment.size_bytes)
+
+    def __release_memory(self, size_bytes: int) -> None:
+        """Release the Reserved Memory, Waking the Uploads Waiting the Memory."""
+        self.used_memory_bytes -= size_bytes
+
+        if self.memory_released:
+            self.memory_released.set()
@@ -0,0 +1,172 @@
+"""Notification Deduplication Store."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from configparser import ConfigParser, SectionProxy
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class NotificationDedupStore:
+    """
+    Deduplication Store Shared by all Notifiers.
+
+    Each Message is Hashed Once (64 bits) and the Entries are Kept by Notifier (Namespace) with the Notifier TTL. The
+    Number of Entries is Bounded by a Memory Budget, Evicting the Oldest Entries. The Store can be Saved into a
+    Snapshot File and Loaded on Start, so a Restart does not Notify the Same Messages Again.
+    """
+
+    ENTRY_SIZE_BYTES: int = 180  # Approximate Memory Used by each Entry
+    SNAPSHOT_HEADER: bytes = b'TEXDEDUP'
+    SNAPSHOT_VERSION: int = 1
+    HASH_MASK: int = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self) -> None:
+        """Initialize the Store."""
+        self.entries: OrderedDict[int, int] = OrderedDict()
+        self.max_entries: int = int(32 * 1024 * 1024 / NotificationDedupStore.ENTRY_SIZE_BYTES)
+        self.snapshot_file: Optional[str] = None
+        self.snapshot_interval_seconds: int = 300
+        self.evicted: int = 0
+
+    def configure(self, config: ConfigParser) -> None:
+        """Configure the Store from the Optional [NOTIFICATION_DEDUP] Section."""
+        dedup_config: Optional[SectionProxy] = config['NOTIFICATION_DEDUP'] if config.has_section('NOTIFICATION_DEDUP') else None
+        data_path: Optional[str] = config.get('CONFIGURATION', 'data_path', fallback=None)
+
+        self.snapshot_file = os.path.join(data_path, 'notification_dedup.bin') if data_path else None
+
+        if not dedup_config:
+            return
+
+        memory_budget_mb: float = float(dedup_config.get('memory_budget_mb', fallback='32'))
+        self.max_entries = max(1, int(memory_budget_mb * 1024 * 1024 / NotificationDedupStore.ENTRY_SIZE_BYTES))
+        self.snapshot_interval_seconds = int(dedup_config.get('snapshot_interval_seconds', fallback='300'))
+        self.snapshot_file = dedup_config.get('snapshot_file', fallback=self.snapshot_file)
+
+    @staticmethod
+    def get_tag(message: str) -> int:
+        """Return the 64 bits Hash of the Message. Computed Once per Notification by the Notifier Engine."""
+        return int.from_bytes(hashlib.blake2b(message.encode('UTF-8'), digest_size=8).digest(), 'big')
+
+    @staticmethod
+    def get_namespace(name: str) -> int:
+        """Return the Namespace (Notifier) Hash, Combined with the Message Hash on the Entries Keys."""
+        return NotificationDedupStore.get_tag(name)
+
+    def __len__(self) -> int:
+        """Return the Number of Entries."""
+        return len(self.entries)
+
+    def check_and_add(self, namespace: int, tag: int, ttl_seconds: int) -> bool:
+        """
+        Check if the Message was Already Notified by the Namespace, Adding it Otherwise.
+
+        :return: True if Duplicated
+        """
+        if ttl_seconds <= 0:
+            return False
+
+        key: int = (namespace ^ tag) & NotificationDedupStore.HASH_MASK
+        now: int = int(time.time())
+        expires_at: Optional[int] = self.entries.get(key)
+
+        if expires_at is not None and expires_at > now:
+            return True
+
+        self.entries[key] = now + ttl_seconds
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evicted += 1
+
+        return False
+
+    def remove(self, namespace: int, tag: int) -> None:
+        """Remove an Entry, so the Message can be Notified Again."""
+        self.entries.pop((namespace ^ tag) & NotificationDedupStore.HASH_MASK, None)
+
+    def remove_expired(self) -> int:
+        """Remove all Expired Entries."""
+        now: int = int(time.time())
+        expired_keys: List[int] = [key for key, expires_at in self.entries.items() if expires_at <= now]
+
+        for key in expired_keys:
+            del self.entries[key]
+
+        return len(expired_keys)
+
+    def snapshot(self) -> int:
+        """
+        Save the Entries into the Snapshot File. The File is Replaced Atomically.
+
+        :return: Number of Saved Entries
+        """
+        if not self.snapshot_file:
+            return 0
+
+        self.remove_expired()
+
+        keys: array = array('Q', self.entries.keys())
+        expires: array = array('Q', self.entries.values())
+        temp_file: str = f'{self.snapshot_file}.tmp'
+
+        with open(temp_file, 'wb') as file:
+            file.write(NotificationDedupStore.SNAPSHOT_HEADER)
+            file.write(struct.pack('<IQ', NotificationDedupStore.SNAPSHOT_VERSION, len(keys)))
+            keys.tofile(file)
+            expires.tofile(file)
+
+        Path(temp_file).replace(self.snapshot_file)
+        return len(keys)
+
+    def load(self) -> int:
+        """
+        Load the Entries from the Snapshot File, Ignoring the Expired Ones. An Invalid Snapshot is Ignored.
+
+        :return: Number of Loaded Entries
+        """
+        if not self.snapshot_file or not os.path.exists(self.snapshot_file):
+            return 0
+
+        keys: array = array('Q')
+        expires: array = array('Q')
+
+        try:
+            with open(self.snapshot_file, 'rb') as file:
+                header: bytes = file.read(len(NotificationDedupStore.SNAPSHOT_HEADER))
+                version, total = struct.unpack('<IQ', file.read(struct.calcsize('<IQ')))
+
+                if header != NotificationDedupStore.SNAPSHOT_HEADER or version != NotificationDedupStore.SNAPSHOT_VERSION:
+                    logger.warning(f'\t\tInvalid Notification Deduplication Snapshot "{self.snapshot_file}". Ignored')
+                    return 0
+
+                keys.fromfile(file, total)
+                expires.fromfile(file, total)
+
+        except (OSError, EOFError, struct.error):
+            logger.warning(f'\t\tUnable to Load the Notification Deduplication Snapshot "{self.snapshot_file}". Ignored')
+            return 0
+
+        now: int = int(time.time())
+        loaded: int = 0
+
+        # The Snapshot Keeps the Insertion Order, so the Newest Entries Stay when Evicting
+        for key, expires_at in zip(keys, expires):
+            if expires_at > now and key not in self.entries:
+                self.entries[key] = expires_at
+                loaded += 1
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        return loaded
@@ -0,0 +1,234 @@
+"""Notification Outbox."""
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from configparser import ConfigParser, SectionProxy
+from typing import Dict, List, Optional, Union
+
+from sqlalchemy import delete, insert, select, update
+
+from TEx.database.db_manager import DbManager
+from TEx.models.database.temp_db_models import NotificationOutboxOrmEntity
+from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
+from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class NotificationOutbox:
+    """
+    Persistent Outbox of the Notifications, Stored on the Temp DB.
+
+    Each Notification is Written into the Outbox Before the Delivery and Removed when Delivered. Failed Notifications
+    are Retried with Exponential Backoff, and the Notifications Left by a Previous Execution are Sent after Restart.
+    The Writes are Buffered and Executed in Batches (Single Transaction), and Notifications Delivered Before the Batch
+    is Written never Touch the Disk.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Outbox."""
+        self.enabled: bool = False
+        self.write_batch_size: int = 100
+        self.write_max_delay_ms: int = 200
+        self.dispatch_interval_seconds: float = 5
+        self.dispatch_batch_size: int = 500
+        self.retry_initial_backoff_seconds: int = 5
+        self.retry_max_backoff_seconds: int = 600
+        self.max_attempts: int = 10
+        self.pending_inserts: Dict[str, Dict] = {}
+        self.pending_updates: Dict[str, Dict] = {}
+        self.pending_deletes: List[str] = []
+        self.oldest_write_time: float = 0.0
+        self.in_flight: Dict[str, int] = {}
+        self.retried: int = 0
+        self.discarded: int = 0
+        self.total_batches: int = 0
+        self.failed_batches: int = 0
+
+    def configure(self, config: ConfigParser) -> None:
+        """Configure the Outbox from the Optional [NOTIFICATION_OUTBOX] Section."""
+        outbox_config: Optional[SectionProxy] = config['NOTIFICATION_OUTBOX'] if config.has_section('NOTIFICATION_OUTBOX') else None
+
+        if not outbox_config:
+            return
+
+        self.enabled = outbox_config.get('enabled', fallback='false') == 'true'
+        self.write_batch_size = max(1, int(outbox_config.get('write_batch_size', fallback='100')))
+        self.write_max_delay_ms = max(1, int(outbox_config.get('write_max_delay_ms', fallback='200')))
+        self.dispatch_interval_seconds = max(0.1, float(outbox_config.get('dispatch_interval_seconds', fallback='5')))
+        self.dispatch_batch_size = max(1, int(outbox_config.get('dispatch_batch_size', fallback='500')))
+        self.retry_initial_backoff_seconds = max(1, int(outbox_config.get('retry_initial_backoff_seconds', fallback='5')))
+        self.retry_max_backoff_seconds = max(self.retry_initial_backoff_seconds, int(outbox_config.get('retry_max_backoff_seconds', fallback='600')))
+        self.max_attempts = int(outbox_config.get('max_attempts', fallback='10'))
+
+    @property
+    def pending_writes(self) -> int:
+        """Return the Number of Buffered Writes."""
+        return len(self.pending_inserts) + len(self.pending_updates) + len(self.pending_deletes)
+
+    def add(self, notifier: str, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str) -> str:
+        """
+        Add a Notification into the Outbox. The Notification is Marked as In Flight.
+
+        :return: Outbox Entry ID
+        """
+        entry_id: str = uuid.uuid4().hex
+        now: int = int(time.time())
+
+        self.__add_write()
+        self.pending_inserts[entry_id] = {
+            'id': entry_id,
+            'notifier': notifier,
+            'rule_id': rule_id,
+            'source': source,
+            'entity_type': 'finder' if isinstance(entity, FinderNotificationMessageEntity) else 'signal',
+            'entity': entity.model_dump_json(),
+            'attempts': 0,
+            'created_at': now,
+            'next_attempt_at': now,
+            }
+        self.in_flight[entry_id] = 0
+
+        return entry_id
+
+    def release(self, entry_id: str) -> None:
+        """Release an In Flight Notification that was not Delivered (Ex: Full Queue). It will be Dispatched Again."""
+        self.in_flight.pop(entry_id, None)
+
+    def ack(self, entry_id: str) -> None:
+        """Remove a Delivered Notification."""
+        self.in_flight.pop(entry_id, None)
+        self.__remove(entry_id=entry_id)
+
+    def retry(self, entry_id: str) -> None:
+        """Schedule the Retry of a Failed Notification, with Exponential Backoff. Discard it after max_attempts."""
+        attempts: int = self.in_flight.pop(entry_id, 0) + 1
+
+        if 0 < self.max_attempts <= attempts:
+            self.discarded += 1
+            logger.warning(f'\t\tNotification {entry_id} Discarded after {attempts} Attempts')
+            self.__remove(entry_id=entry_id)
+            return
+
+        self.retried += 1
+        next_attempt_at: int = int(time.time()) + self.get_backoff_seconds(attempts=attempts)
+
+        # Not Written Yet
+        if entry_id in self.pending_inserts:
+            self.pending_inserts[entry_id].update({'attempts': attempts, 'next_attempt_at': next_attempt_at})
+            return
+
+        self.__add_write()
+        self.pending_updates[entry_id] = {'attempts': attempts, 'next_attempt_at': next_attempt_at}
+
+    def get_backoff_seconds(self, attempts: int) -> int:
+        """Return the Retry Delay after N Failed Attempts."""
+        return int(min(self.retry_max_backoff_seconds, self.retry_initial_backoff_seconds * 2 ** (attempts - 1)))
+
+    def is_flush_due(self) -> bool:
+        """Check if the Buffered Writes Must be Flushed."""
+        if self.pending_writes == 0:
+            return False
+
+        if self.pending_writes >= self.write_batch_size:
+            return True
+
+        return (time.monotonic() - self.oldest_write_time) * 1000 >= self.write_max_delay_ms
+
+    def flush(self) -> int:
+        """
+        Write all Buffered Changes into DB, in a Single Transaction. On Failure, the Changes are Kept Buffered.
+
+        :return: Number of Written Changes
+        """
+        total: int = self.pending_writes
+        if total == 0:
+            return 0
+
+        try:
+            if self.pending_inserts:
+                DbManager.SESSIONS['temp'].execute(insert(NotificationOutboxOrmEntity), list(self.pending_inserts.values()))
+
+            for entry_id, values in self.pending_updates.items():
+                DbManager.SESSIONS['temp'].execute(update(NotificationOutboxOrmEntity).where(NotificationOutboxOrmEntity.id == entry_id).values(**values))
+
+            if self.pending_deletes:
+                DbManager.SESSIONS['temp'].execute(delete(NotificationOutboxOrmEntity).where(NotificationOutboxOrmEntity.id.in_(self.pending_deletes)))
+
+            DbManager.SESSIONS['temp'].commit()
+
+        except Exception:
+            # Keep the Buffered Changes, so they are Written by the Next Flush
+            DbManager.SESSIONS['temp'].rollback()
+            self.failed_batches += 1
+            raise
+
+        self.pending_inserts = {}
+        self.pending_updates = {}
+        self.pending_deletes = []
+        self.total_batches += 1
+        return total
+
+    def get_due(self) -> List[Dict]:
+        """
+        Return the Notifications Ready to be (Re)Delivered, Including the Ones Left by a Previous Execution.
+
+        The Returned Notifications are Marked as In Flight.
+        """
+        self.flush()
+
+        rows: List[NotificationOutboxOrmEntity] = list(DbManager.SESSIONS['temp'].execute(
+            select(NotificationOutboxOrmEntity)
+            .where(NotificationOutboxOrmEntity.next_attempt_at <= int(time.time()))
+            .order_by(NotificationOutboxOrmEntity.next_attempt_at, NotificationOutboxOrmEntity.created_at)
+            .limit(self.dispatch_batch_size + len(self.in_flight)),
+            ).scalars())
+
+        due: List[Dict] = []
+        for row in rows:
+            if row.id in self.in_flight or len(due) >= self.dispatch_batch_size:
+                continue
+
+            self.in_flight[row.id] = row.attempts
+            due.append({
+                'id': row.id,
+                'notifier': row.notifier,
+                'rule_id': row.rule_id,
+                'source': row.source,
+                'entity': NotificationOutbox.__load_entity(entity_type=row.entity_type, content=row.entity),
+                })
+
+        # Detach the Rows, so the Session does not Keep them
+        DbManager.SESSIONS['temp'].expunge_all()
+
+        return due
+
+    def count(self) -> int:
+        """Return the Number of Notifications Waiting on the Outbox."""
+        self.flush()
+        return int(DbManager.SESSIONS['temp'].query(NotificationOutboxOrmEntity).count())
+
+    @staticmethod
+    def __load_entity(entity_type: str, content: str) -> Union[FinderNotificationMessageEntity, SignalNotificationEntityModel]:
+        """Load the Notification Entity from JSON."""
+        if entity_type == 'finder':
+            return FinderNotificationMessageEntity.model_validate_json(content)
+
+        return SignalNotificationEntityModel.model_validate_json(content)
+
+    def __remove(self, entry_id: str) -> None:
+        """Remove a Notification from the Outbox."""
+        # Not Written Yet
+        if self.pending_inserts.pop(entry_id, None):
+            return
+
+        self.__add_write()
+        self.pending_updates.pop(entry_id, None)
+        self.pending_deletes.append(entry_id)
+
+    def __add_write(self) -> None:
+        """Track the Oldest Buffered Write."""
+        if self.pending_writes == 0:
+            self.oldest_write_time = time.monotonic()
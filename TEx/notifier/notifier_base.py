@@ -2,14 +2,12 @@
 from __future__ import annotations
 
 import abc
-import hashlib
 from configparser import SectionProxy
 from typing import Optional, Tuple, Union
 
-from cachetools import TTLCache
-
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.notification_dedup_store import NotificationDedupStore
 
 
 class BaseNotifier:
@@ -17,33 +15,44 @@ class BaseNotifier:
 
     def __init__(self) -> None:
         """Initialize the Base Notifier."""
-        self.cache: Optional[TTLCache] = None
+        self.dedup_store: Optional[NotificationDedupStore] = None
+        self.dedup_namespace: int = 0
+        self.dedup_ttl_seconds: int = 0
         self.timeout_seconds: int
         self.media_attachments_enabled: bool
         self.media_attachments_max_size_bytes: int
 
-    def configure_base(self, config: SectionProxy) -> None:
-        """Configure Base Notifier."""
-        self.cache = TTLCache(maxsize=4096, ttl=int(config.get('prevent_duplication_for_minutes', fallback='240')) * 60)
+    def configure_base(self, config: SectionProxy, dedup_store: Optional[NotificationDedupStore] = None) -> None:
+        """Configure Base Notifier. Without a Shared Deduplication Store, the Notifier Uses its Own."""
+        self.dedup_store = dedup_store if dedup_store is not None else NotificationDedupStore()
+        self.dedup_namespace = NotificationDedupStore.get_namespace(name=config.name)
+        self.dedup_ttl_seconds = int(config.get('prevent_duplication_for_minutes', fallback='240')) * 60
         self.timeout_seconds = int(config.get('timeout_seconds', fallback='30'))
         self.media_attachments_enabled = config.get('media_attachments_enabled', fallback='false') == 'true'
         self.media_attachments_max_size_bytes = int(config.get('media_attachments_max_size_bytes', fallback='10000000'))
 
-    def check_is_duplicated(self, message: str) -> Tuple[bool, str]:
-        """Check if Message is Duplicated on Notifier."""
-        if not message or self.cache is None:
+    def check_is_duplicated(self, message: str, tag: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Check if Message is Duplicated on Notifier.
+
+        :param tag: Deduplication Tag Already Computed for the Message (Shared by all Notifiers)
+        """
+        if not message or self.dedup_store is None:
             return False, ''
 
-        # Compute Deduplication Tag
-        tag: str = hashlib.md5(message.encode('UTF-8')).hexdigest()
+        if tag is None:
+            tag = NotificationDedupStore.get_tag(message=message)
+
+        is_duplicated: bool = self.dedup_store.check_and_add(namespace=self.dedup_namespace, tag=tag, ttl_seconds=self.dedup_ttl_seconds)
+        return is_duplicated, f'{tag:016x}'
 
-        # If Found, Return True
-        if self.cache.get(tag):
-            return True, tag
+    def release_duplication_tag(self, tag: str) -> None:
+        """Forget a Deduplication Tag, so a Failed Notification can be Sent Again."""
+        if tag and self.dedup_store is not None:
+            self.dedup_store.remove(namespace=self.dedup_namespace, tag=int(tag, 16))
 
-        # Otherwise, Just Insert and Return False
-        self.cache[tag] = True
-        return False, tag
+    async def shutdown(self) -> None:
+        """Send any Buffered Notification and Release the Resources."""
 
     @abc.abstractmethod
     async def run(self, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str) -> None:
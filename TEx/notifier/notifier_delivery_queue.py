@@ -0,0 +1,176 @@
+"""Notifier Delivery Queue."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
+from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.notification_outbox import NotificationOutbox
+from TEx.notifier.notifier_base import BaseNotifier
+
+logger = logging.getLogger('TelegramExplorer')
+
+
+class NotifierDeliveryQueue:
+    """
+    Bounded Queue and Worker Tasks of a Single Notifier.
+
+    The Notifications are Only Enqueued by the Finder, so a Slow Notifier (Ex: Discord Rate Limit Retries or a Slow
+    Elasticsearch Cluster) does not Block the Messages Ingestion. When the Queue is Full, the New Notification is Dropped,
+    Unless Enqueued with put_wait (Ex: Retro Hunt), that Waits for a Free Slot.
+
+    With the Outbox, the Delivery Result of each Notification is Reported to the Outbox (Removed or Retried).
+    """
+
+    DROP_LOG_INTERVAL: int = 100
+
+    def __init__(self, name: str, notifier: BaseNotifier, max_size: int, workers: int, outbox: Optional[NotificationOutbox] = None) -> None:
+        """Initialize the Queue. The Worker Tasks are Created on the First Notification."""
+        self.name: str = name
+        self.notifier: BaseNotifier = notifier
+        self.outbox: Optional[NotificationOutbox] = outbox
+        self.max_size: int = max(1, max_size)
+        self.workers: int = max(1, workers)
+        self.queue: Optional[asyncio.Queue[Tuple[float, Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], str, str, Optional[str]]]] = None
+        self.tasks: List[asyncio.Task] = []
+        self.enqueued: int = 0
+        self.delivered: int = 0
+        self.failed: int = 0
+        self.dropped: int = 0
+        self.max_depth: int = 0
+        self.total_latency_seconds: float = 0.0
+        self.max_latency_seconds: float = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Return the Number of Notifications Waiting on the Queue."""
+        return self.queue.qsize() if self.queue else 0
+
+    @property
+    def is_full(self) -> bool:
+        """Return if the Queue is Full."""
+        return self.depth >= self.max_size
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the Worker Tasks are Running."""
+        return len(self.tasks) > 0
+
+    def put(self, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str, outbox_id: Optional[str] = None) -> bool:
+        """
+        Enqueue a Notification, without Waiting.
+
+        :param outbox_id: Outbox Entry ID of the Notification
+        :return: False if the Queue is Full and the Notification was Dropped
+        """
+        if self.queue is None:
+            self.start()
+
+        try:
+            self.queue.put_nowait((time.monotonic(), entity, rule_id, source, outbox_id))  # type: ignore
+
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+            if self.dropped % NotifierDeliveryQueue.DROP_LOG_INTERVAL == 1:
+                logger.warning(f'\t\tNotifier "{self.name}" Queue is Full ({self.max_size}). {self.dropped} Notifications Dropped')
+
+            return False
+
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        return True
+
+    async def put_wait(self, entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str, outbox_id: Optional[str] = None) -> None:
+        """
+        Enqueue a Notification, Waiting for a Free Slot when the Queue is Full. The Notification is never Dropped.
+
+        :param outbox_id: Outbox Entry ID of the Notification
+        """
+        if self.queue is None:
+            self.start()
+
+        await self.queue.put((time.monotonic(), entity, rule_id, source, outbox_id))  # type: ignore
+
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def start(self) -> None:
+        """Create the Queue and Start the Worker Tasks."""
+        if self.is_running:
+            return
+
+        self.queue = asyncio.Queue(maxsize=self.max_size)
+        self.tasks = [
+            asyncio.create_task(self.__worker(), name=f'{self.name}.{worker_ix}')
+            for worker_ix in range(self.workers)
+            ]
+
+    async def join(self) -> None:
+        """Wait all Enqueued Notifications to be Delivered (or Failed)."""
+        if self.queue:
+            await self.queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the Worker Tasks Immediately."""
+        for task in self.tasks:
+            task.cancel()
+
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        """Return the Queue Metrics."""
+        completed: int = self.delivered + self.failed
+
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'max_size': self.max_size,
+            'enqueued': self.enqueued,
+            'delivered': self.delivered,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'mean_latency_ms': round(self.total_latency_seconds * 1000 / completed, 3) if completed else 0.0,
+            'max_latency_ms': round(self.max_latency_seconds * 1000, 3),
+            }
+
+    def summary(self) -> str:
+        """Return a Text Summary of the Queue Metrics."""
+        metrics: Dict[str, Union[int, float]] = self.get_metrics()
+
+        return (
+            f'{self.name}: {metrics["delivered"]} Delivered, {metrics["failed"]} Failed, {metrics["dropped"]} Dropped, '
+            f'Depth {metrics["depth"]}/{metrics["max_size"]} (Max {metrics["max_depth"]}), '
+            f'Latency {metrics["mean_latency_ms"]}ms Mean, {metrics["max_latency_ms"]}ms Max'
+            )
+
+    async def __worker(self) -> None:
+        """Delivery Worker Loop."""
+        queue: asyncio.Queue[Tuple[float, Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], str, str, Optional[str]]] = self.queue  # type: ignore
+
+        while True:
+            enqueued_at, entity, rule_id, source, outbox_id = await queue.get()
+
+            try:
+                await self.notifier.run(entity=entity, rule_id=rule_id, source=source)
+                self.delivered += 1
+
+                if self.outbox and outbox_id:
+                    self.outbox.ack(entry_id=outbox_id)
+
+            except Exception:  # Yes, Catch All
+                self.failed += 1
+                logger.exception(f'Unable to Send Notification on "{self.name}"')
+
+                if self.outbox and outbox_id:
+                    self.outbox.retry(entry_id=outbox_id)
+
+            finally:
+                latency_seconds: float = time.monotonic() - enqueued_at
+                self.total_latency_seconds += latency_seconds
+                self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+                queue.task_done()
@@ -1,25 +1,47 @@
 """Notifier Modules."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from configparser import ConfigParser
-from typing import Dict, List, Union
+import time
+from configparser import ConfigParser, SectionProxy
+from typing import Dict, List, Optional, Union
 
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
 from TEx.notifier.discord_notifier import DiscordNotifier
+from TEx.notifier.discord_webhook_scheduler import DiscordWebhookScheduler
 from TEx.notifier.elastic_search_notifier import ElasticSearchNotifier
+from TEx.notifier.notification_attachment_store import NotificationAttachmentStore
+from TEx.notifier.notification_dedup_store import NotificationDedupStore
+from TEx.notifier.notification_outbox import NotificationOutbox
 from TEx.notifier.notifier_base import BaseNotifier
+from TEx.notifier.notifier_delivery_queue import NotifierDeliveryQueue
 
 logger = logging.getLogger('TelegramExplorer')
 
 
 class NotifierEngine:
-    """Primary Notification Engine."""
+    """
+    Primary Notification Engine.
+
+    Each Notifier Delivers from its own Bounded Queue, so the Callers only Wait to Enqueue the Notifications.
+
+    With the Outbox Enabled, the Notifications are also Persisted Before the Delivery, and a Background Dispatcher
+    Retries the Failed (or Dropped) Notifications and the Notifications Left by a Previous Execution.
+    """
+
+    SHUTDOWN_TIMEOUT_SECONDS: int = 60
 
     def __init__(self) -> None:
         """Initialize Finder Engine."""
         self.notifiers: Dict = {}
+        self.outbox: NotificationOutbox = NotificationOutbox()
+        self.dispatcher_task: Optional[asyncio.Task] = None
+        self.dedup_store: NotificationDedupStore = NotificationDedupStore()
+        self.dedup_snapshot_task: Optional[asyncio.Task] = None
+        self.attachment_store: NotificationAttachmentStore = NotificationAttachmentStore()
 
     def __load_notifiers(self, config: ConfigParser) -> None:
         """Load all Registered Notifiers."""
@@ -29,42 +51,264 @@ class NotifierEngine:
             if 'DISCORD' in register:
 
                 notifier: DiscordNotifier = DiscordNotifier()
-                notifier.configure(url=config[register]['webhook'], config=config[register])
+                notifier.configure(
+                    url=config[register]['webhook'],
+                    config=config[register],
+                    dedup_store=self.dedup_store,
+                    attachment_store=self.attachment_store,
+                    )
 
+                # Concurrent Senders Allow the Scheduler to Pack the Embeds
                 self.notifiers.update({
-                    register: {'instance': notifier},
+                    register: {
+                        'instance': notifier,
+                        'queue': self.__build_queue(name=register, notifier=notifier, config=config[register], default_workers=DiscordWebhookScheduler.MAX_EMBEDS_PER_MESSAGE),
+                        },
                     })
 
             if 'ELASTIC_SEARCH' in register:
                 notifier_es: ElasticSearchNotifier = ElasticSearchNotifier()
                 notifier_es.configure(config=config[register])
 
+                # On Bulk Mode, each Sender Waits its Document to be Sent, so Concurrent Senders Fill the Bulk Requests
                 self.notifiers.update({
-                    register: {'instance': notifier_es},
+                    register: {
+                        'instance': notifier_es,
+                        'queue': self.__build_queue(
+                            name=register,
+                            notifier=notifier_es,
+                            config=config[register],
+                            default_workers=notifier_es.bulk_max_actions if notifier_es.bulk_enabled else 1,
+                            ),
+                        },
                     })
 
+    def __build_queue(self, name: str, notifier: BaseNotifier, config: SectionProxy, default_workers: int = 1) -> NotifierDeliveryQueue:
+        """Build the Notifier Delivery Queue."""
+        return NotifierDeliveryQueue(
+            name=name,
+            notifier=notifier,
+            max_size=int(config.get('queue_max_size', fallback='1000')),
+            workers=int(config.get('queue_workers', fallback=str(default_workers))),
+            outbox=self.outbox if self.outbox.enabled else None,
+            )
+
     def configure(self, config: ConfigParser) -> None:
         """Configure Finder."""
+        self.outbox.configure(config=config)
+        self.dedup_store.configure(config=config)
+        self.attachment_store.configure(config=config)
         self.__load_notifiers(config)
 
-    async def run(self, notifiers: List[str], entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str) -> None:
-        """Dispatch all Notifications.
+    def start(self) -> None:
+        """
+        Start the Background Tasks of a Long Running Execution.
+
+        Loads the Deduplication Snapshot (Saved Periodically and on Shutdown) and Starts the Outbox Dispatcher, that
+        Sends the Notifications Left by a Previous Execution and Retries the Failed Ones.
+        """
+        if not self.dedup_snapshot_task:
+            try:
+                loaded: int = self.dedup_store.load()
+                if loaded > 0:
+                    logger.info(f'\t\t{loaded} Notification Deduplication Entries Loaded')
+
+            except Exception:  # Yes, Catch All
+                logger.exception('Unable to Load the Notification Deduplication Snapshot')
+
+            self.dedup_snapshot_task = asyncio.create_task(self.__snapshot_dedup_store())
+
+        if self.outbox.enabled and not self.dispatcher_task:
+            self.dispatcher_task = asyncio.create_task(self.__dispatch())
+
+    async def run(
+            self, notifiers: List[str], entity: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel], rule_id: str, source: str, block: bool = False,
+            ) -> None:
+        """Dispatch all Notifications. The Notifications are Enqueued into each Notifier Queue and Delivered in Background.
 
         :param notifiers:
         :param message: Message Object
         :param rule_id: Triggered Rule ID
         :param source: Source Account/Phone Number
+        :param block: Wait for a Free Slot when the Notifier Queue is Full, Instead of Dropping the Notification
         :return:
         """
         if len(notifiers) == 0:
             return
 
+        # The Caller may Change the Entity (Ex: found_on) Before the Delivery
+        entity_copy: Union[FinderNotificationMessageEntity, SignalNotificationEntityModel] = entity.model_copy()
+
+        # Deduplication Tag Computed Once, Shared by all Notifiers
+        if isinstance(entity_copy, FinderNotificationMessageEntity) and entity_copy.raw_text and entity_copy.dedup_tag is None:
+            entity_copy.dedup_tag = NotificationDedupStore.get_tag(message=entity_copy.raw_text)
+
         for dispatcher_name in notifiers:
 
-            target_notifier: BaseNotifier = self.notifiers[dispatcher_name]['instance']
+            target_queue: NotifierDeliveryQueue = self.notifiers[dispatcher_name]['queue']
+            outbox_id: Optional[str] = self.outbox.add(notifier=dispatcher_name, entity=entity_copy, rule_id=rule_id, source=source) if self.outbox.enabled else None
+
+            if block:
+                await target_queue.put_wait(entity=entity_copy, rule_id=rule_id, source=source, outbox_id=outbox_id)
+                continue
+
+            # Dropped Notifications are Kept on the Outbox and Sent by the Dispatcher
+            if not target_queue.put(entity=entity_copy, rule_id=rule_id, source=source, outbox_id=outbox_id) and outbox_id:
+                self.outbox.release(entry_id=outbox_id)
+
+        if self.outbox.is_flush_due():
+            self.__flush_outbox()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Return the Delivery Queue Metrics (Depth, Drops and Latency) by Notifier."""
+        return {name: notifier['queue'].get_metrics() for name, notifier in self.notifiers.items()}
+
+    def get_summary(self) -> Optional[str]:
+        """Return the Summary of the Delivery Queues in Use, or None if no Notification was Sent."""
+        lines: List[str] = [notifier['queue'].summary() for notifier in self.notifiers.values() if notifier['queue'].is_running]
+        return '\n'.join(lines) if lines else None
+
+    async def shutdown(self, timeout_seconds: float = SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+        """
+        Deliver the Pending Notifications and Stop the Delivery Queues.
+
+        :param timeout_seconds: Max Time to Wait the Pending Notifications
+        :return: True if all Notifications were Delivered, False if the Timeout was Reached
+        """
+        await self.__stop_dispatcher()
+
+        queues: List[NotifierDeliveryQueue] = [notifier['queue'] for notifier in self.notifiers.values() if notifier['queue'].is_running]
+        if len(queues) == 0:
+            self.__close_outbox()
+            await self.__close_dedup_store()
+            return True
+
+        logger.info(f'\t\tFlushing Notifications ({sum(queue.depth for queue in queues)} Pending)...')
+
+        flushed: bool = True
+        try:
+            await asyncio.wait_for(NotifierEngine.__flush(queues=queues), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f'\t\tNotifications Flush Timeout Reached. {sum(queue.depth for queue in queues)} Notifications Discarded.')
+            flushed = False
+
+        for queue in queues:
+            await queue.stop()
+            logger.info(f'\t\t{queue.summary()}')
+
+        self.__close_outbox()
+        await self.__close_dedup_store()
+        return flushed
+
+    async def __dispatch(self) -> None:
+        """Outbox Dispatcher Loop. Writes the Buffered Outbox Changes and Enqueues the Due Notifications. Runs Until Cancelled."""
+        next_dispatch_at: float = 0.0
+
+        while True:
+            try:
+                if time.monotonic() >= next_dispatch_at:
+                    self.__dispatch_due()
+                    next_dispatch_at = time.monotonic() + self.outbox.dispatch_interval_seconds
+
+                elif self.outbox.is_flush_due():
+                    self.outbox.flush()
+
+            except Exception:  # Yes, Catch All
+                logger.exception('Unable to Dispatch the Notification Outbox')
+
+            await asyncio.sleep(self.outbox.write_max_delay_ms / 1000)
+
+    def __dispatch_due(self) -> None:
+        """Enqueue the Outbox Notifications Ready to be Sent."""
+        for item in self.outbox.get_due():
+
+            if item['notifier'] not in self.notifiers:
+                logger.warning(f'\t\tNotifier "{item["notifier"]}" not Found. Notification {item["id"]} Discarded from the Outbox')
+                self.outbox.ack(entry_id=item['id'])
+                continue
+
+            target_queue: NotifierDeliveryQueue = self.notifiers[item['notifier']]['queue']
+
+            # Keep on the Outbox Until the Next Dispatch
+            if target_queue.is_full:
+                self.outbox.release(entry_id=item['id'])
+                continue
+
+            target_queue.put(entity=item['entity'], rule_id=item['rule_id'], source=item['source'], outbox_id=item['id'])
+
+    async def __stop_dispatcher(self) -> None:
+        """Stop the Outbox Dispatcher."""
+        if not self.dispatcher_task:
+            return
+
+        self.dispatcher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.dispatcher_task
+        self.dispatcher_task = None
+
+    async def __snapshot_dedup_store(self) -> None:
+        """Save the Deduplication Snapshot each snapshot_interval_seconds. Runs Until Cancelled."""
+        if self.dedup_store.snapshot_interval_seconds <= 0:
+            return
+
+        while True:
+            await asyncio.sleep(self.dedup_store.snapshot_interval_seconds)
+
+            try:
+                self.dedup_store.snapshot()
+            except Exception:  # Yes, Catch All
+                logger.exception('Unable to Save the Notification Deduplication Snapshot')
+
+    async def __close_dedup_store(self) -> None:
+        """Stop the Periodic Snapshot and Save the Final Deduplication Snapshot. Only for Started Engines."""
+        if not self.dedup_snapshot_task:
+            return
+
+        self.dedup_snapshot_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.dedup_snapshot_task
+        self.dedup_snapshot_task = None
+
+        try:
+            saved: int = self.dedup_store.snapshot()
+            if saved > 0:
+                logger.info(f'\t\t{saved} Notification Deduplication Entries Saved ({self.dedup_store.evicted} Evicted)')
+
+        except Exception:  # Yes, Catch All
+            logger.exception('Unable to Save the Notification Deduplication Snapshot')
+
+    def __flush_outbox(self) -> None:
+        """Write the Buffered Outbox Changes. Failures do not Stop the Notifications Delivery."""
+        try:
+            self.outbox.flush()
+
+        except Exception:  # Yes, Catch All
+            logger.exception('Unable to Write the Notification Outbox')
+
+    def __close_outbox(self) -> None:
+        """Write the Buffered Outbox Changes and Report the Notifications Left for the Next Execution."""
+        if not self.outbox.enabled:
+            return
+
+        pending: int
+        try:
+            pending = self.outbox.count()
+
+        except Exception:  # Yes, Catch All
+            logger.exception('Unable to Write the Notification Outbox. Notifications may be lost.')
+            return
+
+        if pending > 0:
+            logger.warning(f'\t\t{pending} Notifications Kept on the Outbox, to be Sent on the Next Execution')
+
+    @staticmethod
+    async def __flush(queues: List[NotifierDeliveryQueue]) -> None:
+        """Wait the Queues Deliver all Notifications, then Shutdown the Notifiers (Sending any Buffered Notification)."""
+        await asyncio.gather(*[queue.join() for queue in queues])
 
+        for queue in queues:
             try:
-                await target_notifier.run(entity=entity, rule_id=rule_id, source=source)
+                await queue.notifier.shutdown()
 
             except Exception:  # Yes, Catch All
-                logging.exception('Unable to Send Notification')
+                logger.exception(f'Unable to Shutdown the "{queue.name}" Notifier Gracefully. Notifications may be lost.')
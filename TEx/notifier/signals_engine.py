@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from configparser import ConfigParser
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import pytz
 
@@ -45,12 +45,20 @@ class SignalsEngine:
         """Increment the Messages Sent Counter."""
         self.messages_sent += 1
 
-    async def keep_alive(self) -> None:
-        """Send the Keep Alive."""
+    async def keep_alive(self, details: Optional[str] = None) -> None:
+        """
+        Send the Keep Alive.
+
+        :param details: Optional Text Appended to the Signal Content (Ex: Finder Slowest Rules)
+        """
+        content: str = f'Messages Processed in Period: {self.messages_sent}'
+        if details:
+            content += f'\n{details}'
+
         await self.__send_signal(
             entity=SignalNotificationEntityModel(
                 date_time=datetime.now(tz=pytz.UTC),
-                content=f'Messages Processed in Period: {self.messages_sent}',
+                content=content,
                 signal='KEEP-ALIVE',
             ),
         )
@@ -88,6 +96,16 @@ class SignalsEngine:
             ),
         )
 
+    async def rule_disabled(self, rule_id: str, reason: str) -> None:
+        """Send the Finder Rule Disabled Event."""
+        await self.__send_signal(
+            entity=SignalNotificationEntityModel(
+                date_time=datetime.now(tz=pytz.UTC),
+                content=f'Rule: {rule_id} | Reason: "{reason}"',
+                signal='RULE-DISABLED',
+            ),
+        )
+
     async def __send_signal(self, entity: SignalNotificationEntityModel) -> None:
         """Send the Signal."""
         signal_notifiers: List[str] = self.signal_entity.notifiers[entity.signal]
@@ -0,0 +1,123 @@
+"""
+Finder Keywords Benchmark.
+
+Measure the Startup (File Load and Automaton Build) Time and the Message Throughput of the Keywords Finder for
+Growing Watchlists of Synthetic Handles, Wallet Addresses and Domains.
+
+Usage: python -m benchmarks.finder_keywords_benchmark [--messages 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import string
+import tempfile
+import time
+from configparser import ConfigParser
+from typing import List
+
+from TEx.finder.keywords_finder import KeywordsFinder
+
+TERM_COUNTS: List[int] = [1000, 10000, 50000, 100000]
+VOCABULARY: List[str] = [
+    'hello', 'group', 'channel', 'price', 'wallet', 'today', 'message', 'photo', 'link', 'join', 'admin', 'sale',
+    'crypto', 'bitcoin', 'transfer', 'account', 'password', 'leak', 'data', 'server', 'update', 'news', 'привет',
+    'contato', 'grupo', '🔥', '👍', 'https://t.me/example', 'www.example.com', '12345', '2024-01-01',
+    ]
+
+
+def build_terms(count: int, rnd: random.Random) -> List[str]:
+    """Build a Synthetic Watchlist."""
+    h_result: List[str] = []
+
+    for term_ix in range(count):
+        kind: int = term_ix % 3
+
+        if kind == 0:
+            h_result.append('@' + ''.join(rnd.choices(string.ascii_lowercase + '_', k=rnd.randint(5, 15))))
+        elif kind == 1:
+            h_result.append('bc1q' + ''.join(rnd.choices(string.ascii_lowercase + string.digits, k=38)))
+        else:
+            h_result.append(''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(4, 12))) + rnd.choice(['.com', '.net', '.ru', '.io']))
+
+    return h_result
+
+
+def build_messages(count: int, terms: List[str], rnd: random.Random) -> List[str]:
+    """Build Synthetic Messages, with about 1% of them Containing a Term."""
+    h_result: List[str] = []
+
+    for _ in range(count):
+        words: List[str] = [rnd.choice(VOCABULARY) for _ in range(rnd.randint(5, 60))]
+
+        if rnd.random() < 0.01:
+            words.insert(rnd.randint(0, len(words)), rnd.choice(terms).upper())
+
+        h_result.append(' '.join(words))
+
+    return h_result
+
+
+def run_finder(finder: KeywordsFinder, messages: List[str]) -> int:
+    """Run the Finder over all Messages and Return the Number of Hits."""
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+    async def find_all() -> int:
+        return sum([1 for message in messages if await finder.find(raw_text=message)])
+
+    try:
+        return loop.run_until_complete(find_all())
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """Run the Benchmark."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Finder Keywords Benchmark')
+    parser.add_argument('--messages', type=int, default=2000)
+    args: argparse.Namespace = parser.parse_args()
+
+    rnd: random.Random = random.Random(42)
+
+    print(f'{"Terms":>7} {"States":>9} {"Build (ms)":>11} {"Substring (msg/s)":>18} {"Word Bound. (msg/s)":>20} {"Hits":>5}')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for term_count in TERM_COUNTS:
+            terms: List[str] = build_terms(count=term_count, rnd=rnd)
+            file_path: str = os.path.join(temp_dir, f'watchlist_{term_count}.txt')
+
+            with open(file_path, 'w', encoding='UTF-8') as file:
+                file.write('\n'.join(terms))
+
+            config: ConfigParser = ConfigParser()
+            config.read_dict({
+                'FINDER.RULE.SUBSTRING': {'type': 'keywords', 'file': file_path},
+                'FINDER.RULE.WORD_BOUNDARIES': {'type': 'keywords', 'file': file_path, 'word_boundaries': 'true'},
+                })
+
+            build_start: float = time.perf_counter()
+            finder: KeywordsFinder = KeywordsFinder(config=config['FINDER.RULE.SUBSTRING'])
+            build_ms: float = (time.perf_counter() - build_start) * 1000
+
+            finder_word_boundaries: KeywordsFinder = KeywordsFinder(config=config['FINDER.RULE.WORD_BOUNDARIES'])
+
+            messages: List[str] = build_messages(count=args.messages, terms=terms, rnd=rnd)
+
+            start: float = time.perf_counter()
+            hits: int = run_finder(finder=finder, messages=messages)
+            substring_seconds: float = time.perf_counter() - start
+
+            start = time.perf_counter()
+            run_finder(finder=finder_word_boundaries, messages=messages)
+            word_boundaries_seconds: float = time.perf_counter() - start
+
+            print(
+                f'{term_count:>7} {len(finder.automaton):>9} {build_ms:>11.1f} {len(messages) / substring_seconds:>18.0f} '
+                f'{len(messages) / word_boundaries_seconds:>20.0f} {hits:>5}',
+                )
+
+
+if __name__ == '__main__':
+    main()
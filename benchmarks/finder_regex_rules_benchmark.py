@@ -0,0 +1,134 @@
+"""
+Finder Regex Rules Benchmark.
+
+Compare the Message Throughput of the Per Rule Scan (one Regex Scan per Pattern) Against the Combined Regex Matcher
+Used by the Finder Engine, for a Growing Number of Rules.
+
+Usage: python -m benchmarks.finder_regex_rules_benchmark [--messages 500] [--patterns-per-rule 20]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Set
+
+from TEx.finder.combined_regex_matcher import CombinedRegexMatcher
+from TEx.finder.regex_finder import RegexFinder
+
+RULE_COUNTS: List[int] = [1, 10, 50, 100, 300]
+VOCABULARY: List[str] = [
+    'hello', 'group', 'channel', 'price', 'wallet', 'today', 'message', 'photo', 'link', 'join', 'admin', 'sale',
+    'crypto', 'bitcoin', 'transfer', 'account', 'password', 'leak', 'data', 'server', 'update', 'news', 'привет',
+    'contato', 'grupo', '🔥', '👍', 'https://t.me/example', 'www.example.com', '12345', '2024-01-01',
+    ]
+
+
+def build_rule_patterns(rule_ix: int, patterns_per_rule: int) -> List[str]:
+    """Build a Synthetic Watchlist Rule, Mixing Literal, Prefixed and Literal Free Patterns."""
+    h_result: List[str] = []
+
+    for pattern_ix in range(patterns_per_rule):
+        kind: int = pattern_ix % 4
+
+        if kind == 0:
+            h_result.append(f'watchterm{rule_ix}x{pattern_ix}')
+        elif kind == 1:
+            h_result.append(rf'user_{rule_ix}_{pattern_ix}\s*\d+')
+        elif kind == 2:
+            h_result.append(rf'(?:btc|eth)wallet{rule_ix}y{pattern_ix}[a-f0-9]{{8}}')
+        elif pattern_ix == 3:  # Same Literal Free Pattern Shared by all Rules
+            h_result.append(r'\b4[0-9]{12}(?:[0-9]{3})?\b')
+        else:
+            h_result.append(rf'^leak\W+{rule_ix}\W+{pattern_ix}$')
+
+    return h_result
+
+
+def build_messages(count: int, rule_count: int, seed: int = 42) -> List[str]:
+    """Build Synthetic Messages, with about 1% of them Hitting a Rule."""
+    rnd: random.Random = random.Random(seed)
+    h_result: List[str] = []
+
+    for _ in range(count):
+        words: List[str] = [rnd.choice(VOCABULARY) for _ in range(rnd.randint(5, 60))]
+
+        if rnd.random() < 0.01:
+            words.insert(rnd.randint(0, len(words)), f'WatchTerm{rnd.randrange(rule_count)}x0')
+
+        h_result.append(' '.join(words))
+
+    return h_result
+
+
+def run_per_rule_scan(finders: Dict[str, RegexFinder], messages: List[str]) -> int:
+    """Run the Baseline: Scan each Pattern of each Rule with findall."""
+    h_result: int = 0
+
+    for message in messages:
+        for finder in finders.values():
+            if any(len(pattern.findall(message)) > 0 for pattern in finder.regex_patterns):
+                h_result += 1
+
+    return h_result
+
+
+def run_combined_scan(matcher: CombinedRegexMatcher, messages: List[str]) -> int:
+    """Run the Combined Matcher: One Literal Scan per Message plus the Confirmation of the Candidates."""
+    h_result: int = 0
+
+    for message in messages:
+        matched: Set[str] = matcher.match(raw_text=message)
+        h_result += len(matched)
+
+    return h_result
+
+
+def measure(target: Callable[[], int]) -> float:
+    """Return the Elapsed Seconds of the Target."""
+    start: float = time.perf_counter()
+    target()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the Benchmark."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Finder Regex Rules Benchmark')
+    parser.add_argument('--messages', type=int, default=500)
+    parser.add_argument('--patterns-per-rule', type=int, default=20)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f'{"Rules":>6} {"Patterns":>9} {"Build (ms)":>11} {"Per Rule (msg/s)":>17} {"Combined (msg/s)":>17} {"Speedup":>8}')
+
+    for rule_count in RULE_COUNTS:
+        finders: Dict[str, RegexFinder] = {
+            f'FINDER.RULE.BENCH_{rule_ix}': RegexFinder(config={'regex': '\n'.join(build_rule_patterns(rule_ix, args.patterns_per_rule))})  # type: ignore[arg-type]
+            for rule_ix in range(rule_count)
+            }
+
+        build_start: float = time.perf_counter()
+        matcher: CombinedRegexMatcher = CombinedRegexMatcher()
+        for rule_id, finder in finders.items():
+            matcher.add_rule(rule_id=rule_id, patterns=finder.regex_patterns)
+        matcher.build()
+        build_ms: float = (time.perf_counter() - build_start) * 1000
+
+        messages: List[str] = build_messages(count=args.messages, rule_count=rule_count)
+
+        # Both Strategies Must Agree
+        expected: int = run_per_rule_scan(finders=finders, messages=messages)
+        if expected != run_combined_scan(matcher=matcher, messages=messages):
+            error_msg: str = f'Combined Matcher Result Differs from the Per Rule Scan for {rule_count} Rules'
+            raise AssertionError(error_msg)
+
+        per_rule_seconds: float = measure(lambda: run_per_rule_scan(finders=finders, messages=messages))
+        combined_seconds: float = measure(lambda: run_combined_scan(matcher=matcher, messages=messages))
+
+        print(
+            f'{rule_count:>6} {len(matcher):>9} {build_ms:>11.1f} {len(messages) / per_rule_seconds:>17.0f} '
+            f'{len(messages) / combined_seconds:>17.0f} {per_rule_seconds / combined_seconds:>7.1f}x',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 """Test the Dummy OCR Engine."""
 
+import asyncio
 import unittest
 
 from TEx.core.ocr.dummy_ocr_engine import DummyOcrEngine
@@ -14,3 +15,4 @@ class DummyOcrEngineTest(unittest.TestCase):
         target: OcrEngineBase = DummyOcrEngine()
         target.configure(config=None)
         self.assertIsNone(target.run(file_path='/folder/path'))
+        self.assertIsNone(asyncio.get_event_loop().run_until_complete(target.run_async(file_path='/folder/path')))
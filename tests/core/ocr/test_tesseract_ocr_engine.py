@@ -1,5 +1,7 @@
 """Test the Tesseract OCR Engine."""
 
+import asyncio
+import time
 import unittest
 from unittest import mock
 from configparser import ConfigParser
@@ -112,6 +114,29 @@ class TesseractOcrEngineTest(unittest.TestCase):
 
         self.assertEqual(f'Tesseract command cannot be found at "/folder/to/cmd/file"', context.exception.args[0])
 
+    def test_configure_negative_timeout(self):
+        """Test Config Method when the Timeout is Negative."""
+        # Run Setup
+        args: Dict = {
+            'config': 'unittest_configfile.config'
+        }
+        data: Dict = {}
+
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        # Change Config Settings
+        self.config['OCR.TESSERACT']['tesseract_cmd'] = '/folder/to/cmd/file'
+        self.config['OCR.TESSERACT']['timeout_seconds'] = '-1'
+
+        # Create Test Target
+        target: OcrEngineBase = TesseractOcrEngine()
+
+        # Call Configure
+        with self.assertRaises(AttributeError) as context:
+            target.configure(config=self.config['OCR.TESSERACT'])
+
+        self.assertEqual('"timeout_seconds" setting must be 0 (no timeout) or greater, but is -1', context.exception.args[0])
+
     @mock.patch('TEx.core.ocr.tesseract_ocr_engine.tesseract')
     def test_run_ocr_file_not_found(self, mocked_tesseract):
         """Test Tesseract Engine 'run' method returning Empty Value due a File not Found."""
@@ -124,3 +149,99 @@ class TesseractOcrEngineTest(unittest.TestCase):
 
         # Call Run
         self.assertEqual('', target.run(file_path='/path/to/target/image'))
+
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.tesseract')
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.os')
+    def test_run_async(self, mocked_os_lib, mocked_tesseract):
+        """Test Tesseract Engine 'run_async' method."""
+
+        # Configure Mock
+        mocked_tesseract.image_to_string = mock.MagicMock(return_value='OCR Text')
+        mocked_os_lib.path = mock.MagicMock()
+        mocked_os_lib.path.exists = mock.MagicMock(return_value=True)
+
+        # Create Test Target - Running on Threads to Allow Mocks
+        target: TesseractOcrEngine = TesseractOcrEngine()
+        target.cmd = '/folder/to/cmd/file'
+        target.language = 'eng+osd'
+        target.process_pool_workers = 0
+        target.timeout_seconds = 5
+        target.max_in_flight = 2
+
+        # Call Run
+        result = asyncio.get_event_loop().run_until_complete(target.run_async(file_path='/path/to/target/image'))
+        target.shutdown()
+
+        # Check Internal Behaviour
+        self.assertEqual('OCR Text', result)
+        self.assertEqual('/folder/to/cmd/file', mocked_tesseract.tesseract_cmd)
+        mocked_tesseract.image_to_string.assert_called_once_with(
+            '/path/to/target/image',
+            lang='eng+osd',
+            timeout=5
+        )
+
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.tesseract')
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.os')
+    def test_run_async_timeout(self, mocked_os_lib, mocked_tesseract):
+        """Test Tesseract Engine 'run_async' method returning Empty Value due a Timeout."""
+
+        # Configure Mock
+        mocked_tesseract.image_to_string = mock.MagicMock(side_effect=lambda *args, **kwargs: time.sleep(2))
+        mocked_os_lib.path = mock.MagicMock()
+        mocked_os_lib.path.exists = mock.MagicMock(return_value=True)
+
+        # Create Test Target - Running on Threads to Allow Mocks
+        target: TesseractOcrEngine = TesseractOcrEngine()
+        target.process_pool_workers = 0
+        target.timeout_seconds = 1
+        target.max_in_flight = 1
+
+        # Call Run
+        with self.assertLogs() as captured:
+            result = asyncio.get_event_loop().run_until_complete(target.run_async(file_path='/path/to/target/image'))
+
+        self.assertEqual('', result)
+        self.assertEqual('\t\t\tOCR Timeout (1s) for "/path/to/target/image"', captured.records[0].message)
+
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.tesseract')
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.os')
+    def test_run_async_without_timeout(self, mocked_os_lib, mocked_tesseract):
+        """Test Tesseract Engine 'run_async' method with the Timeout Disabled."""
+
+        # Configure Mock
+        mocked_tesseract.image_to_string = mock.MagicMock(return_value='Detected Text')
+        mocked_os_lib.path = mock.MagicMock()
+        mocked_os_lib.path.exists = mock.MagicMock(return_value=True)
+
+        # Create Test Target - Running on Threads to Allow Mocks
+        target: TesseractOcrEngine = TesseractOcrEngine()
+        target.process_pool_workers = 0
+        target.timeout_seconds = 0
+        target.max_in_flight = 1
+
+        # Call Run
+        self.assertEqual('Detected Text', asyncio.get_event_loop().run_until_complete(target.run_async(file_path='/path/to/target/image')))
+        mocked_tesseract.image_to_string.assert_called_once_with('/path/to/target/image', lang='', timeout=0)
+
+    @mock.patch('TEx.core.ocr.tesseract_ocr_engine.tesseract')
+    def test_run_async_fail(self, mocked_tesseract):
+        """Test Tesseract Engine 'run_async' method returning Empty Value due a File not Found or an Exception."""
+
+        # Configure Mock
+        mocked_tesseract.image_to_string = mock.MagicMock(side_effect=Exception())
+
+        # Create Test Target
+        target: TesseractOcrEngine = TesseractOcrEngine()
+        target.process_pool_workers = 0
+        target.timeout_seconds = 5
+        target.max_in_flight = 1
+
+        # Call Run - File not Found
+        self.assertEqual('', asyncio.get_event_loop().run_until_complete(target.run_async(file_path='/path/to/target/image')))
+
+        # Call Run - Exception
+        with self.assertLogs() as captured:
+            self.assertEqual('', asyncio.get_event_loop().run_until_complete(target.run_async(file_path='resources/sticker.webp')))
+
+        self.assertEqual('OCR Fail', captured.records[0].message)
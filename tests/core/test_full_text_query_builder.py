@@ -0,0 +1,37 @@
+"""Full Text Query Builder Tests."""
+
+import unittest
+
+from TEx.core.full_text_query_builder import FullTextQueryBuilder
+
+
+class FullTextQueryBuilderTest(unittest.TestCase):
+
+    def test_from_terms(self):
+        """Test Build Query from Filter Terms."""
+        self.assertEqual('"Bitcoin"', FullTextQueryBuilder.from_terms(['Bitcoin']))
+        self.assertEqual('"bitcoin" OR " my walle" OR "ay ""hi"""', FullTextQueryBuilder.from_terms(['bitcoin', ' my wallet', 'say "hi"']))
+
+        # Not Searchable Terms
+        self.assertIsNone(FullTextQueryBuilder.from_terms([]))
+        self.assertIsNone(FullTextQueryBuilder.from_terms(['bitcoin', 'ab']))
+        self.assertIsNone(FullTextQueryBuilder.from_terms(['Straße']))
+
+        # Casefold Expansions - "Message" also Matches "Meßage" and "Bitcoins" Matches "Bitcoinß"
+        self.assertIsNone(FullTextQueryBuilder.from_terms(['Message']))
+        self.assertIsNone(FullTextQueryBuilder.from_terms(['bitcoin', 'Fish']))
+        self.assertEqual('"Bitcoin" OR "bra" OR "Walle"', FullTextQueryBuilder.from_terms(['Bitcoins', 'bras', 'Wallet']))
+        self.assertIsNone(FullTextQueryBuilder.from_terms(['sat']))
+
+    def test_from_regex(self):
+        """Test Build Query from the Literals Required by a Regex."""
+        self.assertEqual('"wallet"', FullTextQueryBuilder.from_regex(r'wallet\s*([a-z0-9]{30})'))
+        self.assertEqual('"http" AND "://t.me/"', FullTextQueryBuilder.from_regex(r'https?://t\.me/\w+'))
+        self.assertEqual('"card " AND "number"', FullTextQueryBuilder.from_regex(r'card (number)?.*number'))
+        self.assertEqual('"user" AND "name"', FullTextQueryBuilder.from_regex(r'(?i)user(name)'))
+
+        # No Required Literal
+        self.assertIsNone(FullTextQueryBuilder.from_regex(r'bitcoin|ethereum'))
+        self.assertIsNone(FullTextQueryBuilder.from_regex(r'(?:wallet)?\d+'))
+        self.assertIsNone(FullTextQueryBuilder.from_regex(r'ab\d+cd'))
+        self.assertIsNone(FullTextQueryBuilder.from_regex(r'([a-z]+'))
@@ -0,0 +1,65 @@
+"""Flood Wait Aware Rate Limiter Tests."""
+
+import asyncio
+import time
+import unittest
+
+from TEx.core.rate_limiter import FloodWaitAwareRateLimiter
+
+
+class FloodWaitAwareRateLimiterTest(unittest.TestCase):
+
+    def test_acquire_rate(self):
+        """Test Requests are Limited by the Rate after the Burst."""
+
+        async def run_test() -> float:
+            target: FloodWaitAwareRateLimiter = FloodWaitAwareRateLimiter(max_rate_per_second=20, burst=2)
+            start: float = time.monotonic()
+
+            await asyncio.gather(*[target.acquire() for _ in range(6)])
+
+            return time.monotonic() - start
+
+        elapsed: float = asyncio.get_event_loop().run_until_complete(run_test())
+
+        # 2 from Burst + 4 at 20 Requests per Second
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 1)
+
+    def test_flood_wait(self):
+        """Test Flood Wait Pauses all Requests, Reduces the Rate and the Rate Recovers on Success."""
+
+        async def run_test() -> float:
+            target: FloodWaitAwareRateLimiter = FloodWaitAwareRateLimiter(max_rate_per_second=100, burst=5, recovery_step=25)
+
+            with self.assertLogs() as captured:
+                target.report_flood_wait(seconds=1)
+
+            self.assertEqual('\t\tTelegram Flood Wait of 1s Received. Reducing Rate to 50.00 Requests per Second', captured.records[0].message)
+            self.assertEqual(1, target.flood_waits)
+            self.assertEqual(50, target.rate_per_second)
+
+            start: float = time.monotonic()
+            await target.acquire()
+            elapsed: float = time.monotonic() - start
+
+            target.report_success()
+            self.assertEqual(75, target.rate_per_second)
+            target.report_success()
+            target.report_success()
+            self.assertEqual(100, target.rate_per_second)
+
+            return elapsed
+
+        elapsed: float = asyncio.get_event_loop().run_until_complete(run_test())
+        self.assertGreaterEqual(elapsed, 0.99)
+
+    def test_min_rate(self):
+        """Test the Rate Never Goes Below the Min Rate."""
+        target: FloodWaitAwareRateLimiter = FloodWaitAwareRateLimiter(max_rate_per_second=1, burst=1, min_rate_per_second=0.4)
+
+        with self.assertLogs():
+            target.report_flood_wait(seconds=0)
+            target.report_flood_wait(seconds=0)
+
+        self.assertEqual(0.4, target.rate_per_second)
@@ -0,0 +1,28 @@
+"""Regex Analyzer Tests."""
+
+import unittest
+
+from TEx.core.regex_analyzer import RegexAnalyzer
+
+
+class RegexAnalyzerTest(unittest.TestCase):
+
+    def test_required_literals(self):
+        """Test Extract the Literals Required by a Regex."""
+        self.assertEqual(['wallet'], RegexAnalyzer.required_literals(r'wallet\s*([a-z0-9]{30})'))
+        self.assertEqual(['http', '://t.me/'], RegexAnalyzer.required_literals(r'https?://t\.me/\w+'))
+        self.assertEqual(['user', 'name'], RegexAnalyzer.required_literals(r'(?i)user(name)'))
+        self.assertEqual([], RegexAnalyzer.required_literals(r'bitcoin|ethereum'))
+        self.assertEqual([], RegexAnalyzer.required_literals(r'(?=abc)\d+'))
+        self.assertIsNone(RegexAnalyzer.required_literals(r'invalid[regex'))
+
+    def test_has_group_references(self):
+        """Test Detect Backreferences and Conditionals, Including Nested Ones."""
+        self.assertTrue(RegexAnalyzer.has_group_references(r'(\w)\1'))
+        self.assertTrue(RegexAnalyzer.has_group_references(r'(?P<q>["\'])\w+(?P=q)'))
+        self.assertTrue(RegexAnalyzer.has_group_references(r'(<)?\w+(?(1)>)'))
+        self.assertTrue(RegexAnalyzer.has_group_references(r'foo|(bar(a|(\w)\3))+'))
+        self.assertTrue(RegexAnalyzer.has_group_references(r'invalid[regex'))
+
+        self.assertFalse(RegexAnalyzer.has_group_references(r'(^4[0-9]{12}(?:[0-9]{3})?$)|(3[47][0-9]{13})'))
+        self.assertFalse(RegexAnalyzer.has_group_references(r'[\1-\3]+\d'))
@@ -0,0 +1,116 @@
+"""Staged Pipeline Tests."""
+
+import asyncio
+import unittest
+from typing import List, Optional
+
+from TEx.core.staged_pipeline import StagedPipeline
+
+
+class StagedPipelineTest(unittest.TestCase):
+
+    def test_run_all_stages(self):
+        """Test Items Flow Across all Stages and Stop when a Stage Returns None."""
+        persisted: List[int] = []
+
+        async def stage_double(item: int) -> Optional[int]:
+            return item * 2
+
+        async def stage_filter(item: int) -> Optional[int]:
+            return item if item != 4 else None
+
+        async def stage_persist(item: int) -> Optional[int]:
+            persisted.append(item)
+            return None
+
+        async def run_test():
+            target: StagedPipeline[int] = StagedPipeline(name='ut', queue_max_size=10)
+            target.add_stage(name='double', handler=stage_double, workers=2)
+            target.add_stage(name='filter', handler=stage_filter)
+            target.add_stage(name='persist', handler=stage_persist)
+            target.start()
+
+            for item in range(5):
+                await target.put(item)
+
+            drained: bool = await target.drain(timeout_seconds=5)
+
+            self.assertTrue(drained)
+            self.assertFalse(target.is_running)
+            self.assertEqual([5, 5, 4], [stage.processed for stage in target.stages])
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+        self.assertEqual([0, 2, 6, 8], sorted(persisted))
+
+    def test_stage_exception(self):
+        """Test a Failing Item do not Stop the Workers."""
+        persisted: List[int] = []
+
+        async def stage_fail(item: int) -> Optional[int]:
+            if item == 1:
+                raise ValueError('UT Exception')
+            return item
+
+        async def stage_persist(item: int) -> Optional[int]:
+            persisted.append(item)
+            return None
+
+        async def run_test():
+            target: StagedPipeline[int] = StagedPipeline(name='ut', queue_max_size=10)
+            target.add_stage(name='fail', handler=stage_fail)
+            target.add_stage(name='persist', handler=stage_persist)
+            target.start()
+
+            for item in range(3):
+                await target.put(item)
+
+            with self.assertLogs() as captured:
+                await target.drain(timeout_seconds=5)
+
+            self.assertEqual(1, target.stages[0].failed)
+            self.assertEqual('Unable to Process Item on "ut.fail" Stage', captured.records[0].message)
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+        self.assertEqual([0, 2], persisted)
+
+    def test_backpressure_and_drain_timeout(self):
+        """Test Producer Waits on Full Queue and Drain Gives Up after Timeout."""
+        release: asyncio.Event
+
+        async def stage_blocked(item: int) -> Optional[int]:
+            await release.wait()
+            return None
+
+        async def run_test():
+            nonlocal release
+            release = asyncio.Event()
+
+            target: StagedPipeline[int] = StagedPipeline(name='ut', queue_max_size=1)
+            target.add_stage(name='blocked', handler=stage_blocked)
+            target.start()
+
+            await target.put(1)  # Taken by the Worker
+            await asyncio.sleep(0)
+            await target.put(2)  # Fills the Queue
+
+            # Third Item Must Wait
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(target.put(3), timeout=0.1)
+
+            self.assertEqual(1, target.pending())
+
+            with self.assertLogs() as captured:
+                drained: bool = await target.drain(timeout_seconds=0.1)
+
+            self.assertFalse(drained)
+            self.assertFalse(target.is_running)
+            self.assertEqual('\t\tPipeline "ut" Drain Timeout Reached. 1 Items Discarded.', captured.records[0].message)
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+
+    def test_put_not_running(self):
+        """Test Put into a Stopped Pipeline."""
+        target: StagedPipeline[int] = StagedPipeline(name='ut', queue_max_size=1)
+
+        with self.assertRaises(AttributeError):
+            asyncio.get_event_loop().run_until_complete(target.put(1))
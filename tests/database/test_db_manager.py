@@ -0,0 +1,100 @@
+"""DB Manager Tests."""
+
+import os
+import unittest
+from configparser import ConfigParser
+
+import sqlalchemy.exc
+from sqlalchemy import text
+
+from TEx.core.dir_manager import DirectoryManagerUtils
+from TEx.database.db_initializer import DbInitializer
+from TEx.database.db_manager import DbManager
+
+
+class DbManagerTest(unittest.TestCase):
+
+    DATA_PATH: str = '_data/db_manager'
+
+    def setUp(self) -> None:
+        DirectoryManagerUtils.ensure_dir_struct(self.DATA_PATH)
+
+    def tearDown(self) -> None:
+        for session in DbManager.SESSIONS.values():
+            session.close()
+
+        for engine in DbManager.SQLALCHEMY_BINDS.values():
+            engine.dispose()
+
+        # Restore the Default Test DB
+        DbInitializer.init(data_path='_data/')
+
+    @staticmethod
+    def __pragma(session_name: str, name: str) -> str:
+        return str(DbManager.SESSIONS[session_name].execute(text(f'PRAGMA {name}')).scalar()).lower()
+
+    def test_default_pragmas(self):
+        """Test the Default Pragmas are Applied into the Writer and Reader Connections."""
+        DbInitializer.init(data_path=self.DATA_PATH)
+
+        self.assertEqual('wal', self.__pragma('data', 'journal_mode'))
+        self.assertEqual('1', self.__pragma('data', 'synchronous'))  # NORMAL
+        self.assertEqual('268435456', self.__pragma('data', 'mmap_size'))
+        self.assertEqual('-65536', self.__pragma('data', 'cache_size'))
+        self.assertEqual('2', self.__pragma('data', 'temp_store'))  # MEMORY
+
+        self.assertEqual('wal', self.__pragma('data_read_only', 'journal_mode'))
+        self.assertEqual('-65536', self.__pragma('data_read_only', 'cache_size'))
+        self.assertEqual('1', self.__pragma('data_read_only', 'query_only'))
+
+    def test_read_only_session(self):
+        """Test the Read Only Session Sees Committed Data and Never Writes."""
+        DbInitializer.init(data_path=self.DATA_PATH)
+
+        DbManager.SESSIONS['data'].execute(text('DELETE FROM telegram_group_sync_state'))
+        DbManager.SESSIONS['data'].execute(text("INSERT INTO telegram_group_sync_state VALUES (1, 10, NULL, '2023-01-01 00:00:00', 1, 1, 1)"))
+        DbManager.SESSIONS['data'].commit()
+
+        self.assertEqual(10, DbManager.SESSIONS['data_read_only'].execute(text('SELECT last_message_id FROM telegram_group_sync_state')).scalar())
+
+        with self.assertRaises(sqlalchemy.exc.OperationalError):
+            DbManager.SESSIONS['data_read_only'].execute(text('DELETE FROM telegram_group_sync_state'))
+
+    def test_switch_journal_mode(self):
+        """Test Existing DBs are Switched Between Journal Modes."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'DATABASE': {'journal_mode': 'delete', 'synchronous': 'full', 'cache_size': '1000'}})
+
+        DbInitializer.init(data_path=self.DATA_PATH, config=config)
+        self.assertEqual('delete', self.__pragma('data', 'journal_mode'))
+        self.assertEqual('2', self.__pragma('data', 'synchronous'))  # FULL
+        self.assertEqual('1000', self.__pragma('data', 'cache_size'))
+
+        DbManager.SESSIONS['data'].close()
+        DbManager.SQLALCHEMY_BINDS['data'].dispose()
+
+        with self.assertLogs() as captured:
+            DbInitializer.init(data_path=self.DATA_PATH)
+
+        self.assertEqual('\t[*] SWITCHING DB (data) JOURNAL MODE FROM DELETE TO WAL', captured.records[0].message)
+        self.assertEqual('wal', self.__pragma('data', 'journal_mode'))
+        self.assertTrue(os.path.exists(os.path.join(self.DATA_PATH, 'data_local.db')))
+
+    def test_invalid_settings(self):
+        """Test Invalid [DATABASE] Settings."""
+        config: ConfigParser = ConfigParser()
+
+        config.read_dict({'DATABASE': {'journal_mode': 'WAL; DROP TABLE telegram_message'}})
+        with self.assertRaises(AttributeError) as context:
+            DbManager.init_db(data_path=self.DATA_PATH, config=config)
+
+        self.assertEqual(
+            'Invalid [DATABASE] "journal_mode" value "WAL; DROP TABLE TELEGRAM_MESSAGE". Allowed values are: DELETE, TRUNCATE, PERSIST, MEMORY, WAL, OFF',
+            context.exception.args[0],
+        )
+
+        config.read_dict({'DATABASE': {'journal_mode': 'WAL', 'mmap_size': '1GB'}})
+        with self.assertRaises(AttributeError) as context:
+            DbManager.init_db(data_path=self.DATA_PATH, config=config)
+
+        self.assertEqual('Invalid [DATABASE] "mmap_size" value "1GB". Must be an integer', context.exception.args[0])
@@ -0,0 +1,72 @@
+"""DB Migration Tests."""
+
+import unittest
+from typing import List
+
+from sqlalchemy import text
+
+from TEx.core.dir_manager import DirectoryManagerUtils
+from TEx.database.db_initializer import DbInitializer
+from TEx.database.db_manager import DbManager
+
+
+class DatabaseMigratorTest(unittest.TestCase):
+
+    DATA_PATH: str = '_data/db_migration'
+
+    def setUp(self) -> None:
+        DirectoryManagerUtils.ensure_dir_struct(self.DATA_PATH)
+        DbInitializer.init(data_path=self.DATA_PATH)
+
+    def tearDown(self) -> None:
+        for session in DbManager.SESSIONS.values():
+            session.close()
+
+        for engine in DbManager.SQLALCHEMY_BINDS.values():
+            engine.dispose()
+
+        # Restore the Default Test DB
+        DbInitializer.init(data_path='_data/')
+
+    @staticmethod
+    def __query_plan(statement: str) -> str:
+        return ' '.join(item[3] for item in DbManager.SESSIONS['data'].execute(text(f'EXPLAIN QUERY PLAN {statement}')).all())
+
+    def test_create_missing_indexes(self):
+        """Test Missing Indexes are Created on Existing DBs."""
+        DbManager.SESSIONS['data'].execute(text('DROP INDEX ix_telegram_message_group_id_date_from_id'))
+        DbManager.SESSIONS['data'].execute(text('DROP INDEX ix_telegram_media_group_id_mime_type_date'))
+        DbManager.SESSIONS['data'].commit()
+
+        with self.assertLogs() as captured:
+            DbInitializer.init(data_path=self.DATA_PATH)
+
+        messages: List[str] = [item.message for item in captured.records]
+        self.assertEqual(
+            [
+                '\t[*] APPLYING DB (data) MIGRATION (V0.3.1) - ix_telegram_message_group_id_date_from_id',
+                '\t[*] APPLYING DB (data) MIGRATION (V0.3.1) - ix_telegram_media_group_id_mime_type_date',
+            ],
+            messages,
+        )
+
+    def test_time_windowed_queries_use_indexes(self):
+        """Test the Time Windowed Group Queries are Covered by the Composite Indexes."""
+        self.assertIn(
+            'COVERING INDEX ix_telegram_message_group_id_date_from_id (group_id=? AND date_time>?)',
+            self.__query_plan("SELECT count(DISTINCT from_id) FROM telegram_message WHERE group_id = 1 AND date_time >= '2023-01-01'"),
+        )
+        self.assertIn(
+            '(group_id=? AND date_time<?)',
+            self.__query_plan("DELETE FROM telegram_message WHERE group_id = 1 AND date_time <= '2023-01-01'"),
+        )
+        self.assertIn(
+            'INDEX ix_telegram_media_group_id_mime_type_date (group_id=? AND mime_type=? AND date_time>?)',
+            self.__query_plan("SELECT * FROM telegram_media WHERE group_id = 1 AND mime_type = 'image/png' AND date_time >= '2023-01-01'"),
+        )
+        self.assertIn(
+            'COVERING INDEX ix_telegram_media_group_id_mime_type_date',
+            self.__query_plan(
+                "SELECT mime_type, count(mime_type), sum(size_bytes) FROM telegram_media WHERE group_id = 1 AND date_time >= '2023-01-01' GROUP BY mime_type",
+            ),
+        )
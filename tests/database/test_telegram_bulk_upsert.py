@@ -0,0 +1,86 @@
+"""Telegram Users and Groups Bulk Upsert Tests."""
+
+import unittest
+from typing import Dict, List
+
+from sqlalchemy import func, select
+
+from TEx.database import GROUPS_CACHE, USERS_CACHE
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramUserDatabaseManager
+from TEx.models.database.telegram_db_model import TelegramUserOrmEntity
+from tests.modules.common import TestsCommon
+
+
+class TelegramBulkUpsertTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        TestsCommon.basic_test_setup()
+        GROUPS_CACHE.clear()
+        USERS_CACHE.clear()
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    @staticmethod
+    def __build_user(user_id: int, username: str) -> Dict:
+        return {
+            'id': user_id, 'is_bot': False, 'is_fake': False, 'is_self': False, 'is_scam': False, 'is_verified': False,
+            'first_name': f'First {user_id}', 'last_name': None, 'username': username, 'phone_number': None,
+            'photo_id': None, 'photo_base64': None, 'photo_name': None,
+        }
+
+    def test_users_insert_or_update_batch(self):
+        """Test Users Upsert in Multiple Chunks, Refreshing the Cache."""
+        users: List[Dict] = [self.__build_user(user_id, f'user_{user_id}') for user_id in range(1, 2501)]
+        TelegramUserDatabaseManager.insert_or_update_batch(users)
+
+        self.assertEqual(2500, DbManager.SESSIONS['data'].execute(select(func.count()).select_from(TelegramUserOrmEntity)).scalar())
+
+        # Load into Cache, Using Positional and Keyword Calls
+        self.assertEqual('user_10', TelegramUserDatabaseManager.get_by_id(10).username)
+        self.assertEqual('user_10', TelegramUserDatabaseManager.get_by_id(pk=10).username)
+        self.assertEqual(1, len(USERS_CACHE))
+
+        # Update Existing Users, New Users and Partial Values
+        TelegramUserDatabaseManager.insert_or_update_batch([
+            self.__build_user(10, 'updated_10'),
+            self.__build_user(9000, 'user_9000'),
+            {'id': 11, 'is_bot': False, 'is_fake': False, 'is_self': False, 'is_scam': False, 'is_verified': False, 'first_name': 'Only First Name'},
+        ])
+
+        self.assertEqual(2501, DbManager.SESSIONS['data'].execute(select(func.count()).select_from(TelegramUserOrmEntity)).scalar())
+        self.assertEqual('updated_10', USERS_CACHE[(10,)].username)
+        self.assertEqual('updated_10', TelegramUserDatabaseManager.get_by_id(pk=10).username)
+
+        user_11: TelegramUserOrmEntity = TelegramUserDatabaseManager.get_by_id(pk=11)
+        self.assertEqual('Only First Name', user_11.first_name)
+        self.assertEqual('user_11', user_11.username)
+
+    def test_users_insert_or_update_batch_empty(self):
+        """Test Users Upsert with no Values."""
+        TelegramUserDatabaseManager.insert_or_update_batch(None)
+        TelegramUserDatabaseManager.insert_or_update_batch([])
+
+        self.assertEqual(0, DbManager.SESSIONS['data'].execute(select(func.count()).select_from(TelegramUserOrmEntity)).scalar())
+
+    def test_groups_insert_or_update_batch(self):
+        """Test Groups Upsert."""
+        groups: List[Dict] = [
+            {
+                'id': group_id, 'constructor_id': 'A', 'access_hash': 'AAAAAA',
+                'fake': False, 'gigagroup': False, 'has_geo': False,
+                'participants_count': 1, 'restricted': False,
+                'scam': False, 'group_username': f'UN-{group_id}',
+                'verified': False, 'title': f'UT-{group_id}', 'source': '5526986587745',
+            }
+            for group_id in range(1, 4)
+        ]
+        TelegramGroupDatabaseManager.insert_or_update_batch(groups)
+        self.assertEqual('UT-2', TelegramGroupDatabaseManager.get_by_id(pk=2).title)
+
+        groups[1]['title'] = 'UT-2 Updated'
+        TelegramGroupDatabaseManager.insert_or_update_batch(groups)
+
+        self.assertEqual(3, len(TelegramGroupDatabaseManager.get_all_by_phone_number('5526986587745')))
+        self.assertEqual('UT-2 Updated', TelegramGroupDatabaseManager.get_by_id(pk=2).title)
@@ -0,0 +1,72 @@
+"""Telegram Group Sync State Database Manager Tests."""
+
+import datetime
+import unittest
+from typing import Dict
+
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramGroupSyncStateDatabaseManager, TelegramMessageDatabaseManager
+from TEx.models.database.telegram_db_model import TelegramGroupSyncStateOrmEntity
+from tests.modules.common import TestsCommon
+
+
+class TelegramGroupSyncStateDatabaseManagerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        TestsCommon.basic_test_setup()
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    @staticmethod
+    def __build_message(message_id: int, group_id: int) -> Dict:
+        return {
+            'id': message_id, 'group_id': group_id, 'date_time': datetime.datetime(2023, 1, 1, 0, 0, 0) + datetime.timedelta(minutes=message_id),
+            'message': f'Message {message_id}', 'raw': f'Raw Message {message_id}', 'to_id': None, 'media_id': None,
+        }
+
+    def test_insert_batch_updates_sync_state(self):
+        """Test the Batch Insert Updates the Sync State of Each Group."""
+        TelegramMessageDatabaseManager.insert_batch([
+            self.__build_message(10, 1), self.__build_message(12, 1), self.__build_message(11, 1),
+            self.__build_message(5, 2),
+        ])
+
+        state_1: TelegramGroupSyncStateOrmEntity = TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=1)
+        self.assertEqual(12, state_1.last_message_id)
+        self.assertEqual(datetime.datetime(2023, 1, 1, 0, 12, 0), state_1.last_message_date_time)
+        self.assertEqual(3, state_1.total_messages)
+        self.assertEqual(1, state_1.total_batches)
+        self.assertEqual(3, state_1.last_batch_messages)
+        self.assertIsNotNone(state_1.last_sync_at)
+
+        state_2: TelegramGroupSyncStateOrmEntity = TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=2)
+        self.assertEqual(5, state_2.last_message_id)
+        self.assertEqual(1, state_2.total_messages)
+
+        # Older and Duplicated Messages do not Move the Last Message Back
+        TelegramMessageDatabaseManager.insert_batch([self.__build_message(12, 1), self.__build_message(3, 1)])
+
+        state_1 = TelegramGroupSyncStateDatabaseManager.get_by_group_id(group_id=1)
+        self.assertEqual(12, state_1.last_message_id)
+        self.assertEqual(datetime.datetime(2023, 1, 1, 0, 12, 0), state_1.last_message_date_time)
+        self.assertEqual(4, state_1.total_messages)
+        self.assertEqual(2, state_1.total_batches)
+        self.assertEqual(1, state_1.last_batch_messages)
+
+        self.assertEqual(2, len(TelegramGroupSyncStateDatabaseManager.get_all()))
+
+    def test_get_last_message_id(self):
+        """Test the Last Message id Comes from the Sync State with Fallback to the Messages Table."""
+        self.assertIsNone(TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=1))
+
+        # Message Inserted Without Sync State (Legacy Databases)
+        TelegramMessageDatabaseManager.insert(self.__build_message(50, 1))
+        self.assertEqual(50, TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=1))
+
+        # First Batch Keeps the Newest Message
+        TelegramMessageDatabaseManager.insert_batch([self.__build_message(40, 1)])
+        self.assertEqual(50, TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=1))
+
+        TelegramMessageDatabaseManager.insert_batch([self.__build_message(60, 1)])
+        self.assertEqual(60, TelegramGroupSyncStateDatabaseManager.get_last_message_id(group_id=1))
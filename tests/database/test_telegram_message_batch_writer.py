@@ -0,0 +1,162 @@
+"""Telegram Message Batch Writer Tests."""
+
+import asyncio
+import datetime
+import unittest
+from configparser import ConfigParser
+from typing import Dict, List
+from unittest import mock
+
+import pytz
+from sqlalchemy import select
+
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_message_batch_writer import TelegramMessageBatchWriter
+from TEx.models.database.telegram_db_model import TelegramMessageOrmEntity
+from tests.modules.common import TestsCommon
+
+
+class TelegramMessageBatchWriterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        TestsCommon.basic_test_setup()
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    @staticmethod
+    def __build_message(message_id: int) -> Dict:
+        return {
+            'id': message_id, 'group_id': 1, 'date_time': datetime.datetime.now(tz=pytz.utc),
+            'message': f'Message {message_id}', 'raw': f'Raw Message {message_id}', 'to_id': None, 'media_id': None,
+        }
+
+    @staticmethod
+    def __get_all_ids() -> List[int]:
+        return [
+            item.id for item in DbManager.SESSIONS['data'].execute(
+                select(TelegramMessageOrmEntity).order_by(TelegramMessageOrmEntity.id),
+            ).scalars().all()
+        ]
+
+    def test_configure(self):
+        """Test Configure from [DATABASE] Section and Defaults."""
+        config: ConfigParser = ConfigParser()
+
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.configure(config=config)
+        self.assertEqual(500, target.max_batch_size)
+        self.assertEqual(200, target.max_delay_ms)
+
+        config.read_dict({'DATABASE': {'write_batch_size': '10', 'write_batch_max_delay_ms': '50'}})
+        target.configure(config=config)
+        self.assertEqual(10, target.max_batch_size)
+        self.assertEqual(50, target.max_delay_ms)
+
+    def test_flush_by_size(self):
+        """Test the Buffer is Written when the Batch is Full and Duplicated Messages are Ignored."""
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.max_batch_size = 3
+        target.max_delay_ms = 60000
+
+        target.add(self.__build_message(1))
+        target.add(self.__build_message(2))
+        self.assertEqual([], self.__get_all_ids())
+
+        target.add(self.__build_message(1))  # Duplicated - Must be Ignored
+        self.assertEqual([1, 2], self.__get_all_ids())
+        self.assertEqual(0, len(target.buffer))
+
+        # Messages with Different Set of Keys
+        with_sender: Dict = self.__build_message(3)
+        with_sender['from_id'] = 99
+        with_sender['from_type'] = 'User'
+        target.add(with_sender)
+        target.add(self.__build_message(4))
+        self.assertEqual(2, target.flush())
+        self.assertEqual(0, target.flush())
+
+        self.assertEqual([1, 2, 3, 4], self.__get_all_ids())
+        self.assertEqual(5, target.total_messages)
+        self.assertEqual(2, target.total_batches)
+
+    def test_flush_by_time(self):
+        """Test the Buffer is Written by the Background Task when the Max Delay Expires."""
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.max_batch_size = 100
+        target.max_delay_ms = 10
+
+        async def run_test():
+            task: asyncio.Task = asyncio.create_task(target.auto_flush())
+            target.add(self.__build_message(1))
+            self.assertEqual([], self.__get_all_ids())
+
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+        self.assertEqual([1], self.__get_all_ids())
+
+    def test_flush_fail_rollback(self):
+        """Test a Failing Batch is Rolled Back."""
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.add(self.__build_message(1))
+
+        with mock.patch.object(DbManager.SESSIONS['data'], 'commit', side_effect=Exception('UT Exception')):
+            with self.assertRaises(Exception):
+                target.flush()
+
+        self.assertEqual([], self.__get_all_ids())
+
+    def test_flush_fail_retry(self):
+        """Test the Messages of a Failed Batch are Kept, without Raising on Add, and Written by the Next Flush."""
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.max_batch_size = 2
+        target.max_delay_ms = 60000
+        target.add(self.__build_message(1))
+
+        with mock.patch.object(DbManager.SESSIONS['data'], 'commit', side_effect=Exception('database is locked')):
+            with self.assertLogs() as captured:
+                target.add(self.__build_message(2))
+
+        self.assertEqual('Unable to Write Messages Batch', captured.records[0].message)
+        self.assertEqual([], self.__get_all_ids())
+        self.assertEqual(2, len(target.buffer))
+        self.assertEqual(1, target.total_failed_batches)
+
+        # Only Buffered while Failing
+        target.add(self.__build_message(3))
+        self.assertEqual([], self.__get_all_ids())
+        self.assertEqual(3, len(target.buffer))
+
+        self.assertEqual(3, target.flush())
+        self.assertEqual([1, 2, 3], self.__get_all_ids())
+        self.assertEqual(0, len(target.buffer))
+        self.assertEqual(3, target.total_messages)
+        self.assertEqual(1, target.total_batches)
+
+        # Recovered
+        target.add(self.__build_message(4))
+        target.add(self.__build_message(5))
+        self.assertEqual([1, 2, 3, 4, 5], self.__get_all_ids())
+
+    def test_buffer_limit(self):
+        """Test the Oldest Messages are Dropped when the Buffer is Full."""
+        target: TelegramMessageBatchWriter = TelegramMessageBatchWriter()
+        target.max_batch_size = 2
+        target.max_delay_ms = 60000
+        target.is_failing = True
+
+        with self.assertLogs() as captured:
+            for ix in range(1, 12):
+                target.add(self.__build_message(ix))
+
+        self.assertEqual(8, len(target.buffer))
+        self.assertEqual(3, target.total_dropped)
+        self.assertEqual(
+            ['\t\tMessages Buffer is Full. 1 Messages Dropped', '\t\tMessages Buffer is Full. 3 Messages Dropped'],
+            [record.message for record in captured.records],
+        )
+
+        self.assertEqual(8, target.flush())
+        self.assertEqual([4, 5, 6, 7, 8, 9, 10, 11], self.__get_all_ids())
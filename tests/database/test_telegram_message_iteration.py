@@ -0,0 +1,86 @@
+"""Telegram Message Keyset Iteration Tests."""
+
+import datetime
+import unittest
+from typing import Dict, List
+
+import pytz
+from sqlalchemy import select
+
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramMediaDatabaseManager, TelegramMessageDatabaseManager
+from TEx.models.database.telegram_db_model import TelegramMediaOrmEntity, TelegramMessageOrmEntity
+from tests.modules.common import TestsCommon
+
+
+class TelegramMessageIterationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        TestsCommon.basic_test_setup()
+
+        # Messages 1 to 10 on Group 1, with Repeated Date/Time (Keyset Tie-Break by id), and Messages 1 to 3 on Group 2
+        base_date: datetime.datetime = datetime.datetime.now(tz=pytz.UTC).replace(microsecond=0) - datetime.timedelta(days=20)
+        TelegramMessageDatabaseManager.insert_batch(
+            [self.__build_message(message_id=ix, group_id=1, date_time=base_date + datetime.timedelta(days=ix // 2)) for ix in range(10, 0, -1)]
+            + [self.__build_message(message_id=ix, group_id=2, date_time=base_date) for ix in range(1, 4)],
+        )
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    @staticmethod
+    def __build_message(message_id: int, group_id: int, date_time: datetime.datetime) -> Dict:
+        return {
+            'id': message_id, 'group_id': group_id, 'date_time': date_time,
+            'message': f'Message {message_id}', 'raw': f'Raw Message {message_id}', 'to_id': None, 'media_id': None,
+        }
+
+    def test_iterate_messages_from_group(self):
+        """Test the Keyset Pagination Returns all Messages Once and Ordered."""
+        for page_size in [1, 3, 4, 10, 1000]:
+            self.assertEqual(
+                list(range(1, 11)),
+                [item.id for item in TelegramMessageDatabaseManager.iterate_messages_from_group(group_id=1, page_size=page_size)],
+            )
+            self.assertEqual(
+                list(range(10, 0, -1)),
+                [item.id for item in TelegramMessageDatabaseManager.iterate_messages_from_group(group_id=1, order_by_desc=True, page_size=page_size)],
+            )
+
+        # Date/Time Limit
+        self.assertEqual(
+            [8, 9, 10],
+            [item.id for item in TelegramMessageDatabaseManager.iterate_messages_from_group(group_id=1, message_datetime_limit_seconds=17 * 24 * 60 * 60, page_size=2)],
+        )
+
+    def test_iterate_messages_returns_rows(self):
+        """Test the Iteration Returns Lightweight Rows, not ORM Entities."""
+        row = next(TelegramMessageDatabaseManager.iterate_messages_from_group(group_id=2))
+
+        self.assertNotIsInstance(row, TelegramMessageOrmEntity)
+        self.assertEqual(
+            (1, 2, None, 'Message 1', 'Raw Message 1', None, None, None),
+            (row.id, row.group_id, row.media_id, row.message, row.raw, row.from_id, row.from_type, row.to_id),
+        )
+
+    def test_remove_all_messages_by_age_in_pages(self):
+        """Test Old Messages are Removed in Pages."""
+        self.assertEqual(7, TelegramMessageDatabaseManager.remove_all_messages_by_age(group_id=1, limit_days=17, page_size=2))
+        self.assertEqual([8, 9, 10], [item.id for item in TelegramMessageDatabaseManager.iterate_messages_from_group(group_id=1)])
+        self.assertEqual(3, TelegramMessageDatabaseManager.count_messages_from_group(group_id=2))
+
+    def test_iterate_medias_by_age(self):
+        """Test Old Medias Iteration by Pages."""
+        for ix in range(5):
+            TelegramMediaDatabaseManager.insert({
+                'telegram_id': ix, 'group_id': 1, 'date_time': datetime.datetime.now(tz=pytz.UTC) - datetime.timedelta(days=ix * 10),
+                'file_name': f'file_{ix}.pdf', 'extension': '.pdf', 'height': None, 'width': None, 'mime_type': 'application/pdf',
+                'size_bytes': 10, 'title': None, 'name': None,
+            })
+
+        media_ids: List[int] = list(DbManager.SESSIONS['data'].execute(select(TelegramMediaOrmEntity.id).order_by(TelegramMediaOrmEntity.id)).scalars().all())
+
+        self.assertEqual(
+            [(media_ids[ix], 1, f'file_{ix}.pdf') for ix in range(2, 5)],
+            [tuple(item) for item in TelegramMediaDatabaseManager.iterate_medias_by_age(group_id=1, media_limit_days=15, page_size=2)],
+        )
@@ -0,0 +1,118 @@
+"""Telegram Message Full Text Search Database Manager Tests."""
+
+import datetime
+import unittest
+from typing import Dict, List
+
+from sqlalchemy import delete, text
+
+from TEx.core.dir_manager import DirectoryManagerUtils
+from TEx.database.db_initializer import DbInitializer
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramMediaDatabaseManager, TelegramMessageDatabaseManager, TelegramMessageSearchDatabaseManager
+from TEx.models.database.telegram_db_model import TelegramMessageOrmEntity
+
+
+class TelegramMessageSearchDatabaseManagerTest(unittest.TestCase):
+
+    DATA_PATH: str = '_data/message_search'
+
+    def setUp(self) -> None:
+        DirectoryManagerUtils.ensure_dir_struct(self.DATA_PATH)
+        DbInitializer.init(data_path=self.DATA_PATH)
+
+        DbManager.SESSIONS['data'].execute(delete(TelegramMessageOrmEntity))
+        DbManager.SESSIONS['data'].commit()
+
+    def tearDown(self) -> None:
+        for session in DbManager.SESSIONS.values():
+            session.close()
+
+        for engine in DbManager.SQLALCHEMY_BINDS.values():
+            engine.dispose()
+
+        # Restore the Default Test DB
+        DbInitializer.init(data_path='_data/')
+
+    @staticmethod
+    def __insert_messages(raws: List[str], group_id: int = 1) -> None:
+        TelegramMessageDatabaseManager.insert_batch([
+            {
+                'id': ix + 1, 'group_id': group_id, 'date_time': datetime.datetime.now(tz=datetime.timezone.utc),
+                'message': raw, 'raw': raw, 'to_id': None, 'media_id': None,
+            }
+            for ix, raw in enumerate(raws)
+        ])
+
+    @staticmethod
+    def __search(full_text_query: str, group_id: int = 1) -> List[int]:
+        return sorted(
+            item.id for item in TelegramMessageDatabaseManager.get_all_messages_from_group(group_id=group_id, full_text_query=full_text_query)
+        )
+
+    def test_search_is_kept_in_sync(self):
+        """Test the Index Follows Inserts and Deletes on telegram_message."""
+        self.assertTrue(TelegramMessageSearchDatabaseManager.is_ready())
+
+        self.__insert_messages(['Selling a BITCOIN Wallet', 'Nothing Here', 'my bitcoins'])
+        self.__insert_messages(['bitcoin on other group'], group_id=2)
+
+        self.assertEqual([1, 3], self.__search('"bitcoin"'))
+        self.assertEqual([1, 2], self.__search('"wallet" OR "nothing"'))
+        self.assertEqual([1], self.__search('"bitcoin" AND "wallet"'))
+        self.assertEqual(2, TelegramMessageDatabaseManager.count_messages_from_group(group_id=1, full_text_query='"bitcoin"'))
+
+        DbManager.SESSIONS['data'].execute(delete(TelegramMessageOrmEntity).where(TelegramMessageOrmEntity.group_id == 1, TelegramMessageOrmEntity.id == 1))
+        DbManager.SESSIONS['data'].commit()
+
+        self.assertEqual([3], self.__search('"bitcoin"'))
+        self.assertEqual([1], self.__search('"bitcoin"', group_id=2))
+
+    def test_existing_database_backfill(self):
+        """Test Existing Messages are Indexed Only After the Backfill."""
+        self.__insert_messages(['Selling a BITCOIN Wallet', 'Nothing Here'])
+
+        # Simulate a DB Created Before the Full Text Search Index
+        fts: str = TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME
+        for trigger in ['ai', 'ad', 'au']:
+            DbManager.SESSIONS['data'].execute(text(f'DROP TRIGGER {fts}_{trigger}'))
+        DbManager.SESSIONS['data'].execute(text(f'DROP TABLE {fts}'))
+        DbManager.SESSIONS['data'].commit()
+
+        with self.assertLogs() as captured:
+            DbInitializer.init(data_path=self.DATA_PATH)
+
+        self.assertEqual(
+            [
+                '\t[*] APPLYING DB (data) MIGRATION (V0.3.1) - telegram_message_fts',
+                '\t[*] Existing Messages are not Indexed for Full Text Search. Run the "rebuild_search_index" Command to Index them',
+            ],
+            [item.message for item in captured.records],
+        )
+        self.assertFalse(TelegramMessageSearchDatabaseManager.is_ready())
+
+        # Deleting non Indexed Messages Must not Corrupt the Index
+        DbManager.SESSIONS['data'].execute(delete(TelegramMessageOrmEntity).where(TelegramMessageOrmEntity.id == 2))
+        DbManager.SESSIONS['data'].commit()
+
+        self.assertTrue(TelegramMessageSearchDatabaseManager.rebuild())
+        self.assertTrue(TelegramMessageSearchDatabaseManager.is_ready())
+        self.assertEqual([1], self.__search('"bitcoin"'))
+
+        # New Messages are Indexed by the Triggers
+        TelegramMessageDatabaseManager.insert_batch([
+            {
+                'id': 10, 'group_id': 1, 'date_time': datetime.datetime.now(tz=datetime.timezone.utc),
+                'message': 'new', 'raw': 'new bitcoin', 'to_id': None, 'media_id': None,
+            },
+        ])
+        self.assertEqual([1, 10], self.__search('"bitcoin"'))
+
+    def test_index_survives_vacuum(self):
+        """Test the DB Maintenance Keeps the Index Consistent."""
+        self.__insert_messages(['Selling a BITCOIN Wallet', 'Nothing Here', 'my bitcoins'])
+
+        TelegramMediaDatabaseManager.apply_db_maintenance()
+
+        self.assertEqual([1, 3], self.__search('"bitcoin"'))
+        DbManager.SESSIONS['data'].execute(text(f"INSERT INTO {TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME}({TelegramMessageSearchDatabaseManager.FTS_TABLE_NAME}, rank) VALUES ('integrity-check', 1)"))
@@ -0,0 +1,42 @@
+"""Aho-Corasick Automaton Tests."""
+
+import unittest
+from typing import List, Tuple
+
+from TEx.finder.aho_corasick_automaton import AhoCorasickAutomaton
+
+
+class AhoCorasickAutomatonTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.target: AhoCorasickAutomaton = AhoCorasickAutomaton()
+
+        for ix, term in enumerate(['he', 'she', 'his', 'hers', 'сеть']):
+            self.target.add(term=term, value=ix)
+
+    def test_iter_matches(self):
+        """Test Find all Overlapped Matches with its End Positions."""
+        h_result: List[Tuple[int, int]] = list(self.target.iter_matches('ushers'))
+
+        self.assertEqual([(4, 1), (4, 0), (6, 3)], h_result)
+        self.assertTrue(self.target.is_built)
+
+    def test_find_values(self):
+        """Test Find the Values of all Terms in the Text."""
+        self.assertEqual({0, 1, 3}, self.target.find_values('ushers'))
+        self.assertEqual({2, 4}, self.target.find_values('this is a сеть'))
+        self.assertEqual(set(), self.target.find_values('nothing to see, "hx"'))
+        self.assertEqual(set(), self.target.find_values(''))
+
+    def test_add_after_build(self):
+        """Test the Automaton is Rebuilt when Terms are Added After a Scan."""
+        self.assertEqual(set(), self.target.find_values('foobar'))
+
+        self.target.add(term='oba', value=99)
+        self.assertFalse(self.target.is_built)
+        self.assertEqual({99}, self.target.find_values('foobar'))
+
+    def test_add_empty_term(self):
+        """Test Empty Terms are Rejected."""
+        with self.assertRaises(AttributeError):
+            self.target.add(term='', value=1)
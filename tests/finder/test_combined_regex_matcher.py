@@ -0,0 +1,79 @@
+"""Combined Regex Matcher Tests."""
+
+import re
+import unittest
+from typing import List
+
+from TEx.finder.combined_regex_matcher import CombinedRegexMatcher
+
+
+class CombinedRegexMatcherTest(unittest.TestCase):
+
+    @staticmethod
+    def __compile(patterns: List[str]) -> List[re.Pattern]:
+        return [re.compile(item, flags=re.IGNORECASE | re.MULTILINE) for item in patterns]
+
+    def setUp(self) -> None:
+        self.target: CombinedRegexMatcher = CombinedRegexMatcher()
+        self.target.add_rule(rule_id='RULE_TERM', patterns=self.__compile(['term1|term2', 'term']))
+        self.target.add_rule(rule_id='RULE_TERM3', patterns=self.__compile(['term3']))
+        self.target.add_rule(rule_id='RULE_WALLET', patterns=self.__compile([r'wallet\s*[a-f0-9]{8}\b']))
+        self.target.add_rule(rule_id='RULE_CARD', patterns=self.__compile([r'^[45][0-9]{15}$', r'\bsecret\b']))
+        self.target.add_rule(rule_id='RULE_CARD_COPY', patterns=self.__compile([r'^[45][0-9]{15}$']))
+        self.target.add_rule(rule_id='RULE_DIGITS', patterns=self.__compile([r'\d{20}']))
+        self.target.build()
+
+    def test_match(self):
+        """Test Return all Matching Rules, Including Overlapped Matches."""
+        self.assertEqual({'RULE_TERM', 'RULE_TERM3'}, self.target.match('Mocked TERM3 Raw Text'))
+        self.assertEqual({'RULE_TERM'}, self.target.match('a term here'))
+        self.assertEqual({'RULE_WALLET'}, self.target.match('my Wallet deadbeef'))
+        self.assertEqual(set(), self.target.match('my wallet deadbeefcafe'))
+        self.assertEqual(set(), self.target.match('nothing to see'))
+        self.assertEqual(set(), self.target.match(''))
+        self.assertEqual(set(), self.target.match(None))
+
+    def test_match_literal_free_patterns(self):
+        """Test Patterns without Required Literals and Patterns Shared by many Rules."""
+        self.assertEqual(7, len(self.target))
+        self.assertEqual(2, len(self.target.unfiltered_patterns))
+        self.assertEqual(['RULE_CARD', 'RULE_CARD_COPY'], self.target.pattern_rules[self.target.unfiltered_patterns[0]])
+        self.assertIsNotNone(self.target.unfiltered_prefilter)
+
+        self.assertEqual({'RULE_CARD', 'RULE_CARD_COPY'}, self.target.match('card:\n4111111111111111\nend'))
+        self.assertEqual({'RULE_DIGITS'}, self.target.match('id 12345678901234567890'))
+        self.assertEqual({'RULE_CARD'}, self.target.match('the SECRET is'))
+
+    def test_match_case_folding(self):
+        """Test the Literal Prefilter Mirrors the re.IGNORECASE Char Equivalences."""
+        target: CombinedRegexMatcher = CombinedRegexMatcher()
+        target.add_rule(rule_id='RULE_1', patterns=self.__compile(['password', 'kiss', 'straße', 'σκ']))
+        target.build()
+
+        for text in ['PASSWORD', 'paſſword', 'KİSS', 'kıss', 'STRASSE ßtraße', 'ΣΚ', 'ςϰ']:
+            self.assertEqual(
+                {'RULE_1'} if any(pattern.search(text) for pattern in target.patterns) else set(),
+                target.match(text),
+                text,
+            )
+
+    def test_match_with_group_references(self):
+        """Test Literal Free Patterns with Backreferences are not Merged."""
+        target: CombinedRegexMatcher = CombinedRegexMatcher()
+        target.add_rule(rule_id='RULE_1', patterns=self.__compile([r'(\w)\1\1']))
+        target.add_rule(rule_id='RULE_2', patterns=self.__compile([r'(\d)\d\1']))
+        target.build()
+
+        self.assertIsNone(target.unfiltered_prefilter)
+        self.assertEqual({'RULE_1'}, target.match('aaa'))
+        self.assertEqual({'RULE_1', 'RULE_2'}, target.match('111'))
+        self.assertEqual({'RULE_2'}, target.match('121'))
+
+    def test_match_restricted_rules(self):
+        """Test Restrict the Match to a Set of Rules."""
+        text: str = 'Mocked TERM3 4111111111111111'
+
+        self.assertEqual({'RULE_TERM', 'RULE_TERM3'}, self.target.match(text))
+        self.assertEqual({'RULE_TERM3'}, self.target.match(text, rule_ids={'RULE_TERM3', 'RULE_WALLET'}))
+        self.assertEqual({'RULE_CARD_COPY'}, self.target.match('4111111111111111', rule_ids={'RULE_CARD_COPY'}))
+        self.assertEqual(set(), self.target.match(text, rule_ids=set()))
@@ -1,13 +1,17 @@
 import asyncio
 import datetime
+import json
+import os
+import tempfile
 import unittest
 from configparser import ConfigParser
-from typing import Dict
+from typing import Dict, List
 from unittest import mock
 from unittest.mock import ANY, call
 
 from TEx.core.mapper.telethon_message_mapper import TelethonMessageEntityMapper
 from TEx.finder.finder_engine import FinderEngine
+from TEx.finder.text_file_view import TextFileView
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
 from tests.modules.common import TestsCommon
@@ -191,4 +195,388 @@ class FinderEngineTest(unittest.TestCase):
             call(notifiers=['NOTIFIER.DISCORD.NOT_002'], entity=expected_entity, rule_id='FINDER.RULE.UT_Finder_Demo', source='+15558987453'),
             call(notifiers=['NOTIFIER.DISCORD.NOT_002'], entity=expected_entity, rule_id='FINDER.RULE.UT_Finder_Demo_MultiLine', source='+15558987453'),
             call(notifiers=['NOTIFIER.DISCORD.NOT_002'], entity=expected_entity, rule_id='FINDER.RULE.UT_Finder_Demo_MultiLine_WithLineBreak', source='+15558987453'),
-        ])
\ No newline at end of file
+        ])
+    def test_run_on_file_read_once(self):
+        """Test the Downloaded File is Read Once and Shared by all Rules, Even in Many Chunks."""
+
+        # Setup Mock
+        notifier_engine_mock = mock.AsyncMock()
+        exporter_engine_mock = mock.AsyncMock()
+
+        message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
+            date_time=datetime.datetime.utcnow(),
+            raw_text="Mocked Raw Text",
+            group_name="Group 002",
+            group_id=123456,
+            from_id="1234",
+            to_id=9876,
+            reply_to_msg_id=5544,
+            message_id=969696,
+            is_reply=False,
+            downloaded_media_info=MediaHandlingEntity(
+                media_id=123,
+                file_name='LargeDownloadedFile.txt',
+                content_type='text/plain',
+                size_bytes=12279,
+                disk_file_path='resources/LargeDownloadedFile.txt',
+                is_ocr_supported=False,
+            ),
+            found_on='UTFOUND'
+        )
+
+        args: Dict = {
+            'config': 'unittest_configfile.config'
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        target: FinderEngine = FinderEngine()
+        target.configure(
+            config=self.config,
+            notification_engine=notifier_engine_mock,
+            exporter_engine=exporter_engine_mock
+        )
+        target.find_in_text_files_chunk_size_bytes = 1024
+
+        with mock.patch('TEx.finder.finder_engine.TextFileView', wraps=TextFileView) as text_file_view_mock:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(
+                target.run(
+                    entity=message_entity,
+                    source='+15558987453'
+                )
+            )
+
+        text_file_view_mock.assert_called_once_with(file_path='resources/LargeDownloadedFile.txt', chunk_size_bytes=1024)
+        self.assertEqual(3, target.notification_engine.run.await_count)
+
+    def test_dispatch_index(self):
+        """Test the Rules are Scoped by Group and Source."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true'},
+            'FINDER.RULE.Global': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Groups': {'type': 'regex', 'regex': 'term1', 'groups': '100, 200', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Exclude': {'type': 'all', 'exclude_groups': '200,-300', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Source': {'type': 'regex', 'regex': 'term1', 'groups': '100', 'sources': '+15558987453', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: FinderEngine = FinderEngine()
+        target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+        self.assertEqual({100, 200, -300}, target.rule_set.scoped_group_ids)
+        self.assertEqual({'+15558987453'}, target.rule_set.scoped_sources)
+        self.assertEqual(8, len(target.rule_set.dispatch_index))
+
+        def get_rule_ids(group_id, source):
+            rules, regex_rule_ids = target.rule_set.get_applicable_rules(group_id=group_id, source=source)
+            return [rule['id'] for rule in rules], regex_rule_ids
+
+        self.assertEqual(
+            (['FINDER.RULE.Global', 'FINDER.RULE.Exclude'], {'FINDER.RULE.Global'}),
+            get_rule_ids(group_id=999, source='+15558987453'),
+        )
+        self.assertEqual(
+            (['FINDER.RULE.Global', 'FINDER.RULE.Groups', 'FINDER.RULE.Exclude'], {'FINDER.RULE.Global', 'FINDER.RULE.Groups'}),
+            get_rule_ids(group_id=100, source='+15550000000'),
+        )
+        self.assertEqual(
+            (['FINDER.RULE.Global', 'FINDER.RULE.Groups', 'FINDER.RULE.Exclude', 'FINDER.RULE.Source'], None),
+            get_rule_ids(group_id=100, source='+15558987453'),
+        )
+        self.assertEqual(
+            (['FINDER.RULE.Global', 'FINDER.RULE.Groups'], {'FINDER.RULE.Global', 'FINDER.RULE.Groups'}),
+            get_rule_ids(group_id=200, source='+15558987453'),
+        )
+        self.assertEqual((['FINDER.RULE.Global'], {'FINDER.RULE.Global'}), get_rule_ids(group_id=-300, source='+15558987453'))
+        self.assertEqual(
+            (['FINDER.RULE.Global', 'FINDER.RULE.Exclude'], {'FINDER.RULE.Global'}),
+            get_rule_ids(group_id=None, source='+15558987453'),
+        )
+
+        # Run Only the Applicable Rules
+        entity: mock.MagicMock = mock.MagicMock(raw_text='Mocked term1', group_id=200)
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(target.run(entity=entity, source='+15558987453'))
+
+        self.assertEqual(
+            ['FINDER.RULE.Global', 'FINDER.RULE.Groups'],
+            [item.kwargs['rule_id'] for item in target.notification_engine.run.await_args_list],
+        )
+
+    def test_dispatch_index_invalid_group(self):
+        """Test Invalid Group IDs on Rules Scope."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true'},
+            'FINDER.RULE.Groups': {'type': 'all', 'groups': '100,my_group'},
+        })
+
+        with self.assertRaises(AttributeError) as context:
+            FinderEngine().configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+        self.assertEqual('Invalid Group ID "my_group" for "FINDER.RULE.Groups". Must be an integer', str(context.exception))
+
+    def test_match_budget_inline(self):
+        """Test a Slow Rule is Disabled After Exceeding the Match Budget on Inline Mode."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true', 'match_budget_ms': '5', 'max_budget_violations': '2', 'match_cache_size': '0'},
+            'FINDER.RULE.Fast': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Catastrophic': {'type': 'regex', 'regex': '(a+)+$', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: FinderEngine = FinderEngine()
+        target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+        target.signals_engine = mock.AsyncMock()
+
+        entity: mock.MagicMock = mock.MagicMock(raw_text='term1 ' + 'a' * 20 + '!', group_id=100)
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(target.run(entity=entity, source='+15558987453'))
+
+        self.assertEqual({'FINDER.RULE.Catastrophic': 1}, target.budget_violations)
+        self.assertEqual(set(), target.rule_set.disabled_rule_ids)
+
+        loop.run_until_complete(target.run(entity=entity, source='+15558987453'))
+
+        self.assertEqual({'FINDER.RULE.Catastrophic'}, target.rule_set.disabled_rule_ids)
+        target.signals_engine.rule_disabled.assert_awaited_once_with(
+            rule_id='FINDER.RULE.Catastrophic',
+            reason='Exceeded the Match Budget of 5ms 2 Times',
+        )
+
+        # Disabled Rule are not Evaluated Anymore
+        rules, regex_rule_ids = target.rule_set.get_applicable_rules(group_id=100, source='+15558987453')
+        self.assertEqual(['FINDER.RULE.Fast'], [rule['id'] for rule in rules])
+        self.assertEqual({'FINDER.RULE.Fast'}, regex_rule_ids)
+
+        loop.run_until_complete(target.run(entity=entity, source='+15558987453'))
+        self.assertEqual({'FINDER.RULE.Catastrophic': 2}, target.budget_violations)
+        self.assertEqual(3, target.notification_engine.run.await_count)
+
+    def test_match_budget_process(self):
+        """Test a Catastrophic Regex is Killed on Process Mode and the Message is Matched by the Remaining Rules."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true', 'execution_mode': 'process', 'pool_workers': '1', 'match_budget_ms': '200', 'max_budget_violations': '1'},
+            'FINDER.RULE.Fast': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Catastrophic': {'type': 'regex', 'regex': '(a+)+$', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.All': {'type': 'all', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: FinderEngine = FinderEngine()
+        target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+        try:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(target.run(entity=mock.MagicMock(raw_text='term1 ' + 'a' * 60 + '!', group_id=100), source='+15558987453'))
+
+            self.assertEqual({'FINDER.RULE.Catastrophic'}, target.rule_set.disabled_rule_ids)
+            self.assertEqual(1, target.worker_pool.restarts)
+            self.assertEqual(
+                ['FINDER.RULE.Fast', 'FINDER.RULE.All'],
+                [item.kwargs['rule_id'] for item in target.notification_engine.run.await_args_list],
+            )
+
+            # Recreated Pool Keep Working
+            loop.run_until_complete(target.run(entity=mock.MagicMock(raw_text='term1', group_id=100), source='+15558987453'))
+            self.assertEqual(4, target.notification_engine.run.await_count)
+
+        finally:
+            target.shutdown()
+
+    def test_invalid_execution_mode(self):
+        """Test Invalid Execution Mode."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'FINDER': {'enabled': 'true', 'execution_mode': 'thread'}})
+
+        with self.assertRaises(AttributeError) as context:
+            FinderEngine().configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+        self.assertEqual('Invalid Finder Execution Mode "thread". Must be one of inline, process', str(context.exception))
+
+    def test_match_cache(self):
+        """Test Repeated Messages Reuse the Matched Rules and Still Notify for each Group."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true', 'match_cache_size': '2'},
+            'FINDER.RULE.Global': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'FINDER.RULE.Groups': {'type': 'regex', 'regex': 'term1', 'groups': '100', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: FinderEngine = FinderEngine()
+        target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+        loop = asyncio.get_event_loop()
+        with mock.patch.object(target.rule_set, 'match', wraps=target.rule_set.match) as match_mock:
+            for group_id in [100, 200, 300, 100, 400]:
+                loop.run_until_complete(target.run(entity=mock.MagicMock(raw_text='Forwarded term1', group_id=group_id, downloaded_media_info=None), source='+15558987453'))
+
+        # Groups 200, 300 and 400 Share the Same Applicable Rules
+        self.assertEqual(2, match_mock.call_count)
+        self.assertEqual(3, target.match_cache.hits)
+        self.assertEqual(2, target.match_cache.misses)
+        self.assertEqual(0.6, target.match_cache.hit_rate)
+
+        self.assertEqual(
+            [
+                'FINDER.RULE.Global', 'FINDER.RULE.Groups', 'FINDER.RULE.Global', 'FINDER.RULE.Global',
+                'FINDER.RULE.Global', 'FINDER.RULE.Groups', 'FINDER.RULE.Global',
+            ],
+            [item.kwargs['rule_id'] for item in target.notification_engine.run.await_args_list],
+        )
+        self.assertEqual(
+            [100, 100, 200, 300, 100, 100, 400],
+            [item.kwargs['entity'].group_id for item in target.notification_engine.run.await_args_list],
+        )
+
+    def test_profiling(self):
+        """Test the Rules Profile is Collected on Inline and Process Modes and Saved on Shutdown."""
+        for execution_mode in ['inline', 'process']:
+            with self.subTest(execution_mode=execution_mode), tempfile.TemporaryDirectory() as temp_dir:
+                config: ConfigParser = ConfigParser()
+                config.read_dict({
+                    'FINDER': {
+                        'enabled': 'true', 'execution_mode': execution_mode, 'pool_workers': '1', 'match_cache_size': '0',
+                        'profiling_enabled': 'true', 'profiling_file': os.path.join(temp_dir, 'profile.json'),
+                    },
+                    'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+                    'FINDER.RULE.Term2': {'type': 'regex', 'regex': 'term2', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+                    'FINDER.RULE.All': {'type': 'all', 'groups': '100', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+                })
+
+                target: FinderEngine = FinderEngine()
+                target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+
+                loop = asyncio.get_event_loop()
+                try:
+                    for raw_text, group_id in [('term1', 100), ('term1 term2', 200), ('nothing', 200)]:
+                        loop.run_until_complete(target.run(entity=mock.MagicMock(raw_text=raw_text, group_id=group_id), source='+15558987453'))
+                finally:
+                    target.shutdown()
+
+                with open(os.path.join(temp_dir, 'profile.json'), encoding='UTF-8') as file:
+                    h_result: Dict = json.load(file)
+
+                self.assertEqual({'FINDER.RULE.Term1', 'FINDER.RULE.Term2', 'FINDER.RULE.All'}, set(h_result.keys()))
+                self.assertEqual((3, 2, 2), (h_result['FINDER.RULE.Term1']['evaluations'], h_result['FINDER.RULE.Term1']['timed_evaluations'], h_result['FINDER.RULE.Term1']['hits']))
+                self.assertEqual((3, 1, 1), (h_result['FINDER.RULE.Term2']['evaluations'], h_result['FINDER.RULE.Term2']['timed_evaluations'], h_result['FINDER.RULE.Term2']['hits']))
+                self.assertEqual((1, 1, 1), (h_result['FINDER.RULE.All']['evaluations'], h_result['FINDER.RULE.All']['timed_evaluations'], h_result['FINDER.RULE.All']['hits']))
+
+                self.assertEqual(3, len(target.get_profile_summary().split('\n')))
+
+    def test_profiling_disabled(self):
+        """Test the Profile Summary when the Profiling is Disabled."""
+        target: FinderEngine = FinderEngine()
+        self.assertIsNone(target.get_profile_summary())
+
+    def test_reload(self):
+        """Test the Rules Reload Swap the Valid Rules and Reject the Invalid Ones, Keeping the Running Rules."""
+        for execution_mode in ['inline', 'process']:
+            with self.subTest(execution_mode=execution_mode), tempfile.TemporaryDirectory() as temp_dir:
+                config_file_path: str = os.path.join(temp_dir, 'config.ini')
+
+                def write_config(rules: Dict[str, Dict[str, str]]) -> ConfigParser:
+                    config: ConfigParser = ConfigParser()
+                    config.read_dict({'FINDER': {'enabled': 'true', 'execution_mode': execution_mode, 'pool_workers': '1'}, **rules})
+                    with open(config_file_path, 'w', encoding='UTF-8') as file:
+                        config.write(file)
+                    return config
+
+                notification_engine = mock.MagicMock(notifiers={'NOTIFIER.DISCORD.NOT_001': {}})
+                notification_engine.run = mock.AsyncMock()
+                exporter_engine = mock.MagicMock(exporters={'EXPORTER.ROLLING_PANDAS.EXP_001': {}})
+                exporter_engine.run = mock.AsyncMock()
+
+                target: FinderEngine = FinderEngine()
+                target.configure(
+                    config=write_config({'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_001'}}),
+                    notification_engine=notification_engine,
+                    exporter_engine=exporter_engine,
+                )
+
+                loop = asyncio.get_event_loop()
+
+                def run_messages() -> List[str]:
+                    target.notification_engine.run.reset_mock()
+                    for raw_text in ['term1', 'term2']:
+                        loop.run_until_complete(target.run(entity=mock.MagicMock(raw_text=raw_text, group_id=100, downloaded_media_info=None), source='+15558987453'))
+                    return [item.kwargs['rule_id'] for item in target.notification_engine.run.await_args_list]
+
+                try:
+                    self.assertEqual(['FINDER.RULE.Term1'], run_messages())
+
+                    # Valid Rules
+                    write_config({
+                        'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_001'},
+                        'FINDER.RULE.Term2': {'type': 'regex', 'regex': 'term2', 'notifier': 'NOTIFIER.DISCORD.NOT_001', 'exporter': 'EXPORTER.ROLLING_PANDAS.EXP_001'},
+                    })
+                    previous_worker_pool = target.worker_pool
+                    self.assertTrue(loop.run_until_complete(target.reload(config_file_path=config_file_path)))
+                    self.assertEqual(['FINDER.RULE.Term1', 'FINDER.RULE.Term2'], run_messages())
+                    self.assertEqual(1, target.reloads)
+                    if execution_mode == 'process':
+                        self.assertIsNot(previous_worker_pool, target.worker_pool)
+
+                    # Invalid Regex, Invalid Type, Missing File and Notifier or Exporter not Loaded
+                    for rules in [
+                        {'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1(', 'notifier': 'NOTIFIER.DISCORD.NOT_001'}},
+                        {'FINDER.RULE.Term1': {'type': 'regexp', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_001'}},
+                        {'FINDER.RULE.Term1': {'type': 'keywords', 'file': 'not_found.txt', 'notifier': 'NOTIFIER.DISCORD.NOT_001'}},
+                        {'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NOT_001,NOTIFIER.DISCORD.NEW'}},
+                        {'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'exporter': 'EXPORTER.ROLLING_PANDAS.NEW'}},
+                    ]:
+                        write_config(rules)
+                        self.assertFalse(loop.run_until_complete(target.reload(config_file_path=config_file_path)))
+                        self.assertEqual(['FINDER.RULE.Term1', 'FINDER.RULE.Term2'], run_messages())
+
+                    self.assertFalse(loop.run_until_complete(target.reload(config_file_path=os.path.join(temp_dir, 'not_found.ini'))))
+                    self.assertEqual(1, target.reloads)
+
+                    # Rejection Reason is Logged
+                    write_config({'FINDER.RULE.Term1': {'type': 'regex', 'regex': 'term1', 'notifier': 'NOTIFIER.DISCORD.NEW'}})
+                    with self.assertLogs() as captured:
+                        self.assertFalse(loop.run_until_complete(target.reload(config_file_path=config_file_path)))
+                    self.assertIn('Rule "FINDER.RULE.Term1" Uses Notifiers or Exporters not Loaded: NOTIFIER.DISCORD.NEW', captured.records[-1].message)
+
+                finally:
+                    target.shutdown()
+
+    def test_watch_config(self):
+        """Test the Rules are Reloaded when the Configuration File Changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file_path: str = os.path.join(temp_dir, 'config.ini')
+            with open(config_file_path, 'w', encoding='UTF-8') as file:
+                file.write('[FINDER]\nenabled=true\n')
+
+            config: ConfigParser = ConfigParser()
+            config.read(config_file_path)
+
+            target: FinderEngine = FinderEngine()
+            target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+            target.reload_check_interval_seconds = 0.05
+
+            async def change_config() -> None:
+                await asyncio.sleep(0.1)
+                with open(config_file_path, 'a', encoding='UTF-8') as file:
+                    file.write('[FINDER.RULE.Term1]\ntype=regex\nregex=term1\n')
+                os.utime(config_file_path, (0, 0))
+
+                while target.reloads == 0:
+                    await asyncio.sleep(0.01)
+
+            loop = asyncio.get_event_loop()
+            watch_task = loop.create_task(target.watch_config(config_file_path=config_file_path))
+            loop.run_until_complete(asyncio.wait_for(change_config(), timeout=5))
+            watch_task.cancel()
+            loop.run_until_complete(asyncio.gather(watch_task, return_exceptions=True))
+
+            self.assertEqual(['FINDER.RULE.Term1'], [rule['id'] for rule in target.rule_set.rules])
+
+    def test_watch_config_disabled(self):
+        """Test the Configuration File is not Watched by Default."""
+        target: FinderEngine = FinderEngine()
+        asyncio.get_event_loop().run_until_complete(asyncio.wait_for(target.watch_config(config_file_path='config.ini'), timeout=1))
+        self.assertEqual(0, target.reloads)
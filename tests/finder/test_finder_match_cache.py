@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+
+from TEx.finder.finder_match_cache import FinderMatchCache
+from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
+
+
+class FinderMatchCacheTest(unittest.TestCase):
+
+    def test_build_key(self):
+        """Test the Key Changes with the Text, Media and Dispatch Key."""
+        media: MediaHandlingEntity = MediaHandlingEntity(
+            media_id=123, file_name='file.txt', content_type='text/plain', size_bytes=100, disk_file_path='a/file.txt', is_ocr_supported=False,
+        )
+        forwarded_media: MediaHandlingEntity = media.model_copy(update={'disk_file_path': 'b/file.txt'})
+
+        key: bytes = FinderMatchCache.build_key(raw_text='Text', media=media, dispatch_key=(None, None))
+
+        self.assertEqual(16, len(key))
+        self.assertEqual(key, FinderMatchCache.build_key(raw_text='Text', media=forwarded_media, dispatch_key=(None, None)))
+        self.assertNotEqual(key, FinderMatchCache.build_key(raw_text='text', media=media, dispatch_key=(None, None)))
+        self.assertNotEqual(key, FinderMatchCache.build_key(raw_text='Text', media=None, dispatch_key=(None, None)))
+        self.assertNotEqual(key, FinderMatchCache.build_key(raw_text='Text', media=media, dispatch_key=(100, None)))
+
+    def test_lru_eviction(self):
+        """Test the Least Recently Used Entry is Evicted."""
+        target: FinderMatchCache = FinderMatchCache(max_entries=2, ttl_seconds=60)
+
+        target.put(key=b'1', found_on_content=frozenset({'RULE.A'}), found_on_file=frozenset())
+        target.put(key=b'2', found_on_content=frozenset(), found_on_file=frozenset({'RULE.B'}))
+        self.assertEqual((frozenset({'RULE.A'}), frozenset()), target.get(key=b'1'))
+
+        target.put(key=b'3', found_on_content=frozenset(), found_on_file=frozenset())
+
+        self.assertIsNone(target.get(key=b'2'))
+        self.assertIsNotNone(target.get(key=b'1'))
+        self.assertIsNotNone(target.get(key=b'3'))
+        self.assertEqual(1, target.evictions)
+        self.assertEqual(3, target.hits)
+        self.assertEqual(1, target.misses)
+        self.assertEqual(0.75, target.hit_rate)
+
+    @mock.patch('TEx.finder.finder_match_cache.time.monotonic')
+    def test_expiration(self, mocked_monotonic):
+        """Test Expired Entries are not Returned."""
+        target: FinderMatchCache = FinderMatchCache(max_entries=10, ttl_seconds=60)
+
+        mocked_monotonic.return_value = 100.0
+        target.put(key=b'1', found_on_content=frozenset({'RULE.A'}), found_on_file=frozenset())
+
+        mocked_monotonic.return_value = 160.0
+        self.assertIsNotNone(target.get(key=b'1'))
+
+        mocked_monotonic.return_value = 160.1
+        self.assertIsNone(target.get(key=b'1'))
+        self.assertEqual(1, target.expirations)
+        self.assertEqual(0, len(target.entries))
+
+    def test_disabled(self):
+        """Test a Cache with no Entries Stores Nothing."""
+        target: FinderMatchCache = FinderMatchCache(max_entries=0, ttl_seconds=60)
+        target.put(key=b'1', found_on_content=frozenset({'RULE.A'}), found_on_file=frozenset())
+
+        self.assertFalse(target.is_enabled)
+        self.assertEqual(0, len(target.entries))
+        self.assertEqual(0.0, target.hit_rate)
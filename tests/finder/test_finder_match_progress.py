@@ -0,0 +1,29 @@
+import unittest
+from unittest import mock
+
+from TEx.finder.finder_match_progress import FinderMatchProgress
+
+
+class FinderMatchProgressTest(unittest.TestCase):
+
+    @mock.patch('TEx.finder.finder_match_progress.time.monotonic')
+    def test_slowest_rule(self, mocked_monotonic):
+        """Test the Slowest Rule is Tracked."""
+        mocked_monotonic.side_effect = [10.0, 10.1, 12.1, 12.5]
+
+        target: FinderMatchProgress = FinderMatchProgress()
+        target.start()
+
+        target.enter(rule_id='RULE.A')
+        target.enter(rule_id='RULE.B')
+        target.enter(rule_id='RULE.C')
+        target.finish()
+
+        self.assertEqual('RULE.B', target.slowest_rule_id)
+        self.assertAlmostEqual(2.0, target.slowest_elapsed_seconds)
+        self.assertIsNone(target.current_rule_id)
+
+        # Restart
+        target.start()
+        self.assertIsNone(target.slowest_rule_id)
+        self.assertEqual(0.0, target.slowest_elapsed_seconds)
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+
+from TEx.finder.finder_rule_profile import FinderRuleProfile, FinderRuleStats
+
+
+class FinderRuleStatsTest(unittest.TestCase):
+
+    def test_percentiles(self):
+        """Test the Percentiles are Estimated by the Histogram Buckets."""
+        target: FinderRuleStats = FinderRuleStats()
+
+        for _ in range(90):
+            target.add_latency(elapsed_seconds=0.000_050)  # 50us > 64us Bucket
+        for _ in range(10):
+            target.add_latency(elapsed_seconds=0.010)  # 10ms > 16.384ms Bucket
+
+        self.assertEqual(100, target.timed_evaluations)
+        self.assertAlmostEqual(0.1045, target.total_seconds)
+        self.assertEqual(0.000_064, target.percentile_seconds(percentile=50))
+        self.assertEqual(0.000_064, target.percentile_seconds(percentile=90))
+        self.assertEqual(0.010, target.percentile_seconds(percentile=99))  # Limited to the Max Latency
+        self.assertEqual(0.0, FinderRuleStats().percentile_seconds(percentile=50))
+
+    def test_merge(self):
+        """Test Merge Stats."""
+        target: FinderRuleStats = FinderRuleStats()
+        target.evaluations = 2
+        target.add_latency(elapsed_seconds=0.001)
+
+        other: FinderRuleStats = FinderRuleStats()
+        other.evaluations = 3
+        other.hits = 1
+        other.add_latency(elapsed_seconds=0.002)
+
+        target.merge(other=other)
+
+        self.assertEqual(5, target.evaluations)
+        self.assertEqual(2, target.timed_evaluations)
+        self.assertEqual(1, target.hits)
+        self.assertAlmostEqual(0.003, target.total_seconds)
+        self.assertEqual(0.002, target.max_seconds)
+        self.assertEqual(2, sum(target.histogram))
+
+
+class FinderRuleProfileTest(unittest.TestCase):
+
+    def test_to_dict_and_dump(self):
+        """Test the Slowest Rules are Reported First."""
+        target: FinderRuleProfile = FinderRuleProfile()
+        target.add_evaluations(rule_ids=['RULE.FAST', 'RULE.SLOW'])
+        target.add_evaluations(rule_ids=['RULE.FAST'])
+        target.add_latency(rule_id='RULE.FAST', elapsed_seconds=0.001)
+        target.add_latency(rule_id='RULE.SLOW', elapsed_seconds=0.5)
+        target.add_hit(rule_id='RULE.FAST')
+
+        h_result = target.to_dict()
+
+        self.assertEqual(['RULE.SLOW', 'RULE.FAST'], list(h_result.keys()))
+        self.assertEqual(
+            {
+                'evaluations': 2, 'timed_evaluations': 1, 'hits': 1, 'total_ms': 1.0, 'mean_ms': 1.0,
+                'p50_ms': 1.0, 'p90_ms': 1.0, 'p99_ms': 1.0, 'max_ms': 1.0,
+            },
+            h_result['RULE.FAST'],
+        )
+        self.assertEqual(
+            'RULE.SLOW: 500.0ms Total, p50 500.0ms, p99 500.0ms, 1 Evaluations, 0 Hits',
+            target.summary(top=1),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'profile.json')
+            target.dump(file_path=file_path)
+
+            with open(file_path, encoding='UTF-8') as file:
+                self.assertEqual(h_result, json.load(file))
@@ -0,0 +1,109 @@
+"""Keywords Finder Tests."""
+
+import asyncio
+import unittest
+from configparser import ConfigParser
+from typing import Dict, List
+from unittest import mock
+from unittest.mock import call
+
+from TEx.finder.finder_engine import FinderEngine
+from TEx.finder.keywords_finder import KeywordsFinder
+
+
+class KeywordsFinderTest(unittest.TestCase):
+
+    @staticmethod
+    def __build_finder(settings: Dict[str, str]) -> KeywordsFinder:
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'FINDER.RULE.UT_Keywords': {'type': 'keywords', 'file': 'resources/keywords_watchlist.txt', **settings}})
+        return KeywordsFinder(config=config['FINDER.RULE.UT_Keywords'])
+
+    @staticmethod
+    def __find_all(target: KeywordsFinder, texts: List[str]) -> List[bool]:
+        loop = asyncio.get_event_loop()
+        return [loop.run_until_complete(target.find(raw_text=text)) for text in texts]
+
+    def test_load_terms(self):
+        """Test Load the Terms File, Ignoring Comments and Empty Lines."""
+        with self.assertLogs('TelegramExplorer', level='INFO') as captured:
+            target: KeywordsFinder = self.__build_finder({})
+
+        self.assertEqual([12, 42, 15, 7, 6, 3], target.terms_length)
+        self.assertTrue(target.case_folding)
+        self.assertFalse(target.word_boundaries)
+        self.assertIn('6 Keywords Loaded from "resources/keywords_watchlist.txt"', captured.output[0])
+
+    def test_find_with_case_folding(self):
+        """Test Find with the Default Settings: Case Insensitive Substring Match."""
+        target: KeywordsFinder = self.__build_finder({})
+
+        self.assertEqual(
+            [True, True, True, True, True, True, False, False, False],
+            self.__find_all(target, [
+                'new post from @cryptoleaks today',
+                'send to BC1QXY2KGDYGJRSQTZQ2N0YRF2493P83KKFJHX0WLH now',
+                'visit https://evil-domain.com/login',
+                'STRASSE',
+                'ФИШИНГ атака',
+                'concatenate',
+                'evil-domain.co',
+                '',
+                None,
+            ]),
+        )
+
+    def test_find_case_sensitive(self):
+        """Test Find with Case Folding Disabled."""
+        target: KeywordsFinder = self.__build_finder({'case_folding': 'false'})
+
+        self.assertEqual(
+            [True, False, True, False],
+            self.__find_all(target, ['hi @CryptoLeaks', 'hi @cryptoleaks', 'CAT', 'cat']),
+        )
+
+    def test_find_with_word_boundaries(self):
+        """Test Find with Word Boundaries."""
+        target: KeywordsFinder = self.__build_finder({'word_boundaries': 'true'})
+
+        self.assertEqual(
+            [True, True, True, False, False, True, False],
+            self.__find_all(target, [
+                'cat',
+                'the Cat, the dog',
+                '(@cryptoleaks)',
+                'concatenate',
+                'mail@cryptoleaks',
+                'a cats cat',
+                'evil-domain.com_backup',
+            ]),
+        )
+
+    def test_file_not_found(self):
+        """Test Missing Terms File."""
+        with self.assertRaises(AttributeError) as context:
+            self.__build_finder({'file': 'resources/not_found.txt'})
+
+        self.assertEqual('Keywords File "resources/not_found.txt" not Found for "FINDER.RULE.UT_Keywords"', str(context.exception))
+
+    def test_finder_engine_with_keywords_rule(self):
+        """Test the Finder Engine Load and Run Keywords Rules."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'FINDER': {'enabled': 'true'},
+            'FINDER.RULE.UT_Keywords': {'type': 'keywords', 'file': 'resources/keywords_watchlist.txt', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: FinderEngine = FinderEngine()
+        target.configure(config=config, notification_engine=mock.AsyncMock(), exporter_engine=mock.AsyncMock())
+        self.assertIsInstance(target.rule_set.rules[0]['instance'], KeywordsFinder)
+
+        entity: mock.MagicMock = mock.MagicMock(raw_text='Message from @CryptoLeaks')
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(target.run(entity=entity, source='+15558987453'))
+
+        target.notification_engine.run.assert_has_awaits([
+            call(notifiers=['NOTIFIER.DISCORD.NOT_002'], entity=entity, rule_id='FINDER.RULE.UT_Keywords', source='+15558987453'),
+        ])
+        self.assertEqual('MESSAGE', entity.found_on)
@@ -0,0 +1,72 @@
+"""Text File View Tests."""
+
+import asyncio
+import os
+import re
+import shutil
+import unittest
+from typing import List
+
+from TEx.finder.text_file_view import TextFileView
+
+
+class TextFileViewTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data_path: str = '_data/text_file_view'
+        os.makedirs(self.data_path, exist_ok=True)
+        self.file_path: str = os.path.join(self.data_path, 'dump.txt')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_path, ignore_errors=True)
+
+    def __read_chunks(self, content: bytes, chunk_size_bytes: int, overlap_chars: int) -> List[str]:
+        with open(self.file_path, 'wb') as file:
+            file.write(content)
+
+        target: TextFileView = TextFileView(file_path=self.file_path, chunk_size_bytes=chunk_size_bytes, overlap_chars=overlap_chars)
+
+        async def read_all() -> List[str]:
+            return [chunk async for chunk in target.iter_chunks()]
+
+        h_result: List[str] = asyncio.get_event_loop().run_until_complete(read_all())
+        self.assertEqual(len(h_result), target.chunks_read)
+
+        return h_result
+
+    def test_single_chunk(self):
+        """Test Small Files are Read in a Single Chunk, and Empty Files are a Single Empty Chunk."""
+        self.assertEqual(['line 1\nline 2'], self.__read_chunks(b'line 1\nline 2', chunk_size_bytes=1024, overlap_chars=10))
+        self.assertEqual([''], self.__read_chunks(b'', chunk_size_bytes=1024, overlap_chars=10))
+
+    def test_chunks_cut_on_line_breaks(self):
+        """Test Chunks End on Line Breaks and Start with the Previous Lines Inside the Overlap."""
+        lines: List[str] = [f'line {ix:03}' for ix in range(100)]
+        chunks: List[str] = self.__read_chunks('\n'.join(lines).encode('UTF-8'), chunk_size_bytes=100, overlap_chars=20)
+
+        self.assertGreater(len(chunks), 5)
+
+        for chunk in chunks[:-1]:
+            self.assertTrue(chunk.endswith('\n'))
+
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith('line '), chunk)
+
+        # Every Line is Complete in at Least one Chunk and Line Anchors Still Work
+        for line in lines:
+            self.assertTrue(any(re.search(f'^{line}$', chunk, flags=re.MULTILINE) for chunk in chunks), line)
+
+    def test_long_lines_overlap(self):
+        """Test Matches Crossing the Boundary of Lines Longer than the Chunk are Found on the Overlap."""
+        content: str = ('x' * 95) + 'secret' + ('y' * 300)
+        chunks: List[str] = self.__read_chunks(content.encode('UTF-8'), chunk_size_bytes=100, overlap_chars=10)
+
+        self.assertEqual(content, chunks[0] + ''.join(chunk[10:] for chunk in chunks[1:]))
+        self.assertTrue(any('secret' in chunk for chunk in chunks))
+
+    def test_invalid_and_split_encoding(self):
+        """Test Invalid Bytes are Replaced and Multibyte Chars Split Between Chunks are Preserved."""
+        content: bytes = ('a' * 99).encode('UTF-8') + 'ção'.encode('UTF-8') + b'\xff\xfe invalid'
+        chunks: List[str] = self.__read_chunks(content, chunk_size_bytes=100, overlap_chars=0)
+
+        self.assertEqual(('a' * 99) + 'ção�� invalid', ''.join(chunks))
@@ -6,7 +6,7 @@ from TEx.core.dir_manager import DirectoryManagerUtils
 from TEx.database.db_initializer import DbInitializer
 from TEx.database.db_manager import DbManager
 from TEx.models.database.telegram_db_model import (
-    TelegramGroupOrmEntity,
+    TelegramGroupOrmEntity, TelegramGroupSyncStateOrmEntity,
     TelegramMediaOrmEntity, TelegramMessageOrmEntity, TelegramUserOrmEntity, )
 from TEx.modules.execution_configuration_handler import ExecutionConfigurationHandler
 
@@ -28,6 +28,7 @@ class TestsCommon:
         DbManager.SESSIONS['data'].execute(delete(TelegramGroupOrmEntity))
         DbManager.SESSIONS['data'].execute(delete(TelegramMediaOrmEntity))
         DbManager.SESSIONS['data'].execute(delete(TelegramUserOrmEntity))
+        DbManager.SESSIONS['data'].execute(delete(TelegramGroupSyncStateOrmEntity))
         DbManager.SESSIONS['data'].commit()
 
     @staticmethod
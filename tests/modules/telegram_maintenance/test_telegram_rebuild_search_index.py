@@ -0,0 +1,56 @@
+"""Telegram Rebuild Search Index Tests."""
+
+import asyncio
+import logging
+import unittest
+from configparser import ConfigParser
+from typing import Dict
+from unittest import mock
+
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramMessageSearchDatabaseManager
+from TEx.modules.telegram_maintenance.telegram_rebuild_search_index import TelegramMaintenanceRebuildSearchIndex
+from tests.modules.common import TestsCommon
+
+
+class TelegramMaintenanceRebuildSearchIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = ConfigParser()
+        self.config.read('../../config.ini')
+
+        TestsCommon.basic_test_setup()
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    def __execute(self, args: Dict) -> list:
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        with self.assertLogs('TelegramExplorer', level=logging.DEBUG) as captured:
+            asyncio.get_event_loop().run_until_complete(
+                TelegramMaintenanceRebuildSearchIndex().run(config=self.config, args=args, data=data),
+            )
+
+        return [item.message for item in captured.records]
+
+    def test_rebuild_search_index_disabled(self):
+        """Test Module Disabled."""
+        messages = self.__execute(args={'config': 'unittest_configfile.config', 'rebuild_search_index': False})
+        self.assertEqual(['\t\tModule is Not Enabled...'], messages)
+
+    def test_rebuild_search_index(self):
+        """Test Rebuild the Index."""
+        TelegramMessageSearchDatabaseManager.set_ready(is_ready=False)
+
+        messages = self.__execute(args={'config': 'unittest_configfile.config', 'rebuild_search_index': True})
+        self.assertEqual(['\t\tRebuilding Full Text Search Index', '\t\tFull Text Search Index Rebuilt Successfully'], messages)
+        self.assertTrue(TelegramMessageSearchDatabaseManager.is_ready())
+
+    def test_rebuild_search_index_not_available(self):
+        """Test Rebuild when the SQLite Build has no Full Text Search Support."""
+        with mock.patch.object(TelegramMessageSearchDatabaseManager, 'exists', return_value=False):
+            messages = self.__execute(args={'config': 'unittest_configfile.config', 'rebuild_search_index': True})
+
+        self.assertEqual(['\t\tRebuilding Full Text Search Index', '\t\tFull Text Search is not Available on this SQLite Build'], messages)
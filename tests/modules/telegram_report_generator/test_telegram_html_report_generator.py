@@ -25,6 +25,7 @@ from TEx.models.database.telegram_db_model import (
 )
 from TEx.modules.execution_configuration_handler import ExecutionConfigurationHandler
 from TEx.modules.telegram_messages_scrapper import TelegramGroupMessageScrapper
+from TEx.models.facade.telegram_message_report_facade_entity import TelegramMessageReportFacadeEntity
 from TEx.modules.telegram_report_generator.telegram_html_report_generator import TelegramReportGenerator
 from tests.modules.mockups_groups_mockup_data import base_groups_mockup_data, base_messages_mockup_data, \
     base_users_mockup_data
@@ -151,7 +152,7 @@ class TelegramGroupMessageScrapperTest(unittest.TestCase):
             'report_folder': '_report',
             'group_id': '*',
             'order_desc': True,
-            'filter': 'Message',
+            'filter': 'age',
             'limit_days': 30,
             'report': True,
             'suppress_repeating_messages': True,
@@ -177,8 +178,7 @@ class TelegramGroupMessageScrapperTest(unittest.TestCase):
             expected_log_messages = [
                 '\t\tFound 2 Groups',
                 '\t\tProcessing "UT-01" (1)',
-                '\t\t\tRetrieving Messages',
-                '\t\t\tFiltering',
+                '\t\t\tRetrieving Messages',  # No Matches on Full Text Search Index - Skipped
                 '\t\tProcessing "UT-02" (2)',
                 '\t\t\tRetrieving Messages',
                 '\t\t\tFiltering',
@@ -202,6 +202,30 @@ class TelegramGroupMessageScrapperTest(unittest.TestCase):
             os.path.exists(os.path.join('_report', 'result_UN-b_2.html'))
         )
 
+    def test_filter_messages_around(self):
+        """Test the Around Messages Window Returns Each Message Once."""
+
+        messages = []
+        for ix, raw in enumerate(['a', 'b', 'c match', 'd match', 'e', 'f', 'g', 'h match', 'i']):
+            message: TelegramMessageReportFacadeEntity = TelegramMessageReportFacadeEntity()
+            message.id = ix + 1
+            message.raw = raw
+            message.message = raw
+            messages.append(message)
+
+        target: TelegramReportGenerator = TelegramReportGenerator()
+        result = list(target.filter_messages(messages=iter(messages), filter_words=['MATCH'], args={'around_messages': 2}))
+
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7, 8, 9], [item.id for item in result])
+        self.assertEqual(
+            [(True, False), (True, False), (False, False), (False, False), (False, True), (False, True), (True, False), (False, False), (False, True)],
+            [(item.meta_previous, item.meta_next) for item in result],
+        )
+        self.assertEqual('c <span class="marker">MATCH</span>', result[2].message)
+
+        result = list(target.filter_messages(messages=iter(messages), filter_words=['h match'], args={'around_messages': 0}))
+        self.assertEqual([8], [item.id for item in result])
+
     def __load_execution_config(self, args, data):
 
         execution_configuration_loader: ExecutionConfigurationHandler = ExecutionConfigurationHandler()
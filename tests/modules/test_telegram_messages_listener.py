@@ -17,6 +17,7 @@ from telethon.tl.types import User, UserStatusRecently
 
 from TEx.database import GROUPS_CACHE, USERS_CACHE
 from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramMessageDatabaseManager
 from TEx.models.database.telegram_db_model import (
     TelegramMediaOrmEntity, TelegramMessageOrmEntity, TelegramGroupOrmEntity, TelegramUserOrmEntity)
 from TEx.modules.telegram_messages_listener import TelegramGroupMessageListener
@@ -90,29 +91,20 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
 
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with self.assertLogs() as captured:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(
-                target.run(
-                    config=self.config,
-                    args=args,
-                    data=data
-                )
-            )
-
-            mocked_channels_def = [
+        mocked_channels_def = [
 
-                # Channels as Chat
-                base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0],
-                base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0],
-                base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7],
-                base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7],
+            # Channels as Chat
+            base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0],
+            base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0], base_groups_mockup_data.chats[0],
+            base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7],
+            base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7], base_groups_mockup_data.chats[7],
 
-                base_groups_mockup_data.chats[12],  # User as Chat
-                base_groups_mockup_data.chats[13],  # Chat as Chat
-            ]
+            base_groups_mockup_data.chats[12],  # User as Chat
+            base_groups_mockup_data.chats[13],  # Chat as Chat
+        ]
 
-            # Emulate Dispatcher Calls
+        # Emulate Dispatcher Calls during the Catch Up
+        async def catch_up_side_effect():
             for ix, message in enumerate(base_messages_mockup_data):
 
                 if not message.date:
@@ -140,9 +132,19 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
 
                 mocked_event.message = message
 
-                loop.run_until_complete(
-                    target._TelegramGroupMessageListener__handler(event=mocked_event)
-                    )
+                await target._TelegramGroupMessageListener__handler(event=mocked_event)
+
+        telegram_client_mockup.catch_up = mock.AsyncMock(side_effect=catch_up_side_effect)
+
+        with self.assertLogs() as captured:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(
+                target.run(
+                    config=self.config,
+                    args=args,
+                    data=data
+                )
+            )
 
         # Assert Event Handler Added
         telegram_client_mockup.add_event_handler.assert_called_once_with(mock.ANY, NewMessage)
@@ -170,8 +172,8 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
             mock.call(), mock.call(), mock.call()
         ])
         mock_signals_engine.keep_alive.assert_has_awaits([
-            mock.call(),
-            mock.call()
+            mock.call(details=None),
+            mock.call(details=None)
         ])
         mock_signals_engine.shutdown.assert_awaited_once()
 
@@ -183,25 +185,27 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
         )
 
         # Check Logs
-        self.assertEqual(20, len(captured.records))
+        self.assertEqual(22, len(captured.records))
+        self.assertTrue(captured.records[21].message.startswith('\t\tFinder Match Cache: '))
         self.assertEqual('\t\tListening Past Messages...', captured.records[0].message)
         self.assertEqual('\t\tListening New Messages...', captured.records[1].message)
-        self.assertEqual('\t\tTelegram Client Disconnected...', captured.records[2].message)
-        self.assertEqual('\t\tGroup "10981" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[5].message)
-        self.assertEqual('\t\tUser "5566" was not found on DB. Performing automatic synchronization.', captured.records[6].message)
-        self.assertEqual('\t\tGroup "10984" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[7].message)
-        self.assertEqual('\t\t\tDownloading Photo from Message 183018 at 2020-05-12 21:22:35', captured.records[8].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183644 (12761.9 Kbytes) as application/vnd.android.package-archive at 2020-05-17 19:20:13', captured.records[9].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183659 (58.8613 Kbytes) as image/webp at 2020-05-17 21:29:30', captured.records[10].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183771 (2258.64 Kbytes) as video/mp4 at 2020-05-18 19:41:47', captured.records[11].message)
-        self.assertEqual('\t\tUser "6699" was not found on DB. Performing automatic synchronization.', captured.records[12].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 192 (20.1279 Kbytes) as application/x-tgsticker at 2021-08-13 06:51:26', captured.records[13].message)
-        self.assertEqual('\t\tUser "1523754667" was not found on DB. Performing automatic synchronization.', captured.records[14].message)
-        self.assertEqual('		Group "12099" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[15].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 4622199 (11.3203 Kbytes) as text/plain at 2022-02-16 15:15:01', captured.records[16].message)
-        self.assertEqual('\t\tUser "881571585" was not found on DB. Performing automatic synchronization.', captured.records[17].message)
-        self.assertEqual('		Group "12000" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[18].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 34357 (2900.25 Kbytes) as application/pdf at 2022-02-16 16:05:17', captured.records[19].message)
+        self.assertEqual('\t\tDraining Ingest Pipeline (0 Pending Messages)...', captured.records[17].message)
+        self.assertEqual('\t\tTelegram Client Disconnected...', captured.records[18].message)
+        self.assertEqual('\t\tGroup "10981" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[2].message)
+        self.assertEqual('\t\tUser "5566" was not found on DB. Performing automatic synchronization.', captured.records[3].message)
+        self.assertEqual('\t\tGroup "10984" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[4].message)
+        self.assertEqual('\t\t\tDownloading Photo from Message 183018 at 2020-05-12 21:22:35', captured.records[5].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183644 (12761.9 Kbytes) as application/vnd.android.package-archive at 2020-05-17 19:20:13', captured.records[6].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183659 (58.8613 Kbytes) as image/webp at 2020-05-17 21:29:30', captured.records[7].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183771 (2258.64 Kbytes) as video/mp4 at 2020-05-18 19:41:47', captured.records[8].message)
+        self.assertEqual('\t\tUser "6699" was not found on DB. Performing automatic synchronization.', captured.records[9].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 192 (20.1279 Kbytes) as application/x-tgsticker at 2021-08-13 06:51:26', captured.records[10].message)
+        self.assertEqual('\t\tUser "1523754667" was not found on DB. Performing automatic synchronization.', captured.records[11].message)
+        self.assertEqual('		Group "12099" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[12].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 4622199 (11.3203 Kbytes) as text/plain at 2022-02-16 15:15:01', captured.records[13].message)
+        self.assertEqual('\t\tUser "881571585" was not found on DB. Performing automatic synchronization.', captured.records[14].message)
+        self.assertEqual('		Group "12000" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[15].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 34357 (2900.25 Kbytes) as application/pdf at 2022-02-16 16:05:17', captured.records[16].message)
 
         # Check Synchronized Groups
         all_groups = DbManager.SESSIONS['data'].execute(
@@ -431,17 +435,8 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
 
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with self.assertLogs() as captured:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(
-                target.run(
-                    config=self.config,
-                    args=args,
-                    data=data
-                )
-            )
-
-            # Emulate Dispatcher Calls
+        # Emulate Dispatcher Calls during the Catch Up
+        async def catch_up_side_effect():
             for ix, message in enumerate(base_messages_mockup_data):
 
                 if not message.date:
@@ -468,31 +463,42 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
 
                 mocked_event.message = message
 
-                loop.run_until_complete(
-                    target._TelegramGroupMessageListener__handler(event=mocked_event)
-                    )
+                await target._TelegramGroupMessageListener__handler(event=mocked_event)
+
+        telegram_client_mockup.catch_up = mock.AsyncMock(side_effect=catch_up_side_effect)
+
+        with self.assertLogs() as captured:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(
+                target.run(
+                    config=self.config,
+                    args=args,
+                    data=data
+                )
+            )
 
         for message in captured.records:
             print(message.message)
 
         # Check Logs
-        self.assertEqual(18, len(captured.records))
+        self.assertEqual(20, len(captured.records))
         self.assertEqual('\t\tApplied Groups Filtering... 1 selected', captured.records[0].message)
         self.assertEqual('\t\tListening Past Messages...', captured.records[1].message)
         self.assertEqual('\t\tListening New Messages...', captured.records[2].message)
-        self.assertEqual('\t\tTelegram Client Disconnected...', captured.records[3].message)
-        self.assertEqual('\t\tGroup "10984" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[6].message)
-        self.assertEqual('\t\t\tDownloading Photo from Message 183018 at 2020-05-12 21:22:35', captured.records[7].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183644 (12761.9 Kbytes) as application/vnd.android.package-archive at 2020-05-17 19:20:13', captured.records[8].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183659 (58.8613 Kbytes) as image/webp at 2020-05-17 21:29:30', captured.records[9].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 183771 (2258.64 Kbytes) as video/mp4 at 2020-05-18 19:41:47', captured.records[10].message)
-        self.assertEqual('\t\tUser "6699" was not found on DB. Performing automatic synchronization.', captured.records[11].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 192 (20.1279 Kbytes) as application/x-tgsticker at 2021-08-13 06:51:26', captured.records[12].message)
-        self.assertEqual('\t\tUser "1523754667" was not found on DB. Performing automatic synchronization.', captured.records[13].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 4622199 (11.3203 Kbytes) as text/plain at 2022-02-16 15:15:01', captured.records[14].message)
-        self.assertEqual('\t\t\t\tMedia Download is not Allowed, Ignoring...', captured.records[15].message)
-        self.assertEqual('\t\tUser "881571585" was not found on DB. Performing automatic synchronization.', captured.records[16].message)
-        self.assertEqual('\t\t\tDownloading Media from Message 34357 (2900.25 Kbytes) as application/pdf at 2022-02-16 16:05:17', captured.records[17].message)
+        self.assertEqual('\t\tDraining Ingest Pipeline (0 Pending Messages)...', captured.records[15].message)
+        self.assertEqual('\t\tTelegram Client Disconnected...', captured.records[16].message)
+        self.assertEqual('\t\tGroup "10984" not found on DB. Performing automatic synchronization. Consider execute "load_groups" command to perform a full group synchronization (Members and Group Cover Photo).', captured.records[3].message)
+        self.assertEqual('\t\t\tDownloading Photo from Message 183018 at 2020-05-12 21:22:35', captured.records[4].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183644 (12761.9 Kbytes) as application/vnd.android.package-archive at 2020-05-17 19:20:13', captured.records[5].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183659 (58.8613 Kbytes) as image/webp at 2020-05-17 21:29:30', captured.records[6].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 183771 (2258.64 Kbytes) as video/mp4 at 2020-05-18 19:41:47', captured.records[7].message)
+        self.assertEqual('\t\tUser "6699" was not found on DB. Performing automatic synchronization.', captured.records[8].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 192 (20.1279 Kbytes) as application/x-tgsticker at 2021-08-13 06:51:26', captured.records[9].message)
+        self.assertEqual('\t\tUser "1523754667" was not found on DB. Performing automatic synchronization.', captured.records[10].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 4622199 (11.3203 Kbytes) as text/plain at 2022-02-16 15:15:01', captured.records[11].message)
+        self.assertEqual('\t\t\t\tMedia Download is not Allowed, Ignoring...', captured.records[12].message)
+        self.assertEqual('\t\tUser "881571585" was not found on DB. Performing automatic synchronization.', captured.records[13].message)
+        self.assertEqual('\t\t\tDownloading Media from Message 34357 (2900.25 Kbytes) as application/pdf at 2022-02-16 16:05:17', captured.records[14].message)
 
         # Check Synchronized Groups
         all_groups = DbManager.SESSIONS['data'].execute(
@@ -689,6 +695,27 @@ class TelegramGroupMessageListenerTest(unittest.TestCase):
         self.assertEqual(1, len(captured.records))
         self.assertEqual('\t\tModule is Not Enabled...', captured.records[0].message)
 
+    def test_detect_gap(self):
+        """Test Gap Detection Between the Last Synced Message and the Received Messages."""
+        TelegramMessageDatabaseManager.insert_batch([{
+            'id': 100, 'group_id': 1, 'date_time': datetime.datetime.now(), 'message': 'Message', 'raw': 'Message',
+        }])
+
+        target: TelegramGroupMessageListener = TelegramGroupMessageListener()
+        target.gap_warning_threshold = 10
+
+        with self.assertLogs() as captured:
+            target._TelegramGroupMessageListener__detect_gap(group_id=1, message_id=105)  # Small Gap - Ignored
+            target._TelegramGroupMessageListener__detect_gap(group_id=1, message_id=150)
+            target._TelegramGroupMessageListener__detect_gap(group_id=1, message_id=140)  # Out of Order - Ignored
+            target._TelegramGroupMessageListener__detect_gap(group_id=2, message_id=500)  # Never Synced - Ignored
+            target._TelegramGroupMessageListener__detect_gap(group_id=2, message_id=600)
+
+        self.assertEqual(2, len(captured.records))
+        self.assertEqual('\t\tGap Detected on Group "1". 44 Messages Missing (from 106 to 149)', captured.records[0].message)
+        self.assertEqual('\t\tGap Detected on Group "2". 99 Messages Missing (from 501 to 599)', captured.records[1].message)
+        self.assertEqual({1: 150, 2: 600}, target.last_message_ids)
+
     def verify_single_group(self, group_obj, access_hash=None, constructor_id=None, fake=None, gigagroup=None, username=None,
                             has_geo=None, group_id=None, restricted=None, scam=None, source=None, title=None,
                             verified=None, group_type=None):
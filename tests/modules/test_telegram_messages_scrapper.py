@@ -11,6 +11,7 @@ from unittest import mock
 
 import pytz
 from sqlalchemy import asc, select
+from telethon.errors.rpcerrorlist import FloodWaitError
 from telethon.tl.functions.messages import GetDialogsRequest
 
 from TEx.database.db_manager import DbManager
@@ -287,6 +288,126 @@ class TelegramGroupMessageScrapperTest(unittest.TestCase):
             self.assertEqual('			Downloading Media from Message 34357 (2900.25 Kbytes) as application/pdf at 2022-02-16 16:05:17', captured.records[9].message)
             self.assertEqual('		Download Messages from "UT-01" > Last Offset: 4622199', captured.records[10].message)
 
+    def test_run_download_messages_concurrent_with_flood_wait(self):
+        """Test Run Method Downloading Groups Concurrently and Retrying after a Telegram Flood Wait."""
+
+        # Setup Mock
+        telegram_client_mockup = mock.AsyncMock(side_effect=self.run_connect_side_effect)
+        calls: Dict = {1: 0, 2: 0}
+
+        async def async_generator_side_effect(items):
+            for item in items:
+                yield item
+
+        async def async_generator_flood_wait_side_effect():
+            raise FloodWaitError(request=None, capture=0)
+            yield  # Make it an Async Generator
+
+        def iter_messages_side_effect(entity, **kwargs):
+            calls[entity.channel_id] += 1
+
+            if entity.channel_id == 1 and calls[1] == 1:
+                return async_generator_flood_wait_side_effect()
+
+            if entity.channel_id == 1 and calls[1] == 2:
+                return async_generator_side_effect(base_messages_mockup_data)
+
+            return async_generator_side_effect([])
+
+        telegram_client_mockup.iter_messages = mock.MagicMock(side_effect=iter_messages_side_effect)
+
+        # Call Test Target Method
+        target: TelegramGroupMessageScrapper = TelegramGroupMessageScrapper()
+        args: Dict = {
+            'config': 'unittest_configfile.config',
+            'download_messages': True,
+            'ignore_media': True,
+            'group_id': '*'
+        }
+        data: Dict = {
+            'telegram_client': telegram_client_mockup
+        }
+
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+        self.config['MESSAGES.DOWNLOAD']['concurrency'] = '2'
+
+        with self.assertLogs() as captured:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(
+                target.run(
+                    config=self.config,
+                    args=args,
+                    data=data
+                )
+            )
+
+        self.assertEqual(2, target.concurrency)
+        self.assertEqual(1, target.rate_limiter.flood_waits)
+        self.assertIn('\t\tTelegram Flood Wait of 0s Received. Reducing Rate to 50.00 Requests per Second', [record.message for record in captured.records])
+        self.assertEqual({1: 3, 2: 1}, calls)
+
+        # Check all Messages in SQLlite DB
+        self.assertEqual(9, len(TelegramMessageDatabaseManager.get_all_messages_from_group(group_id=1)))
+        self.assertEqual(1, len(TelegramMessageDatabaseManager.get_all_messages_from_group(group_id=2)))
+
+    def test_run_download_messages_worker_failure(self):
+        """Test a Failing Worker is Logged without Detaching the Others and its Downloaded Messages are Kept."""
+
+        # Setup Mock
+        telegram_client_mockup = mock.AsyncMock(side_effect=self.run_connect_side_effect)
+        calls: Dict = {1: 0, 2: 0}
+
+        async def async_generator_side_effect(items):
+            for item in items:
+                yield item
+
+        async def async_generator_failure_side_effect(items):
+            for item in items:
+                yield item
+            raise RuntimeError('UT Exception')
+
+        def iter_messages_side_effect(entity, **kwargs):
+            calls[entity.channel_id] += 1
+
+            if entity.channel_id == 1:
+                return async_generator_failure_side_effect(base_messages_mockup_data)
+
+            return async_generator_side_effect([])
+
+        telegram_client_mockup.iter_messages = mock.MagicMock(side_effect=iter_messages_side_effect)
+
+        # Call Test Target Method
+        target: TelegramGroupMessageScrapper = TelegramGroupMessageScrapper()
+        args: Dict = {
+            'config': 'unittest_configfile.config',
+            'download_messages': True,
+            'ignore_media': True,
+            'group_id': '*'
+        }
+        data: Dict = {
+            'telegram_client': telegram_client_mockup
+        }
+
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+        self.config['MESSAGES.DOWNLOAD']['concurrency'] = '2'
+
+        with self.assertLogs() as captured:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(
+                target.run(
+                    config=self.config,
+                    args=args,
+                    data=data
+                )
+            )
+
+        self.assertIn('\t\tGroups Download Worker Failed', [record.message for record in captured.records])
+        self.assertEqual({1: 1, 2: 1}, calls)
+
+        # Check all Messages in SQLlite DB
+        self.assertEqual(9, len(TelegramMessageDatabaseManager.get_all_messages_from_group(group_id=1)))
+        self.assertEqual(1, len(TelegramMessageDatabaseManager.get_all_messages_from_group(group_id=2)))
+
     def test_run_download_messages_disabled(self):
         """Test Run Method for Scrap Telegram Groups - Module Disabled."""
 
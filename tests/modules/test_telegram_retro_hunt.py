@@ -0,0 +1,199 @@
+"""Telegram Retro Hunt Tests."""
+
+import asyncio
+import datetime
+import logging
+import unittest
+from configparser import ConfigParser
+from typing import Dict, List
+from unittest import mock
+
+import pytz
+
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, TelegramMessageDatabaseManager
+from TEx.modules.telegram_retro_hunt import TelegramRetroHunt
+from tests.modules.common import TestsCommon
+
+
+class TelegramRetroHuntTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = ConfigParser()
+        self.config.read('../../config.ini')
+
+        TestsCommon.basic_test_setup()
+
+        for group_id, title in [(1, 'UT-01'), (2, 'UT-02')]:
+            TelegramGroupDatabaseManager.insert_or_update({
+                'id': group_id, 'constructor_id': 'A', 'access_hash': 'AAAAAA',
+                'fake': False, 'gigagroup': False, 'has_geo': False,
+                'participants_count': 1, 'restricted': False,
+                'scam': False, 'group_username': f'UN-{group_id}',
+                'verified': False, 'title': title, 'source': '5526986587745'
+            })
+
+        media_id: int = TelegramMediaDatabaseManager.insert({
+            'group_id': 2, 'telegram_id': 159, 'file_name': 'file_001.txt', 'extension': 'txt',
+            'date_time': datetime.datetime.utcnow(), 'mime_type': 'text/plain', 'size_bytes': 123
+        })
+
+        now: datetime.datetime = datetime.datetime.now(tz=pytz.utc)
+        messages: List[Dict] = [
+            {'id': 1, 'group_id': 1, 'date_time': now, 'message': 'Message term1', 'raw': 'Message term1'},
+            {'id': 2, 'group_id': 1, 'date_time': now, 'message': 'Nothing Here', 'raw': 'Nothing Here'},
+            {'id': 3, 'group_id': 1, 'date_time': now - datetime.timedelta(days=40), 'message': 'Old term1', 'raw': 'Old term1'},
+            {'id': 4, 'group_id': 2, 'date_time': now, 'message': 'Another term2', 'raw': 'Another term2', 'media_id': media_id},
+        ]
+        messages.extend([
+            {'id': 100 + ix, 'group_id': 2, 'date_time': now - datetime.timedelta(minutes=ix), 'message': f'Message {ix}', 'raw': f'Message {ix}'}
+            for ix in range(10)
+        ])
+        TelegramMessageDatabaseManager.insert_batch(messages)
+
+    def tearDown(self) -> None:
+        DbManager.SESSIONS['data'].close()
+
+    @staticmethod
+    def __build_engine_mockup() -> mock.MagicMock:
+        """Engine Mockup, with Synchronous configure and start and Asynchronous run and shutdown."""
+        engine_mockup = mock.MagicMock()
+        engine_mockup.run = mock.AsyncMock()
+        engine_mockup.shutdown = mock.AsyncMock()
+        return engine_mockup
+
+    def __execute(self, args: Dict, data: Dict, mock_notification_engine: bool = True) -> TelegramRetroHunt:
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        self.config.read_dict({
+            'FINDER': {'pool_workers': '2'},
+            'FINDER.RULE.UT_Finder_Demo_Group2': {'type': 'regex', 'regex': 'term2', 'groups': '2', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+        })
+
+        target: TelegramRetroHunt = TelegramRetroHunt()
+        if mock_notification_engine:
+            target.notification_engine = TelegramRetroHuntTest.__build_engine_mockup()
+        target.exporter_engine = TelegramRetroHuntTest.__build_engine_mockup()
+
+        with mock.patch.dict(DbManager.SETTINGS, {'read_page_size': '3'}):
+            asyncio.get_event_loop().run_until_complete(target.run(config=self.config, args=args, data=data))
+
+        return target
+
+    def test_run(self):
+        """Test Run the Selected Rules over the Stored Messages."""
+        args: Dict = {
+            'config': 'unittest_configfile.config', 'retro_hunt': True, 'rule': 'UT_Finder_Demo,FINDER.RULE.UT_Finder_Demo_Group2',
+            'limit_days': 30, 'group_id': '*',
+        }
+        data: Dict = {'internals': {'panic': False}}
+
+        with self.assertLogs('TelegramExplorer', level=logging.INFO) as captured:
+            target: TelegramRetroHunt = self.__execute(args=args, data=data)
+
+        self.assertFalse(data['internals']['panic'])
+        self.assertEqual(13, target.messages_processed)
+        self.assertEqual(3, target.hits)
+
+        hits = sorted(
+            (item.kwargs['entity'].message_id, item.kwargs['rule_id']) for item in target.notification_engine.run.await_args_list
+        )
+        self.assertEqual(
+            [(1, 'FINDER.RULE.UT_Finder_Demo'), (4, 'FINDER.RULE.UT_Finder_Demo'), (4, 'FINDER.RULE.UT_Finder_Demo_Group2')],
+            hits,
+        )
+
+        # Check Notified Entity
+        entity = [item.kwargs['entity'] for item in target.notification_engine.run.await_args_list if item.kwargs['entity'].message_id == 4][0]
+        self.assertEqual('UT-02', entity.group_name)
+        self.assertEqual('Another term2', entity.raw_text)
+        self.assertEqual('MESSAGE', entity.found_on)
+        self.assertEqual('text/plain', entity.downloaded_media_info.content_type)
+        self.assertEqual('_data/media/2/file_001.txt', entity.downloaded_media_info.disk_file_path.replace('\\', '/'))
+
+        # Only the Rule with Exporter
+        target.exporter_engine.run.assert_has_awaits([
+            mock.call(exporters=['EXPORTER.ROLLING_PANDAS.TEST_EXPORTER_001'], entity=mock.ANY, rule_id='FINDER.RULE.UT_Finder_Demo'),
+        ], any_order=True)
+        self.assertEqual(2, target.exporter_engine.run.await_count)
+        target.exporter_engine.shutdown.assert_awaited_once()
+        target.notification_engine.start.assert_called_once()
+        target.notification_engine.shutdown.assert_awaited_once()
+
+        messages: List[str] = [item.message for item in captured.records]
+        self.assertIn('\t\tHunting 2 Rules: FINDER.RULE.UT_Finder_Demo, FINDER.RULE.UT_Finder_Demo_Group2', messages)
+        self.assertTrue(messages[-1].startswith('\t\tRetro Hunt Finished: 13 Messages in '))
+        self.assertTrue(messages[-1].endswith('msg/s), 3 Hits'))
+
+    def test_run_with_notifier_engine(self):
+        """Test the Hits are Delivered by the Notifier Engine, and the Pending Notifications Flushed on Shutdown."""
+        args: Dict = {
+            'config': 'unittest_configfile.config', 'retro_hunt': True, 'rule': 'UT_Finder_Demo,FINDER.RULE.UT_Finder_Demo_Group2',
+            'limit_days': 30, 'group_id': '*',
+        }
+        data: Dict = {'internals': {'panic': False}}
+
+        notifier_mockup = mock.MagicMock()
+        notifier_mockup.run = mock.AsyncMock()
+        notifier_mockup.shutdown = mock.AsyncMock()
+
+        with mock.patch('TEx.notifier.notifier_engine.DiscordNotifier', return_value=notifier_mockup), \
+                self.assertLogs('TelegramExplorer', level=logging.INFO) as captured:
+            target: TelegramRetroHunt = self.__execute(args=args, data=data, mock_notification_engine=False)
+
+        self.assertFalse(data['internals']['panic'])
+        self.assertEqual(
+            [(1, 'FINDER.RULE.UT_Finder_Demo'), (4, 'FINDER.RULE.UT_Finder_Demo'), (4, 'FINDER.RULE.UT_Finder_Demo_Group2')],
+            sorted((item.kwargs['entity'].message_id, item.kwargs['rule_id']) for item in notifier_mockup.run.await_args_list),
+        )
+        notifier_mockup.shutdown.assert_awaited()
+        self.assertFalse(target.notification_engine.notifiers['NOTIFIER.DISCORD.NOT_002']['queue'].is_running)
+
+        messages: List[str] = [item.message for item in captured.records]
+        self.assertTrue(any(message.startswith('\t\tNOTIFIER.DISCORD.NOT_002: 3 Delivered, 0 Failed, 0 Dropped') for message in messages))
+
+    def test_run_hits_over_queue_size(self):
+        """Test the Hits are not Dropped when they Outnumber the Notifier Queue Size."""
+        args: Dict = {'config': 'unittest_configfile.config', 'retro_hunt': True, 'rule': 'UT_Finder_All_Messages', 'limit_days': 30, 'group_id': '*'}
+        data: Dict = {'internals': {'panic': False}}
+
+        self.config.read_dict({
+            'FINDER.RULE.UT_Finder_All_Messages': {'type': 'regex', 'regex': 'Message', 'groups': '1,2', 'notifier': 'NOTIFIER.DISCORD.NOT_002'},
+            'NOTIFIER.DISCORD.NOT_002': {'queue_max_size': '2', 'queue_workers': '1'},
+        })
+
+        async def slow_run(**kwargs):
+            await asyncio.sleep(0.001)
+
+        notifier_mockup = mock.MagicMock()
+        notifier_mockup.run = mock.AsyncMock(side_effect=slow_run)
+        notifier_mockup.shutdown = mock.AsyncMock()
+
+        with mock.patch('TEx.notifier.notifier_engine.DiscordNotifier', return_value=notifier_mockup):
+            target: TelegramRetroHunt = self.__execute(args=args, data=data, mock_notification_engine=False)
+
+        self.assertEqual(11, target.hits)
+        self.assertEqual(11, notifier_mockup.run.await_count)
+
+        metrics = target.notification_engine.get_metrics()['NOTIFIER.DISCORD.NOT_002']
+        self.assertEqual((11, 11, 0, 2), (metrics['enqueued'], metrics['delivered'], metrics['dropped'], metrics['max_depth']))
+
+    def test_run_unknown_rule(self):
+        """Test Unknown Rules."""
+        args: Dict = {'config': 'unittest_configfile.config', 'retro_hunt': True, 'rule': 'UT_Finder_Demo,Unknown', 'limit_days': 30, 'group_id': '*'}
+        data: Dict = {'internals': {'panic': False}}
+
+        with self.assertLogs('TelegramExplorer', level=logging.INFO) as captured:
+            self.__execute(args=args, data=data)
+
+        self.assertTrue(data['internals']['panic'])
+        self.assertEqual('Finder Rule "Unknown" not Found', captured.records[-1].message)
+
+    def test_run_disabled(self):
+        """Test Module Disabled."""
+        target: TelegramRetroHunt = TelegramRetroHunt()
+
+        with self.assertLogs('TelegramExplorer', level=logging.DEBUG) as captured:
+            asyncio.get_event_loop().run_until_complete(target.run(config=self.config, args={'retro_hunt': False}, data={}))
+
+        self.assertEqual(['\t\tModule is Not Enabled...'], [item.message for item in captured.records])
@@ -10,8 +10,9 @@ from typing import Dict
 import pytz
 
 from TEx.database import GROUPS_CACHE, USERS_CACHE
-from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramMediaDatabaseManager, \
-    TelegramMessageDatabaseManager, \
+from TEx.database.db_manager import DbManager
+from TEx.database.telegram_group_database import TelegramGroupDatabaseManager, TelegramGroupSyncStateDatabaseManager, \
+    TelegramMediaDatabaseManager, TelegramMessageDatabaseManager, \
     TelegramUserDatabaseManager
 from TEx.modules.telegram_stats_generator import TelegramStatsGenerator
 from tests.modules.common import TestsCommon
@@ -110,6 +111,13 @@ class TelegramStatsGeneratorTest(unittest.TestCase):
             'to_id': None, 'media_id': None
         })
 
+        # Add Sync State for Group 2
+        TelegramGroupSyncStateDatabaseManager.update_from_batch(
+            group_id=2, last_message_id=58, last_message_date_time=datetime.datetime.utcnow() - datetime.timedelta(hours=5),
+            batch_messages=3,
+        )
+        DbManager.SESSIONS['data'].commit()
+
     def test_run(self):
         """Test Run Method."""
 
@@ -164,3 +172,8 @@ class TelegramStatsGeneratorTest(unittest.TestCase):
         self.assertEqual('UN-b_2 \n', report_content[15])
         self.assertEqual('\tapplication/pdf                                                       : 2 entries       : 579 bytes (0.00 mbytes)\n', report_content[16])
         self.assertEqual('\tapplication/txt                                                       : 1 entries       : 999 bytes (0.00 mbytes)\n', report_content[17])
+
+        self.assertEqual('**** Sync Status for Groups ****\n', report_content[20])
+        self.assertEqual('UN-A_1 : never synced\n', report_content[21])
+        self.assertTrue(report_content[22].startswith('UN-b_2 : last message 58                 : synced at '))
+        self.assertTrue(report_content[22].endswith(' : 5.0 hours behind'))
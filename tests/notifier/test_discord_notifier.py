@@ -13,6 +13,13 @@ from tests.modules.common import TestsCommon
 from tests.modules.mockups_groups_mockup_data import channel_1_mocked
 
 
+async def delivered(**kwargs):
+    """Mocked Scheduler Send, with the Embed Delivered."""
+    delivery = asyncio.get_running_loop().create_future()
+    delivery.set_result(None)
+    return delivery
+
+
 class DiscordNotifierTest(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -23,8 +30,8 @@ class DiscordNotifierTest(unittest.TestCase):
         """Test Run Method First Time - No Duplication Detection."""
 
         # Setup Mock
-        discord_webhook_mock = mock.AsyncMock()
-        discord_webhook_mock.add_embed = mock.MagicMock()
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
 
         message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
             date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
@@ -47,7 +54,7 @@ class DiscordNotifierTest(unittest.TestCase):
         data: Dict = {}
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with mock.patch('TEx.notifier.discord_notifier.AsyncDiscordWebhook', return_value=discord_webhook_mock):
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
             # Execute Discord Notifier Configure Method
             target.configure(
                 config=self.config['NOTIFIER.DISCORD.NOT_001'],
@@ -65,9 +72,10 @@ class DiscordNotifierTest(unittest.TestCase):
                 )
             )
 
-        # Check is Embed was Added into Webhook
-        discord_webhook_mock.add_embed.assert_called_once()
-        call_arg = discord_webhook_mock.add_embed.call_args[0][0]
+        # Check is Embed was Sent to the Scheduler
+        scheduler_mock.send.assert_awaited_once()
+        call_arg = scheduler_mock.send.call_args[1]['embed']
+        self.assertEqual(scheduler_mock.send.call_args[1]['files'], {})
 
         self.assertEqual(call_arg.title, '**Channel 1972142108** (1972142108)')
         self.assertEqual(call_arg.description, 'Mocked Raw Text')
@@ -79,17 +87,55 @@ class DiscordNotifierTest(unittest.TestCase):
         self.assertEqual(call_arg.fields[3], {'inline': True, 'name': 'Group Name', 'value': 'Channel 1972142108'})
         self.assertEqual(call_arg.fields[4], {'inline': True, 'name': 'Group ID', 'value': '1972142108'})
         self.assertEqual(call_arg.fields[5], {'inline': False, 'name': 'Found On', 'value': 'UT FOUND 2'})
-        self.assertEqual(call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': 'de33f5dda9c686c64d23b8aec2eebfc7'})
+        self.assertEqual(call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': '12158b626e976631'})
+
+    def test_run_long_message(self):
+        """Test the Description is Truncated to the Discord Limit."""
+
+        # Setup Mock
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
+
+        message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
+            date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
+            raw_text='A' * 5000,
+            group_name="Channel 1972142108",
+            group_id=1972142108,
+            from_id="1234",
+            to_id=9876,
+            reply_to_msg_id=5544,
+            message_id=5975883,
+            is_reply=False,
+            downloaded_media_info=None,
+            found_on='UT FOUND'
+        )
+
+        target: DiscordNotifier = DiscordNotifier()
+        args: Dict = {
+            'config': 'unittest_configfile.config'
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
+            target.configure(
+                config=self.config['NOTIFIER.DISCORD.NOT_001'],
+                url='url.domain/path'
+            )
+
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(target.run(entity=message_entity, rule_id='RULE_UT_01', source='+15558987453'))
 
-        # Check if Webhook was Executed
-        discord_webhook_mock.execute.assert_awaited_once()
+        call_arg = scheduler_mock.send.call_args[1]['embed']
+        self.assertEqual(len(call_arg.description), 4096)
+        self.assertEqual(call_arg.description, f'{"A" * 4093}...')
 
     def test_run_duplication_control(self):
         """Test Run Method First Time - With Duplication Detection."""
 
         # Setup Mock
-        discord_webhook_mock = mock.AsyncMock()
-        discord_webhook_mock.add_embed = mock.MagicMock()
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
 
         message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
             date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
@@ -112,7 +158,7 @@ class DiscordNotifierTest(unittest.TestCase):
         data: Dict = {}
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with mock.patch('TEx.notifier.discord_notifier.AsyncDiscordWebhook', return_value=discord_webhook_mock):
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
             # Execute Discord Notifier Configure Method
             target.configure(
                 config=self.config['NOTIFIER.DISCORD.NOT_001'],
@@ -140,19 +186,15 @@ class DiscordNotifierTest(unittest.TestCase):
                 )
             )
 
-        # Check is Embed was Added into Webhook Exact 1 Time
-        discord_webhook_mock.add_embed.assert_called_once()
-
-        # Check if Webhook was Executed Exact 1 Time
-        discord_webhook_mock.execute.assert_awaited_once()
+        # Check is Embed was Sent to the Scheduler Exact 1 Time
+        scheduler_mock.send.assert_awaited_once()
 
     def test_run_with_downloaded_media_image(self):
         """Test Run Method With Downloaded Media as Image."""
 
         # Setup Mock
-        discord_webhook_mock = mock.AsyncMock()
-        discord_webhook_mock.add_embed = mock.MagicMock()
-        discord_webhook_mock.add_file = mock.MagicMock()
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
 
         message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
             date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
@@ -182,7 +224,7 @@ class DiscordNotifierTest(unittest.TestCase):
         data: Dict = {}
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with mock.patch('TEx.notifier.discord_notifier.AsyncDiscordWebhook', return_value=discord_webhook_mock):
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
             # Execute Discord Notifier Configure Method
             target.configure(
                 config=self.config['NOTIFIER.DISCORD.NOT_001'],
@@ -200,11 +242,10 @@ class DiscordNotifierTest(unittest.TestCase):
                 )
             )
 
-        # Check is Embed was Added into Webhook
-        discord_webhook_mock.add_embed.assert_called_once()
-        discord_webhook_mock.add_file.assert_called_once()
-        embed_call_arg = discord_webhook_mock.add_embed.call_args[0][0]
-        add_file_arg = discord_webhook_mock.add_file.call_args[1]
+        # Check is Embed was Sent to the Scheduler
+        scheduler_mock.send.assert_awaited_once()
+        embed_call_arg = scheduler_mock.send.call_args[1]['embed']
+        files_arg = scheduler_mock.send.call_args[1]['files']
 
         self.assertEqual(embed_call_arg.title, '**Channel 1972142108** (1972142108)')
         self.assertEqual(embed_call_arg.description, 'Mocked Raw Text')
@@ -216,23 +257,22 @@ class DiscordNotifierTest(unittest.TestCase):
         self.assertEqual(embed_call_arg.fields[3], {'inline': True, 'name': 'Group Name', 'value': 'Channel 1972142108'})
         self.assertEqual(embed_call_arg.fields[4], {'inline': True, 'name': 'Group ID', 'value': '1972142108'})
         self.assertEqual(embed_call_arg.fields[5], {'inline': False, 'name': 'Found On', 'value': 'UT FOUND 3'})
-        self.assertEqual(embed_call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': 'de33f5dda9c686c64d23b8aec2eebfc7'})
+        self.assertEqual(embed_call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': '12158b626e976631'})
 
         self.assertEqual(embed_call_arg.image['url'], 'attachment://122761750_387013276008970_8208112669996447119_n.jpg')
 
-        self.assertEqual(add_file_arg['filename'], '122761750_387013276008970_8208112669996447119_n.jpg')
-        self.assertIsNotNone(add_file_arg['file'])
+        self.assertEqual(list(files_arg.keys()), ['122761750_387013276008970_8208112669996447119_n.jpg'])
+        self.assertIsNotNone(files_arg['122761750_387013276008970_8208112669996447119_n.jpg'])
 
-        # Check if Webhook was Executed
-        discord_webhook_mock.execute.assert_awaited_once()
+        # Released after the Delivery
+        self.assertEqual(target.attachment_store.attachments['resources/122761750_387013276008970_8208112669996447119_n.jpg'].references, 0)
 
     def test_run_with_downloaded_media_video(self):
         """Test Run Method With Downloaded Media as Video."""
 
         # Setup Mock
-        discord_webhook_mock = mock.AsyncMock()
-        discord_webhook_mock.add_embed = mock.MagicMock()
-        discord_webhook_mock.add_file = mock.MagicMock()
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
 
         message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
             date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
@@ -262,7 +302,7 @@ class DiscordNotifierTest(unittest.TestCase):
         data: Dict = {}
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with mock.patch('TEx.notifier.discord_notifier.AsyncDiscordWebhook', return_value=discord_webhook_mock):
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
             # Execute Discord Notifier Configure Method
             target.configure(
                 config=self.config['NOTIFIER.DISCORD.NOT_001'],
@@ -280,11 +320,10 @@ class DiscordNotifierTest(unittest.TestCase):
                 )
             )
 
-        # Check is Embed was Added into Webhook
-        discord_webhook_mock.add_embed.assert_called_once()
-        discord_webhook_mock.add_file.assert_called_once()
-        embed_call_arg = discord_webhook_mock.add_embed.call_args[0][0]
-        add_file_arg = discord_webhook_mock.add_file.call_args[1]
+        # Check is Embed was Sent to the Scheduler
+        scheduler_mock.send.assert_awaited_once()
+        embed_call_arg = scheduler_mock.send.call_args[1]['embed']
+        files_arg = scheduler_mock.send.call_args[1]['files']
 
         self.assertEqual(embed_call_arg.title, '**Channel 1972142108** (1972142108)')
         self.assertEqual(embed_call_arg.description, 'Mocked Raw Text')
@@ -296,23 +335,19 @@ class DiscordNotifierTest(unittest.TestCase):
         self.assertEqual(embed_call_arg.fields[3], {'inline': True, 'name': 'Group Name', 'value': 'Channel 1972142108'})
         self.assertEqual(embed_call_arg.fields[4], {'inline': True, 'name': 'Group ID', 'value': '1972142108'})
         self.assertEqual(embed_call_arg.fields[5], {'inline': False, 'name': 'Found On', 'value': 'UT FOUND 4'})
-        self.assertEqual(embed_call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': 'de33f5dda9c686c64d23b8aec2eebfc7'})
+        self.assertEqual(embed_call_arg.fields[7], {'inline': False, 'name': 'Tag', 'value': '12158b626e976631'})
 
         self.assertEqual(embed_call_arg.video['url'], 'attachment://unknow.mp4')
 
-        self.assertEqual(add_file_arg['filename'], 'unknow.mp4')
-        self.assertIsNotNone(add_file_arg['file'])
-
-        # Check if Webhook was Executed
-        discord_webhook_mock.execute.assert_awaited_once()
+        self.assertEqual(list(files_arg.keys()), ['unknow.mp4'])
+        self.assertIsNotNone(files_arg['unknow.mp4'])
 
     def test_run_with_signal(self):
         """Test Run Method With Signal Input."""
 
         # Setup Mock
-        discord_webhook_mock = mock.AsyncMock()
-        discord_webhook_mock.add_embed = mock.MagicMock()
-        discord_webhook_mock.add_file = mock.MagicMock()
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
 
         message_entity: SignalNotificationEntityModel = SignalNotificationEntityModel(
             signal='INITIALIZATION',
@@ -327,7 +362,7 @@ class DiscordNotifierTest(unittest.TestCase):
         data: Dict = {}
         TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
 
-        with mock.patch('TEx.notifier.discord_notifier.AsyncDiscordWebhook', return_value=discord_webhook_mock):
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
             # Execute Discord Notifier Configure Method
             target.configure(
                 config=self.config['NOTIFIER.DISCORD.NOT_001'],
@@ -345,9 +380,9 @@ class DiscordNotifierTest(unittest.TestCase):
                 )
             )
 
-        # Check is Embed was Added into Webhook
-        discord_webhook_mock.add_embed.assert_called_once()
-        embed_call_arg = discord_webhook_mock.add_embed.call_args[0][0]
+        # Check is Embed was Sent to the Scheduler
+        scheduler_mock.send.assert_awaited_once()
+        embed_call_arg = scheduler_mock.send.call_args[1]['embed']
 
         self.assertEqual(embed_call_arg.title, 'INITIALIZATION')
         self.assertEqual(embed_call_arg.description, 'Signal Content')
@@ -355,5 +390,74 @@ class DiscordNotifierTest(unittest.TestCase):
         self.assertEqual(len(embed_call_arg.fields), 2)
         self.assertEqual(embed_call_arg.fields[0], {'inline': True, 'name': 'Source', 'value': '+15558987453'})
 
-        # Check if Webhook was Executed
-        discord_webhook_mock.execute.assert_awaited_once()
+    def test_shutdown(self):
+        """Test Shutdown Method Sends the Scheduled Embeds."""
+
+        # Setup Mock
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=delivered)
+
+        target: DiscordNotifier = DiscordNotifier()
+        args: Dict = {
+            'config': 'unittest_configfile.config'
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
+            target.configure(
+                config=self.config['NOTIFIER.DISCORD.NOT_001'],
+                url='url.domain/path'
+            )
+
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(target.shutdown())
+
+        scheduler_mock.shutdown.assert_awaited_once()
+
+    def test_run_delivery_failed(self):
+        """Test Run Method Raises when the Embed was not Sent, Allowing the Same Message to be Sent Again."""
+
+        async def failed(**kwargs):
+            delivery = asyncio.get_running_loop().create_future()
+            delivery.set_exception(ConnectionError('Unreachable'))
+            return delivery
+
+        # Setup Mock
+        scheduler_mock = mock.AsyncMock()
+        scheduler_mock.send = mock.AsyncMock(side_effect=failed)
+
+        message_entity: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
+            date_time=datetime.datetime(2023, 10, 1, 9, 58, 22),
+            raw_text="Mocked Raw Text Failed",
+            group_name="Channel 1972142108",
+            group_id=1972142108,
+            from_id="1234",
+            to_id=9876,
+            reply_to_msg_id=5544,
+            message_id=5975883,
+            is_reply=False,
+            downloaded_media_info=None,
+            found_on='UT FOUND'
+        )
+
+        target: DiscordNotifier = DiscordNotifier()
+        args: Dict = {
+            'config': 'unittest_configfile.config'
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        with mock.patch('TEx.notifier.discord_notifier.DiscordWebhookScheduler.get_instance', return_value=scheduler_mock):
+            target.configure(
+                config=self.config['NOTIFIER.DISCORD.NOT_001'],
+                url='url.domain/path'
+            )
+
+            loop = asyncio.get_event_loop()
+            for _ in range(2):
+                with self.assertRaises(ConnectionError):
+                    loop.run_until_complete(target.run(entity=message_entity, rule_id='RULE_UT_01', source='+15558987453'))
+
+        # Not Handled as Duplicated
+        self.assertEqual(2, scheduler_mock.send.await_count)
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+import httpx
+from discord_webhook import DiscordEmbed
+
+from TEx.notifier.discord_webhook_scheduler import DiscordWebhookScheduler
+
+
+class DiscordWebhookSchedulerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        DiscordWebhookScheduler.INSTANCES.clear()
+        DiscordWebhookScheduler.BUCKETS.clear()
+
+        self.requests: List[httpx.Request] = []
+        self.deliveries: List[asyncio.Future] = []
+        self.responses: List[httpx.Response] = []
+        self.unreachable: bool = False
+        self.real_client = httpx.AsyncClient
+
+    def __handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+
+        if self.unreachable:
+            raise httpx.ConnectError('Unreachable', request=request)
+
+        return self.responses.pop(0) if self.responses else httpx.Response(204)
+
+    def __run(self, items: List[Dict]) -> DiscordWebhookScheduler:
+        """Send all Items and Shutdown the Scheduler."""
+        target: DiscordWebhookScheduler = DiscordWebhookScheduler.get_instance(name='NOTIFIER.DISCORD.UT', url='https://discord.local/api/webhooks/1/token', timeout_seconds=5, max_pending=100)
+
+        async def execute() -> None:
+            for item in items:
+                self.deliveries.append(await target.send(embed=item['embed'], files=item['files']))
+            await target.shutdown()
+
+        with mock.patch(
+                'TEx.notifier.discord_webhook_scheduler.httpx.AsyncClient',
+                side_effect=lambda **kwargs: self.real_client(transport=httpx.MockTransport(self.__handler), **kwargs),
+                ):
+            asyncio.get_event_loop().run_until_complete(execute())
+
+        return target
+
+    @staticmethod
+    def __embed(ix: int) -> Dict:
+        return {'embed': DiscordEmbed(title=f'Title {ix}', description=f'Description {ix}'), 'files': {}}
+
+    def test_batching(self):
+        """Test the Embeds are Packed up to 10 per Request, Reusing the Same Session."""
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(ix) for ix in range(25)])
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual([len(json.loads(request.content)['embeds']) for request in self.requests], [10, 10, 5])
+        self.assertEqual(json.loads(self.requests[0].content)['embeds'][0]['title'], 'Title 0')
+        self.assertEqual(json.loads(self.requests[2].content)['embeds'][4]['title'], 'Title 24')
+
+        self.assertEqual(target.sent, 25)
+        self.assertEqual(target.requests, 3)
+        self.assertTrue(all(delivery.done() and delivery.exception() is None for delivery in self.deliveries))
+        self.assertEqual(target.failed, 0)
+        self.assertNotIn('https://discord.local/api/webhooks/1/token', DiscordWebhookScheduler.INSTANCES)
+
+    def test_batching_max_chars(self):
+        """Test the Embeds are Packed up to 6000 Characters per Request."""
+        items: List[Dict] = [{'embed': DiscordEmbed(title='T', description='D' * 2500), 'files': {}} for _ in range(5)]
+        self.__run(items=items)
+
+        self.assertEqual([len(json.loads(request.content)['embeds']) for request in self.requests], [2, 2, 1])
+
+    def test_attachment_sent_alone(self):
+        """Test Embeds with Attachments are Sent Alone, as Multipart."""
+        items: List[Dict] = [
+            DiscordWebhookSchedulerTest.__embed(0),
+            {'embed': DiscordEmbed(title='With File', description='Description'), 'files': {'file.jpg': b'binary content'}},
+            DiscordWebhookSchedulerTest.__embed(2),
+            DiscordWebhookSchedulerTest.__embed(3),
+            ]
+        target: DiscordWebhookScheduler = self.__run(items=items)
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(self.requests[0].headers['Content-Type'], 'application/json')
+        self.assertIn('multipart/form-data', self.requests[1].headers['Content-Type'])
+        self.assertIn(b'filename="file.jpg"', self.requests[1].content)
+        self.assertIn(b'binary content', self.requests[1].content)
+        self.assertIn(b'With File', self.requests[1].content)
+        self.assertEqual(len(json.loads(self.requests[2].content)['embeds']), 2)
+        self.assertEqual(target.sent, 4)
+
+    def test_rate_limit(self):
+        """Test the Batch is Retried when Rate Limited and the Bucket is Tracked from the Headers."""
+        self.responses = [
+            httpx.Response(429, json={'retry_after': 0.05, 'global': False}, headers={'X-RateLimit-Bucket': 'UT_BUCKET'}),
+            httpx.Response(204, headers={'X-RateLimit-Bucket': 'UT_BUCKET', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '0.05'}),
+            ]
+
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(ix) for ix in range(3)])
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[0].content, self.requests[1].content)
+        self.assertEqual(target.sent, 3)
+        self.assertEqual(target.rate_limited, 1)
+        self.assertEqual(target.failed, 0)
+
+        self.assertIn('UT_BUCKET', DiscordWebhookScheduler.BUCKETS)
+        self.assertEqual(DiscordWebhookScheduler.BUCKETS['UT_BUCKET'].remaining, 0)
+        self.assertGreater(DiscordWebhookScheduler.BUCKETS['UT_BUCKET'].get_wait_seconds(), 0)
+
+    def test_rate_limit_exhausted(self):
+        """Test the Batch is Dropped after the Max Retries."""
+        self.responses = [httpx.Response(429, headers={'Retry-After': '0.01'}) for _ in range(DiscordWebhookScheduler.MAX_RETRIES)]
+
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(0)])
+
+        self.assertEqual(len(self.requests), DiscordWebhookScheduler.MAX_RETRIES)
+        self.assertEqual(target.sent, 0)
+        self.assertEqual(target.failed, 1)
+        self.assertEqual(target.rate_limited, DiscordWebhookScheduler.MAX_RETRIES)
+        self.assertIsInstance(self.deliveries[0].exception(), httpx.HTTPStatusError)
+
+    def test_error(self):
+        """Test Failed Requests are not Retried."""
+        self.responses = [httpx.Response(400, json={'message': 'Invalid Form Body'})]
+
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(0)])
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(target.sent, 0)
+        self.assertEqual(target.failed, 1)
+        self.assertEqual([delivery.exception().response.status_code for delivery in self.deliveries], [400])
+
+    def test_error_resent_one_by_one(self):
+        """Test a Rejected Batch is Resent One Embed at a Time, so Only the Invalid Embed Fails."""
+        self.responses = [
+            httpx.Response(400, json={'message': 'Invalid Form Body'}),
+            httpx.Response(204),
+            httpx.Response(400, json={'message': 'Invalid Form Body'}),
+            httpx.Response(204),
+            ]
+
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(ix) for ix in range(3)])
+
+        self.assertEqual([len(json.loads(request.content)['embeds']) for request in self.requests], [3, 1, 1, 1])
+        self.assertEqual(json.loads(self.requests[2].content)['embeds'][0]['title'], 'Title 1')
+        self.assertEqual(target.sent, 2)
+        self.assertEqual(target.failed, 1)
+        self.assertIsNone(self.deliveries[0].exception())
+        self.assertEqual(self.deliveries[1].exception().response.status_code, 400)
+        self.assertIsNone(self.deliveries[2].exception())
+
+    def test_connection_error(self):
+        """Test the Deliveries Fail when the Webhook is Unreachable."""
+        self.unreachable = True
+        target: DiscordWebhookScheduler = self.__run(items=[DiscordWebhookSchedulerTest.__embed(ix) for ix in range(2)])
+
+        self.assertEqual(target.failed, 2)
+        self.assertTrue(all(isinstance(delivery.exception(), httpx.ConnectError) for delivery in self.deliveries))
+
+    def test_get_instance(self):
+        """Test the Scheduler is Shared by the Same Webhook URL."""
+        target_1: DiscordWebhookScheduler = DiscordWebhookScheduler.get_instance(name='A', url='https://discord.local/1', timeout_seconds=5, max_pending=10)
+        target_2: DiscordWebhookScheduler = DiscordWebhookScheduler.get_instance(name='B', url='https://discord.local/1', timeout_seconds=5, max_pending=10)
+        target_3: DiscordWebhookScheduler = DiscordWebhookScheduler.get_instance(name='C', url='https://discord.local/2', timeout_seconds=5, max_pending=10)
+
+        self.assertIs(target_1, target_2)
+        self.assertIsNot(target_1, target_3)
@@ -1,11 +1,14 @@
 import asyncio
 import datetime
+import json
 import unittest
 from configparser import ConfigParser
-from typing import Dict
+from typing import Dict, List
 from unittest import mock
 
 import pytz
+from aiohttp import web
+from elasticsearch.helpers import BulkIndexError
 
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
 from TEx.models.facade.media_handler_facade_entity import MediaHandlingEntity
@@ -298,3 +301,163 @@ class ElasticSearchNotifierTest(unittest.TestCase):
 
         self.assertEqual(submited_document, expected_document)
 
+
+    def test_run_bulk(self):
+        """Test Bulk Mode Buffer the Documents and Flush by Size, Bytes, Time and on Shutdown."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'NOTIFIER.ELASTIC_SEARCH.UT_01': {
+            'address': 'http://localhost:1', 'index_name': 'ut_index', 'pipeline_name': 'ut_pipeline',
+            'bulk_enabled': 'true', 'bulk_max_actions': '3', 'bulk_max_bytes': '1000', 'bulk_flush_interval_seconds': '0.1',
+        }})
+
+        flushed_batches: List[List[str]] = []
+
+        async def streaming_bulk_mock(client, actions, **kwargs):
+            self.assertEqual('ut_pipeline', kwargs['pipeline'])
+            flushed_batches.append([action['_source']['content'] for action in actions])
+            for action in actions:
+                if action['_source']['content'] == 'rejected':
+                    yield False, {'index': {'_index': 'ut_index', '_id': action['_id'], 'status': 400}}
+
+        target: ElasticSearchNotifier = ElasticSearchNotifier()
+        with mock.patch('TEx.notifier.elastic_search_notifier.AsyncElasticsearch', return_value=mock.AsyncMock()):
+            target.configure(config=config['NOTIFIER.ELASTIC_SEARCH.UT_01'])
+
+        async def send(content: str) -> None:
+            await target.run(
+                entity=SignalNotificationEntityModel(signal='UT', date_time=datetime.datetime(2023, 10, 1, tzinfo=pytz.UTC), content=content),
+                rule_id='SIGNALS', source='+15558987453',
+            )
+
+        async def run_test() -> None:
+            # Size Triggered. The Notifications Wait their Documents to be Sent
+            deliveries: List[asyncio.Task] = [asyncio.create_task(send(content)) for content in ['d1', 'rejected', 'd3', 'd4']]
+            await asyncio.sleep(0.01)
+            self.assertEqual([['d1', 'rejected', 'd3']], flushed_batches)
+            self.assertEqual([True, True, True, False], [delivery.done() for delivery in deliveries])
+            self.assertIsNone(deliveries[0].exception())
+            self.assertIsInstance(deliveries[1].exception(), BulkIndexError)
+
+            # Time Triggered
+            await asyncio.sleep(0.2)
+            self.assertEqual([['d1', 'rejected', 'd3'], ['d4']], flushed_batches)
+            self.assertIsNone(deliveries[3].exception())
+
+            # Bytes Triggered (the Buffer never Exceeds bulk_max_bytes)
+            deliveries = [asyncio.create_task(send('b' * 600)), asyncio.create_task(send('c' * 600))]
+            await asyncio.sleep(0.01)
+            self.assertEqual(['b' * 600], flushed_batches[2])
+
+            # Flush on Shutdown
+            await target.shutdown()
+            self.assertEqual(['c' * 600], flushed_batches[3])
+            await asyncio.gather(*deliveries)
+
+        with mock.patch('TEx.notifier.elastic_search_notifier.async_streaming_bulk', side_effect=streaming_bulk_mock):
+            asyncio.get_event_loop().run_until_complete(run_test())
+
+        self.assertEqual((4, 5, 1), (target.bulk_flushes, target.bulk_indexed, target.bulk_rejected))
+        target.client.index.assert_not_awaited()
+        target.client.close.assert_awaited_once()
+
+    def test_run_bulk_failed(self):
+        """Test the Notifications Fail when the Bulk Request Fails."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'NOTIFIER.ELASTIC_SEARCH.UT_01': {
+            'address': 'http://localhost:1', 'index_name': 'ut_index', 'pipeline_name': 'ut_pipeline',
+            'bulk_enabled': 'true', 'bulk_max_actions': '2',
+        }})
+
+        async def streaming_bulk_mock(client, actions, **kwargs):
+            if actions:
+                raise ConnectionError('UT Unreachable')
+            yield False, {}
+
+        target: ElasticSearchNotifier = ElasticSearchNotifier()
+        with mock.patch('TEx.notifier.elastic_search_notifier.AsyncElasticsearch', return_value=mock.AsyncMock()):
+            target.configure(config=config['NOTIFIER.ELASTIC_SEARCH.UT_01'])
+
+        async def run_test() -> List:
+            return await asyncio.gather(*[
+                target.run(
+                    entity=SignalNotificationEntityModel(signal='UT', date_time=datetime.datetime(2023, 10, 1, tzinfo=pytz.UTC), content=content),
+                    rule_id='SIGNALS', source='+15558987453',
+                )
+                for content in ['d1', 'd2']
+            ], return_exceptions=True)
+
+        with mock.patch('TEx.notifier.elastic_search_notifier.async_streaming_bulk', side_effect=streaming_bulk_mock):
+            results: List = asyncio.get_event_loop().run_until_complete(run_test())
+
+        self.assertEqual([ConnectionError, ConnectionError], [type(result) for result in results])
+
+    def test_run_bulk_with_local_server(self):
+        """Test Bulk Mode Against a Local Stand-in Server. Items Rejected with 429 are Retried, Other Failures are Counted."""
+        requests: List[List[Dict]] = []
+        query_strings: List[Dict] = []
+
+        async def bulk_handler(request: web.Request) -> web.Response:
+            lines: List[Dict] = [json.loads(line) for line in (await request.text()).splitlines() if line]
+            documents: List[Dict] = lines[1::2]
+            requests.append(documents)
+            query_strings.append(dict(request.query))
+
+            items: List[Dict] = []
+            for action, document in zip(lines[0::2], documents):
+                document_id: str = action['index']['_id']
+                if document['content'] == 'bad':
+                    items.append({'index': {'_index': 'ut_index', '_id': document_id, 'status': 400, 'error': {'type': 'mapper_parsing_exception'}}})
+                elif document['content'] == 'busy' and len(requests) == 1:
+                    items.append({'index': {'_index': 'ut_index', '_id': document_id, 'status': 429, 'error': {'type': 'es_rejected_execution_exception'}}})
+                else:
+                    items.append({'index': {'_index': 'ut_index', '_id': document_id, 'status': 201}})
+
+            return web.json_response(
+                {'took': 1, 'errors': any(item['index']['status'] > 299 for item in items), 'items': items},
+                headers={'X-Elastic-Product': 'Elasticsearch'},
+            )
+
+        async def run_test() -> None:
+            app: web.Application = web.Application()
+            app.router.add_route('*', '/_bulk', bulk_handler)
+            runner: web.AppRunner = web.AppRunner(app)
+            await runner.setup()
+            site: web.TCPSite = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port: int = site._server.sockets[0].getsockname()[1]
+
+            try:
+                config: ConfigParser = ConfigParser()
+                config.read_dict({'NOTIFIER.ELASTIC_SEARCH.UT_01': {
+                    'address': f'http://127.0.0.1:{port}', 'index_name': 'ut_index', 'pipeline_name': 'ut_pipeline',
+                    'bulk_enabled': 'true', 'bulk_max_actions': '10', 'bulk_retry_backoff_seconds': '0.01',
+                }})
+
+                target: ElasticSearchNotifier = ElasticSearchNotifier()
+                target.configure(config=config['NOTIFIER.ELASTIC_SEARCH.UT_01'])
+
+                deliveries: List[asyncio.Task] = [
+                    asyncio.create_task(target.run(
+                        entity=SignalNotificationEntityModel(signal='UT', date_time=datetime.datetime(2023, 10, 1, tzinfo=pytz.UTC), content=content),
+                        rule_id='SIGNALS', source='+15558987453',
+                    ))
+                    for content in ['ok 1', 'busy', 'bad', 'ok 2']
+                ]
+                await asyncio.sleep(0.01)
+
+                await target.shutdown()
+                results: List = await asyncio.gather(*deliveries, return_exceptions=True)
+
+                # Only the Document Rejected for Other Reason than 429 Fails
+                self.assertEqual([None, None, BulkIndexError, None], [type(result) if result else None for result in results])
+
+            finally:
+                await runner.cleanup()
+
+            self.assertEqual((1, 3, 1), (target.bulk_flushes, target.bulk_indexed, target.bulk_rejected))
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+
+        # Only the Item Rejected with 429 was Retried
+        self.assertEqual([['ok 1', 'busy', 'bad', 'ok 2'], ['busy']], [[document['content'] for document in documents] for documents in requests])
+        self.assertEqual('ut_pipeline', query_strings[0]['pipeline'])
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from configparser import ConfigParser
+from typing import List, Optional
+
+from TEx.notifier.notification_attachment_store import NotificationAttachmentStore
+
+
+class NotificationAttachmentStoreTest(unittest.TestCase):
+
+    IMAGE_PATH: str = 'resources/122761750_387013276008970_8208112669996447119_n.jpg'
+    APK_PATH: str = 'resources/demo.apk'
+
+    def test_configure(self):
+        """Test Configure Method."""
+        target: NotificationAttachmentStore = NotificationAttachmentStore()
+        target.configure(config=ConfigParser())
+        self.assertEqual(64 * 1024 * 1024, target.max_memory_bytes)
+
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'NOTIFICATION_ATTACHMENTS': {'max_memory_mb': '0.5'}})
+        target.configure(config=config)
+        self.assertEqual(512 * 1024, target.max_memory_bytes)
+
+    def test_shared_read(self):
+        """Test the File is Read Once for Concurrent and Later Uploads."""
+        target: NotificationAttachmentStore = NotificationAttachmentStore()
+
+        async def execute() -> List[Optional[bytes]]:
+            contents: List[Optional[bytes]] = list(await asyncio.gather(*[target.acquire(path=self.IMAGE_PATH, size_bytes=1520) for _ in range(5)]))
+            for _ in range(5):
+                target.release(path=self.IMAGE_PATH)
+
+            # Released Content is Kept for the Next Uploads
+            contents.append(await target.acquire(path=self.IMAGE_PATH, size_bytes=1520))
+            target.release(path=self.IMAGE_PATH)
+            return contents
+
+        contents: List[Optional[bytes]] = asyncio.get_event_loop().run_until_complete(execute())
+
+        with open(self.IMAGE_PATH, 'rb') as file:
+            expected: bytes = file.read()
+
+        self.assertTrue(all(content is contents[0] for content in contents))
+        self.assertEqual(expected, contents[0])
+        self.assertEqual(1, target.total_reads)
+        self.assertEqual(5, target.total_shared)
+        self.assertEqual(0, target.attachments[self.IMAGE_PATH].references)
+        self.assertEqual(len(expected), target.used_memory_bytes)  # Real Size Tracked
+
+    def test_missing_file(self):
+        """Test Missing Files Return None and are not Kept."""
+        target: NotificationAttachmentStore = NotificationAttachmentStore()
+
+        content: Optional[bytes] = asyncio.get_event_loop().run_until_complete(target.acquire(path='resources/missing.jpg', size_bytes=1000))
+
+        self.assertIsNone(content)
+        self.assertEqual({}, dict(target.attachments))
+        self.assertEqual(0, target.used_memory_bytes)
+
+    def test_memory_cap(self):
+        """Test the Uploads Wait for the Memory, and the Released Contents are Evicted."""
+        target: NotificationAttachmentStore = NotificationAttachmentStore()
+        target.max_memory_bytes = 530000
+        events: List[str] = []
+
+        async def upload(path: str, size_bytes: int, hold_seconds: float) -> None:
+            await target.acquire(path=path, size_bytes=size_bytes)
+            events.append(f'acquired {path}')
+            await asyncio.sleep(hold_seconds)
+            target.release(path=path)
+            events.append(f'released {path}')
+
+        async def execute() -> None:
+            await asyncio.gather(
+                upload(path=self.APK_PATH, size_bytes=524288, hold_seconds=0.05),
+                upload(path=self.IMAGE_PATH, size_bytes=23359, hold_seconds=0),
+                )
+
+        asyncio.get_event_loop().run_until_complete(execute())
+
+        self.assertEqual([f'acquired {self.APK_PATH}', f'released {self.APK_PATH}', f'acquired {self.IMAGE_PATH}', f'released {self.IMAGE_PATH}'], events)
+        self.assertEqual([self.IMAGE_PATH], list(target.attachments.keys()))
+        self.assertEqual(23359, target.used_memory_bytes)
+
+    def test_single_attachment_over_cap(self):
+        """Test a Single Attachment Bigger than the Memory Cap is Allowed."""
+        target: NotificationAttachmentStore = NotificationAttachmentStore()
+        target.max_memory_bytes = 1000
+
+        content: Optional[bytes] = asyncio.get_event_loop().run_until_complete(target.acquire(path=self.APK_PATH, size_bytes=524288))
+
+        self.assertEqual(524288, len(content))
@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from configparser import ConfigParser
+
+from TEx.notifier.discord_notifier import DiscordNotifier
+from TEx.notifier.notification_dedup_store import NotificationDedupStore
+
+
+class NotificationDedupStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir: str = tempfile.mkdtemp()
+
+        self.config = ConfigParser()
+        self.config.read_dict({
+            'CONFIGURATION': {'data_path': self.temp_dir},
+            'NOTIFICATION_DEDUP': {'memory_budget_mb': '1'},
+            'NOTIFIER.DISCORD.UT_01': {'webhook': 'https://mocked/01', 'prevent_duplication_for_minutes': '10'},
+            'NOTIFIER.DISCORD.UT_02': {'webhook': 'https://mocked/02', 'prevent_duplication_for_minutes': '10'},
+        })
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_configure(self):
+        """Test Configure Method."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        target.configure(config=self.config)
+
+        self.assertEqual(int(1024 * 1024 / NotificationDedupStore.ENTRY_SIZE_BYTES), target.max_entries)
+        self.assertEqual(os.path.join(self.temp_dir, 'notification_dedup.bin'), target.snapshot_file)
+        self.assertEqual(300, target.snapshot_interval_seconds)
+
+    def test_check_and_add(self):
+        """Test the Entries are Kept by Namespace."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        tag: int = NotificationDedupStore.get_tag(message='Mocked Message')
+        namespace_1: int = NotificationDedupStore.get_namespace(name='NOTIFIER.DISCORD.UT_01')
+        namespace_2: int = NotificationDedupStore.get_namespace(name='NOTIFIER.DISCORD.UT_02')
+
+        self.assertEqual(tag, NotificationDedupStore.get_tag(message='Mocked Message'))
+        self.assertFalse(target.check_and_add(namespace=namespace_1, tag=tag, ttl_seconds=60))
+        self.assertTrue(target.check_and_add(namespace=namespace_1, tag=tag, ttl_seconds=60))
+        self.assertFalse(target.check_and_add(namespace=namespace_2, tag=tag, ttl_seconds=60))
+
+        # Removed
+        target.remove(namespace=namespace_1, tag=tag)
+        self.assertFalse(target.check_and_add(namespace=namespace_1, tag=tag, ttl_seconds=60))
+
+        # Disabled
+        self.assertFalse(target.check_and_add(namespace=namespace_1, tag=tag, ttl_seconds=0))
+
+        # Expired
+        target.entries[(namespace_2 ^ tag)] = int(time.time()) - 1
+        self.assertFalse(target.check_and_add(namespace=namespace_2, tag=tag, ttl_seconds=60))
+
+    def test_memory_budget(self):
+        """Test the Oldest Entries are Evicted when the Memory Budget is Reached."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        target.max_entries = 3
+
+        for ix in range(5):
+            target.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message=f'Message {ix}'), ttl_seconds=60)
+
+        self.assertEqual(3, len(target))
+        self.assertEqual(2, target.evicted)
+        self.assertFalse(target.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message='Message 0'), ttl_seconds=60))
+        self.assertTrue(target.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message='Message 4'), ttl_seconds=60))
+
+    def test_snapshot_and_load(self):
+        """Test the Entries Survive a Restart, Except the Expired Ones."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        target.configure(config=self.config)
+
+        for ix in range(10):
+            target.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message=f'Message {ix}'), ttl_seconds=60)
+        target.entries[NotificationDedupStore.get_tag(message='Message 0')] = int(time.time()) - 1
+
+        self.assertEqual(9, target.snapshot())
+        self.assertFalse(os.path.exists(f'{target.snapshot_file}.tmp'))
+
+        restarted: NotificationDedupStore = NotificationDedupStore()
+        restarted.configure(config=self.config)
+        self.assertEqual(9, restarted.load())
+
+        self.assertFalse(restarted.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message='Message 0'), ttl_seconds=60))
+        self.assertTrue(restarted.check_and_add(namespace=0, tag=NotificationDedupStore.get_tag(message='Message 9'), ttl_seconds=60))
+
+    def test_load_invalid_snapshot(self):
+        """Test an Invalid or Missing Snapshot is Ignored."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        target.configure(config=self.config)
+        self.assertEqual(0, target.load())
+
+        with open(target.snapshot_file, 'wb') as file:
+            file.write(b'INVALID')
+
+        with self.assertLogs() as captured:
+            self.assertEqual(0, target.load())
+
+        self.assertIn('Unable to Load the Notification Deduplication Snapshot', captured.records[0].message)
+
+    def test_shared_by_notifiers(self):
+        """Test the Notifiers Share the Store, Keeping their own Entries."""
+        target: NotificationDedupStore = NotificationDedupStore()
+        target.configure(config=self.config)
+
+        notifier_1: DiscordNotifier = DiscordNotifier()
+        notifier_1.configure(url='https://mocked/01', config=self.config['NOTIFIER.DISCORD.UT_01'], dedup_store=target)
+        notifier_2: DiscordNotifier = DiscordNotifier()
+        notifier_2.configure(url='https://mocked/02', config=self.config['NOTIFIER.DISCORD.UT_02'], dedup_store=target)
+
+        self.assertEqual((False, '12158b626e976631'), notifier_1.check_is_duplicated(message='Mocked Raw Text'))
+        self.assertEqual((True, '12158b626e976631'), notifier_1.check_is_duplicated(message='Mocked Raw Text'))
+        self.assertEqual((False, '12158b626e976631'), notifier_2.check_is_duplicated(message='Mocked Raw Text'))
+        self.assertEqual(2, len(target))
+
+        notifier_1.release_duplication_tag(tag='12158b626e976631')
+        self.assertEqual(1, len(target))
+
+        # Tag Computed by the Notifier Engine
+        self.assertEqual(
+            (True, '12158b626e976631'),
+            notifier_2.check_is_duplicated(message='Mocked Raw Text', tag=NotificationDedupStore.get_tag(message='Mocked Raw Text')),
+        )
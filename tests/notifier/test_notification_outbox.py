@@ -0,0 +1,157 @@
+import time
+import unittest
+from configparser import ConfigParser
+from datetime import datetime
+from typing import Dict, List
+from unittest import mock
+
+from sqlalchemy import delete, update
+
+from TEx.database.db_manager import DbManager
+from TEx.models.database.temp_db_models import NotificationOutboxOrmEntity
+from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
+from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.notification_outbox import NotificationOutbox
+from tests.modules.common import TestsCommon
+
+
+class NotificationOutboxTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        TestsCommon.basic_test_setup()
+        DbManager.SESSIONS['temp'].execute(delete(NotificationOutboxOrmEntity))
+        DbManager.SESSIONS['temp'].commit()
+
+        self.config = ConfigParser()
+        self.config.read_dict({'NOTIFICATION_OUTBOX': {'enabled': 'true', 'write_batch_size': '3', 'max_attempts': '3', 'retry_initial_backoff_seconds': '10'}})
+
+        self.signal: SignalNotificationEntityModel = SignalNotificationEntityModel(signal='UT', date_time=datetime(2023, 10, 1), content='UT Content')
+        self.message: FinderNotificationMessageEntity = FinderNotificationMessageEntity(
+            date_time=datetime(2023, 10, 1, 9, 58, 22),
+            raw_text='Mocked Raw Text',
+            group_name='Channel 1972142108',
+            group_id=1972142108,
+            from_id=1234,
+            to_id=9876,
+            reply_to_msg_id=5544,
+            message_id=55,
+            is_reply=False,
+            downloaded_media_info=None,
+            found_on='UT FOUND',
+        )
+
+    def test_configure(self):
+        """Test Configure Method."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=ConfigParser())
+        self.assertFalse(target.enabled)
+
+        target.configure(config=self.config)
+        self.assertTrue(target.enabled)
+        self.assertEqual(3, target.write_batch_size)
+        self.assertEqual(3, target.max_attempts)
+        self.assertEqual(10, target.retry_initial_backoff_seconds)
+
+    def test_batched_writes(self):
+        """Test the Writes are Buffered, and Notifications Delivered Before the Write never Touch the Disk."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=self.config)
+
+        entry_1: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.message, rule_id='RULE_UT', source='+15558987453')
+        entry_2: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.signal, rule_id='', source='+15558987453')
+        self.assertFalse(target.is_flush_due())
+
+        # Delivered Before the Write
+        target.ack(entry_id=entry_1)
+        self.assertEqual(1, target.pending_writes)
+
+        self.assertEqual(1, target.flush())
+        self.assertEqual(1, target.total_batches)
+        self.assertEqual(1, target.count())
+
+        target.ack(entry_id=entry_2)
+        self.assertEqual(0, target.count())
+
+    def test_flush_failed(self):
+        """Test the Buffered Writes are Kept when the Transaction Fails, and Written by the Next Flush."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=self.config)
+
+        entry_1: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.message, rule_id='RULE_UT', source='+15558987453')
+        entry_2: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.signal, rule_id='', source='+15558987453')
+        target.flush()
+
+        entry_3: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.signal, rule_id='', source='+15558987453')
+        target.retry(entry_id=entry_1)
+        target.ack(entry_id=entry_2)
+
+        with mock.patch.object(DbManager.SESSIONS['temp'], 'commit', side_effect=Exception('database is locked')):
+            with self.assertRaises(Exception):
+                target.flush()
+
+        self.assertEqual(3, target.pending_writes)
+        self.assertEqual(1, target.failed_batches)
+
+        self.assertEqual(3, target.flush())
+        self.assertEqual(
+            sorted([(entry_1, 1), (entry_3, 0)]),
+            sorted((item.id, item.attempts) for item in DbManager.SESSIONS['temp'].query(NotificationOutboxOrmEntity).all()),
+        )
+
+    def test_retry_and_restart(self):
+        """Test the Failed Notifications are Retried with Backoff, Including after a Restart."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=self.config)
+
+        entry_1: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.message, rule_id='RULE_UT', source='+15558987453')
+        entry_2: str = target.add(notifier='NOTIFIER.ELASTIC_SEARCH.UT', entity=self.signal, rule_id='', source='+15558987453')
+        target.flush()
+
+        # In Flight Notifications are not Dispatched Again
+        self.assertEqual([], target.get_due())
+
+        target.retry(entry_id=entry_1)
+        self.assertEqual(1, target.retried)
+        self.assertEqual([], target.get_due())  # Waiting the Backoff
+
+        # Restart, with entry_2 Never Delivered
+        restarted: NotificationOutbox = NotificationOutbox()
+        restarted.configure(config=self.config)
+
+        due: List[Dict] = restarted.get_due()
+        self.assertEqual([entry_2], [item['id'] for item in due])
+        self.assertEqual('NOTIFIER.ELASTIC_SEARCH.UT', due[0]['notifier'])
+        self.assertEqual(self.signal, due[0]['entity'])
+
+        # Backoff Expired
+        DbManager.SESSIONS['temp'].execute(update(NotificationOutboxOrmEntity).values(next_attempt_at=int(time.time()) - 1))
+        DbManager.SESSIONS['temp'].commit()
+
+        due = restarted.get_due()
+        self.assertEqual([entry_1], [item['id'] for item in due])
+        self.assertEqual(self.message, due[0]['entity'])
+        self.assertEqual('RULE_UT', due[0]['rule_id'])
+        self.assertEqual(1, restarted.in_flight[entry_1])
+
+    def test_retry_max_attempts(self):
+        """Test the Notification is Discarded after the Max Attempts."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=self.config)
+
+        entry_id: str = target.add(notifier='NOTIFIER.DISCORD.UT', entity=self.signal, rule_id='', source='+15558987453')
+
+        for attempt in range(3):
+            target.in_flight[entry_id] = attempt
+            target.retry(entry_id=entry_id)
+
+        self.assertEqual(2, target.retried)
+        self.assertEqual(1, target.discarded)
+        self.assertEqual(0, target.count())
+
+    def test_get_backoff_seconds(self):
+        """Test the Exponential Backoff."""
+        target: NotificationOutbox = NotificationOutbox()
+        target.configure(config=self.config)
+
+        self.assertEqual([10, 20, 40, 80], [target.get_backoff_seconds(attempts=attempts) for attempts in range(1, 5)])
+        self.assertEqual(600, target.get_backoff_seconds(attempts=20))
@@ -0,0 +1,34 @@
+import asyncio
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.notifier_delivery_queue import NotifierDeliveryQueue
+
+
+class NotifierDeliveryQueueTest(unittest.TestCase):
+
+    def test_failed_delivery(self):
+        """Test Failed Deliveries are Counted and does not Stop the Worker."""
+        notifier_mockup = mock.MagicMock()
+        notifier_mockup.run = mock.AsyncMock(side_effect=[Exception('UT'), None])
+
+        target: NotifierDeliveryQueue = NotifierDeliveryQueue(name='NOTIFIER.UT', notifier=notifier_mockup, max_size=10, workers=1)
+        entity: SignalNotificationEntityModel = SignalNotificationEntityModel(signal='UT', date_time=datetime(2023, 10, 1), content='UT')
+
+        async def run_test() -> None:
+            self.assertTrue(target.put(entity=entity, rule_id='UT', source='+15558987453'))
+            self.assertTrue(target.put(entity=entity, rule_id='UT', source='+15558987453'))
+            await target.join()
+            await target.stop()
+
+        with self.assertLogs() as captured:
+            asyncio.get_event_loop().run_until_complete(run_test())
+
+        self.assertEqual('Unable to Send Notification on "NOTIFIER.UT"', captured.records[0].message)
+        self.assertEqual(
+            {'depth': 0, 'max_depth': 2, 'max_size': 10, 'enqueued': 2, 'delivered': 1, 'failed': 1, 'dropped': 0},
+            {key: value for key, value in target.get_metrics().items() if not key.endswith('latency_ms')},
+        )
+        self.assertFalse(target.is_running)
@@ -6,7 +6,13 @@ from typing import Dict
 from unittest import mock
 from unittest.mock import call
 
+from sqlalchemy import delete
+
+from TEx.database.db_manager import DbManager
+from TEx.models.database.temp_db_models import NotificationOutboxOrmEntity
 from TEx.models.facade.finder_notification_facade_entity import FinderNotificationMessageEntity
+from TEx.models.facade.signal_notification_model import SignalNotificationEntityModel
+from TEx.notifier.notification_dedup_store import NotificationDedupStore
 from TEx.notifier.notifier_engine import NotifierEngine
 from tests.modules.common import TestsCommon
 from tests.modules.mockups_groups_mockup_data import base_messages_mockup_data
@@ -27,6 +33,7 @@ class NotifierEngineTest(unittest.TestCase):
 
         elastic_notifier_mockup = mock.AsyncMock()
         elastic_notifier_mockup.run = mock.AsyncMock()
+        elastic_notifier_mockup.bulk_enabled = False
 
         target: NotifierEngine = NotifierEngine()
         args: Dict = {
@@ -70,11 +77,193 @@ class NotifierEngineTest(unittest.TestCase):
                     )
                 )
 
+                # Notifications are Delivered in Background
+                self.assertTrue(loop.run_until_complete(target.shutdown(timeout_seconds=5)))
+
+                # Deduplication Tag Computed Once for all Notifiers
+                delivered_entity = message_entity.model_copy(update={'dedup_tag': NotificationDedupStore.get_tag(message='Mocked Raw Text')})
+
                 discord_notifier_mockup.run.assert_has_awaits([
-                    call(entity=message_entity, rule_id='RULE_UT_01', source='+15558987453'),
-                    call(entity=message_entity, rule_id='RULE_UT_01', source='+15558987453')
+                    call(entity=delivered_entity, rule_id='RULE_UT_01', source='+15558987453'),
+                    call(entity=delivered_entity, rule_id='RULE_UT_01', source='+15558987453')
                 ])
 
                 elastic_notifier_mockup.run.assert_has_awaits([
-                    call(entity=message_entity, rule_id='RULE_UT_01', source='+15558987453')
+                    call(entity=delivered_entity, rule_id='RULE_UT_01', source='+15558987453')
                 ])
+                self.assertIsNone(message_entity.dedup_tag)
+                self.assertNotIn('dedup_tag', delivered_entity.model_dump_json())
+
+    def test_run_slow_notifier(self):
+        """Test a Slow Notifier does not Block the Caller nor the Other Notifiers, and the Pending Notifications are Flushed on Shutdown."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'NOTIFIER.DISCORD.SLOW': {'webhook': 'https://mocked', 'queue_max_size': '2', 'queue_workers': '1'},
+            'NOTIFIER.ELASTIC_SEARCH.FAST': {'address': 'https://mocked'},
+        })
+
+        release: asyncio.Event
+
+        async def slow_run(**kwargs):
+            await release.wait()
+
+        slow_notifier_mockup = mock.AsyncMock()
+        slow_notifier_mockup.run = mock.AsyncMock(side_effect=slow_run)
+        fast_notifier_mockup = mock.AsyncMock()
+        fast_notifier_mockup.run = mock.AsyncMock()
+        fast_notifier_mockup.bulk_enabled = False
+
+        target: NotifierEngine = NotifierEngine()
+        with mock.patch('TEx.notifier.notifier_engine.DiscordNotifier', return_value=slow_notifier_mockup), \
+                mock.patch('TEx.notifier.notifier_engine.ElasticSearchNotifier', return_value=fast_notifier_mockup):
+            target.configure(config=config)
+
+        async def run_test() -> None:
+            nonlocal release
+            release = asyncio.Event()
+            entity: SignalNotificationEntityModel = SignalNotificationEntityModel(signal='UT', date_time=datetime(2023, 10, 1), content='UT')
+
+            for ix in range(4):
+                # The Caller Change the Entity After the Enqueue
+                entity.content = f'UT {ix}'
+                await asyncio.wait_for(
+                    target.run(notifiers=['NOTIFIER.DISCORD.SLOW', 'NOTIFIER.ELASTIC_SEARCH.FAST'], entity=entity, rule_id='UT', source='+15558987453'),
+                    timeout=1,
+                )
+
+            await asyncio.sleep(0.01)
+            self.assertEqual(4, fast_notifier_mockup.run.await_count)
+
+            # Slow Queue Holds 1 Running and 2 Pending Notifications. The Last one is Dropped
+            metrics = target.get_metrics()['NOTIFIER.DISCORD.SLOW']
+            self.assertEqual((2, 1, 3), (metrics['depth'], metrics['dropped'], metrics['enqueued']))
+            self.assertIn('NOTIFIER.DISCORD.SLOW: 0 Delivered, 0 Failed, 1 Dropped, Depth 2/2 (Max 2)', target.get_summary())
+
+            release.set()
+            self.assertTrue(await target.shutdown(timeout_seconds=5))
+
+        asyncio.get_event_loop().run_until_complete(run_test())
+
+        self.assertEqual(
+            ['UT 0', 'UT 1', 'UT 2'],
+            [item.kwargs['entity'].content for item in slow_notifier_mockup.run.await_args_list],
+        )
+        self.assertEqual(
+            ['UT 0', 'UT 1', 'UT 2', 'UT 3'],
+            [item.kwargs['entity'].content for item in fast_notifier_mockup.run.await_args_list],
+        )
+        metrics = target.get_metrics()['NOTIFIER.DISCORD.SLOW']
+        self.assertEqual((0, 3, 0, 1), (metrics['depth'], metrics['delivered'], metrics['failed'], metrics['dropped']))
+        self.assertGreater(metrics['max_latency_ms'], 0)
+
+    def test_shutdown_timeout(self):
+        """Test the Shutdown Discard the Pending Notifications when the Deadline is Reached."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({'NOTIFIER.DISCORD.STUCK': {'webhook': 'https://mocked', 'queue_workers': '1'}})
+
+        async def stuck_run(**kwargs):
+            await asyncio.sleep(60)
+
+        stuck_notifier_mockup = mock.AsyncMock()
+        stuck_notifier_mockup.run = mock.AsyncMock(side_effect=stuck_run)
+
+        target: NotifierEngine = NotifierEngine()
+        with mock.patch('TEx.notifier.notifier_engine.DiscordNotifier', return_value=stuck_notifier_mockup):
+            target.configure(config=config)
+
+        entity: SignalNotificationEntityModel = SignalNotificationEntityModel(signal='UT', date_time=datetime(2023, 10, 1), content='UT')
+
+        async def run_test() -> bool:
+            await target.run(notifiers=['NOTIFIER.DISCORD.STUCK'], entity=entity, rule_id='UT', source='+15558987453')
+            await target.run(notifiers=['NOTIFIER.DISCORD.STUCK'], entity=entity, rule_id='UT', source='+15558987453')
+            return await target.shutdown(timeout_seconds=0.1)
+
+        with self.assertLogs() as captured:
+            self.assertFalse(asyncio.get_event_loop().run_until_complete(run_test()))
+
+        self.assertIn('\t\tNotifications Flush Timeout Reached. 1 Notifications Discarded.', [record.message for record in captured.records])
+        self.assertFalse(target.notifiers['NOTIFIER.DISCORD.STUCK']['queue'].is_running)
+
+    def test_bulk_queue_workers(self):
+        """Test the Elastic Search Bulk Mode Queue has one Sender per Bulk Action by Default."""
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'NOTIFIER.ELASTIC_SEARCH.BULK': {'address': 'https://mocked'},
+            'NOTIFIER.ELASTIC_SEARCH.BULK_CUSTOM': {'address': 'https://mocked', 'queue_workers': '4'},
+        })
+
+        notifier_mockup = mock.MagicMock()
+        notifier_mockup.bulk_enabled = True
+        notifier_mockup.bulk_max_actions = 50
+
+        target: NotifierEngine = NotifierEngine()
+        with mock.patch('TEx.notifier.notifier_engine.ElasticSearchNotifier', return_value=notifier_mockup):
+            target.configure(config=config)
+
+        self.assertEqual(50, target.notifiers['NOTIFIER.ELASTIC_SEARCH.BULK']['queue'].workers)
+        self.assertEqual(4, target.notifiers['NOTIFIER.ELASTIC_SEARCH.BULK_CUSTOM']['queue'].workers)
+
+    def test_shutdown_not_started(self):
+        """Test the Shutdown without any Notification Sent."""
+        target: NotifierEngine = NotifierEngine()
+        self.assertTrue(asyncio.get_event_loop().run_until_complete(target.shutdown()))
+        self.assertIsNone(target.get_summary())
+
+    def test_outbox(self):
+        """Test the Failed Notifications are Retried from the Outbox, Including after a Restart."""
+        TestsCommon.basic_test_setup()
+        DbManager.SESSIONS['temp'].execute(delete(NotificationOutboxOrmEntity))
+        DbManager.SESSIONS['temp'].commit()
+
+        config: ConfigParser = ConfigParser()
+        config.read_dict({
+            'NOTIFIER.ELASTIC_SEARCH.FLAKY': {'address': 'https://mocked'},
+            'NOTIFICATION_OUTBOX': {'enabled': 'true', 'dispatch_interval_seconds': '0.1', 'write_max_delay_ms': '10', 'retry_initial_backoff_seconds': '1'},
+        })
+        entity: SignalNotificationEntityModel = SignalNotificationEntityModel(signal='UT', date_time=datetime(2023, 10, 1), content='UT')
+
+        async def wait_await_count(notifier_mockup: mock.AsyncMock, count: int) -> None:
+            for _ in range(100):
+                if notifier_mockup.run.await_count >= count:
+                    return
+                await asyncio.sleep(0.05)
+
+        def build_engine(notifier_mockup: mock.AsyncMock) -> NotifierEngine:
+            engine: NotifierEngine = NotifierEngine()
+            notifier_mockup.bulk_enabled = False
+            with mock.patch('TEx.notifier.notifier_engine.ElasticSearchNotifier', return_value=notifier_mockup):
+                engine.configure(config=config)
+            return engine
+
+        # Unreachable Notifier. The Notification is Kept on the Outbox
+        unreachable_notifier_mockup = mock.AsyncMock()
+        unreachable_notifier_mockup.run = mock.AsyncMock(side_effect=ConnectionError('Unreachable'))
+        target: NotifierEngine = build_engine(notifier_mockup=unreachable_notifier_mockup)
+
+        async def run_unreachable() -> None:
+            target.start()
+            await target.run(notifiers=['NOTIFIER.ELASTIC_SEARCH.FLAKY'], entity=entity, rule_id='UT', source='+15558987453')
+            await wait_await_count(notifier_mockup=unreachable_notifier_mockup, count=2)
+            self.assertTrue(await target.shutdown(timeout_seconds=5))
+
+        with self.assertLogs() as captured:
+            asyncio.get_event_loop().run_until_complete(run_unreachable())
+
+        self.assertEqual(2, unreachable_notifier_mockup.run.await_count)
+        self.assertEqual(2, target.outbox.retried)
+        self.assertIn('\t\t1 Notifications Kept on the Outbox, to be Sent on the Next Execution', [record.message for record in captured.records])
+
+        # Restart. The Notification is Sent
+        notifier_mockup = mock.AsyncMock()
+        notifier_mockup.run = mock.AsyncMock()
+        target = build_engine(notifier_mockup=notifier_mockup)
+
+        async def run_restarted() -> None:
+            target.start()
+            await wait_await_count(notifier_mockup=notifier_mockup, count=1)
+            self.assertTrue(await target.shutdown(timeout_seconds=5))
+
+        asyncio.get_event_loop().run_until_complete(run_restarted())
+
+        notifier_mockup.run.assert_awaited_once_with(entity=entity, rule_id='UT', source='+15558987453')
+        self.assertEqual(0, target.outbox.count())
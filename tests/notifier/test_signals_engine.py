@@ -42,6 +42,7 @@ class SignalsEngineFactoryTest(unittest.TestCase):
         self.assertEqual(['NOTIFIER.ELASTIC_SEARCH.UT_01'], h_result.signal_entity.notifiers['INITIALIZATION'])
         self.assertEqual(['NOTIFIER.DISCORD.NOT_001', 'NOTIFIER.ELASTIC_SEARCH.UT_01'], h_result.signal_entity.notifiers['SHUTDOWN'])
         self.assertEqual(['NOTIFIER.ELASTIC_SEARCH.UT_01', 'NOTIFIER.DISCORD.NOT_001'], h_result.signal_entity.notifiers['NEW-GROUP'])
+        self.assertEqual(['NOTIFIER.DISCORD.NOT_001'], h_result.signal_entity.notifiers['RULE-DISABLED'])
 
     @mock.patch('TEx.notifier.signals_engine.NotifierEngine')
     def test_get_instance_without_signals_on_config_file(self, mocked_signal_engine):
@@ -68,6 +69,7 @@ class SignalsEngineFactoryTest(unittest.TestCase):
         self.assertEqual([], h_result.signal_entity.notifiers['INITIALIZATION'])
         self.assertEqual([], h_result.signal_entity.notifiers['SHUTDOWN'])
         self.assertEqual([], h_result.signal_entity.notifiers['NEW-GROUP'])
+        self.assertEqual([], h_result.signal_entity.notifiers['RULE-DISABLED'])
 
 
 class SignalsEngineTest(unittest.TestCase):
@@ -122,6 +124,38 @@ class SignalsEngineTest(unittest.TestCase):
         # Check the Messages Sent Counter Reset
         self.assertEqual(0, target.messages_sent)
 
+    @mock.patch('TEx.notifier.signals_engine.NotifierEngine')
+    def test_keep_alive_with_details(self, mocked_signal_engine):
+        """Test keep_alive method with Details."""
+        args: Dict = {
+            'config': 'unittest_configfile.config',
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        # Configure Mock
+        mocked_signal_engine.run = mock.AsyncMock()
+
+        target: SignalsEngine = SignalsEngineFactory.get_instance(
+            config=self.config,
+            notification_engine=mocked_signal_engine,
+            source='+1234567809'
+        )
+        target.inc_messages_sent()
+
+        # Invoke Test Target
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(
+            target.keep_alive(details='FINDER.RULE.UT: 10ms Total')
+        )
+
+        # Check Entity Used
+        self.__check_result_entity(
+            mocked_signal_engine=mocked_signal_engine,
+            signal='KEEP-ALIVE',
+            message='Messages Processed in Period: 1\nFINDER.RULE.UT: 10ms Total'
+        )
+
     @mock.patch('TEx.notifier.signals_engine.NotifierEngine')
     def test_shutdown(self, mocked_signal_engine):
         """Test shutdown Method."""
@@ -250,6 +284,50 @@ class SignalsEngineTest(unittest.TestCase):
             message='ID: 9988 | Title: "UT Group Title"'
         )
 
+    @mock.patch('TEx.notifier.signals_engine.NotifierEngine')
+    def test_rule_disabled(self, mocked_signal_engine):
+        """Test rule_disabled Method."""
+        args: Dict = {
+            'config': 'unittest_configfile.config',
+        }
+        data: Dict = {}
+        TestsCommon.execute_basic_pipeline_steps_for_initialization(config=self.config, args=args, data=data)
+
+        # Configure Mock
+        mocked_signal_engine.run = mock.AsyncMock()
+
+        target: SignalsEngine = SignalsEngineFactory.get_instance(
+            config=self.config,
+            notification_engine=mocked_signal_engine,
+            source='+12345678451'
+        )
+
+        # Invoke Test Target
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(
+            target.rule_disabled(
+                rule_id='FINDER.RULE.UT',
+                reason='UT Reason'
+            )
+        )
+
+        # Check Results
+        mocked_signal_engine.run.assert_has_awaits([
+            call(
+                notifiers=['NOTIFIER.DISCORD.NOT_001'],
+                entity=ANY,
+                rule_id='SIGNALS',
+                source='+12345678451'
+            )
+        ])
+
+        # Check Entity Used
+        self.__check_result_entity(
+            mocked_signal_engine=mocked_signal_engine,
+            signal='RULE-DISABLED',
+            message='Rule: FINDER.RULE.UT | Reason: "UT Reason"'
+        )
+
     def __check_result_entity(self, mocked_signal_engine, signal: str, message: str):
 
         # Check Entity Used